@@ -1,25 +1,50 @@
 #!/usr/bin/env python3
 """
-Build a word index for the etymology CSV to enable fast lookups.
+Build lookup indexes for the etymology CSV.
 
+Default: converts data/etymology_db/etymology.csv.gz into an indexed SQLite
+store (data/etymology_db/etymology.sqlite) keyed by (term, lang), with a
+reverse index on related_term. Every language is covered.
+
+--json: builds the legacy English-only word index instead.
 Creates: data/etymology_db/word_index.json
 Format: {"word": {"start_row": N, "count": M}, ...}
-
-This allows direct navigation to word locations instead of scanning 4.2M rows.
 """
+import argparse
 import gzip
 import csv
 import json
 import logging
+import sys
 from pathlib import Path
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+CSV_PATH = Path(__file__).parent.parent / "data" / "etymology_db" / "etymology.csv.gz"
+
+
+def build_store():
+    """Convert the etymology CSV into the SQLite store."""
+    from shared.services.lexicon.etymology_db_service import build_etymology_store
+
+    if not CSV_PATH.exists():
+        logger.error(f"❌ Etymology CSV not found: {CSV_PATH}")
+        return
+
+    logger.info("Building etymology SQLite store...")
+    logger.info(f"  Source: {CSV_PATH}")
+    store_path = build_etymology_store(CSV_PATH)
+    size_mb = store_path.stat().st_size / (1024 * 1024)
+    logger.info(f"✓ Store saved: {store_path} ({size_mb:.1f} MB)")
+
+
 def build_index():
     """Build word index from etymology CSV."""
-    csv_path = Path(__file__).parent.parent / "data" / "etymology_db" / "etymology.csv.gz"
+    csv_path = CSV_PATH
     index_path = csv_path.parent / "word_index.json"
     
     if not csv_path.exists():
@@ -77,4 +102,10 @@ def build_index():
     logger.info(f"✓ Index saved: {index_path}")
 
 if __name__ == '__main__':
-    build_index()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--json", action="store_true", help="build the legacy word_index.json instead")
+    args = parser.parse_args()
+    if args.json:
+        build_index()
+    else:
+        build_store()
@@ -4,16 +4,20 @@ Build compact Kaikki indexes for fast offline lookup.
 
 Outputs per language (under data/lexicons/indexes/):
 - kaikki-<slug>-mini.jsonl : minimal entry rows (one JSON per line)
-- kaikki-<slug>-index.json : key -> byte offset into mini file
+- kaikki-keys.sqlite       : shared key -> byte offset store for all mini files
 
 Keys include exact, lowercase, accent-stripped, and hyphen-stripped variants.
 """
 import json
 import logging
-import unicodedata
+import sys
 from pathlib import Path
 from typing import Dict, List
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared.services.lexicon.kaikki_store import get_kaikki_store
+
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
@@ -77,13 +81,6 @@ LANGS = [
 ]
 
 
-def remove_accents(text: str) -> str:
-    return "".join(
-        c for c in unicodedata.normalize("NFD", text)
-        if unicodedata.category(c) != "Mn"
-    )
-
-
 def romanization_from_forms(forms: List[Dict]) -> str:
     for form in forms:
         if "romanization" in form.get("tags", []):
@@ -98,22 +95,20 @@ def build_language(lang: Dict[str, str]) -> None:
     slug = lang["slug"]
     source_path = LEX_DIR / lang["source"]
     mini_path = INDEX_DIR / f"kaikki-{slug}-mini.jsonl"
-    index_path = INDEX_DIR / f"kaikki-{slug}-index.json"
 
     if not source_path.exists():
         logger.warning(f"{name}: source not found at {source_path}")
         return
 
-    if mini_path.exists() and index_path.exists():
-        logger.info(f"{name}: index already exists (skipping)")
+    if mini_path.exists():
+        logger.info(f"{name}: compact data already exists (refreshing keys only)")
+        get_kaikki_store(INDEX_DIR).ensure_source(mini_path)
         return
 
     logger.info(f"{name}: building compact index")
     logger.info(f"  source : {source_path}")
     logger.info(f"  mini   : {mini_path}")
-    logger.info(f"  index  : {index_path}")
 
-    index: Dict[str, int] = {}
     total = 0
     kept = 0
 
@@ -146,23 +141,14 @@ def build_language(lang: Dict[str, str]) -> None:
                 "etymology_text": data.get("etymology_text", ""),
             }
 
-            offset = fout.tell()
             json.dump(entry, fout, ensure_ascii=False)
             fout.write("\n")
             kept += 1
 
-            w_lower = word.lower()
-            w_no_accents = remove_accents(w_lower)
-            w_no_hyphen = w_no_accents.replace("-", "")
-            for key in [word, w_lower, w_no_accents, w_no_hyphen]:
-                if key and key not in index:
-                    index[key] = offset
-
             if line_num % 200_000 == 0:
                 logger.info(f"  processed {line_num:,} lines (kept {kept:,})")
 
-    with open(index_path, "w", encoding="utf-8") as fidx:
-        json.dump(index, fidx, separators=(",", ":"))
+    get_kaikki_store(INDEX_DIR).ensure_source(mini_path)
 
     logger.info(f"{name}: done (kept {kept:,} of {total:,} lines)")
     logger.info("")
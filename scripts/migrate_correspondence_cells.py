@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Migration script to move correspondence tables into the sparse cell store.
+
+This script:
+1. Creates the correspondence_cells table if it doesn't exist
+2. Finds every table whose grid is still a JSON blob in `content`
+3. Writes its non-empty cells to correspondence_cells
+4. Replaces `content` with the layout only (scroll names, columns, row counts)
+
+Tables are also migrated lazily the first time they are opened; this script
+does them all up front.
+
+Run from the project root:
+    python scripts/migrate_correspondence_cells.py
+"""
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared.database import engine, Base, get_db_session
+from pillars.correspondences.models.correspondence_models import CorrespondenceTable
+from pillars.correspondences.services.cell_store import is_cell_store_layout
+from pillars.correspondences.services.table_service import TableService
+
+
+def create_tables():
+    """Ensure the correspondence_cells table exists."""
+    print("Creating correspondence_cells table if needed...")
+    Base.metadata.create_all(bind=engine)
+    print("Done.")
+
+
+def migrate_all():
+    """Migrate every legacy table."""
+    print("\n=== Correspondence Cell Store Migration ===\n")
+
+    create_tables()
+
+    with get_db_session() as db:
+        service = TableService(db)
+        tables = db.query(CorrespondenceTable).all()
+        legacy = [t for t in tables if not is_cell_store_layout(t.content)]
+        print(f"Found {len(tables)} tables, {len(legacy)} to migrate\n")
+
+        total = 0
+        for table in legacy:
+            written = service.migrate_table(table)
+            total += written
+            print(f"  '{table.name}': {written:,} cells")
+
+    print(f"\n=== Migration Complete: {total:,} cells written ===")
+
+
+if __name__ == "__main__":
+    migrate_all()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Migration script to move inline document image bytes into the shared image store.
+
+This script:
+1. Creates the image_blobs table if it doesn't exist
+2. Finds every document_images row that still keeps its bytes inline
+3. Writes the bytes to the content-addressed store beside the database
+   (identical images across documents are stored once)
+4. Clears the inline copy and VACUUMs the database to give the space back
+
+Legacy rows stay readable without this; running it is what keeps the main
+database small.
+
+Run from the project root:
+    python scripts/migrate_image_store.py
+"""
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared.database import engine, Base
+from shared.models.document_manager.document import DocumentImage
+from shared.services.document_manager.document_service import document_service_context
+
+
+def create_tables():
+    """Ensure the image_blobs table exists."""
+    print("Creating image_blobs table if needed...")
+    Base.metadata.create_all(bind=engine)
+    print("Done.")
+
+
+def vacuum():
+    """Rebuild the database file so the freed pages are returned to disk."""
+    print("\nVacuuming database...")
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("VACUUM")
+    print("Done.")
+
+
+def migrate_all():
+    """Migrate every inline image."""
+    print("\n=== Document Image Store Migration ===\n")
+
+    create_tables()
+
+    with document_service_context() as service:
+        pending = service.db.query(DocumentImage).filter(DocumentImage.data.isnot(None)).count()
+        print(f"Found {pending:,} inline images to migrate\n")
+        if not pending:
+            return
+        migrated = service.migrate_images_to_store()
+
+    print(f"\n=== Migration Complete: {migrated:,} images moved to the store ===")
+    vacuum()
+
+
+if __name__ == "__main__":
+    migrate_all()
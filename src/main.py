@@ -28,11 +28,17 @@ os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = "--disable-gpu --single-process"
 
 _configure_logging()
 
+# Time every import from here on when asked to (ISOPGEM_PROFILE_STARTUP=1)
+from shared.startup_profiler import startup_profiler, REPORT_NAME
+PROFILE_STARTUP = os.environ.get("ISOPGEM_PROFILE_STARTUP", "0") == "1"
+if PROFILE_STARTUP:
+    startup_profiler.install()
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QVBoxLayout, QWidget, 
     QLabel, QHBoxLayout, QFrame, QGraphicsDropShadowEffect, QPushButton
 )
-from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtCore import Qt, QEvent, QTimer
 from PyQt6.QtGui import QCloseEvent, QIcon, QFont, QColor, QImageReader, QPixmap
 
 # Increase image allocation limit to 512MB to prevent "Rejecting image" errors
@@ -41,23 +47,26 @@ QImageReader.setAllocationLimit(512)
 
 from shared.ui import WindowManager, get_app_stylesheet
 from shared.ui.font_loader import load_custom_fonts
+from shared.ui.hub_registry import HubRegistry, HubSpec
+from shared.config import get_config
 from shared.database import init_db
 from shared.ui.kinetic_enforcer import KineticEnforcer
-from pillars.gematria.ui import GematriaHub
-from pillars.geometry.ui import GeometryHub
-from pillars.cymatics.ui import CymaticsHub
-from pillars.document_manager.ui import DocumentManagerHub
-from pillars.astrology.ui import AstrologyHub
-from pillars.tq.ui import TQHub
-try:
-    from pillars.adyton.ui import AdytonHub
-    ADYTON_AVAILABLE = True
-except (ImportError, OSError) as e:
-    AdytonHub = None
-    ADYTON_AVAILABLE = False
-    print(f"Warning: Adyton pillar not available (OpenGL issue): {e}")
-from pillars.correspondences.ui import CorrespondenceHub
-from pillars.time_mechanics.ui import TimeMechanicsHub
+from pillars.gematria.services.gematria_signal_handler import GematriaSignalHandler
+
+# Pillar hubs in tab (and sidebar) order. Each is imported and built only when
+# its tab is first shown, so unused pillars never load their heavy dependencies.
+PILLAR_HUBS = [
+    HubSpec("gematria", "Gematria", "pillars.gematria.ui.gematria_hub", "GematriaHub"),
+    HubSpec("geometry", "Geometry", "pillars.geometry.ui.geometry_hub", "GeometryHub"),
+    HubSpec("cymatics", "Cymatics", "pillars.cymatics.ui.cymatics_hub", "CymaticsHub"),
+    HubSpec("documents", "Documents", "pillars.document_manager.ui.document_manager_hub", "DocumentManagerHub"),
+    HubSpec("astrology", "Astrology", "pillars.astrology.ui.astrology_hub", "AstrologyHub"),
+    HubSpec("tq", "TQ", "pillars.tq.ui.tq_hub", "TQHub"),
+    HubSpec("adyton", "Adyton", "pillars.adyton.ui.adyton_hub", "AdytonHub",
+            unavailable_text="Adyton requires OpenGL (not available)"),
+    HubSpec("correspondences", "Emerald Tablet", "pillars.correspondences.ui.correspondence_hub", "CorrespondenceHub"),
+    HubSpec("time_mechanics", "Time Mechanics", "pillars.time_mechanics.ui.time_mechanics_hub", "TimeMechanicsHub"),
+]
 
 
 class IsopGemMainWindow(QMainWindow):
@@ -123,16 +132,12 @@ class IsopGemMainWindow(QMainWindow):
         
         self.setCentralWidget(main_container)
         
-        # Initialize pillars
+        # Initialize pillars: Gematria services now, hubs on first activation
         self._init_gematria_pillar()
-        self._init_geometry_pillar()
-        self._init_cymatics_pillar()
-        self._init_document_manager_pillar()
-        self._init_astrology_pillar()
-        self._init_tq_pillar()
-        self._init_adyton_pillar()
-        self._init_correspondences_pillar()
-        self._init_time_mechanics_pillar()
+        self.hubs = HubRegistry(self.tabs, self.window_manager)
+        for spec in PILLAR_HUBS:
+            self.hubs.register(spec)
+        self.hubs.ensure_loaded(PILLAR_HUBS[0].key)
         
         # Connect tab change to raise all tool windows
         self.tabs.currentChanged.connect(self.window_manager.raise_all_windows)
@@ -397,56 +402,9 @@ class IsopGemMainWindow(QMainWindow):
         super().changeEvent(event)
 
     def _init_gematria_pillar(self):
-        """Initialize the Gematria pillar."""
-        gematria_hub = GematriaHub(self.window_manager)
-        self.tabs.addTab(gematria_hub, "Gematria")
-    
-    def _init_geometry_pillar(self):
-        """Initialize the Geometry pillar."""
-        geometry_hub = GeometryHub(self.window_manager)
-        self.tabs.addTab(geometry_hub, "Geometry")
-
-    def _init_cymatics_pillar(self):
-        """Initialize the Cymatics pillar."""
-        cymatics_hub = CymaticsHub(self.window_manager)
-        self.tabs.addTab(cymatics_hub, "Cymatics")
-    
-    def _init_document_manager_pillar(self):
-        """Initialize the Document Manager pillar."""
-        document_hub = DocumentManagerHub(self.window_manager)
-        self.tabs.addTab(document_hub, "Documents")
-    
-    def _init_astrology_pillar(self):
-        """Initialize the Astrology pillar."""
-        astrology_hub = AstrologyHub(self.window_manager)
-        self.tabs.addTab(astrology_hub, "Astrology")
-    
-    def _init_tq_pillar(self):
-        """Initialize the TQ pillar."""
-        tq_hub = TQHub(self.window_manager)
-        self.tabs.addTab(tq_hub, "TQ")
-
-    def _init_adyton_pillar(self):
-        """Initialize the Adyton pillar."""
-        if ADYTON_AVAILABLE and AdytonHub is not None:
-            adyton_hub = AdytonHub(self.window_manager)
-            self.tabs.addTab(adyton_hub, "Adyton")
-        else:
-            # Create a placeholder tab
-            from PyQt6.QtWidgets import QLabel
-            placeholder = QLabel("Adyton requires OpenGL (not available)")
-            placeholder.setStyleSheet("color: #888; padding: 20px;")
-            self.tabs.addTab(placeholder, "Adyton (Unavailable)")
-
-    def _init_correspondences_pillar(self):
-        """Initialize the Emerald Tablet pillar."""
-        correspondence_hub = CorrespondenceHub(self.window_manager)
-        self.tabs.addTab(correspondence_hub, "Emerald Tablet")
-
-    def _init_time_mechanics_pillar(self):
-        """Initialize the Time Mechanics pillar."""
-        time_hub = TimeMechanicsHub(self.window_manager)
-        self.tabs.addTab(time_hub, "Time Mechanics")
+        """Initialize the Gematria pillar services."""
+        # Answers gematria_bus requests (spreadsheet GEMATRIA()) for the whole session
+        self.gematria_signal_handler = GematriaSignalHandler()
     
     def closeEvent(self, a0: QCloseEvent | None):
         """Handle main window close event."""
@@ -456,13 +414,27 @@ class IsopGemMainWindow(QMainWindow):
             a0.accept()
 
 
+def _on_first_interactive(window: IsopGemMainWindow):
+    """Record cold-start time, write the profile if enabled, then start idle preloading."""
+    elapsed = startup_profiler.mark("first_interactive")
+    logger.info(f"Main window interactive after {elapsed * 1000:.0f} ms")
+    if PROFILE_STARTUP:
+        startup_profiler.uninstall()
+        startup_profiler.write_report(get_config().paths.user_state / REPORT_NAME)
+        logger.info("Startup profile:\n%s", startup_profiler.summary())
+    if get_config().features.preload_pillar_hubs:
+        window.hubs.preload_when_idle()
+
+
 def main():
     """Initialize and run the application."""
     # Initialize Database
-    init_db()
+    with startup_profiler.phase("init_db"):
+        init_db()
 
     # Create application instance
-    app = QApplication(sys.argv)
+    with startup_profiler.phase("create_application"):
+        app = QApplication(sys.argv)
     
     # Set application-wide icon
     icon_path = os.path.join(os.path.dirname(__file__), "assets", "icons", "app_icon.png")
@@ -558,10 +530,14 @@ def main():
         logger.warning("Could not register Mermaid cleanup: %s", e)
 
     # Create and show main window
-    window = IsopGemMainWindow()
-    # Use normal window size instead of maximized to test multi-monitor behavior
-    window.resize(1440, 900)
-    window.show()
+    with startup_profiler.phase("main_window"):
+        window = IsopGemMainWindow()
+        # Use normal window size instead of maximized to test multi-monitor behavior
+        window.resize(1440, 900)
+        window.show()
+
+    # The first event-loop pass after show() is the first interactive moment
+    QTimer.singleShot(0, lambda: _on_first_interactive(window))
 
     # Run application event loop
     exit_code = app.exec()
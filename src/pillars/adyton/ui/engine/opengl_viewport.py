@@ -2,9 +2,11 @@
 ADYTON OPENGL VIEWPORT
 
 Depth-buffered viewport using QOpenGLWidget + PyOpenGL. This avoids manual
-painter sorting by relying on the GL Z-buffer.
+painter sorting by relying on the GL Z-buffer. The scene is compiled once
+into vertex buffer objects (see scene_buffers) and drawn with one call for
+the filled faces and one for the outlines.
 """
-from typing import List
+from typing import Dict, List
 
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 from PyQt6.QtCore import Qt, QPoint, QPointF
@@ -30,10 +32,16 @@ from OpenGL.GL import (
     glMatrixMode,
     glLoadIdentity,
     glMultMatrixf,
-    glBegin,
-    glEnd,
-    glColor3f,
-    glVertex3f,
+    glGenBuffers,
+    glDeleteBuffers,
+    glBindBuffer,
+    glBufferData,
+    glEnableClientState,
+    glDisableClientState,
+    glVertexPointer,
+    glColorPointer,
+    glDrawElements,
+    glDrawArrays,
     glPointSize,
     glLineWidth,
     glBlendFunc,
@@ -47,14 +55,24 @@ from OpenGL.GL import (
     GL_PROJECTION,
     GL_MODELVIEW,
     GL_TRIANGLES,
-    GL_LINE_LOOP,
+    GL_LINES,
     GL_POINTS,
+    GL_ARRAY_BUFFER,
+    GL_ELEMENT_ARRAY_BUFFER,
+    GL_STATIC_DRAW,
+    GL_FLOAT,
+    GL_UNSIGNED_INT,
+    GL_VERTEX_ARRAY,
+    GL_COLOR_ARRAY,
 )
 
-from pillars.adyton.models.geometry_types import Object3D, Face3D
+from pillars.adyton.models.geometry_types import Object3D
 from pillars.adyton.models.prism import SevenSidedPrism
 from ...constants import COLOR_GOLD, COLOR_SILVER
 from .camera import AdytonCamera
+from .scene_buffers import SceneArrayCache, SceneArrays, model_matrix
+
+_BUFFER_NAMES = ("vertices", "colors", "triangles", "outline_vertices", "outline_colors")
 
 
 class AdytonGLViewport(QOpenGLWidget):
@@ -96,6 +114,13 @@ class AdytonGLViewport(QOpenGLWidget):
         self.last_pos: QPoint = QPoint()
         self.mouse_pressed: bool = False
 
+        # Scene arrays and the GL buffers they were last uploaded to
+        self._scene_buffers = SceneArrayCache()
+        self._vbos: Dict[str, int] = {}
+        self._uploaded_version: int | None = None
+        self._triangle_index_count = 0
+        self._outline_vertex_count = 0
+
     # ------------------------------------------------------------------
     # GL lifecycle
     # ------------------------------------------------------------------
@@ -106,6 +131,11 @@ class AdytonGLViewport(QOpenGLWidget):
         """
         glClearColor(0.02, 0.02, 0.03, 1.0)
         glEnable(GL_DEPTH_TEST)
+        self._vbos = dict(zip(_BUFFER_NAMES, glGenBuffers(len(_BUFFER_NAMES))))
+        self._uploaded_version = None
+        context = self.context()
+        if context is not None:
+            context.aboutToBeDestroyed.connect(self._release_buffers)
 
     def resizeGL(self, w: int, h: int):
         """
@@ -135,15 +165,12 @@ class AdytonGLViewport(QOpenGLWidget):
         glLoadIdentity()
         glMultMatrixf(projection.data())
 
-        for obj in self.scene_objects:
-            model = self._model_matrix(obj)
-            mv = view * model
-
-            glMatrixMode(GL_MODELVIEW)
-            glLoadIdentity()
-            glMultMatrixf(mv.data())
+        # Scene arrays are already in world space: the modelview is the view
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+        glMultMatrixf(view.data())
 
-            self._draw_object(obj)
+        self._draw_scene(self._scene_buffers.get(self.scene_objects))
 
         if self.draw_labels:
             self._draw_overlays(projection, view)
@@ -225,17 +252,65 @@ class AdytonGLViewport(QOpenGLWidget):
     # Helpers
     # ------------------------------------------------------------------
     def _model_matrix(self, obj: Object3D) -> QMatrix4x4:
-        m = QMatrix4x4()
-        m.translate(obj.position)
-        m.rotate(obj.rotation.x(), 1, 0, 0)
-        m.rotate(obj.rotation.y(), 0, 1, 0)
-        m.rotate(obj.rotation.z(), 0, 0, 1)
-        m.scale(obj.scale)
-        return m
-
-    def _draw_object(self, obj: Object3D):
-        for face in obj.faces:
-            self._draw_face(face)
+        return model_matrix(obj)
+
+    def _upload(self, arrays: SceneArrays):
+        """Copy the scene arrays into the VBOs (only when the scene changed)."""
+        uploads = [
+            (GL_ARRAY_BUFFER, "vertices", arrays.vertices),
+            (GL_ARRAY_BUFFER, "colors", arrays.vertex_colors),
+            (GL_ELEMENT_ARRAY_BUFFER, "triangles", arrays.triangles),
+            (GL_ARRAY_BUFFER, "outline_vertices", arrays.outline_vertices),
+            (GL_ARRAY_BUFFER, "outline_colors", arrays.outline_colors),
+        ]
+        for target, name, data in uploads:
+            glBindBuffer(target, self._vbos[name])
+            glBufferData(target, data.nbytes, data if data.size else None, GL_STATIC_DRAW)
+            glBindBuffer(target, 0)
+        self._triangle_index_count = arrays.triangles.size
+        self._outline_vertex_count = len(arrays.outline_vertices)
+        self._uploaded_version = arrays.version
+
+    def _draw_scene(self, arrays: SceneArrays):
+        if not self._vbos:
+            return
+        if arrays.version != self._uploaded_version:
+            self._upload(arrays)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+
+        # Filled faces: one indexed draw
+        if self._triangle_index_count:
+            glBindBuffer(GL_ARRAY_BUFFER, self._vbos["vertices"])
+            glVertexPointer(3, GL_FLOAT, 0, None)
+            glBindBuffer(GL_ARRAY_BUFFER, self._vbos["colors"])
+            glColorPointer(3, GL_FLOAT, 0, None)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self._vbos["triangles"])
+            glDrawElements(GL_TRIANGLES, self._triangle_index_count, GL_UNSIGNED_INT, None)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        # Outlines (only faces whose outline differs, for 'solidity'): one draw
+        if self._outline_vertex_count:
+            glLineWidth(2.0)
+            glBindBuffer(GL_ARRAY_BUFFER, self._vbos["outline_vertices"])
+            glVertexPointer(3, GL_FLOAT, 0, None)
+            glBindBuffer(GL_ARRAY_BUFFER, self._vbos["outline_colors"])
+            glColorPointer(3, GL_FLOAT, 0, None)
+            glDrawArrays(GL_LINES, 0, self._outline_vertex_count)
+
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    def _release_buffers(self):
+        if not self._vbos:
+            return
+        self.makeCurrent()
+        glDeleteBuffers(len(self._vbos), list(self._vbos.values()))
+        self.doneCurrent()
+        self._vbos = {}
+        self._uploaded_version = None
 
     # ------------------------------------------------------------------
     # Overlay text (Greek letters on vowel ring)
@@ -376,58 +451,6 @@ class AdytonGLViewport(QOpenGLWidget):
         }
         return mapping.get(planet.lower(), "")
 
-    def _draw_face(self, face: Face3D):
-        verts = face.vertices
-        if len(verts) < 3:
-            return
-
-        # Simple ambient + directional shading
-        if face.shading:
-            light_dir = QVector3D(0.25, -0.6, 0.75).normalized()
-            v0, v1, v2 = verts[0], verts[1], verts[2]
-            normal = QVector3D.crossProduct(v1 - v0, v2 - v0).normalized()
-            ambient = 0.35
-            diffuse = max(0.0, QVector3D.dotProduct(normal, light_dir))
-            shade = min(1.0, ambient + diffuse * 0.75)
-        else:
-            shade = 1.0
-
-        col = face.color
-        glColor3f(col.redF() * shade, col.greenF() * shade, col.blueF() * shade)
-
-        glBegin(GL_TRIANGLES)
-        if len(verts) == 3:
-            for v in verts:
-                glVertex3f(v.x(), v.y(), v.z())
-        elif len(verts) == 4:
-            v0, v1, v2, v3 = verts
-            glVertex3f(v0.x(), v0.y(), v0.z())
-            glVertex3f(v1.x(), v1.y(), v1.z())
-            glVertex3f(v2.x(), v2.y(), v2.z())
-
-            glVertex3f(v0.x(), v0.y(), v0.z())
-            glVertex3f(v2.x(), v2.y(), v2.z())
-            glVertex3f(v3.x(), v3.y(), v3.z())
-        else:
-            v0 = verts[0]
-            for i in range(1, len(verts) - 1):
-                v1 = verts[i]
-                v2 = verts[i + 1]
-                glVertex3f(v0.x(), v0.y(), v0.z())
-                glVertex3f(v1.x(), v1.y(), v1.z())
-                glVertex3f(v2.x(), v2.y(), v2.z())
-        glEnd()
-
-        # Outline for the face (only if different, for 'solidity')
-        oc = face.outline_color
-        if oc != col:
-            glColor3f(oc.redF(), oc.greenF(), oc.blueF())
-            glLineWidth(2.0)
-            glBegin(GL_LINE_LOOP)
-            for v in verts:
-                glVertex3f(v.x(), v.y(), v.z())
-            glEnd()
-
     # Starfield removed (kept stub for future use)
     def _draw_starfield(self, projection: QMatrix4x4, view: QMatrix4x4):
         return
\ No newline at end of file
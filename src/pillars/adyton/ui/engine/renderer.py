@@ -7,11 +7,13 @@ This module implements the Software Rasterizer using the Painter's Algorithm.
 It projects 3D faces onto the 2D QPainter canvas.
 """
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List
+
+import numpy as np
 from PyQt6.QtCore import QPointF, QRect
-from PyQt6.QtGui import QPainter, QPolygonF, QColor, QMatrix4x4, QVector3D, QVector4D, QBrush, QPen
+from PyQt6.QtGui import QPainter, QPolygonF, QMatrix4x4
 from .scene import AdytonScene
-from pillars.adyton.models.geometry_types import Face3D
+from .scene_buffers import qmatrix_to_numpy
 from .camera import AdytonCamera
 
 @dataclass
@@ -19,8 +21,7 @@ class ProjectedFace:
     """A face that has been projected to screen coordinates."""
     polygon: QPolygonF
     depth: float
-    color: QColor
-    outline_color: QColor
+    face_index: int  # into the scene arrays' brushes/pens
 
 class AdytonRenderer:
     """
@@ -34,10 +35,17 @@ class AdytonRenderer:
         """
         pass
 
-    def render(self, painter: QPainter, scene: AdytonScene, camera: AdytonCamera, viewport: QRect):
+    def prepare_frame(self, scene: AdytonScene, camera: AdytonCamera, viewport: QRect) -> List[ProjectedFace]:
         """
-        Main render loop.
+        Project and depth-sort the scene, farthest face first.
+
+        Every vertex goes through one matrix multiply over the scene arrays;
+        only the final QPolygonF construction is per face.
         """
+        arrays = scene.arrays()
+        if arrays.face_count == 0:
+            return []
+
         # 1. Setup Matrices
         view_matrix = camera.view_matrix()
         
@@ -46,59 +54,54 @@ class AdytonRenderer:
         projection_matrix.perspective(camera.fov, aspect_ratio, 10.0, 5000.0)
         
         # Combined VP Matrix
-        vp_matrix = projection_matrix * view_matrix
+        vp = qmatrix_to_numpy(projection_matrix * view_matrix)
+        view = qmatrix_to_numpy(view_matrix)
         
-        width = viewport.width()
-        height = viewport.height()
-        half_w = width / 2.0
-        half_h = height / 2.0
-
-        # 2. Collect and Project Faces
-        faces = scene.get_all_faces()
-        projected_faces: List[ProjectedFace] = []
+        half_w = viewport.width() / 2.0
+        half_h = viewport.height() / 2.0
 
-        for face in faces:
-            # Depth from view-space Z (negative is farther in OpenGL-style view)
-            centroid4 = QVector4D(face.centroid.x(), face.centroid.y(), face.centroid.z(), 1.0)
-            centroid_view = view_matrix * centroid4
-            view_z = centroid_view.z()
-            
-            poly = QPolygonF()
-            all_valid = True
+        # 2. Project all vertices; near plane clipping (simple W check) per face
+        clip = arrays.vertices_h @ vp.T
+        w = clip[:, 3]
+        in_front = w > 0.1
+        starts = arrays.face_offsets[:-1]
+        face_visible = np.logical_and.reduceat(in_front, starts)
 
-            for v in face.vertices:
-                # MVP Transform
-                vec4 = QVector4D(v.x(), v.y(), v.z(), 1.0)
-                clip_space = vp_matrix * vec4
-                w = clip_space.w()
-                
-                # Near plane clipping (Simple W check)
-                if w <= 0.1: 
-                    all_valid = False
-                    break
-                
-                # NDC Division
-                ndc_x = clip_space.x() / w
-                ndc_y = clip_space.y() / w
-                
-                # Viewport Transform (Flip Y for screen coords)
-                screen_x = (ndc_x * half_w) + half_w
-                screen_y = half_h - (ndc_y * half_h) # In Qt, Y is down
-                
-                poly.append(QPointF(screen_x, screen_y))
-            
-            if all_valid:
-                projected_faces.append(ProjectedFace(poly, view_z + 0.01, face.color, face.outline_color))
+        safe_w = np.where(in_front, w, 1.0)
+        screen = np.empty((len(clip), 2))
+        screen[:, 0] = clip[:, 0] / safe_w * half_w + half_w
+        screen[:, 1] = half_h - clip[:, 1] / safe_w * half_h  # In Qt, Y is down
 
         # 3. Sort by Depth (Painter's Algorithm: Furthest first) using view-space Z
-        projected_faces.sort(key=lambda f: f.depth)  # more negative (farther) first
+        depth = arrays.centroids_h @ view[2] + 0.01
+        visible = np.flatnonzero(face_visible)
+        order = visible[np.argsort(depth[visible], kind='stable')]
+
+        points = screen.tolist()
+        offsets = arrays.face_offsets.tolist()
+        return [
+            ProjectedFace(
+                QPolygonF([QPointF(x, y) for x, y in points[offsets[i]:offsets[i + 1]]]),
+                float(depth[i]),
+                i,
+            )
+            for i in order.tolist()
+        ]
+
+    def render(self, painter: QPainter, scene: AdytonScene, camera: AdytonCamera, viewport: QRect):
+        """
+        Main render loop.
+        """
+        projected_faces = self.prepare_frame(scene, camera, viewport)
+        arrays = scene.arrays()
 
         # 4. Draw
         if scene.background_color:
             painter.fillRect(viewport, scene.background_color)
 
         # Antialiasing is usually set by the widget
+        brushes, pens = arrays.brushes, arrays.pens
         for p_face in projected_faces:
-            painter.setBrush(QBrush(p_face.color))
-            painter.setPen(QPen(p_face.outline_color, 1.0))
-            painter.drawPolygon(p_face.polygon)
\ No newline at end of file
+            painter.setBrush(brushes[p_face.face_index])
+            painter.setPen(pens[p_face.face_index])
+            painter.drawPolygon(p_face.polygon)
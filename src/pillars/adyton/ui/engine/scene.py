@@ -9,12 +9,14 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 from PyQt6.QtGui import QVector3D, QColor, QMatrix4x4
 from pillars.adyton.models.geometry_types import Face3D, Object3D
+from .scene_buffers import SceneArrayCache, SceneArrays
 
 @dataclass
 class AdytonScene:
     """The Container of the Sanctuary."""
     objects: List[Object3D] = field(default_factory=list)
     background_color: QColor = field(default_factory=lambda: QColor(10, 10, 15))
+    _buffers: SceneArrayCache = field(default_factory=SceneArrayCache, repr=False)
 
     def add_object(self, obj: Object3D):
         """
@@ -41,4 +43,12 @@ class AdytonScene:
             # For simplicity, we can call it here or manage dirty flags
             obj.update_world_transform() 
             all_faces.extend(obj._world_faces)
-        return all_faces
\ No newline at end of file
+        return all_faces
+
+    def arrays(self) -> SceneArrays:
+        """The scene compiled to NumPy arrays; recompiled only when objects change."""
+        return self._buffers.get(self.objects)
+
+    def invalidate(self):
+        """Force a recompile after editing face vertices or colors in place."""
+        self._buffers.invalidate()
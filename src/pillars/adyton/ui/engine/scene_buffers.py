@@ -0,0 +1,177 @@
+"""
+THE LOOM OF THE ADYTON (Scene Buffers)
+
+"Woven once, beheld from every side."
+
+This module compiles the Sanctuary's objects into flat NumPy arrays
+(world-space vertices, per-face colors, triangle indices) that both the
+OpenGL viewport and the QPainter renderer draw from. The arrays are rebuilt
+only when an object is added, removed or moved, never per frame.
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from PyQt6.QtGui import QBrush, QMatrix4x4, QPen
+
+from pillars.adyton.models.geometry_types import Object3D
+
+# Directional light shared by the shaded (GL) path
+LIGHT_DIRECTION = np.array([0.25, -0.6, 0.75]) / np.linalg.norm([0.25, -0.6, 0.75])
+AMBIENT = 0.35
+DIFFUSE = 0.75
+
+
+def qmatrix_to_numpy(matrix: QMatrix4x4) -> np.ndarray:
+    """Row-major 4x4 array of a QMatrix4x4 (whose data() is column-major)."""
+    return np.array(matrix.data(), dtype=np.float64).reshape(4, 4).T
+
+
+def model_matrix(obj: Object3D) -> QMatrix4x4:
+    """The object's translate-rotate-scale matrix."""
+    m = QMatrix4x4()
+    m.translate(obj.position)
+    m.rotate(obj.rotation.x(), 1, 0, 0)
+    m.rotate(obj.rotation.y(), 0, 1, 0)
+    m.rotate(obj.rotation.z(), 0, 0, 1)
+    m.scale(obj.scale)
+    return m
+
+
+@dataclass
+class SceneArrays:
+    """The whole scene as arrays; face ``i`` owns vertices ``face_offsets[i]:face_offsets[i+1]``."""
+    version: int
+    vertices: np.ndarray             # (V, 3) float32, world space
+    vertices_h: np.ndarray           # (V, 4) float64 homogeneous, for projection
+    face_offsets: np.ndarray         # (F + 1,) int64 CSR offsets
+    centroids_h: np.ndarray          # (F, 4) float64 homogeneous
+    normals: np.ndarray              # (F, 3) float64 unit normals (zero if degenerate)
+    shade: np.ndarray                # (F,) float64 directional shading factor
+    triangles: np.ndarray            # (T, 3) uint32 fan triangulation
+    vertex_colors: np.ndarray        # (V, 3) float32 shaded fill color per vertex
+    outline_vertices: np.ndarray     # (2L, 3) float32 GL_LINES segments
+    outline_colors: np.ndarray       # (2L, 3) float32
+    brushes: List[QBrush]            # painter fill per face
+    pens: List[QPen]                 # painter outline per face
+
+    @property
+    def face_count(self) -> int:
+        return len(self.face_offsets) - 1
+
+
+def compile_objects(objects: Sequence[Object3D], version: int = 0) -> SceneArrays:
+    """Flatten objects into world-space scene arrays (faces with < 3 vertices are dropped)."""
+    vertex_chunks: List[np.ndarray] = []
+    sizes: List[int] = []
+    fills: List[Tuple[float, float, float]] = []
+    outlines: List[Optional[Tuple[float, float, float]]] = []
+    shaded: List[bool] = []
+    brushes: List[QBrush] = []
+    pens: List[QPen] = []
+
+    for obj in objects:
+        matrix = qmatrix_to_numpy(model_matrix(obj))
+        for face in obj.faces:
+            if len(face.vertices) < 3:
+                continue
+            local = np.array([(v.x(), v.y(), v.z(), 1.0) for v in face.vertices])
+            world = local @ matrix.T
+            vertex_chunks.append(world[:, :3] / world[:, 3:4])
+            sizes.append(len(face.vertices))
+
+            col, oc = face.color, face.outline_color
+            fills.append((col.redF(), col.greenF(), col.blueF()))
+            outlines.append((oc.redF(), oc.greenF(), oc.blueF()) if oc != col else None)
+            shaded.append(face.shading)
+            brushes.append(QBrush(col))
+            pens.append(QPen(oc, 1.0))
+
+    face_offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=face_offsets[1:])
+    vertices = np.concatenate(vertex_chunks) if vertex_chunks else np.zeros((0, 3))
+    starts = face_offsets[:-1]
+    counts = np.asarray(sizes, dtype=np.int64)
+
+    # Centroids and normals (from the first three vertices, as before)
+    if len(sizes):
+        centroids = np.add.reduceat(vertices, starts, axis=0) / counts[:, None]
+        normals = np.cross(vertices[starts + 1] - vertices[starts], vertices[starts + 2] - vertices[starts])
+        lengths = np.linalg.norm(normals, axis=1)
+        normals = np.divide(normals, lengths[:, None], out=np.zeros_like(normals), where=lengths[:, None] > 0)
+    else:
+        centroids = np.zeros((0, 3))
+        normals = np.zeros((0, 3))
+
+    diffuse = np.clip(normals @ LIGHT_DIRECTION, 0.0, None)
+    shade = np.where(np.asarray(shaded, dtype=bool), np.minimum(1.0, AMBIENT + diffuse * DIFFUSE), 1.0)
+
+    # Fan triangulation: (start, start + k, start + k + 1) for k in 1..n-2
+    tri_counts = counts - 2
+    tri_face = np.repeat(np.arange(len(sizes)), tri_counts)
+    k = np.arange(tri_counts.sum()) - np.repeat(np.cumsum(tri_counts) - tri_counts, tri_counts) + 1
+    base = starts[tri_face]
+    triangles = np.column_stack((base, base + k, base + k + 1)).astype(np.uint32)
+
+    fill_array = np.asarray(fills, dtype=np.float64).reshape(-1, 3)
+    vertex_colors = np.repeat(fill_array * shade[:, None], counts, axis=0).astype(np.float32)
+
+    # Outline segments (v_i, v_i+1) around faces whose outline differs from the fill
+    segment_chunks: List[np.ndarray] = []
+    color_chunks: List[np.ndarray] = []
+    for face_index, outline in enumerate(outlines):
+        if outline is None:
+            continue
+        ring = vertices[face_offsets[face_index]:face_offsets[face_index + 1]]
+        segment_chunks.append(np.stack((ring, np.roll(ring, -1, axis=0)), axis=1).reshape(-1, 3))
+        color_chunks.append(np.tile(outline, (len(ring) * 2, 1)))
+
+    return SceneArrays(
+        version=version,
+        vertices=vertices.astype(np.float32),
+        vertices_h=np.column_stack((vertices, np.ones(len(vertices)))),
+        face_offsets=face_offsets,
+        centroids_h=np.column_stack((centroids, np.ones(len(centroids)))),
+        normals=normals,
+        shade=shade,
+        triangles=triangles,
+        vertex_colors=vertex_colors,
+        outline_vertices=(np.concatenate(segment_chunks) if segment_chunks else np.zeros((0, 3))).astype(np.float32),
+        outline_colors=(np.concatenate(color_chunks) if color_chunks else np.zeros((0, 3))).astype(np.float32),
+        brushes=brushes,
+        pens=pens,
+    )
+
+
+def _object_signature(obj: Object3D) -> Tuple:
+    p, r, s = obj.position, obj.rotation, obj.scale
+    return (
+        id(obj), id(obj.faces), len(obj.faces),
+        p.x(), p.y(), p.z(), r.x(), r.y(), r.z(), s.x(), s.y(), s.z(),
+    )
+
+
+class SceneArrayCache:
+    """
+    Holds the compiled arrays for a list of objects.
+
+    Recompiles when objects are added, removed, moved, rotated or scaled;
+    call ``invalidate()`` after editing a face's vertices or colors in place.
+    """
+
+    def __init__(self):
+        """Start empty; the first ``get`` compiles."""
+        self._signature: Optional[Tuple] = None
+        self._arrays: Optional[SceneArrays] = None
+        self._version = 0
+
+    def get(self, objects: Sequence[Object3D]) -> SceneArrays:
+        signature = tuple(_object_signature(obj) for obj in objects)
+        if self._arrays is None or signature != self._signature:
+            self._version += 1
+            self._arrays = compile_objects(objects, self._version)
+            self._signature = signature
+        return self._arrays
+
+    def invalidate(self) -> None:
+        self._arrays = None
@@ -1,8 +1,8 @@
 """
 Correspondence Models - The Emerald Scrolls.
-SQLAlchemy models for storing correspondence tables with JSON-based grid content.
+SQLAlchemy models for storing correspondence tables and their sparse cells.
 """
-from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy import Column, String, DateTime, Integer, Text, JSON, ForeignKey
 from shared.database import Base
 from datetime import datetime
 import uuid
@@ -11,7 +11,12 @@ class CorrespondenceTable(Base):
     """
     Represents a 'Spreadsheet' or 'Table' of correspondences.
     
-    The 'content' JSON blob stores the grid data:
+    Tables saved with the cell store keep only the layout in 'content'
+    (scroll names, columns, row counts, flagged by ``"cell_store": true``);
+    the cells themselves live in CorrespondenceCell rows.
+    
+    Legacy tables keep the whole grid in the 'content' JSON blob until they
+    are first loaded:
     {
         "columns": ["Hebrew", "English", "Number"],
         "rows": [
@@ -42,3 +47,23 @@ class CorrespondenceTable(Base):
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "content": self.content or {}
         }
+
+
+class CorrespondenceCell(Base):
+    """
+    One non-empty cell of a correspondence table.
+    
+    Keyed by (table, scroll, row, col); empty cells have no row. A cell holds
+    either a typed plain value or a formula, plus its optional style dict.
+    """
+    __tablename__ = 'correspondence_cells'
+
+    table_id = Column(String, ForeignKey('correspondence_tables.id', ondelete='CASCADE'), primary_key=True)
+    scroll = Column(Integer, primary_key=True)  # Sheet index within the table
+    row = Column(Integer, primary_key=True)
+    col = Column(Integer, primary_key=True)
+
+    value = Column(Text, nullable=True)        # Plain value, as text
+    value_type = Column(String(8), nullable=True)  # 'str', 'int', 'float' or 'bool'
+    formula = Column(Text, nullable=True)      # Raw formula including the leading '='
+    style = Column(JSON, nullable=True)
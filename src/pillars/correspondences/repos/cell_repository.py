@@ -0,0 +1,77 @@
+"""
+Cell Repository - The Keeper of the Ledger.
+Sparse CorrespondenceCell storage: region rewrites, bulk inserts and streamed reads.
+"""
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+from pillars.correspondences.models.correspondence_models import CorrespondenceCell
+from pillars.correspondences.services.cell_store import CellRecord, Region, decode_value, encode_value
+from typing import Iterable, Iterator, Optional, Tuple
+
+# Rows fetched per round trip when streaming cells
+_FETCH_ROWS = 5000
+
+
+class CellRepository:
+    """
+    Keeper of the Ledger.
+    Reads and writes the sparse cells of correspondence tables. Methods do not
+    commit; the caller commits once per save so a save is atomic.
+    """
+    def __init__(self, session: Session):
+        """
+        Bind the repository to a session.
+
+        Args:
+            session: SQLAlchemy session shared with the table repository.
+        """
+        self.session = session
+
+    def iter_cells(self, table_id: str, scroll: Optional[int] = None) -> Iterator[Tuple[int, CellRecord]]:
+        """Stream (scroll, record) pairs in (scroll, row, col) order without loading the table."""
+        c = CorrespondenceCell
+        stmt = select(c.scroll, c.row, c.col, c.value, c.value_type, c.formula, c.style).where(c.table_id == table_id)
+        if scroll is not None:
+            stmt = stmt.where(c.scroll == scroll)
+        stmt = stmt.order_by(c.scroll, c.row, c.col).execution_options(yield_per=_FETCH_ROWS)
+        for sc, row, col, value, value_type, formula, style in self.session.execute(stmt):
+            yield sc, (row, col, decode_value(value, value_type, formula), style)
+
+    def count(self, table_id: str) -> int:
+        """Number of stored cells of a table."""
+        return self.session.scalar(
+            select(func.count()).select_from(CorrespondenceCell).where(CorrespondenceCell.table_id == table_id)
+        ) or 0
+
+    def insert_cells(self, table_id: str, scroll: int, records: Iterable[CellRecord]) -> int:
+        """Bulk-insert records (their keys must be free). Returns the number written."""
+        rows = []
+        for r, c, raw, style in records:
+            value, value_type, formula = encode_value(raw)
+            rows.append({
+                "table_id": table_id, "scroll": scroll, "row": r, "col": c,
+                "value": value, "value_type": value_type, "formula": formula, "style": style or None,
+            })
+        if rows:
+            self.session.execute(insert(CorrespondenceCell), rows)
+        return len(rows)
+
+    def delete_region(self, table_id: str, scroll: int, region: Region) -> None:
+        """Delete the stored cells of a scroll inside a region."""
+        c = CorrespondenceCell
+        top, left, bottom, right = region
+        stmt = delete(c).where(c.table_id == table_id, c.scroll == scroll, c.row >= top, c.col >= left)
+        if bottom is not None:
+            stmt = stmt.where(c.row <= bottom)
+        if right is not None:
+            stmt = stmt.where(c.col <= right)
+        self.session.execute(stmt)
+
+    def delete_scrolls_from(self, table_id: str, scroll: int) -> None:
+        """Delete every cell of scrolls at or after ``scroll`` (scrolls that no longer exist)."""
+        c = CorrespondenceCell
+        self.session.execute(delete(c).where(c.table_id == table_id, c.scroll >= scroll))
+
+    def delete_table(self, table_id: str) -> None:
+        """Delete every cell of a table."""
+        self.delete_scrolls_from(table_id, 0)
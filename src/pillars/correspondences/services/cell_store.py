@@ -0,0 +1,241 @@
+"""
+Cell Store - The Sparse Ledger.
+Sparse cell records, dirty-region deltas and streaming CSV/JSON transfer for correspondence tables.
+"""
+import csv
+import json
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+
+# (top, left, bottom, right), inclusive; a None bottom/right extends to the sheet edge
+Region = Tuple[int, int, Optional[int], Optional[int]]
+# (row, col, raw value, style dict or None)
+CellRecord = Tuple[int, int, Any, Optional[Dict[str, Any]]]
+
+LAYOUT_VERSION = "3.0"
+# Rows held in memory at once by the streaming readers and writers
+BLOCK_ROWS = 1000
+
+_DECODERS = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": lambda text: text == "1",
+}
+
+
+class ScrollDelta(NamedTuple):
+    """Unsaved changes of one scroll: stored cells inside ``regions`` are replaced by ``cells``."""
+    regions: List[Region]
+    cells: List[CellRecord]
+
+
+def encode_value(raw: Any) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Split a raw cell value into its (value, value_type, formula) columns."""
+    if raw is None or raw == "":
+        return None, None, None
+    if isinstance(raw, str):
+        if raw.startswith("="):
+            return None, None, raw
+        return raw, "str", None
+    if isinstance(raw, bool):
+        return ("1" if raw else "0"), "bool", None
+    if isinstance(raw, int):
+        return str(raw), "int", None
+    if isinstance(raw, float):
+        return repr(raw), "float", None
+    return str(raw), "str", None
+
+
+def decode_value(value: Optional[str], value_type: Optional[str], formula: Optional[str]) -> Any:
+    """Inverse of ``encode_value``; an empty cell decodes to ``""``."""
+    if formula is not None:
+        return formula
+    if value is None:
+        return ""
+    return _DECODERS.get(value_type or "str", str)(value)
+
+
+def is_empty(raw: Any, style: Optional[Dict[str, Any]]) -> bool:
+    """Whether a cell needs no stored record."""
+    return (raw is None or raw == "") and not style
+
+
+def clip_region(region: Region, row_count: int, col_count: int) -> Tuple[int, int, int, int]:
+    """Concrete (top, left, bottom, right) of a region inside a grid (may be empty)."""
+    top, left, bottom, right = region
+    bottom = row_count - 1 if bottom is None else min(bottom, row_count - 1)
+    right = col_count - 1 if right is None else min(right, col_count - 1)
+    return top, left, bottom, right
+
+
+def grid_delta(
+    data: Sequence[Sequence[Any]],
+    styles: Dict[Tuple[int, int], Dict[str, Any]],
+    regions: Iterable[Region],
+    col_count: int,
+) -> ScrollDelta:
+    """
+    Build the delta that rewrites ``regions`` of a dense grid.
+
+    Args:
+        data: Row-major raw values
+        styles: {(row, col): style}
+        regions: Changed regions; overlapping regions are fine
+        col_count: Sheet width (rows may be ragged)
+    """
+    regions = list(regions)
+    found: Dict[Tuple[int, int], CellRecord] = {}
+    for region in regions:
+        top, left, bottom, right = clip_region(region, len(data), col_count)
+        for r in range(top, bottom + 1):
+            row = data[r]
+            width = len(row)
+            for c in range(left, right + 1):
+                raw = row[c] if c < width else ""
+                style = styles.get((r, c))
+                if not is_empty(raw, style):
+                    found[(r, c)] = (r, c, raw, style or None)
+    return ScrollDelta(regions, list(found.values()))
+
+
+def iter_grid_records(data: Sequence[Sequence[Any]], styles: Dict[Tuple[int, int], Dict[str, Any]]) -> Iterator[CellRecord]:
+    """Every non-empty cell of a dense grid, row by row."""
+    width = max((len(row) for row in data), default=0)
+    yield from grid_delta(data, styles, [(0, 0, None, None)], width).cells
+
+
+def scroll_layout(name: str, columns: List[str], row_count: int) -> Dict[str, Any]:
+    """The layout entry of one scroll, as stored in the table's content JSON."""
+    return {"name": name, "columns": list(columns), "row_count": row_count}
+
+
+def is_cell_store_layout(content: Optional[Dict[str, Any]]) -> bool:
+    """Whether table content is a cell-store layout (rather than a legacy grid blob)."""
+    return bool(content) and bool(content.get("cell_store"))  # type: ignore[union-attr]
+
+
+def split_scrolls(content: Optional[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    (active scroll index, scroll dicts) of legacy grid content.
+
+    Handles the multi-scroll 2.0 format and the older single-sheet format
+    (``columns`` plus ``data`` or ``rows``).
+    """
+    content = content or {}
+    if "scrolls" in content:
+        return content.get("active_scroll_index", 0), list(content.get("scrolls") or [])
+    if not content.get("columns") and not content.get("data") and not content.get("rows"):
+        return 0, []
+    return 0, [{
+        "name": "Sheet1",
+        "columns": content.get("columns", []),
+        "data": content.get("data", []) or content.get("rows", []),
+        "styles": content.get("styles", {}),
+    }]
+
+
+def empty_scroll(layout: Dict[str, Any]) -> Dict[str, Any]:
+    """A blank scroll dict (SpreadsheetModel input) sized by its layout entry."""
+    columns = list(layout.get("columns", []))
+    return {
+        "name": layout.get("name", "Sheet"),
+        "columns": columns,
+        "data": [[""] * len(columns) for _ in range(layout.get("row_count", 0))],
+        "styles": {},
+    }
+
+
+def place_record(scroll: Dict[str, Any], record: CellRecord) -> None:
+    """Write one record into a scroll dict built by ``empty_scroll``."""
+    r, c, raw, style = record
+    data = scroll["data"]
+    if r >= len(data):
+        return
+    row = data[r]
+    if c >= len(row):
+        row.extend([""] * (c + 1 - len(row)))
+    row[c] = raw
+    if style:
+        scroll["styles"][f"{r},{c}"] = style
+
+
+# --- Streaming transfer ---
+
+def iter_blocks(rows: Iterable[List[Any]], block_rows: int = BLOCK_ROWS) -> Iterator[List[List[Any]]]:
+    """Group a row stream into lists of at most ``block_rows`` rows."""
+    rows = iter(rows)
+    while True:
+        block = list(islice(rows, block_rows))
+        if not block:
+            return
+        yield block
+
+
+def write_csv(stream: TextIO, rows: Iterable[Sequence[Any]]) -> int:
+    """Write rows as CSV while they are produced; ``None`` becomes empty. Returns the row count."""
+    writer = csv.writer(stream)
+    count = 0
+    for block in iter_blocks(rows):
+        writer.writerows([["" if v is None else v for v in row] for row in block])
+        count += len(block)
+    return count
+
+
+def iter_csv_blocks(stream: TextIO, block_rows: int = BLOCK_ROWS) -> Iterator[List[List[str]]]:
+    """Read CSV rows in blocks of at most ``block_rows``."""
+    return iter_blocks(csv.reader(stream), block_rows)
+
+
+def write_json(
+    stream: TextIO,
+    name: str,
+    columns: List[str],
+    rows: Iterable[Sequence[Any]],
+    styles: Optional[Dict[Tuple[int, int], Dict[str, Any]]] = None,
+) -> int:
+    """
+    Write a scroll as one JSON document, a row per line, while rows are produced.
+
+    The result is the same ``{name, columns, styles, data}`` document the
+    model's ``to_json`` describes, laid out so ``read_json`` can stream it back.
+    Returns the row count.
+    """
+    header = {
+        "name": name,
+        "columns": list(columns),
+        "styles": {f"{r},{c}": v for (r, c), v in (styles or {}).items()},
+    }
+    stream.write(json.dumps(header, ensure_ascii=False)[:-1] + ', "data": [\n')
+    count = 0
+    for block in iter_blocks(rows):
+        lines = [json.dumps(list(row), ensure_ascii=False) for row in block]
+        stream.write((",\n" if count else "") + ",\n".join(lines))
+        count += len(block)
+    stream.write("\n]}\n")
+    return count
+
+
+def read_json(stream: TextIO, block_rows: int = BLOCK_ROWS) -> Tuple[Dict[str, Any], Iterator[List[List[Any]]]]:
+    """
+    Read a scroll document: (header without data, iterator of row blocks).
+
+    Files laid out by ``write_json`` are streamed a line at a time; any other
+    JSON document of the same shape is parsed whole.
+    """
+    first = stream.readline()
+    if first.rstrip().endswith('"data": ['):
+        header = json.loads(first.rstrip()[:-len(', "data": [')] + "}")
+
+        def rows() -> Iterator[List[Any]]:
+            for line in stream:
+                line = line.strip()
+                if line in ("]}", ""):
+                    continue
+                yield json.loads(line.rstrip(","))
+
+        return header, iter_blocks(rows(), block_rows)
+
+    document = json.loads(first + stream.read())
+    data = document.pop("data", None) or document.pop("rows", [])
+    return document, iter_blocks(data, block_rows)
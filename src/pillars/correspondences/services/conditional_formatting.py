@@ -5,12 +5,102 @@ Applies conditional cell styles based on value comparisons (GT, LT, EQ, CONTAINS
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import Callable, Iterable, List, Optional, Dict, Any, Set, Tuple
+import numpy as np
 from PyQt6.QtCore import QRect
 from PyQt6.QtGui import QColor
 
 logger = logging.getLogger(__name__)
 
+# (top, left, bottom, right) -> row-major evaluated values of that block
+ValueSource = Callable[[int, int, int, int], List[List[Any]]]
+
+# Changed cells patched one by one; beyond this the touched rules are re-evaluated whole
+_PENDING_LIMIT = 256
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _to_numbers(values: np.ndarray) -> np.ndarray:
+    """Float view of an object array; non-numbers become NaN."""
+    try:
+        return values.astype(float)
+    except (TypeError, ValueError):
+        return np.vectorize(_as_float, otypes=[float])(values)
+
+
+def _to_text(values: np.ndarray) -> np.ndarray:
+    """Lower-cased text view of an object array."""
+    return np.char.lower(values.astype(str))
+
+
+def evaluate_rule(
+    rule: "ConditionalRule",
+    values: np.ndarray,
+    numbers: Optional[np.ndarray] = None,
+    text: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Boolean match mask of one rule over a 2-D object array of cell values.
+
+    Vectorized equivalent of ConditionalManager._check_condition: empty
+    cells never match, GT/LT compare numerically (non-numbers never match),
+    EQ and CONTAINS compare case-insensitive text. ``numbers``/``text`` are
+    the block's precomputed float and lower-cased views, when shared
+    between rules.
+    """
+    empty = (values == "") | (values == None)  # noqa: E711 (elementwise)
+    rt = str(rule.rule_type).upper()
+    if rt in ("GT", "LT"):
+        threshold = _as_float(rule.value)
+        if np.isnan(threshold):
+            return np.zeros(values.shape, dtype=bool)
+        numbers = _to_numbers(values) if numbers is None else numbers
+        with np.errstate(invalid="ignore"):
+            matched = numbers > threshold if rt == "GT" else numbers < threshold
+    elif rt in ("EQ", "CONTAINS"):
+        text = _to_text(values) if text is None else text
+        target = str(rule.value).lower()
+        matched = (text == target) if rt == "EQ" else (np.char.find(text, target) >= 0)
+    else:
+        return np.zeros(values.shape, dtype=bool)
+    return matched & ~empty
+
+
+class _Block:
+    """Values of one sheet region, with float and text views computed once on demand."""
+
+    def __init__(self, top: int, left: int, rows: List[List[Any]]):
+        self.top, self.left = top, left
+        self.values = np.empty((len(rows), len(rows[0]) if rows else 0), dtype=object)
+        self.values[:, :] = rows
+        self._numbers: Optional[np.ndarray] = None
+        self._text: Optional[np.ndarray] = None
+
+    def covers(self, t: int, l: int, b: int, r: int) -> bool:
+        bottom, right = self.top + self.values.shape[0] - 1, self.left + self.values.shape[1] - 1
+        return self.top <= t and self.left <= l and b <= bottom and r <= right
+
+    def evaluate(self, rule: "ConditionalRule", t: int, l: int, b: int, r: int) -> np.ndarray:
+        window = (slice(t - self.top, b - self.top + 1), slice(l - self.left, r - self.left + 1))
+        rt = str(rule.rule_type).upper()
+        if rt in ("GT", "LT") and self._numbers is None:
+            self._numbers = _to_numbers(self.values)
+        if rt in ("EQ", "CONTAINS") and self._text is None:
+            self._text = _to_text(self.values)
+        return evaluate_rule(
+            rule,
+            self.values[window],
+            None if self._numbers is None else self._numbers[window],
+            None if self._text is None else self._text[window],
+        )
+
+
 @dataclass
 class ConditionalRule:
     """
@@ -25,6 +115,12 @@ class ConditionalRule:
 class ConditionalManager:
     """
     Evaluates rules against cell values.
+    
+    Each rule is evaluated over its whole range at once (``evaluate_rule``)
+    and the first-match-wins result is cached as a {(row, col): style} map,
+    so painting a cell is one dictionary lookup. The cache is kept until the
+    model reports changed cells (``invalidate_cells``) or a moved region
+    (``invalidate_region``); only the affected cells or rules are redone.
     """
     def __init__(self):
         """
@@ -32,6 +128,9 @@ class ConditionalManager:
         
         """
         self.rules: List[ConditionalRule] = []
+        self._masks: List[Optional[List[np.ndarray]]] = []  # Per rule, per range; None = stale
+        self._styles: Optional[Dict[Tuple[int, int], Dict[str, Any]]] = {}  # None = rebuild
+        self._pending: Set[Tuple[int, int]] = set()
 
     def add_rule(self, rule: ConditionalRule):
         """
@@ -42,6 +141,8 @@ class ConditionalManager:
         
         """
         self.rules.append(rule)
+        self._masks.append(None)
+        self._styles = None
 
     def clear_all_rules(self):
         """
@@ -49,6 +150,101 @@ class ConditionalManager:
         
         """
         self.rules = []
+        self._masks = []
+        self._styles = {}
+        self._pending.clear()
+
+    def invalidate_all(self):
+        """Re-evaluate every rule on the next lookup."""
+        self._masks = [None] * len(self.rules)
+        self._styles = None
+        self._pending.clear()
+
+    def invalidate_region(self, top, left, bottom=None, right=None):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+        """Re-evaluate the rules whose ranges meet a region (None extends it to the sheet edge)."""
+        bottom = float('inf') if bottom is None else bottom
+        right = float('inf') if right is None else right
+        for i, rule in enumerate(self.rules):
+            if any(t <= bottom and top <= b and l <= right and left <= r for t, l, b, r in rule.ranges):  # type: ignore[reportUnknownVariableType]
+                self._masks[i] = None
+                self._styles = None
+
+    def invalidate_cells(self, cells: Iterable[Tuple[int, int]]):
+        """Re-check changed cells against the rules covering them on the next lookup."""
+        if not self.rules:
+            return
+        for row, col in cells:
+            for rule in self.rules:
+                if any(t <= row <= b and l <= col <= r for t, l, b, r in rule.ranges):  # type: ignore[reportUnknownVariableType]
+                    self._pending.add((row, col))
+                    break
+        if len(self._pending) > _PENDING_LIMIT:
+            for row, col in self._pending:
+                self.invalidate_region(row, col, row, col)
+            self._pending.clear()
+
+    def style_at(self, row: int, col: int, values: ValueSource) -> Optional[Dict[str, Any]]:
+        """
+        Cached format dict of a cell, or None.
+        
+        Args:
+            row, col: The cell
+            values: Supplies evaluated cell values for rules that need (re)evaluating
+        """
+        if not self.rules:
+            return None
+        if self._pending or self._styles is None:
+            self._refresh(values)
+        return self._styles.get((row, col))  # type: ignore[union-attr]
+
+    def _refresh(self, values: ValueSource):
+        # 1. Patch single changed cells into the masks that are still valid
+        for row, col in self._pending:
+            value = values(row, col, row, col)[0][0]
+            match = None
+            for i, rule in enumerate(self.rules):
+                covered = False
+                for k, (t, l, b, r) in enumerate(rule.ranges):  # type: ignore[reportUnknownVariableType]
+                    if t <= row <= b and l <= col <= r:
+                        covered = True
+                        if self._masks[i] is not None:
+                            self._masks[i][k][row - t, col - l] = self._check_condition(rule, value)  # type: ignore[index]
+                if covered and match is None and self._check_condition(rule, value):
+                    match = rule.format_style
+            if self._styles is not None:
+                if match is None:
+                    self._styles.pop((row, col), None)
+                else:
+                    self._styles[(row, col)] = match
+        self._pending.clear()
+
+        # 2. Re-evaluate stale rules over their whole ranges. Ranges are read
+        #    once through a shared bounding block when they mostly overlap.
+        stale = [i for i, masks in enumerate(self._masks) if masks is None]
+        if stale:
+            ranges = [span for i in stale for span in self.rules[i].ranges]
+            top, left = min(t for t, _, _, _ in ranges), min(l for _, l, _, _ in ranges)
+            bottom, right = max(b for _, _, b, _ in ranges), max(r for _, _, _, r in ranges)
+            area = sum((b - t + 1) * (r - l + 1) for t, l, b, r in set(ranges))
+            shared = None
+            if (bottom - top + 1) * (right - left + 1) <= 2 * area:
+                shared = _Block(top, left, values(top, left, bottom, right))
+            for i in stale:
+                masks = []
+                for t, l, b, r in self.rules[i].ranges:  # type: ignore[reportUnknownVariableType]
+                    block = shared if shared is not None else _Block(t, l, values(t, l, b, r))
+                    masks.append(block.evaluate(self.rules[i], t, l, b, r))
+                self._masks[i] = masks
+
+        # 3. Compose first-match-wins styles (later rules only fill unclaimed cells)
+        if self._styles is None:
+            styles: Dict[Tuple[int, int], Dict[str, Any]] = {}
+            for rule, masks in zip(self.rules, self._masks):
+                for (t, l, _b, _r), mask in zip(rule.ranges, masks):  # type: ignore[arg-type, reportUnknownVariableType]
+                    rows, cols = np.nonzero(mask)
+                    for cell in zip((rows + t).tolist(), (cols + l).tolist()):
+                        styles.setdefault(cell, rule.format_style)
+            self._styles = styles
 
     def get_style(self, row, col, value) -> Optional[Dict[str, Any]]:  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
         """Returns format dict if any rule matches, else None."""
@@ -0,0 +1,147 @@
+"""
+Dependency Graph - The Web of Precedents.
+Tracks which formula cells read which cells and ranges, so an edit recalculates only its dependents.
+"""
+import sys
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+Cell = Tuple[int, int]
+CellRange = Tuple[int, int, int, int]  # (top, left, bottom, right), inclusive
+
+# Ranges are indexed per column in blocks of this many rows
+_BUCKET_ROWS = 64
+
+
+class DependencyGraph:
+    """
+    Precedent/dependent graph of a sheet's formula cells.
+
+    Each formula cell registers the cells and ranges it reads (from its
+    parsed formula). Single-cell references are kept in a reverse map;
+    ranges are indexed by (column, row block), so finding the formulas that
+    read a cell only scans the ranges near it.
+    """
+
+    def __init__(self):
+        """Start with no registered formulas."""
+        self._precedents: Dict[Cell, Tuple[FrozenSet[Cell], Tuple[CellRange, ...]]] = {}
+        self._cell_dependents: Dict[Cell, Set[Cell]] = {}
+        self._range_buckets: Dict[Tuple[int, int], Set[Tuple[CellRange, Cell]]] = {}
+        self._volatile: Set[Cell] = set()
+
+    def __len__(self) -> int:
+        return len(self._precedents)
+
+    def __contains__(self, cell: Cell) -> bool:
+        return cell in self._precedents
+
+    @property
+    def volatile_cells(self) -> Set[Cell]:
+        """Formula cells that must recalculate on every change (e.g. live data)."""
+        return set(self._volatile)
+
+    def set_precedents(
+        self,
+        cell: Cell,
+        cells: Iterable[Cell],
+        ranges: Iterable[CellRange],
+        volatile: bool = False,
+    ) -> None:
+        """Register (or replace) what a formula cell reads."""
+        self.remove(cell)
+        refs = frozenset(cells)
+        spans = tuple(set(ranges))
+        self._precedents[cell] = (refs, spans)
+        for ref in refs:
+            self._cell_dependents.setdefault(ref, set()).add(cell)
+        for span in spans:
+            for bucket in self._buckets(span):
+                self._range_buckets.setdefault(bucket, set()).add((span, cell))
+        if volatile:
+            self._volatile.add(cell)
+
+    def remove(self, cell: Cell) -> None:
+        """Forget a formula cell's precedents (its formula changed or moved)."""
+        entry = self._precedents.pop(cell, None)
+        self._volatile.discard(cell)
+        if entry is None:
+            return
+        refs, spans = entry
+        for ref in refs:
+            dependents = self._cell_dependents.get(ref)
+            if dependents is not None:
+                dependents.discard(cell)
+                if not dependents:
+                    del self._cell_dependents[ref]
+        for span in spans:
+            for bucket in self._buckets(span):
+                entries = self._range_buckets.get(bucket)
+                if entries is None:
+                    continue
+                entries.discard((span, cell))
+                if not entries:
+                    del self._range_buckets[bucket]
+
+    def clear(self) -> None:
+        self._precedents.clear()
+        self._cell_dependents.clear()
+        self._range_buckets.clear()
+        self._volatile.clear()
+
+    def direct_dependents(self, cell: Cell) -> Set[Cell]:
+        """Formula cells that read ``cell`` directly or through a range."""
+        row, col = cell
+        found = set(self._cell_dependents.get(cell, ()))
+        for (top, left, bottom, right), dependent in self._range_buckets.get((col, row // _BUCKET_ROWS), ()):
+            if top <= row <= bottom and left <= col <= right:
+                found.add(dependent)
+        return found
+
+    def dependents_of_region(
+        self,
+        top: int,
+        left: int,
+        bottom: Optional[int] = None,
+        right: Optional[int] = None,
+    ) -> Set[Cell]:
+        """Formula cells reading anything inside a region (``None`` extends it to the sheet edge)."""
+        max_row = bottom if bottom is not None else sys.maxsize
+        max_col = right if right is not None else sys.maxsize
+        found: Set[Cell] = set()
+        for cell, (refs, spans) in self._precedents.items():
+            if any(top <= r <= max_row and left <= c <= max_col for r, c in refs) or any(
+                r1 <= max_row and top <= r2 and c1 <= max_col and left <= c2 for r1, c1, r2, c2 in spans
+            ):
+                found.add(cell)
+        return found
+
+    def cells_in_region(
+        self,
+        top: int,
+        left: int,
+        bottom: Optional[int] = None,
+        right: Optional[int] = None,
+    ) -> List[Cell]:
+        """Registered formula cells located inside a region."""
+        max_row = bottom if bottom is not None else sys.maxsize
+        max_col = right if right is not None else sys.maxsize
+        return [(r, c) for r, c in self._precedents if top <= r <= max_row and left <= c <= max_col]
+
+    def transitive_dependents(self, cells: Iterable[Cell]) -> Set[Cell]:
+        """Every formula cell that depends on ``cells``, directly or through other formulas."""
+        found: Set[Cell] = set()
+        queue = deque(cells)
+        while queue:
+            for dependent in self.direct_dependents(queue.popleft()):
+                if dependent not in found:
+                    found.add(dependent)
+                    queue.append(dependent)
+        return found
+
+    @staticmethod
+    def _buckets(span: CellRange) -> Iterable[Tuple[int, int]]:
+        top, left, bottom, right = span
+        for col in range(left, right + 1):
+            for block in range(top // _BUCKET_ROWS, bottom // _BUCKET_ROWS + 1):
+                yield (col, block)
@@ -5,7 +5,8 @@ Recursive descent parser and evaluator for spreadsheet formulas with cross-pilla
 import re
 import math
 import logging
-from typing import Any, Dict, Callable, NamedTuple, List, Optional, Set, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Callable, FrozenSet, NamedTuple, List, Optional, Set, Tuple
 from enum import Enum, auto
 
 logger = logging.getLogger(__name__)
@@ -207,27 +208,56 @@ class Tokenizer:
         tokens.append(Token(TokenType.EOF, ""))
         return tokens
 
+# --- Parsed formulas ---
+# The parser builds a small tree of these nodes; FormulaEngine walks it.
+
+class Literal(NamedTuple):
+    """A number, string or boolean constant."""
+    value: Any
+
+class CellRef(NamedTuple):
+    """A single reference such as A1 or $B$2 (or a bare name)."""
+    name: str
+
+class RangeRef(NamedTuple):
+    """A range such as A1:B10."""
+    start: str
+    end: str
+
+class Call(NamedTuple):
+    """A function call; an omitted argument is None."""
+    name: str
+    args: Tuple[Any, ...]
+
+class Negate(NamedTuple):
+    """Unary minus."""
+    operand: Any
+
+class BinaryOp(NamedTuple):
+    """A binary operator applied to two nodes."""
+    op: str
+    left: Any
+    right: Any
+
+
 class Parser:
     """
     Parser class definition.
     
     Attributes:
-        engine: Description of engine.
         tokens: Description of tokens.
         pos: Description of pos.
         current_token: Description of current_token.
     
     """
-    def __init__(self, engine, tokens: List[Token]):
+    def __init__(self, tokens: List[Token]):
         """
           init   logic.
         
         Args:
-            engine: Description of engine.
             tokens: Description of tokens.
         
         """
-        self.engine = engine
         self.tokens = tokens
         self.pos = 0
         self.current_token = self.tokens[0]
@@ -274,14 +304,7 @@ class Parser:
         while self.current_token.type == TokenType.OP and self.current_token.value in ('=', '>', '<', '>=', '<=', '<>'):
             op = self.current_token.value
             self.eat(TokenType.OP)
-            right = self.concatenation()
-            
-            # Simple eval
-            if op == '=': node = (node == right)
-            elif op == '>': node = (node > right)
-            elif op == '<': node = (node < right)
-            elif op == '>=': node = (node >= right)
-            elif op == '<=': node = (node <= right)
+            node = BinaryOp(op, node, self.concatenation())
             
         return node
         
@@ -293,8 +316,7 @@ class Parser:
         node = self.additive()
         while self.current_token.type == TokenType.OP and self.current_token.value == '&':
             self.eat(TokenType.OP)
-            right = self.additive()
-            node = str(node) + str(right)
+            node = BinaryOp('&', node, self.additive())
         return node
 
     def additive(self):
@@ -306,9 +328,7 @@ class Parser:
         while self.current_token.type == TokenType.OP and self.current_token.value in ('+', '-'):
             op = self.current_token.value
             self.eat(TokenType.OP)
-            right = self.multiplicative()
-            if op == '+': node = self._safe_add(node, right)
-            elif op == '-': node = self._safe_sub(node, right)
+            node = BinaryOp(op, node, self.multiplicative())
         return node
 
     def multiplicative(self):
@@ -320,9 +340,7 @@ class Parser:
         while self.current_token.type == TokenType.OP and self.current_token.value in ('*', '/'):
             op = self.current_token.value
             self.eat(TokenType.OP)
-            right = self.power()
-            if op == '*': node = self._safe_mul(node, right)
-            elif op == '/': node = self._safe_div(node, right)
+            node = BinaryOp(op, node, self.power())
         return node
 
     def power(self):
@@ -333,8 +351,8 @@ class Parser:
         node = self.atom()
         while self.current_token.type == TokenType.OP and self.current_token.value == '^':
             self.eat(TokenType.OP)
-            right = self.atom() # Right associative? Standard is left usually for 2^3^4? Let's do left for now.
-            node = self._safe_pow(node, right)
+            # Left associative: 2^3^4 is (2^3)^4
+            node = BinaryOp('^', node, self.atom())
         return node
 
     def atom(self):
@@ -346,11 +364,11 @@ class Parser:
         
         if token.type == TokenType.NUMBER:
             self.eat(TokenType.NUMBER)
-            return float(token.value) if '.' in token.value else int(token.value)
+            return Literal(float(token.value) if '.' in token.value else int(token.value))
         
         elif token.type == TokenType.STRING:
             self.eat(TokenType.STRING)
-            return token.value
+            return Literal(token.value)
             
         elif token.type == TokenType.ID:
             # Could be CellRef or Function Call
@@ -379,13 +397,7 @@ class Parser:
                         else:
                              args.append(self.expr())
                 self.eat(TokenType.RPAREN)
-                
-                # Execute Function
-                func = FormulaRegistry.get(name)
-                if func:
-                    return func(self.engine, *args)  # type: ignore[reportUnknownArgumentType, reportUnknownMemberType, reportUnknownVariableType]
-                else:
-                    raise ValueError(f"Unknown function: {name}")
+                return Call(name, tuple(args))
             
             elif self.current_token.type == TokenType.OP and self.current_token.value == ':':
                  # Range: A1:B2
@@ -398,16 +410,14 @@ class Parser:
                  
                  end_cell = self.current_token.value
                  self.eat(TokenType.ID)
-                 
-                 # Resolve Range
-                 return self.engine._resolve_range_values(start_cell, end_cell)  # type: ignore[reportUnknownMemberType, reportUnknownVariableType]
+                 return RangeRef(start_cell, end_cell)
             
             else:
                  # Single Cell Ref OR Boolean Constant
-                 if name.upper() == "TRUE": return True
-                 if name.upper() == "FALSE": return False
+                 if name.upper() == "TRUE": return Literal(True)
+                 if name.upper() == "FALSE": return Literal(False)
                  
-                 return self.engine._resolve_cell_value(name)  # type: ignore[reportUnknownMemberType, reportUnknownVariableType]
+                 return CellRef(name)
 
         elif token.type == TokenType.LPAREN:
             self.eat(TokenType.LPAREN)
@@ -422,48 +432,146 @@ class Parser:
             # Handle unary minus check?
             if token.type == TokenType.OP and token.value == '-':
                 self.eat(TokenType.OP)
-                return -self.atom()
+                return Negate(self.atom())
             
             raise ValueError(f"Unexpected token: {token}")
 
-    # --- Safe Helpers ---
-    def _safe_add(self, a, b):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
-        """Add two values, falling back to string concatenation if not numeric."""
-        try:
-            return float(a) + float(b)
-        except (TypeError, ValueError):
-            return str(a) + str(b)
 
-    def _safe_sub(self, a, b):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
-        """Subtract b from a, returning #VALUE! on type error."""
-        try:
-            return float(a) - float(b)
-        except (TypeError, ValueError):
-            return "#VALUE!"
+# --- Safe Helpers ---
+def _safe_add(a, b):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+    """Add two values, falling back to string concatenation if not numeric."""
+    try:
+        return float(a) + float(b)
+    except (TypeError, ValueError):
+        return str(a) + str(b)
 
-    def _safe_mul(self, a, b):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
-        """Multiply two values, returning #VALUE! on type error."""
-        try:
-            return float(a) * float(b)
-        except (TypeError, ValueError):
-            return "#VALUE!"
+def _safe_sub(a, b):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+    """Subtract b from a, returning #VALUE! on type error."""
+    try:
+        return float(a) - float(b)
+    except (TypeError, ValueError):
+        return "#VALUE!"
 
-    def _safe_div(self, a, b):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
-        """Divide a by b, returning #DIV/0! on zero or #VALUE! on type error."""
-        try:
-            divisor = float(b)
-            if divisor == 0:
-                return "#DIV/0!"
-            return float(a) / divisor
-        except (TypeError, ValueError):
-            return "#VALUE!"
+def _safe_mul(a, b):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+    """Multiply two values, returning #VALUE! on type error."""
+    try:
+        return float(a) * float(b)
+    except (TypeError, ValueError):
+        return "#VALUE!"
 
-    def _safe_pow(self, a, b):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
-        """Raise a to power b, returning #VALUE! on error."""
-        try:
-            return float(a) ** float(b)
-        except (TypeError, ValueError, OverflowError):
-            return "#VALUE!"
+def _safe_div(a, b):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+    """Divide a by b, returning #DIV/0! on zero or #VALUE! on type error."""
+    try:
+        divisor = float(b)
+        if divisor == 0:
+            return "#DIV/0!"
+        return float(a) / divisor
+    except (TypeError, ValueError):
+        return "#VALUE!"
+
+def _safe_pow(a, b):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+    """Raise a to power b, returning #VALUE! on error."""
+    try:
+        return float(a) ** float(b)
+    except (TypeError, ValueError, OverflowError):
+        return "#VALUE!"
+
+_BINARY_OPS: Dict[str, Callable[[Any, Any], Any]] = {
+    '=': lambda a, b: a == b,
+    '<>': lambda a, b: a != b,
+    '>': lambda a, b: a > b,
+    '<': lambda a, b: a < b,
+    '>=': lambda a, b: a >= b,
+    '<=': lambda a, b: a <= b,
+    '&': lambda a, b: str(a) + str(b),
+    '+': _safe_add,
+    '-': _safe_sub,
+    '*': _safe_mul,
+    '/': _safe_div,
+    '^': _safe_pow,
+}
+
+
+# --- Parse cache ---
+
+_REF_RE = re.compile(r'(\$?)([A-Z]+)(\$?)([0-9]+)', re.IGNORECASE)
+
+# Functions whose value can change without any cell changing
+VOLATILE_FUNCTIONS = frozenset({"ASTRO"})
+
+class ParsedFormula(NamedTuple):
+    """A parsed formula body and the references it reads."""
+    root: Any                                      # AST node (None if parsing failed)
+    error: Optional[str]                           # Parse error message
+    cells: FrozenSet[Tuple[int, int]]              # Single-cell references, zero-based (row, col)
+    ranges: Tuple[Tuple[int, int, int, int], ...]  # (top, left, bottom, right) of each range read
+    volatile: bool                                 # Calls a volatile function
+
+_PARSE_CACHE: "OrderedDict[str, ParsedFormula]" = OrderedDict()
+_PARSE_CACHE_SIZE = 20000
+
+
+def ref_to_rc(ref: str) -> Optional[Tuple[int, int]]:
+    """Zero-based (row, col) of a reference like A1 or $B$2, or None if it is not one."""
+    match = _REF_RE.match(ref)
+    if not match:
+        return None
+    return FormulaEngine._to_rc(match.group(4), match.group(2))
+
+
+def _collect_references(node, cells: Set[Tuple[int, int]], ranges: List[Tuple[int, int, int, int]], calls: Set[str]) -> None:
+    kind = type(node)
+    if kind is CellRef:
+        rc = ref_to_rc(node.name)
+        if rc is not None:
+            cells.add(rc)
+    elif kind is RangeRef:
+        start, end = ref_to_rc(node.start), ref_to_rc(node.end)
+        if start is not None and end is not None:
+            top, bottom = min(start[0], end[0]), max(start[0], end[0])
+            left, right = min(start[1], end[1]), max(start[1], end[1])
+            # Oversized ranges evaluate to #REF! without reading any cell
+            if (bottom - top + 1) * (right - left + 1) <= FormulaEngine.MAX_RANGE_CELLS:
+                ranges.append((top, left, bottom, right))
+    elif kind is Call:
+        calls.add(node.name.upper())
+        for arg in node.args:
+            if arg is not None:
+                _collect_references(arg, cells, ranges, calls)
+    elif kind is Negate:
+        _collect_references(node.operand, cells, ranges, calls)
+    elif kind is BinaryOp:
+        _collect_references(node.left, cells, ranges, calls)
+        _collect_references(node.right, cells, ranges, calls)
+
+
+def parse_formula(formula: str) -> ParsedFormula:
+    """
+    Parse a formula body (the text after '='), memoized by text.
+
+    Cells with the same formula text share one parse, and a sheet is
+    re-evaluated without re-tokenizing anything.
+    """
+    parsed = _PARSE_CACHE.get(formula)
+    if parsed is not None:
+        _PARSE_CACHE.move_to_end(formula)
+        return parsed
+
+    try:
+        root = Parser(Tokenizer.tokenize(formula)).parse()
+    except Exception as e:
+        parsed = ParsedFormula(None, str(e), frozenset(), (), False)
+    else:
+        cells: Set[Tuple[int, int]] = set()
+        ranges: List[Tuple[int, int, int, int]] = []
+        calls: Set[str] = set()
+        _collect_references(root, cells, ranges, calls)
+        parsed = ParsedFormula(root, None, frozenset(cells), tuple(ranges), bool(calls & VOLATILE_FUNCTIONS))
+
+    _PARSE_CACHE[formula] = parsed
+    if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+        _PARSE_CACHE.popitem(last=False)
+    return parsed
 
 
 class FormulaEngine:
@@ -475,6 +583,7 @@ class FormulaEngine:
     # Performance configuration
     MAX_RECURSION_DEPTH = 100  # Maximum formula dependency depth
     MAX_EVAL_COUNT = 5000  # Maximum cell evaluations per formula
+    MAX_RANGE_CELLS = 10000  # Maximum cells in one range reference
     
     def __init__(self, data_context: Dict[str, Any]):
         """Initialize the formula engine with a data context."""
@@ -515,10 +624,10 @@ class FormulaEngine:
         self._eval_count += 1
         
         try:
-            tokens = Tokenizer.tokenize(formula)
-            parser = Parser(self, tokens)
-            result = parser.parse()
-            return result
+            parsed = parse_formula(formula)
+            if parsed.error is not None:
+                raise ValueError(parsed.error)
+            return self._eval_node(parsed.root)
         except Exception as e:
             logger.error(f"Formula evaluation error: {e}", exc_info=True)
             return f"#ERROR: {str(e)}"
@@ -533,9 +642,29 @@ class FormulaEngine:
                     logger.info(f"Formula evaluation completed: {self._eval_count} cells")
                 self._eval_count = 0
 
+    def _eval_node(self, node) -> Any:  # type: ignore[reportMissingParameterType]
+        """Evaluate a parsed node; operands are evaluated left to right."""
+        kind = type(node)
+        if kind is Literal:
+            return node.value
+        if kind is CellRef:
+            return self._resolve_cell_value(node.name)
+        if kind is RangeRef:
+            return self._resolve_range_values(node.start, node.end)
+        if kind is Call:
+            args = [None if arg is None else self._eval_node(arg) for arg in node.args]
+            func = FormulaRegistry.get(node.name)
+            if func:
+                return func(self, *args)  # type: ignore[reportUnknownArgumentType, reportUnknownMemberType, reportUnknownVariableType]
+            raise ValueError(f"Unknown function: {node.name}")
+        if kind is Negate:
+            return -self._eval_node(node.operand)
+        left = self._eval_node(node.left)
+        return _BINARY_OPS[node.op](left, self._eval_node(node.right))
+
     def _resolve_cell_value(self, ref: str):
         # A1 -> Val, $A$1 -> Val
-        match = re.match(r'(\$?)([A-Z]+)(\$?)([0-9]+)', ref, re.IGNORECASE)
+        match = _REF_RE.match(ref)
         if not match: return ref # Return as string if not valid ref
         
         _abs_col, c_str, _abs_row, r_str = match.groups()  # type: ignore  # 4 errors
@@ -556,8 +685,8 @@ class FormulaEngine:
         Performance guard: Limits range size to prevent excessive calculations.
         """
         # A1:B2 -> [Val, Val, ...]
-        m1 = re.match(r'(\$?)([A-Z]+)(\$?)([0-9]+)', start_ref, re.IGNORECASE)
-        m2 = re.match(r'(\$?)([A-Z]+)(\$?)([0-9]+)', end_ref, re.IGNORECASE)
+        m1 = _REF_RE.match(start_ref)
+        m2 = _REF_RE.match(end_ref)
         
         if not m1 or not m2:
              return []
@@ -574,11 +703,10 @@ class FormulaEngine:
         cols = c_end - c_start + 1
         cell_count = rows * cols
         
-        MAX_RANGE_CELLS = 10000  # Configurable limit
-        if cell_count > MAX_RANGE_CELLS:
+        if cell_count > self.MAX_RANGE_CELLS:
             logger.warning(
                 f"Range {start_ref}:{end_ref} contains {cell_count} cells "
-                f"(limit: {MAX_RANGE_CELLS}). This may cause performance issues."
+                f"(limit: {self.MAX_RANGE_CELLS}). This may cause performance issues."
             )
             # Return error instead of attempting evaluation
             return ["#REF!"]  # Excel error for invalid range reference
@@ -597,7 +725,8 @@ class FormulaEngine:
                     values.append(val)
         return values
 
-    def _to_rc(self, r_str, c_str):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+    @staticmethod
+    def _to_rc(r_str, c_str):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
         """Convert spreadsheet refs (A1, AA10) to zero-based row/col."""
         c_idx = 0
         for char in c_str.upper():
@@ -635,8 +764,8 @@ def get_error(*args):
     return None
 
 
-@FormulaRegistry.register("GEMATRIA", "Calculates Gematria.", "GEMATRIA(text, [cipher])", "Esoteric", [
-    ArgumentMetadata("text", "Text/Cell", "str"),
+@FormulaRegistry.register("GEMATRIA", "Calculates Gematria; a range sums the value of each cell.", "GEMATRIA(text, [cipher])", "Esoteric", [
+    ArgumentMetadata("text", "Text/Cell/Range", "str"),
     ArgumentMetadata("cipher", "Cipher Name", "gematria_cipher", True)
 ])
 def func_gematria(engine: FormulaEngine, text: Any, cipher: str = "English (TQ)"):
@@ -644,27 +773,39 @@ def func_gematria(engine: FormulaEngine, text: Any, cipher: str = "English (TQ)"
     Calculates the Gematria value of the text via Signal Bus.
     
     Uses the GematriaBus to request calculations without directly importing
-    the Gematria pillar, preserving architectural sovereignty.
+    the Gematria pillar, preserving architectural sovereignty. The bus's
+    synchronous path calls the Gematria pillar's registered resolver in-process
+    and memoizes (text, cipher) results, so a column of formulas costs no
+    event-loop round trips. A range argument is resolved in one batched call
+    and the values of its non-empty cells are summed.
     
     Args:
         engine: The formula engine context
-        text: The text to calculate
+        text: The text to calculate, or a range of texts
         cipher: The cipher name (default: "English (TQ)")
         
     Returns:
         int: The calculated Gematria value
         str: Error message if calculation fails (e.g., "#CIPHER?", "#TIMEOUT!")
     """
-    if not text:
-        return 0
-    
-    text_str = str(text)
     cipher_str = str(cipher)
     
-    # Request calculation via Signal Bus
-    result = gematria_bus.request_calculation(text_str, cipher_str)
+    if isinstance(text, list):
+        err = get_error(text)
+        if err:
+            return err
+        texts = [str(t) for t in text if t not in (None, "")]
+        total = 0
+        for value in gematria_bus.calculate_many(texts, cipher_str):
+            if isinstance(value, str):
+                return value
+            total += value
+        return total
+    
+    if not text:
+        return 0
     
-    return result
+    return gematria_bus.calculate(str(text), cipher_str)
 
 @FormulaRegistry.register(
     "ASTRO", 
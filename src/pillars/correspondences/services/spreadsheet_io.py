@@ -1,8 +1,8 @@
-import csv
-import json
 from PyQt6.QtWidgets import QFileDialog, QMessageBox
 from PyQt6.QtCore import Qt
 
+from pillars.correspondences.services.cell_store import iter_csv_blocks, write_csv, write_json
+
 class SpreadsheetIO:
     """
     Service for handling Spreadsheet Import/Export operations.
@@ -16,18 +16,9 @@ class SpreadsheetIO:
         if not path: return
 
         try:
+            # Rows stream straight from the model's raw values, a block at a time
             with open(path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                rows = model.rowCount()
-                cols = model.columnCount()
-                
-                for r in range(rows):
-                    row_data = []
-                    for c in range(cols):
-                        idx = model.index(r, c)
-                        val = model.data(idx, Qt.ItemDataRole.EditRole)
-                        row_data.append(val if val is not None else "")
-                    writer.writerow(row_data)
+                write_csv(f, model.iter_raw_rows())
                     
             QMessageBox.information(window, "Export Successful", f"Saved to {path}")
         except Exception as e:
@@ -40,12 +31,16 @@ class SpreadsheetIO:
         if not path: return
         
         try:
-            # model.to_json() should exist on the model
-            data = model.to_json()
-            data['name'] = getattr(model, "scroll_name", "Sheet")
-
+            # Same {name, columns, styles, data} document as model.to_json(),
+            # written a row per line as the rows are read
             with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+                write_json(
+                    f,
+                    getattr(model, "scroll_name", "Sheet"),
+                    model._columns,
+                    model.iter_raw_rows(),
+                    model._styles,
+                )
             
             QMessageBox.information(window, "Export Successful", f"Saved to {path}")
         except Exception as e:
@@ -71,24 +66,27 @@ class SpreadsheetIO:
         if not path: return
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                data = list(reader)
-                
-            if not data: return
-            
-            r_count = len(data)
-            c_count = max(len(row) for row in data)
-            
-            # Resize model if needed
-            if r_count > model.rowCount():
-                model.setRowCount(r_count)
-            if c_count > model.columnCount():
-                model.setColumnCount(c_count)
+            r_count = c_count = 0
+            # One undo step; rows are applied a block at a time as they are read
+            model.undo_stack.beginMacro("Import CSV")
+            try:
+                with open(path, 'r', encoding='utf-8', newline='') as f:
+                    for block in iter_csv_blocks(f):
+                        width = max(len(row) for row in block)
+                        # Grow the grid if needed
+                        if r_count + len(block) > model.rowCount():
+                            model.insertRows(model.rowCount(), r_count + len(block) - model.rowCount())
+                        if width > model.columnCount():
+                            model.insertColumns(model.columnCount(), width - model.columnCount())
+                        for r, row in enumerate(block, start=r_count):
+                            for c, val in enumerate(row):
+                                model.setData(model.index(r, c), val, Qt.ItemDataRole.EditRole)
+                        r_count += len(block)
+                        c_count = max(c_count, width)
+            finally:
+                model.undo_stack.endMacro()
                 
-            for r, row in enumerate(data):
-                for c, val in enumerate(row):
-                    model.setData(model.index(r, c), val, Qt.ItemDataRole.EditRole)
+            if not r_count: return
                     
             QMessageBox.information(window, "Import Successful", f"Loaded {r_count}x{c_count} grid.")
             
@@ -2,10 +2,19 @@
 Table Service - The Steward of the Tablets.
 Service layer mediating between UI and TableRepository for correspondence table operations.
 """
+import csv
+import logging
 from sqlalchemy.orm import Session
 from pillars.correspondences.repos.table_repository import TableRepository
+from pillars.correspondences.repos.cell_repository import CellRepository
 from pillars.correspondences.models.correspondence_models import CorrespondenceTable
-from typing import List, Optional, Dict, Any
+from pillars.correspondences.services.cell_store import (
+    LAYOUT_VERSION, ScrollDelta, empty_scroll, is_cell_store_layout, iter_blocks,
+    iter_grid_records, place_record, scroll_layout, split_scrolls, write_csv,
+)
+from typing import List, Optional, Dict, Any, Iterator, TextIO
+
+logger = logging.getLogger(__name__)
 
 class TableService:
     """
@@ -23,10 +32,13 @@ class TableService:
         """
         self.session = session
         self.repo = TableRepository(session)
+        self.cells = CellRepository(session)
 
     def create_table(self, name: str, content: Dict[str, Any]) -> CorrespondenceTable:
-        """Create a new correspondence table."""
-        return self.repo.create(name, content)
+        """Create a new correspondence table; its grid goes straight into the cell store."""
+        table = self.repo.create(name, {})
+        self._store_grid(table, content)
+        return table
 
     def list_tables(self) -> List[CorrespondenceTable]:
         """Retrieve all scrolls from the library."""
@@ -37,8 +49,150 @@ class TableService:
         return self.repo.get_by_id(table_id)
 
     def save_content(self, table_id: str, content: Dict[str, Any]) -> Optional[CorrespondenceTable]:
-        """Update the content of a scroll."""
-        return self.repo.update_content(table_id, content)
+        """
+        Replace the whole grid of a table.
+        
+        Rewrites every cell; editors should prefer ``save_scrolls``, which
+        writes only what changed.
+        """
+        table = self.repo.get_by_id(table_id)
+        if not table:
+            return None
+        self._store_grid(table, content)
+        return table
+
+    def load_content(self, table_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Assemble a table's scrolls from the cell store.
+        
+        Legacy tables (whole grid in the content blob) are migrated on first
+        load. Returns multi-scroll content ({"scrolls": [{name, columns, data,
+        styles}], ...}) flagged with ``"cell_store": True``.
+        """
+        table = self.repo.get_by_id(table_id)
+        if not table:
+            return None
+        if not is_cell_store_layout(table.content):
+            self.migrate_table(table)
+
+        layout = table.content
+        scrolls = [empty_scroll(entry) for entry in layout.get("scrolls", [])]
+        for index, record in self.cells.iter_cells(table_id):
+            if index < len(scrolls):
+                place_record(scrolls[index], record)
+        return {
+            "format_version": LAYOUT_VERSION,
+            "cell_store": True,
+            "active_scroll_index": layout.get("active_scroll_index", 0),
+            "scrolls": scrolls,
+        }
+
+    def migrate_table(self, table: CorrespondenceTable) -> int:
+        """Move a legacy JSON grid blob into the cell store. Returns the number of cells written."""
+        written = self._store_grid(table, table.content)
+        logger.info(f"Migrated correspondence table {table.id} to the cell store ({written} cells)")
+        return written
+
+    def save_scrolls(
+        self,
+        table_id: str,
+        active_index: int,
+        layouts: List[Dict[str, Any]],
+        deltas: List[ScrollDelta],
+    ) -> Optional[CorrespondenceTable]:
+        """
+        Save an edited table: the layout plus only the changed cells of each scroll.
+        
+        Args:
+            table_id: The table to save
+            active_index: Scroll shown when the table is reopened
+            layouts: One ``scroll_layout`` entry per scroll, in order
+            deltas: One ``ScrollDelta`` per scroll (empty when unchanged)
+        """
+        for index, delta in enumerate(deltas):
+            for region in delta.regions:
+                self.cells.delete_region(table_id, index, region)
+            self.cells.insert_cells(table_id, index, delta.cells)
+        self.cells.delete_scrolls_from(table_id, len(layouts))
+        return self.repo.update_content(table_id, self._layout(active_index, layouts))
+
+    def export_csv(self, table_id: str, scroll: int, stream: TextIO) -> int:
+        """Stream one scroll from the cell store to CSV without assembling the grid."""
+        return write_csv(stream, self.iter_rows(table_id, scroll))
+
+    def iter_rows(self, table_id: str, scroll: int = 0) -> Iterator[List[Any]]:
+        """Dense rows of one stored scroll, built a row at a time from the sparse cells."""
+        table = self.repo.get_by_id(table_id)
+        if not table:
+            return
+        if not is_cell_store_layout(table.content):
+            self.migrate_table(table)
+        entries = table.content.get("scrolls", [])
+        if scroll >= len(entries):
+            return
+        width, row_count = len(entries[scroll].get("columns", [])), entries[scroll].get("row_count", 0)
+
+        current, row = 0, [""] * width
+        for _, (r, c, raw, _style) in self.cells.iter_cells(table_id, scroll):
+            if r >= row_count:
+                break
+            while current < r:
+                yield row
+                current, row = current + 1, [""] * width
+            if c < width:
+                row[c] = raw
+        while current < row_count:
+            yield row
+            current, row = current + 1, [""] * width
+
+    def import_csv(self, name: str, stream: TextIO) -> CorrespondenceTable:
+        """
+        Create a table from CSV, a block of rows at a time.
+        
+        The first row becomes the column headers, as in IngestionService.
+        """
+        reader = csv.reader(stream)
+        columns = [str(v) for v in next(reader, [])]
+        table = self.repo.create(name, {})
+
+        row_count = 0
+        for rows in iter_blocks(reader):
+            records = [(row_count + i, c, v, None) for i, row in enumerate(rows) for c, v in enumerate(row) if v != ""]
+            self.cells.insert_cells(table.id, 0, records)
+            row_count += len(rows)
+            width = max(len(row) for row in rows)
+            columns.extend(f"Column {i + 1}" for i in range(len(columns), width))
+        return self.repo.update_content(table.id, self._layout(0, [scroll_layout("Sheet1", columns, row_count)]))
+
+    @staticmethod
+    def _layout(active_index: int, layouts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "format_version": LAYOUT_VERSION,
+            "cell_store": True,
+            "active_scroll_index": active_index,
+            "scrolls": layouts,
+        }
+
+    def _store_grid(self, table: CorrespondenceTable, content: Optional[Dict[str, Any]]) -> int:
+        """Replace all cells of a table with a grid-format content dict, and store its layout."""
+        active_index, scrolls = split_scrolls(content)
+        self.cells.delete_table(table.id)
+        layouts = []
+        written = 0
+        for index, scroll in enumerate(scrolls):
+            data = scroll.get("data") or scroll.get("rows") or []
+            styles = {}
+            for key, style in (scroll.get("styles") or {}).items():
+                try:
+                    r, c = map(int, key.split(","))
+                except (AttributeError, ValueError):
+                    continue
+                styles[(r, c)] = style
+            for block in iter_blocks(iter_grid_records(data, styles), 5000):
+                written += self.cells.insert_cells(table.id, index, block)
+            layouts.append(scroll_layout(scroll.get("name", "Sheet"), scroll.get("columns", []), len(data)))
+        self.repo.update_content(table.id, self._layout(active_index, layouts))
+        return written
 
     def rename_table(self, table_id: str, new_name: str) -> Optional[CorrespondenceTable]:
         """Rename a scroll."""
@@ -46,4 +200,5 @@ class TableService:
 
     def destroy_table(self, table_id: str):
         """Destroy a scroll forever."""
+        self.cells.delete_table(table_id)
         self.repo.delete(table_id)
\ No newline at end of file
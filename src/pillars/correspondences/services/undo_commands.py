@@ -5,6 +5,21 @@ QUndoCommand implementations for reversible spreadsheet cell, row, column, and s
 from PyQt6.QtGui import QUndoCommand
 from PyQt6.QtCore import QModelIndex, Qt
 
+
+def _mark_dirty(model, top, left, bottom=None, right=None):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+    """Queue the cells a command touched for the next save (None extends to the sheet edge)."""
+    if hasattr(model, "mark_dirty"):
+        model.mark_dirty(top, left, bottom, right)
+
+
+def _invalidate(model, top, left, bottom=None, right=None):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+    """Recalculate and queue for saving the cells a command touched (None extends to the sheet edge)."""
+    if hasattr(model, "invalidate_region"):
+        model.invalidate_region(top, left, bottom, right)
+    elif hasattr(model, "clear_eval_cache"):
+        model.clear_eval_cache()
+    _mark_dirty(model, top, left, bottom, right)
+
 class SetCellDataCommand(QUndoCommand):
     """
     Command to change a single cell's value.
@@ -110,9 +125,9 @@ class SetCellDataCommand(QUndoCommand):
                 
         else:
             self.model._data[self.row][self.col] = self.new_value  # type: ignore[reportUnknownMemberType]
+            _invalidate(self.model, self.row, self.col, self.row, self.col)
             
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _mark_dirty(self.model, self.row, self.col, self.row, self.col)
         self.model.dataChanged.emit(idx, idx, [self.role])
 
     def undo(self):
@@ -144,9 +159,9 @@ class SetCellDataCommand(QUndoCommand):
              
         else:
             self.model._data[self.row][self.col] = self.old_value  # type: ignore[reportUnknownMemberType]
+            _invalidate(self.model, self.row, self.col, self.row, self.col)
             
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _mark_dirty(self.model, self.row, self.col, self.row, self.col)
         self.model.dataChanged.emit(idx, idx, [self.role])
 
 
@@ -195,8 +210,7 @@ class InsertRowsCommand(QUndoCommand):
         self.model._styles = shifted_styles
         
         self.model.endInsertRows()
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _invalidate(self.model, self.position, 0)
 
     def undo(self):
         """Remove inserted rows and shift style keys back up."""
@@ -219,8 +233,7 @@ class InsertRowsCommand(QUndoCommand):
         self.model._styles = shifted_styles
         
         self.model.endRemoveRows()
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _invalidate(self.model, self.position, 0)
 
 
 class RemoveRowsCommand(QUndoCommand):
@@ -273,8 +286,7 @@ class RemoveRowsCommand(QUndoCommand):
         self.model._styles = shifted_styles
         
         self.model.endRemoveRows()
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _invalidate(self.model, self.position, 0)
 
     def undo(self):
         """Re-insert rows and restore styles."""
@@ -299,8 +311,7 @@ class RemoveRowsCommand(QUndoCommand):
         self.model._styles = shifted_styles
         
         self.model.endInsertRows()
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _invalidate(self.model, self.position, 0)
 
 
 class InsertColumnsCommand(QUndoCommand):
@@ -353,8 +364,7 @@ class InsertColumnsCommand(QUndoCommand):
         self.model._styles = shifted_styles
         
         self.model.endInsertColumns()
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _invalidate(self.model, 0, self.position)
 
     def undo(self):
         """Remove inserted columns and shift style keys back left."""
@@ -383,8 +393,7 @@ class InsertColumnsCommand(QUndoCommand):
         self.model._styles = shifted_styles
         
         self.model.endRemoveColumns()
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _invalidate(self.model, 0, self.position)
 
 
 class RemoveColumnsCommand(QUndoCommand):
@@ -451,8 +460,7 @@ class RemoveColumnsCommand(QUndoCommand):
         self.model._styles = shifted_styles
         
         self.model.endRemoveColumns()
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _invalidate(self.model, 0, self.position)
 
     def undo(self):
         """Re-insert columns and restore styles."""
@@ -484,8 +492,7 @@ class RemoveColumnsCommand(QUndoCommand):
         self.model._styles = shifted_styles
         
         self.model.endInsertColumns()
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _invalidate(self.model, 0, self.position)
 
 class SortRangeCommand(QUndoCommand):
     """
@@ -530,8 +537,7 @@ class SortRangeCommand(QUndoCommand):
         tl = self.model.index(self.top, self.left)  # type: ignore[reportUnknownMemberType, reportUnknownVariableType]
         br = self.model.index(self.bottom, self.right)  # type: ignore[reportUnknownMemberType, reportUnknownVariableType]
         self.model.dataChanged.emit(tl, br, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
-        if hasattr(self.model, "clear_eval_cache"):
-            self.model.clear_eval_cache()
+        _invalidate(self.model, self.top, self.left, self.bottom, self.right)
 
     def redo(self):
         """
@@ -400,8 +400,8 @@ class CorrespondenceHub(QWidget):
             table = service.create_table(name, data)
             # We must refresh the list to see it
             self._load_tables()
-            # Launch it
-            self._launch_window(table.id, table.name, data)
+            # Launch it (from the cell store, so the first save writes only edits)
+            self._launch_window(table.id, table.name, service.load_content(table.id))
             
             # Hide the Hub (Library) as we are now focusing on the specific Tablet (Scroll)
             self.hide()
@@ -474,7 +474,8 @@ class CorrespondenceHub(QWidget):
             service = TableService(session)
             table = service.get_table(table_id)
             if table:
-                self._launch_window(table.id, table.name, table.content)
+                # Migrates legacy grid blobs into the cell store on first open
+                self._launch_window(table.id, table.name, service.load_content(table.id))
 
     def _launch_window(self, table_id, name, content):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
         # We need a persistent session for the window's repository interactions.
@@ -22,7 +22,9 @@ from pillars.document_manager.ui.features.math_feature import MathFeature
 from pillars.document_manager.ui.features.mermaid_feature import MermaidFeature
 from pillars.document_manager.ui.features.etymology_feature import EtymologyFeature
 
-from pillars.correspondences.services.formula_engine import FormulaHelper, FormulaEngine
+from pillars.correspondences.services.formula_engine import FormulaHelper, FormulaEngine, parse_formula
+from pillars.correspondences.services.dependency_graph import DependencyGraph
+from pillars.correspondences.services.cell_store import ScrollDelta, grid_delta, scroll_layout
 from pillars.correspondences.services.spreadsheet_validator import validate_spreadsheet_data, ValidationError
 
 
@@ -90,6 +92,11 @@ class SpreadsheetModel(QAbstractTableModel):
         self.undo_stack = QUndoStack(self)
         self.conditional_manager = ConditionalManager()
         self._eval_cache = {}
+        # Precedents of every formula cell currently in _eval_cache
+        self._dependencies = DependencyGraph()
+        # Unsaved changes: edited cells, and regions (fills, sorts, row/column moves)
+        self._dirty_cells = set()
+        self._dirty_regions = [(0, 0, None, None)]  # Nothing is in the cell store yet
 
     def fill_selection(self, source_range, target_range):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
         """
@@ -157,15 +164,111 @@ class SpreadsheetModel(QAbstractTableModel):
                     self._styles[(r, c)] = style.copy()
 
         self.endResetModel()
-        self.clear_eval_cache()
+        self.invalidate_region(tgt_top, tgt_left, tgt_bottom, tgt_right)
+        self.mark_dirty(tgt_top, tgt_left, tgt_bottom, tgt_right)
         tl = self.index(target_range.top(), target_range.left())  # type: ignore[reportUnknownArgumentType, reportUnknownMemberType]
         br = self.index(target_range.bottom(), target_range.right())  # type: ignore[reportUnknownArgumentType, reportUnknownMemberType]
         self.dataChanged.emit(tl, br)
 
 
     def clear_eval_cache(self):
-        """Reset cached formula evaluations after mutations."""
+        """Reset every cached formula evaluation."""
         self._eval_cache.clear()
+        self._dependencies.clear()
+        self.conditional_manager.invalidate_all()
+
+    def evaluate_block(self, top, left, bottom, right):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+        """Evaluated values of a region as rows of values ("" outside the sheet)."""
+        return [[self.evaluate_cell(r, c) for c in range(left, right + 1)] for r in range(top, bottom + 1)]
+
+    def invalidate_cells(self, cells):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+        """
+        Drop cached values of edited cells and everything that depends on them.
+
+        Only the edited cells and their transitive dependents recalculate
+        (plus volatile formulas such as ASTRO); the rest of the cache stays.
+
+        Returns:
+            The set of (row, col) cells whose cached values were dropped.
+        """
+        cells = set(cells)
+        volatile = self._dependencies.volatile_cells
+        dirty = self._dependencies.transitive_dependents(cells | volatile)
+        dirty |= cells | volatile
+        for cell in cells:
+            # The edit may have changed the formula, and with it the precedents
+            self._dependencies.remove(cell)
+        self._drop_cached(dirty)
+        self.conditional_manager.invalidate_cells(dirty)
+        return dirty
+
+    def invalidate_region(self, top, left, bottom=None, right=None):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+        """
+        Invalidate every cell in a region; None extends it to the sheet edge.
+
+        Used for fills and sorts, and for row/column inserts and removals,
+        which move every cell below (or right of) the change.
+        """
+        max_row = float('inf') if bottom is None else bottom
+        max_col = float('inf') if right is None else right
+        cells = {
+            (r, c) for r, c in self._eval_cache
+            if top <= r <= max_row and left <= c <= max_col
+        }
+        cells.update(self._dependencies.cells_in_region(top, left, bottom, right))
+        readers = self._dependencies.dependents_of_region(top, left, bottom, right)
+        self.conditional_manager.invalidate_region(top, left, bottom, right)
+        return self.invalidate_cells(cells | readers)
+
+    def mark_dirty(self, top, left, bottom=None, right=None):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+        """Queue a region for the next save; None extends it to the sheet edge."""
+        if (0, 0, None, None) in self._dirty_regions:
+            return
+        if top == bottom and left == right:
+            self._dirty_cells.add((top, left))
+        else:
+            self._dirty_regions.append((top, left, bottom, right))
+
+    def mark_clean(self):
+        """Forget queued changes (the cell store now matches the model)."""
+        self._dirty_cells.clear()
+        self._dirty_regions.clear()
+
+    @property
+    def is_dirty(self):
+        """Whether the model has changes the cell store does not."""
+        return bool(self._dirty_cells or self._dirty_regions)
+
+    def dirty_delta(self) -> ScrollDelta:
+        """The cell-store delta that saves every queued change."""
+        regions = list(self._dirty_regions) + [(r, c, r, c) for r, c in self._dirty_cells]
+        return grid_delta(self._data, self._styles, regions, len(self._columns))
+
+    def scroll_layout(self):  # type: ignore[reportUnknownParameterType]
+        """Layout entry (name, columns, row count) of this scroll for the cell store."""
+        return scroll_layout(getattr(self, "scroll_name", "Sheet"), self._columns, len(self._data))
+
+    def iter_raw_rows(self):  # type: ignore[reportUnknownParameterType]
+        """Raw values row by row, padded to the column count (for streaming export)."""
+        width = len(self._columns)
+        for row in self._data:
+            yield row if len(row) == width else (list(row) + [""] * width)[:width]
+
+    def _drop_cached(self, cells):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
+        stale = [cell for cell in cells if cell in self._eval_cache]
+        for cell in stale:
+            del self._eval_cache[cell]
+        # Repaint dependents outside the edited cell
+        if len(stale) > 1 and self._data and self._columns:
+            rows = [r for r, _ in stale]
+            cols = [c for _, c in stale]
+            top, left = max(0, min(rows)), max(0, min(cols))
+            bottom = min(len(self._data) - 1, max(rows))
+            right = min(len(self._columns) - 1, max(cols))
+            if top <= bottom and left <= right:
+                self.dataChanged.emit(
+                    self.index(top, left), self.index(bottom, right), [Qt.ItemDataRole.DisplayRole]
+                )
 
     def get_cell_raw(self, row, col):  # type: ignore[reportMissingParameterType, reportUnknownParameterType]
         """
@@ -200,6 +303,8 @@ class SpreadsheetModel(QAbstractTableModel):
 
             if isinstance(raw, str) and raw.startswith("="):
                 result = self.formula_engine.evaluate(raw, visited)
+                parsed = parse_formula(raw[1:].strip())
+                self._dependencies.set_precedents(key, parsed.cells, parsed.ranges, parsed.volatile)
             else:
                 result = raw
 
@@ -282,7 +387,7 @@ class SpreadsheetModel(QAbstractTableModel):
             bg = style.get("bg")
             cond = None
             if hasattr(self, "conditional_manager"):
-                cond = self.conditional_manager.get_style(row, col, self.evaluate_cell(row, col))
+                cond = self.conditional_manager.style_at(row, col, self.evaluate_block)
             color_hex = cond.get("bg") if cond and cond.get("bg") else bg
             if color_hex:
                 return QColor(color_hex)
@@ -292,7 +397,7 @@ class SpreadsheetModel(QAbstractTableModel):
             style = self._styles.get((row, col), {})  # type: ignore[reportUnknownMemberType, reportUnknownVariableType]
             cond = None
             if hasattr(self, "conditional_manager"):
-                cond = self.conditional_manager.get_style(row, col, self.evaluate_cell(row, col))
+                cond = self.conditional_manager.style_at(row, col, self.evaluate_block)
             fg = cond.get("fg") if cond and cond.get("fg") else style.get("fg")
             if fg:
                 return QColor(fg)
@@ -63,11 +63,16 @@ class SpreadsheetWindow(QMainWindow):
             active_index = 0
             
         # Hydrate Models
-        for scroll in scrolls_data:
+        from_cell_store = bool(content.get("cell_store"))
+        for index, scroll in enumerate(scrolls_data):
             m = SpreadsheetModel(scroll)
             # Store name on the model for convenience? Or separate metadata?
             # Model doesn't natively store name, let's attach it.
             m.scroll_name = scroll.get("name", "Sheet") 
+            if from_cell_store:
+                # Loaded from the cell store: only later edits need saving
+                m.mark_clean()
+                m.stored_scroll = index
             self.models.append(m)
             
         if not self.models:
@@ -637,21 +642,19 @@ class SpreadsheetWindow(QMainWindow):
     def _save_table(self) -> None:
         """Persists the table to the database (Multi-Scroll format)."""
         try:
-            # Serialize all scrolls
-            scrolls_list = []
-            for m in self.models:
-                # model.to_json() returns {columns, data, styles}. We need to add name.
-                json_data = m.to_json()
-                json_data["name"] = getattr(m, "scroll_name", "Sheet")
-                scrolls_list.append(json_data)
+            # Save only the cells changed since the last save
+            layouts, deltas = [], []
+            for index, m in enumerate(self.models):
+                if getattr(m, "stored_scroll", None) != index:
+                    # New scroll (or stored under another index): write it whole
+                    m.mark_dirty(0, 0)
+                layouts.append(m.scroll_layout())
+                deltas.append(m.dirty_delta())
                 
-            final_content = {
-                "format_version": "2.0",
-                "active_scroll_index": self.current_model_index,
-                "scrolls": scrolls_list
-            }
-            
-            self.service.save_content(self.table_id, final_content)
+            self.service.save_scrolls(self.table_id, self.current_model_index, layouts, deltas)
+            for index, m in enumerate(self.models):
+                m.mark_clean()
+                m.stored_scroll = index
             self.status_bar.show_message("Tablet saved successfully.", 3000)
         except Exception as e:
             QMessageBox.critical(self, "Save Failed", str(e))
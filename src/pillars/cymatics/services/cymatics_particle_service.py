@@ -6,11 +6,14 @@ on a vibrating plate, mimicking real Chladni figure experiments.
 from __future__ import annotations
 
 from typing import Optional
+
 import numpy as np
-from scipy import ndimage
 
 from ..models import ParticleState
 
+# Fraction of speed kept after bouncing off the plate edge
+RESTITUTION = 0.8
+
 
 class CymaticsParticleService:
     """Simulates particles accumulating at nodal lines.
@@ -22,6 +25,12 @@ class CymaticsParticleService:
     This mimics the physics of sand particles on a vibrating Chladni
     plate, which accumulate at the nodal lines where the plate
     displacement is minimal.
+
+    Every step works on whole arrays: the gradient and amplitude of the
+    field are sampled bilinearly at all particles at once, and bouncing off
+    the boundary and settling on nodal lines are boolean masks. All
+    randomness comes from the service's generator, so a seeded service
+    replays exactly.
     """
 
     def __init__(self, seed: int | None = None):
@@ -29,8 +38,12 @@ class CymaticsParticleService:
 
         Args:
             seed: Optional random seed for reproducible particle positions
+                and motion
         """
         self._rng = np.random.default_rng(seed)
+        self._field: Optional[np.ndarray] = None
+        self._table: Optional[np.ndarray] = None
+        self._peak = 0.0
 
     def initialize_particles(
         self,
@@ -40,50 +53,31 @@ class CymaticsParticleService:
         boundary_mask: Optional[np.ndarray] = None,
     ) -> ParticleState:
         """Initialize particles within the plate boundary."""
-        positions_list = []
-        
-        # Limit iterations to avoid infinite loops if mask is too small
-        max_iter = 100
-        iteration = 0
+        accepted = []
+        found = 0
 
-        while len(positions_list) < count and iteration < max_iter:
-            iteration += 1
+        # Limit iterations to avoid infinite loops if mask is too small
+        for _ in range(100):
+            if found >= count:
+                break
             # Generate candidates (extra to account for rejection)
-            if hasattr(self, '_rng'):
-                candidates = self._rng.random((count * 2, 2))
-            else:
-                candidates = np.random.rand(count * 2, 2)
-
+            candidates = self._rng.random((count * 2, 2), dtype=np.float32)
             if boundary_mask is not None:
-                # Map [0, 1] to grid coordinates
-                x_idx = np.floor(candidates[:, 0] * (grid_size - 1)).astype(int)
-                y_idx = np.floor(candidates[:, 1] * (grid_size - 1)).astype(int)
-                
-                # Clip to safe range
-                x_idx = np.clip(x_idx, 0, grid_size - 1)
-                y_idx = np.clip(y_idx, 0, grid_size - 1)
-                
-                # Filter by mask (Vectorized)
                 # Note: boundary_mask indices are [y, x]
-                valid = boundary_mask[y_idx, x_idx]
-                candidates = candidates[valid]
-
-            positions_list.extend(candidates.tolist())
+                x_idx, y_idx = self._cell_indices(candidates, boundary_mask.shape[0])
+                candidates = candidates[boundary_mask[y_idx, x_idx]]
+            accepted.append(candidates)
+            found += len(candidates)
 
         # If we failed to find enough valid spots, fill remainder with center
-        if len(positions_list) < count:
-            remaining = count - len(positions_list)
-            center_fill = np.full((remaining, 2), 0.5)
-            positions_list.extend(center_fill.tolist())
-
-        positions = np.array(positions_list[:count])
-        velocities = np.zeros_like(positions)
-        settled = np.zeros(count, dtype=bool)
+        if found < count:
+            accepted.append(np.full((count - found, 2), 0.5, dtype=np.float32))
 
+        positions = np.concatenate(accepted)[:count] if accepted else np.zeros((0, 2), np.float32)
         return ParticleState(
-            positions=positions,
-            velocities=velocities,
-            settled=settled,
+            positions=np.ascontiguousarray(positions),
+            velocities=np.zeros_like(positions),
+            settled=np.zeros(count, dtype=bool),
         )
 
     def update_particles(
@@ -93,79 +87,99 @@ class CymaticsParticleService:
         dt: float = 0.016,
         speed: float = 0.5,
         settle_threshold: float = 0.03,
-        damping: float = 0.92,
+        damping: float = 0.95,
         noise: float = 0.02,
         boundary_mask: Optional[np.ndarray] = None,
     ) -> ParticleState:
-        """Update particle positions based on field gradient, with boundary clipping."""
-        if state.positions.shape[0] == 0:
+        """Advance every particle one step.
+
+        Args:
+            state: Current particles (positions in [0, 1], x then y).
+            field: Plate displacement field; particles descend ``|field|``.
+            dt: Time step.
+            speed: Magnitude of the drift force.
+            settle_threshold: Particles where ``|field|`` is below this
+                fraction of its peak settle on the nodal line and stop.
+            damping: Velocity kept per step (friction).
+            noise: Standard deviation of the random kick the vibrating
+                plate gives moving particles, per unit speed.
+            boundary_mask: Valid positions, indexed [y, x]; particles that
+                would leave it bounce back.
+        """
+        count = state.positions.shape[0]
+        if count == 0:
             return state
 
+        table = self._field_table(field)
         grid_size = field.shape[0]  # Assume square grid
-
-        # Compute potential as abs(field) to move towards nodes (zeros)
-        potential = np.abs(field)
-
-        # Compute gradients of potential
-        grad_y, grad_x = np.gradient(potential)
-
-        # Particle positions in grid coordinates (float)
-        x = state.positions[:, 0] * (grid_size - 1)
-        y = state.positions[:, 1] * (grid_size - 1)
-
-        # Interpolate gradients at particle positions
-        force_x = ndimage.map_coordinates(grad_x, [y, x], order=1, mode='nearest')
-        force_y = ndimage.map_coordinates(grad_y, [y, x], order=1, mode='nearest')
-
-        # Force = -grad(potential) to move towards lower potential (nodal lines)
-        force = np.stack((-force_x, -force_y), axis=1)  # (N, 2)
-
-        # Normalize and scale force
-        mag = np.linalg.norm(force, axis=1, keepdims=True)
-        # Avoid division by zero
-        force = np.where(mag > 1e-6, force / mag * speed, 0)
-
-        # Update velocities with force and friction
-        # Use friction damping from user code (0.95) or passed parameter? 
-        # User code had hardcoded 0.95
-        new_vel = state.velocities + force * dt
-        new_vel *= 0.95  # Friction damping to prevent perpetual motion
-
-        # Update positions
-        new_pos = state.positions + new_vel * dt
-
-        # Boundary handling
+        positions = state.positions.astype(np.float32, copy=False)
+        velocities = state.velocities.astype(np.float32, copy=False)
+
+        # Bilinear sample of (-d|f|/dx, -d|f|/dy, |f|) at every particle
+        x = positions[:, 0] * np.float32(grid_size - 1)
+        y = positions[:, 1] * np.float32(grid_size - 1)
+        x0 = np.clip(x.astype(np.intp), 0, grid_size - 2)
+        y0 = np.clip(y.astype(np.intp), 0, grid_size - 2)
+        fx = np.clip(x - x0.astype(np.float32), 0.0, 1.0)
+        fy = np.clip(y - y0.astype(np.float32), 0.0, 1.0)
+        corner = y0 * grid_size + x0
+        sample = np.take(table, corner, axis=0) * ((1 - fx) * (1 - fy))[:, None]
+        sample += np.take(table, corner + 1, axis=0) * (fx * (1 - fy))[:, None]
+        sample += np.take(table, corner + grid_size, axis=0) * ((1 - fx) * fy)[:, None]
+        sample += np.take(table, corner + grid_size + 1, axis=0) * (fx * fy)[:, None]
+        force, amplitude = sample[:, :2], sample[:, 2]
+
+        # Unit drift toward lower amplitude, scaled by speed
+        magnitude = np.hypot(force[:, 0], force[:, 1])
+        scale = np.where(magnitude > 1e-6, np.float32(speed * dt) / np.maximum(magnitude, 1e-6), 0)
+        new_vel = velocities + force * scale[:, None]
+        if noise > 0.0:
+            # Uniform kick with standard deviation noise * speed
+            kick = self._rng.random((count, 2), dtype=np.float32) - np.float32(0.5)
+            new_vel += kick * np.float32(noise * speed * np.sqrt(12.0))
+        new_vel *= np.float32(damping)
+
+        # Settling mask: particles on a nodal line stop there
+        settled = amplitude <= settle_threshold * self._peak
+        new_vel *= ~settled[:, None]
+
+        new_pos = positions + new_vel * np.float32(dt)
+
+        # Reflection mask: leaving the plate undoes the move and bounces
+        offset = np.abs(new_pos - np.float32(0.5))
+        outside = np.maximum(offset[:, 0], offset[:, 1]) > 0.5
         if boundary_mask is not None:
-            # First, clip to [0,1] to prevent out-of-bounds
-            new_pos = np.clip(new_pos, 0, 1)
-
-            # Compute grid indices for new positions
-            x_idx = np.floor(new_pos[:, 0] * (grid_size - 1)).astype(int)
-            y_idx = np.floor(new_pos[:, 1] * (grid_size - 1)).astype(int)
-
-            # Clamp indices to valid range
-            x_idx = np.clip(x_idx, 0, grid_size - 1)
-            y_idx = np.clip(y_idx, 0, grid_size - 1)
-
-            # Check if outside the plate shape
-            # Note: boundary_mask indices are [y, x]
-            outside = ~boundary_mask[y_idx, x_idx]
-
-            # For particles outside, revert position and reflect velocity with energy loss
-            new_pos[outside] = state.positions[outside]
-            new_vel[outside] = -new_vel[outside] * 0.8  # Bounce with 20% energy loss
-
-        # Calculate settled status (low velocity check)
-        velocity_mag = np.linalg.norm(new_vel, axis=1)
-        settled = velocity_mag < 0.1
+            x_idx, y_idx = self._cell_indices(new_pos, grid_size)
+            outside |= ~np.take(boundary_mask, y_idx * grid_size + x_idx)
+        bounced = outside[:, None]
+        new_pos = np.where(bounced, positions, new_pos)
+        new_vel = np.where(bounced, new_vel * np.float32(-RESTITUTION), new_vel)
 
-        # Return updated state
         return ParticleState(
             positions=new_pos,
             velocities=new_vel,
             settled=settled,
         )
 
+    def _field_table(self, field: np.ndarray) -> np.ndarray:
+        """Flattened (-grad |field|, |field|) rows, rebuilt only for a new field."""
+        if field is not self._field:
+            potential = np.abs(field).astype(np.float32)
+            grad_y, grad_x = np.gradient(potential)
+            table = np.empty(potential.shape + (3,), dtype=np.float32)
+            table[..., 0] = -grad_x
+            table[..., 1] = -grad_y
+            table[..., 2] = potential
+            self._table = table.reshape(-1, 3)
+            self._peak = float(potential.max())
+            self._field = field
+        return self._table
+
+    @staticmethod
+    def _cell_indices(positions: np.ndarray, grid_size: int) -> tuple[np.ndarray, np.ndarray]:
+        """Grid cell (x, y) containing each position, clamped to the grid."""
+        cells = np.clip((positions * (grid_size - 1)).astype(np.intp), 0, grid_size - 1)
+        return cells[:, 0], cells[:, 1]
 
     def reset_settled(self, state: ParticleState) -> ParticleState:
         """Reset settled status for all particles.
@@ -6,11 +6,13 @@ and both manual mode selection and frequency-based input.
 from __future__ import annotations
 
 import time
-from typing import Tuple
+from typing import Callable, Hashable, Optional, Tuple, Union
 
 import numpy as np
 from scipy.special import jv as bessel_jv
 
+from shared.utils.byte_budget_lru import ByteBudgetLRU
+
 from ..models import PlateShape, SimulationParams, SimulationResult
 
 # Precomputed Bessel function zeros for circular plate modes
@@ -36,6 +38,23 @@ def _bessel_zero(m: int, n: int) -> float:
     return _BESSEL_ZEROS_CACHE[key]
 
 
+CachedArrays = Union[np.ndarray, Tuple[np.ndarray, ...]]
+
+
+def array_nbytes(value: CachedArrays) -> int:
+    """Size of a cached array (or tuple of arrays), for the basis cache budget."""
+    if isinstance(value, tuple):
+        return sum(array.nbytes for array in value)
+    return value.nbytes
+
+
+def _vertices_key(params: SimulationParams) -> Optional[Tuple[Tuple[float, float], ...]]:
+    """Hashable form of the custom polygon (only it depends on the vertices)."""
+    if params.plate_shape != PlateShape.CUSTOM_POLYGON:
+        return None
+    return tuple((float(x), float(y)) for x, y in params.custom_polygon_vertices)
+
+
 class CymaticsSimulationService:
     """Generates standing-wave patterns for 2D plates.
 
@@ -77,6 +96,29 @@ class CymaticsSimulationService:
         n = max(1, min(self.MODE_MAX, total_mode - m + 1))
         return (m, n)
 
+    def __init__(self, cache: Optional[ByteBudgetLRU] = None):
+        """
+        Args:
+            cache: Byte-bounded cache of basis fields, envelopes and grids
+                (sized with ``array_nbytes``); defaults to one sized by
+                ``memory.cymatics_basis_cache_mb`` in the app config.
+        """
+        if cache is None:
+            from shared.config import get_config
+
+            cache = ByteBudgetLRU(get_config().memory.cymatics_basis_cache_mb * 1024 * 1024, array_nbytes)
+        self.cache = cache
+
+    def _cached(self, key: Hashable, build: Callable[[], CachedArrays]) -> CachedArrays:
+        """Cached arrays for ``key``; they are read-only since every frame shares them."""
+        def build_frozen() -> CachedArrays:
+            value = build()
+            for array in value if isinstance(value, tuple) else (value,):
+                array.flags.writeable = False
+            return value
+
+        return self.cache.get_or_build(key, build_frozen)
+
     def simulate(
         self, params: SimulationParams, phase: float = 0.0
     ) -> SimulationResult:
@@ -84,23 +126,36 @@ class CymaticsSimulationService:
 
         If use_frequency_mode is True, derives modes from frequency_hz.
         Generates field based on plate_shape setting.
+
+        Each plate mode is a fixed basis field; a frame only recombines the
+        cached primary and secondary modes with this phase's weights and
+        applies the cached boundary/damping envelope.
         """
         # Resolve effective modes
         effective_params = self._resolve_params(params)
 
-        # Generate field based on plate shape
-        if effective_params.plate_shape == PlateShape.RECTANGULAR:
-            field = self._generate_rectangular_field(effective_params, phase)
-        elif effective_params.plate_shape == PlateShape.CIRCULAR:
-            field = self._generate_circular_field(effective_params, phase)
-        elif effective_params.plate_shape == PlateShape.HEXAGONAL:
-            field = self._generate_hexagonal_field(effective_params, phase)
-        elif effective_params.plate_shape == PlateShape.HEPTAGONAL:
-            field = self._generate_heptagonal_field(effective_params, phase)
-        elif effective_params.plate_shape == PlateShape.CUSTOM_POLYGON:
-            field = self._generate_polygon_field(effective_params, phase)
-        else:
-            field = self._generate_rectangular_field(effective_params, phase)
+        plate = effective_params.plate_shape
+        if plate not in _MODE_BUILDERS:
+            plate = PlateShape.RECTANGULAR
+        grid_size = max(16, int(effective_params.grid_size))
+
+        primary = self._mode_field(
+            plate, grid_size, effective_params.mode_m, effective_params.mode_n
+        )
+        secondary = self._mode_field(
+            plate, grid_size, effective_params.secondary_m, effective_params.secondary_n
+        )
+
+        # Mix and apply time evolution
+        mix = float(np.clip(effective_params.mix, 0.0, 1.0))
+        primary_phase = 0.6 + 0.4 * np.cos(phase)
+        secondary_phase = 0.6 + 0.4 * np.cos(1.35 * phase + np.pi / 4.0)
+        field = primary * np.float32((1.0 - mix) * primary_phase)
+        field += secondary * np.float32(mix * secondary_phase)
+
+        envelope = self._envelope(effective_params, plate, grid_size)
+        if envelope is not None:
+            field *= envelope
 
         normalized = self._normalize_field(field)
 
@@ -108,7 +163,10 @@ class CymaticsSimulationService:
         height_map = field.copy() if params.show_3d_surface else None
 
         # Generate boundary mask for particle collision detection
-        boundary_mask = self._generate_boundary_mask(params, field.shape)
+        boundary_key = ("boundary", params.plate_shape, field.shape, _vertices_key(params))
+        boundary_mask = self._cached(
+            boundary_key, lambda: self._generate_boundary_mask(params, field.shape)
+        )
 
         return SimulationResult(
             field=field,
@@ -119,6 +177,110 @@ class CymaticsSimulationService:
             boundary_mask=boundary_mask,
         )
 
+    def _mode_field(self, plate: PlateShape, grid_size: int, m: int, n: int) -> np.ndarray:
+        """Cached float32 basis field of one (m, n) mode on a plate."""
+        build = _MODE_BUILDERS[plate]
+        return self._cached(
+            ("mode", plate, grid_size, m, n),
+            lambda: build(self, grid_size, m, n).astype(np.float32),
+        )
+
+    def _envelope(
+        self, params: SimulationParams, plate: PlateShape, grid_size: int
+    ) -> Optional[np.ndarray]:
+        """Cached boundary mask times damping for a plate, or None if flat."""
+        if plate == PlateShape.RECTANGULAR and params.damping <= 0.0:
+            return None
+        key = ("envelope", plate, grid_size, float(params.damping), _vertices_key(params))
+        return self._cached(
+            key, lambda: self._build_envelope(params, plate, grid_size).astype(np.float32)
+        )
+
+    # ─────────────────────────────────────────────────────────────────
+    # Basis fields (computed once per plate, resolution and mode)
+    # ─────────────────────────────────────────────────────────────────
+
+    def _rectangular_mode(self, grid_size: int, m: int, n: int) -> np.ndarray:
+        """Rectangular plate mode sin(m pi x) * sin(n pi y) on [0, 1]^2."""
+        axis = np.linspace(0.0, 1.0, grid_size)
+        return np.outer(np.sin(n * np.pi * axis), np.sin(m * np.pi * axis))
+
+    def _circular_mode(self, grid_size: int, m: int, n: int) -> np.ndarray:
+        """Circular plate using Bessel functions (true Chladni patterns).
+
+        Uses J_m(k_mn * r) * cos(m * theta) for circular plate vibration
+        modes, where k_mn is the nth zero of the Bessel function J_m.
+        """
+        r, theta = self._polar_grid(grid_size, flipped=False)
+        k_mn = _bessel_zero(m, max(1, n))
+        return bessel_jv(m, k_mn * r) * np.cos(m * theta)
+
+    def _hexagonal_mode(self, grid_size: int, m: int, n: int) -> np.ndarray:
+        """Hexagonal plate with three-fold symmetric modes.
+
+        Uses superposition of three 60-degree rotated sine waves
+        to create hexagonal symmetry patterns.
+        """
+        xx, yy = self._centered_grid(grid_size, flipped=False)
+        field = np.zeros_like(xx)
+        # Three-fold symmetric pattern (0°, 60°, 120° rotations)
+        for angle in (0, np.pi / 3, 2 * np.pi / 3):
+            rx = xx * np.cos(angle) + yy * np.sin(angle)
+            ry = -xx * np.sin(angle) + yy * np.cos(angle)
+            field += np.sin(m * np.pi * (rx + 1) / 2) * np.sin(
+                n * np.pi * (ry + 1) / 2
+            )
+        return field
+
+    def _heptagonal_mode(self, grid_size: int, m: int, n: int) -> np.ndarray:
+        """Standing wave on a 7-sided plate (Bessel-like radial approximation)."""
+        r, theta = self._polar_grid(grid_size, flipped=True)
+        n_symmetry = 7
+        radial = np.cos(m * 2.5 * r * np.pi)
+        angular = np.cos(n * (theta * n_symmetry / 2.0))
+        return radial * angular
+
+    def _build_envelope(
+        self, params: SimulationParams, plate: PlateShape, grid_size: int
+    ) -> np.ndarray:
+        if plate in (PlateShape.RECTANGULAR, PlateShape.CUSTOM_POLYGON):
+            axis = np.linspace(0.0, 1.0, grid_size)
+            xx, yy = np.meshgrid(axis, axis)
+            envelope = np.ones_like(xx)
+            if params.damping > 0.0:
+                envelope *= self._damping_mask(xx, yy, params.damping)
+            if plate == PlateShape.CUSTOM_POLYGON and len(params.custom_polygon_vertices) >= 3:
+                envelope *= self._polygon_mask(xx, yy, params.custom_polygon_vertices)
+            return envelope
+
+        flipped = plate == PlateShape.HEPTAGONAL
+        xx, yy = self._centered_grid(grid_size, flipped=flipped)
+        r, _ = self._polar_grid(grid_size, flipped=flipped)
+        if plate == PlateShape.CIRCULAR:
+            # Zero outside the unit circle
+            envelope = (r <= 1.0).astype(float)
+        elif plate == PlateShape.HEXAGONAL:
+            envelope = self._hexagon_mask(xx, yy, radius=0.95)
+        else:
+            envelope = self._heptagon_mask(xx, yy, radius=0.95)
+        if params.damping > 0.0:
+            envelope *= np.exp(-params.damping * r**2)
+        return envelope
+
+    def _centered_grid(self, grid_size: int, flipped: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Meshgrid over [-1, 1]^2 (y running downwards when flipped)."""
+        x = np.linspace(-1.0, 1.0, grid_size)
+        y = x[::-1] if flipped else x
+        return np.meshgrid(x, y)
+
+    def _polar_grid(self, grid_size: int, flipped: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Cached radius and angle over the centered grid (float64)."""
+        def build() -> Tuple[np.ndarray, np.ndarray]:
+            xx, yy = self._centered_grid(grid_size, flipped)
+            return np.sqrt(xx**2 + yy**2), np.arctan2(yy, xx)
+
+        return self._cached(("polar", grid_size, flipped), build)
+
     def _generate_boundary_mask(
         self, params: SimulationParams, shape: tuple[int, int]
     ) -> np.ndarray:
@@ -218,158 +380,6 @@ class CymaticsSimulationService:
             particle_speed=params.particle_speed,
         )
 
-    def _generate_rectangular_field(
-        self, params: SimulationParams, phase: float
-    ) -> np.ndarray:
-        """Original rectangular plate standing wave pattern."""
-        grid_size = max(16, int(params.grid_size))
-        x = np.linspace(0.0, 1.0, grid_size)
-        y = np.linspace(0.0, 1.0, grid_size)
-        xx, yy = np.meshgrid(x, y)
-
-        primary = np.sin(params.mode_m * np.pi * xx) * np.sin(
-            params.mode_n * np.pi * yy
-        )
-        secondary = np.sin(params.secondary_m * np.pi * xx) * np.sin(
-            params.secondary_n * np.pi * yy
-        )
-
-        mix = float(np.clip(params.mix, 0.0, 1.0))
-        primary_phase = 0.6 + 0.4 * np.cos(phase)
-        secondary_phase = 0.6 + 0.4 * np.cos(1.35 * phase + np.pi / 4.0)
-        field = (1.0 - mix) * primary * primary_phase
-        field += mix * secondary * secondary_phase
-
-        if params.damping > 0.0:
-            field *= self._damping_mask(xx, yy, params.damping)
-
-        return field
-
-    def _generate_circular_field(
-        self, params: SimulationParams, phase: float
-    ) -> np.ndarray:
-        """Circular plate using Bessel functions (true Chladni patterns).
-
-        Uses J_m(k_mn * r) * cos(m * theta) for circular plate vibration
-        modes, where k_mn is the nth zero of the Bessel function J_m.
-        """
-        grid_size = max(16, int(params.grid_size))
-        x = np.linspace(-1.0, 1.0, grid_size)
-        y = np.linspace(-1.0, 1.0, grid_size)
-        xx, yy = np.meshgrid(x, y)
-
-        # Convert to polar coordinates
-        r = np.sqrt(xx**2 + yy**2)
-        theta = np.arctan2(yy, xx)
-
-        # Primary mode: J_m(k_mn * r) * cos(m * theta)
-        m, n = params.mode_m, max(1, params.mode_n)
-        k_mn = _bessel_zero(m, n)
-        radial_primary = bessel_jv(m, k_mn * r)
-        angular_primary = np.cos(m * theta)
-        primary = radial_primary * angular_primary
-
-        # Secondary mode for interference
-        m2, n2 = params.secondary_m, max(1, params.secondary_n)
-        k_mn2 = _bessel_zero(m2, n2)
-        radial_secondary = bessel_jv(m2, k_mn2 * r)
-        angular_secondary = np.cos(m2 * theta)
-        secondary = radial_secondary * angular_secondary
-
-        # Mix and apply time evolution
-        mix = float(np.clip(params.mix, 0.0, 1.0))
-        primary_phase = 0.6 + 0.4 * np.cos(phase)
-        secondary_phase = 0.6 + 0.4 * np.cos(1.35 * phase + np.pi / 4.0)
-
-        field = (1.0 - mix) * primary * primary_phase
-        field += mix * secondary * secondary_phase
-
-        # Apply circular boundary (zero outside unit circle)
-        field[r > 1.0] = 0.0
-
-        # Optional radial damping
-        if params.damping > 0.0:
-            field *= np.exp(-params.damping * r**2)
-
-        return field
-
-    def _generate_hexagonal_field(
-        self, params: SimulationParams, phase: float
-    ) -> np.ndarray:
-        """Hexagonal plate with three-fold symmetric modes.
-
-        Uses superposition of three 60-degree rotated sine waves
-        to create hexagonal symmetry patterns.
-        """
-        grid_size = max(16, int(params.grid_size))
-        x = np.linspace(-1.0, 1.0, grid_size)
-        y = np.linspace(-1.0, 1.0, grid_size)
-        xx, yy = np.meshgrid(x, y)
-
-        m, n = params.mode_m, params.mode_n
-
-        # Three-fold symmetric pattern (0°, 60°, 120° rotations)
-        angles = [0, np.pi / 3, 2 * np.pi / 3]
-        field = np.zeros_like(xx)
-
-        for angle in angles:
-            # Rotate coordinates
-            rx = xx * np.cos(angle) + yy * np.sin(angle)
-            ry = -xx * np.sin(angle) + yy * np.cos(angle)
-            # Add wave contribution
-            field += np.sin(m * np.pi * (rx + 1) / 2) * np.sin(
-                n * np.pi * (ry + 1) / 2
-            )
-
-        # Secondary mode with different symmetry
-        m2, n2 = params.secondary_m, params.secondary_n
-        secondary = np.zeros_like(xx)
-        for angle in angles:
-            rx = xx * np.cos(angle) + yy * np.sin(angle)
-            ry = -xx * np.sin(angle) + yy * np.cos(angle)
-            secondary += np.sin(m2 * np.pi * (rx + 1) / 2) * np.sin(
-                n2 * np.pi * (ry + 1) / 2
-            )
-
-        # Mix and time evolution
-        mix = float(np.clip(params.mix, 0.0, 1.0))
-        primary_phase = 0.6 + 0.4 * np.cos(phase)
-        secondary_phase = 0.6 + 0.4 * np.cos(1.35 * phase + np.pi / 4.0)
-
-        result = (1.0 - mix) * field * primary_phase
-        result += mix * secondary * secondary_phase
-
-        # Apply hexagonal boundary mask
-        mask = self._hexagon_mask(xx, yy, radius=0.95)
-        result *= mask
-
-        if params.damping > 0.0:
-            r = np.sqrt(xx**2 + yy**2)
-            result *= np.exp(-params.damping * r**2)
-
-        return result
-
-    def _generate_polygon_field(
-        self, params: SimulationParams, phase: float
-    ) -> np.ndarray:
-        """Custom polygon plate with rectangular modes masked to polygon boundary."""
-        # Start with rectangular field
-        field = self._generate_rectangular_field(params, phase)
-
-        # Apply polygon mask if vertices provided
-        if params.custom_polygon_vertices and len(params.custom_polygon_vertices) >= 3:
-            grid_size = field.shape[0]
-            x = np.linspace(0.0, 1.0, grid_size)
-            y = np.linspace(0.0, 1.0, grid_size)
-            xx, yy = np.meshgrid(x, y)
-
-            mask = self._polygon_mask(
-                xx, yy, params.custom_polygon_vertices
-            )
-            field *= mask
-
-        return field
-
     def _hexagon_mask(
         self, xx: np.ndarray, yy: np.ndarray, radius: float = 1.0
     ) -> np.ndarray:
@@ -386,54 +396,6 @@ class CymaticsSimulationService:
             mask *= (dist < radius * np.cos(np.pi / 6)).astype(float)
         return mask
 
-    def _generate_heptagonal_field(
-        self, params: SimulationParams, phase: float
-    ) -> np.ndarray:
-        """Generating standing wave on 7-sided plate."""
-        grid_size = params.grid_size
-        x = np.linspace(-1.0, 1.0, grid_size)
-        y = np.linspace(1.0, -1.0, grid_size)  # FLIPPED to match visual space
-        xx, yy = np.meshgrid(x, y)
-        
-        # Heptagonal symmetry
-        field = np.zeros_like(xx)
-        n_symmetry = 7
-        
-        # RadialBessel-like function approx for polygonal modes
-        r = np.sqrt(xx**2 + yy**2)
-        theta = np.arctan2(yy, xx)
-        
-        # Primary mode
-        k1 = params.mode_m * 2.5
-        m1 = params.mode_n
-        radial = np.cos(k1 * r * np.pi) 
-        angular = np.cos(m1 * (theta * n_symmetry / 2.0))
-        field += radial * angular
-
-        # Secondary mode interference
-        k2 = params.secondary_m * 2.5
-        m2 = params.secondary_n
-        radial2 = np.cos(k2 * r * np.pi)
-        angular2 = np.cos(m2 * (theta * n_symmetry / 2.0))
-        secondary = radial2 * angular2
-
-        # Mix and phase
-        mix = float(np.clip(params.mix, 0.0, 1.0))
-        primary_phase = 0.6 + 0.4 * np.cos(phase)
-        secondary_phase = 0.6 + 0.4 * np.cos(1.35 * phase + np.pi / 4.0)
-
-        result = (1.0 - mix) * field * primary_phase
-        result += mix * secondary * secondary_phase
-        
-        # Apply heptagonal boundary mask
-        mask = self._heptagon_mask(xx, yy, radius=0.95)
-        result *= mask
-        
-        if params.damping > 0.0:
-            result *= np.exp(-params.damping * r**2)
-            
-        return result
-
     def _heptagon_mask(
         self, xx: np.ndarray, yy: np.ndarray, radius: float = 1.0
     ) -> np.ndarray:
@@ -501,3 +463,13 @@ class CymaticsSimulationService:
         cy = 0.5
         radius = np.sqrt((xx - cx) ** 2 + (yy - cy) ** 2)
         return np.exp(-damping * radius**2)
+
+
+_MODE_BUILDERS: dict[PlateShape, Callable[[CymaticsSimulationService, int, int, int], np.ndarray]] = {
+    PlateShape.RECTANGULAR: CymaticsSimulationService._rectangular_mode,
+    # Custom polygons use rectangular modes masked to the polygon boundary
+    PlateShape.CUSTOM_POLYGON: CymaticsSimulationService._rectangular_mode,
+    PlateShape.CIRCULAR: CymaticsSimulationService._circular_mode,
+    PlateShape.HEXAGONAL: CymaticsSimulationService._hexagonal_mode,
+    PlateShape.HEPTAGONAL: CymaticsSimulationService._heptagonal_mode,
+}
@@ -8,8 +8,8 @@ from __future__ import annotations
 from typing import Optional
 
 import numpy as np
-from PyQt6.QtCore import Qt, QPointF
-from PyQt6.QtGui import QBrush, QColor, QPainter, QPaintEvent, QPen
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QImage, QPainter, QPaintEvent
 from PyQt6.QtWidgets import QWidget
 
 from ..models import ParticleState
@@ -90,55 +90,36 @@ class CymaticsParticleView(QWidget):
             return
 
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        # Rasterize all particles with array writes, then blit once
         w, h = self.width(), self.height()
-        positions = self._particles.positions
-        settled = self._particles.settled
-
-        # Draw trails first (underneath particles)
-        if self._show_trails and self._position_history:
-            self._draw_trails(painter, w, h)
-
-        # Draw particles
-        painter.setPen(Qt.PenStyle.NoPen)
-
-        for i, (pos, is_settled) in enumerate(zip(positions, settled)):
-            x = pos[0] * w
-            y = pos[1] * h
-
-            if is_settled:
-                painter.setBrush(QBrush(self._settled_color))
-                radius = self._particle_radius * 1.2  # Settled slightly larger
-            else:
-                painter.setBrush(QBrush(self._moving_color))
-                radius = self._particle_radius
-
-            painter.drawEllipse(QPointF(x, y), radius, radius)
+        if w > 0 and h > 0:
+            pixels = self._rasterize(w, h)
+            image = QImage(pixels.data, w, h, 4 * w, QImage.Format.Format_ARGB32)
+            painter.drawImage(0, 0, image)
 
         # Draw statistics overlay
         self._draw_stats(painter)
+        painter.end()
 
-    def _draw_trails(self, painter: QPainter, w: int, h: int) -> None:
-        """Draw fading motion trails for particles."""
-        n_frames = len(self._position_history)
-        if n_frames == 0:
-            return
-
-        for frame_idx, positions in enumerate(self._position_history):
-            # Fade alpha based on age
-            alpha = int(50 * (frame_idx + 1) / n_frames)
-            trail_color = QColor(150, 150, 150, alpha)
-            painter.setBrush(QBrush(trail_color))
-            painter.setPen(Qt.PenStyle.NoPen)
+    def _rasterize(self, w: int, h: int) -> np.ndarray:
+        """Render trails, moving and settled particles into an ARGB32 buffer."""
+        pixels = np.zeros((h, w), dtype=np.uint32)
 
-            # Smaller radius for older positions
-            radius = self._particle_radius * 0.5 * (frame_idx + 1) / n_frames
+        # Trails first (underneath particles), older ones fainter and smaller
+        if self._show_trails and self._position_history:
+            n_frames = len(self._position_history)
+            for frame_idx, positions in enumerate(self._position_history):
+                alpha = int(50 * (frame_idx + 1) / n_frames)
+                radius = self._particle_radius * 0.5 * (frame_idx + 1) / n_frames
+                _splat(pixels, positions, QColor(150, 150, 150, alpha).rgba(), radius)
 
-            for pos in positions:
-                x = pos[0] * w
-                y = pos[1] * h
-                painter.drawEllipse(QPointF(x, y), radius, radius)
+        positions = self._particles.positions
+        settled = self._particles.settled
+        _splat(pixels, positions[~settled], self._moving_color.rgba(), self._particle_radius)
+        # Settled slightly larger, drawn on top
+        _splat(pixels, positions[settled], self._settled_color.rgba(), self._particle_radius * 1.2)
+        return pixels
 
     def _draw_stats(self, painter: QPainter) -> None:
         """Draw particle statistics in corner."""
@@ -158,3 +139,16 @@ class CymaticsParticleView(QWidget):
         painter.setPen(QColor(200, 200, 200))
         painter.drawText(10, 20, f"Particles: {n_total}")
         painter.drawText(10, 38, f"Settled: {n_settled} ({percent:.0f}%)")
+
+
+def _splat(pixels: np.ndarray, positions: np.ndarray, argb: int, radius: float) -> None:
+    """Write square dots of ``argb`` centred on normalized ``positions``."""
+    h, w = pixels.shape
+    size = max(1, int(round(2 * radius)))
+    xs = (positions[:, 0] * w).astype(np.intp) - size // 2
+    ys = (positions[:, 1] * h).astype(np.intp) - size // 2
+    for dy in range(size):
+        for dx in range(size):
+            x, y = xs + dx, ys + dy
+            inside = (x >= 0) & (x < w) & (y >= 0) & (y < h)
+            pixels[y[inside], x[inside]] = argb
@@ -410,7 +410,7 @@ class CymaticsSimulatorWindow(QMainWindow):
         row = QHBoxLayout()
         row.setSpacing(12)
         row.addWidget(self._field_label("Count"))
-        self._particle_count = self._styled_spin_box(100, 5000, 2000, step=100)
+        self._particle_count = self._styled_spin_box(100, 100_000, 2000, step=500)
         row.addWidget(self._particle_count, 1)
         layout.addLayout(row)
 
@@ -1,10 +1,11 @@
-from .document import Document, DocumentImage
+from .document import Document, DocumentImage, ImageBlob
 from .document_verse import DocumentVerse, VerseRule, VerseEditLog
 from .notebook import Notebook, Section
 
 __all__ = [
 	"Document",
 	"DocumentImage",
+	"ImageBlob",
 	"DocumentVerse",
     "VerseRule",
 	"VerseEditLog",
@@ -1 +1 @@
-from shared.models.document_manager.document import Document, DocumentImage, DocumentLink
+from shared.models.document_manager.document import Document, DocumentImage, DocumentLink, ImageBlob
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import (
     QComboBox, QFrame, QScrollArea, QSizePolicy,
     QGraphicsDropShadowEffect
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QCoreApplication, QSettings, QRunnable, QThreadPool, QObject, pyqtSlot
+from PyQt6.QtCore import Qt, pyqtSignal, QCoreApplication, QSettings, QRunnable, QThreadPool, QObject, QTimer, pyqtSlot
 from PyQt6.QtGui import QFont, QColor
 from pillars.document_manager.services.document_service import document_service_context
 from shared.ui.catalyst_styles import (
@@ -21,39 +21,75 @@ logger = logging.getLogger(__name__)
 MAX_HISTORY = 10
 
 
+PAGE_SIZE = 50
+
+
 class SearchWorkerSignals(QObject):
     """Signals for SearchWorker to communicate with main thread."""
-    finished = pyqtSignal(list)  # Emits search results
-    error = pyqtSignal(str)      # Emits error message
+    finished = pyqtSignal(int, dict)  # Emits (search generation, result page)
+    error = pyqtSignal(int, str)      # Emits (search generation, error message)
 
 
 class SearchWorker(QRunnable):
     """Background worker for document search to prevent UI freezing."""
     
-    def __init__(self, query: str):
+    def __init__(self, query: str, generation: int, page: int = 1, page_size: int = PAGE_SIZE):
         """
           init   logic.
         
         Args:
             query: Description of query.
+            generation: Search the page belongs to, echoed back with the result.
+            page: 1-based result page to fetch.
+            page_size: Number of results per page.
         
         """
         super().__init__()
         self.query = query
+        self.generation = generation
+        self.page = page
+        self.page_size = page_size
         self.signals = SearchWorkerSignals()
     
     @pyqtSlot()
     def run(self):
         """Execute the search in background thread."""
         try:
-            logger.debug(f"SearchWorker: Communing with Archives for '{self.query}'...")
+            logger.debug(f"SearchWorker: Communing with Archives for '{self.query}' (page {self.page})...")
             with document_service_context() as service:
-                results = service.search_documents_with_highlights(self.query)
-            logger.info(f"SearchWorker: Found {len(results)} documents for '{self.query}'")
-            self.signals.finished.emit(results)
+                page = service.search_documents_page(self.query, page=self.page, page_size=self.page_size)
+            logger.info(f"SearchWorker: Found {page['total']} documents for '{self.query}'")
+            self.signals.finished.emit(self.generation, page)
         except Exception as e:
             logger.error(f"SearchWorker: Error searching for '{self.query}': {e}")
-            self.signals.error.emit(str(e))
+            self.signals.error.emit(self.generation, str(e))
+
+
+class HighlightWorkerSignals(QObject):
+    """Signals for HighlightWorker to communicate with main thread."""
+    finished = pyqtSignal(str, dict)  # Emits (query, {doc_id: snippet})
+
+
+class HighlightWorker(QRunnable):
+    """Background worker that builds snippets for the rows currently on screen."""
+
+    def __init__(self, query: str, doc_ids: list):
+        super().__init__()
+        self.query = query
+        self.doc_ids = doc_ids
+        self.signals = HighlightWorkerSignals()
+
+    @pyqtSlot()
+    def run(self):
+        """Fetch highlights for the requested documents."""
+        try:
+            with document_service_context() as service:
+                highlights = service.get_search_highlights(self.query, self.doc_ids)
+            self.signals.finished.emit(self.query, highlights)
+        except Exception as e:
+            logger.error(f"HighlightWorker: Error highlighting '{self.query}': {e}")
+
+
 class DocumentSearchWindow(QMainWindow):
     """Window for advanced document search with highlighting."""
     
@@ -77,6 +113,16 @@ class DocumentSearchWindow(QMainWindow):
         
         # Store current results for filtering/sorting
         self.current_results = []
+        self.current_query = ""
+        self.current_page = 0
+        self.page_count = 0
+        self.total_results = 0
+        # Bumped on every new search so pages from an earlier one are dropped
+        self.search_generation = 0
+        
+        # Snippets are generated lazily for visible rows only
+        self.highlights = {}
+        self.pending_highlights = set()
         self.active_collection_filter = None
         self.active_type_filter = None
         
@@ -376,8 +422,16 @@ class DocumentSearchWindow(QMainWindow):
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.cellDoubleClicked.connect(self._on_row_double_clicked)
+        self.table.verticalScrollBar().valueChanged.connect(self._request_visible_highlights)
         
         parent_layout.addWidget(self.table)
+        
+        self.btn_load_more = QPushButton("Load More Results")
+        self.btn_load_more.setObjectName("NavigatorButton")
+        self.btn_load_more.setStyleSheet(get_navigator_style())
+        self.btn_load_more.clicked.connect(self._load_more)
+        self.btn_load_more.hide()
+        parent_layout.addWidget(self.btn_load_more)
 
     def _create_filter_chip(self, text: str, filter_type: str, value: str, is_active: bool = False) -> QPushButton:
         """Create a filter chip button."""
@@ -497,8 +551,8 @@ class DocumentSearchWindow(QMainWindow):
             title_item.setData(Qt.ItemDataRole.UserRole, r['id'])
             self.table.setItem(row, 0, title_item)
             
-            # Snippet (using QLabel for HTML support)
-            highlights = r.get('highlights', '')
+            # Snippet (using QLabel for HTML support); filled in lazily once visible
+            highlights = self.highlights.get(r['id'], r.get('highlights', ''))
             snippet_label = QLabel(f"<html><body>{highlights}</body></html>")
             snippet_label.setWordWrap(True)
             snippet_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
@@ -522,12 +576,67 @@ class DocumentSearchWindow(QMainWindow):
         self.table.resizeRowsToContents()
         
         # Update status with count
-        total = len(self.current_results)
+        total = max(self.total_results, len(self.current_results))
         showing = len(results)
         if showing == total:
             self.lbl_status.setText(f"Found {total} document{'s' if total != 1 else ''}")
         else:
             self.lbl_status.setText(f"Showing {showing} of {total} document{'s' if total != 1 else ''}")
+        
+        self.btn_load_more.setVisible(self.current_page < self.page_count)
+        QTimer.singleShot(0, self._request_visible_highlights)
+    
+    def _visible_rows(self) -> range:
+        """Return the range of table rows currently inside the viewport."""
+        count = self.table.rowCount()
+        if count == 0:
+            return range(0)
+        first = self.table.rowAt(0)
+        last = self.table.rowAt(self.table.viewport().height() - 1)
+        first = 0 if first < 0 else first
+        last = count - 1 if last < 0 else last
+        return range(first, last + 1)
+    
+    def _request_visible_highlights(self, *_):
+        """Dispatch snippet generation for visible rows that do not have one yet."""
+        if not self.current_query:
+            return
+        
+        doc_ids = []
+        for row in self._visible_rows():
+            item = self.table.item(row, 0)
+            if item is None:
+                continue
+            doc_id = item.data(Qt.ItemDataRole.UserRole)
+            if doc_id not in self.highlights and doc_id not in self.pending_highlights:
+                doc_ids.append(doc_id)
+        
+        if not doc_ids:
+            return
+        
+        self.pending_highlights.update(doc_ids)
+        worker = HighlightWorker(self.current_query, doc_ids)
+        worker.signals.finished.connect(self._on_highlights_ready)
+        self.thread_pool.start(worker)
+    
+    def _on_highlights_ready(self, query: str, highlights: dict):
+        """Fill in snippets for rows whose highlights have arrived."""
+        if query != self.current_query:
+            return  # Stale response from a previous search
+        
+        self.highlights.update(highlights)
+        self.pending_highlights.difference_update(highlights)
+        
+        for row in range(self.table.rowCount()):
+            item = self.table.item(row, 0)
+            if item is None:
+                continue
+            doc_id = item.data(Qt.ItemDataRole.UserRole)
+            if doc_id in highlights:
+                label = self.table.cellWidget(row, 1)
+                if isinstance(label, QLabel):
+                    label.setText(f"<html><body>{highlights[doc_id]}</body></html>")
+        self.table.resizeRowsToContents()
 
     def _add_to_history(self, term: str):
         """Add a search term to history (most recent first, max 10)."""
@@ -575,31 +684,62 @@ class DocumentSearchWindow(QMainWindow):
         self.table.setRowCount(0)
         self.btn_search.setEnabled(False)  # Prevent double-clicks
         
-        # Dispatch to background thread
-        worker = SearchWorker(query)
+        # Reset paging and snippet state for the new query
+        self.current_query = query
+        self.current_results = []
+        self.current_page = 0
+        self.page_count = 0
+        self.total_results = 0
+        self.highlights = {}
+        self.pending_highlights = set()
+        self.search_generation += 1
+        
+        self._dispatch_search(query, 1)
+    
+    def _dispatch_search(self, query: str, page: int):
+        """Dispatch a search for one result page to the background thread."""
+        worker = SearchWorker(query, self.search_generation, page)
         worker.signals.finished.connect(self._on_search_complete)
         worker.signals.error.connect(self._on_search_error)
         self.thread_pool.start(worker)
-        logger.debug(f"_perform_search: Dispatched worker for '{query}'")
+        logger.debug(f"_dispatch_search: Dispatched worker for '{query}' (page {page})")
+    
+    def _load_more(self):
+        """Fetch the next page of results for the current query."""
+        if not self.current_query or self.current_page >= self.page_count:
+            return
+        self.btn_load_more.setEnabled(False)
+        self._dispatch_search(self.current_query, self.current_page + 1)
     
-    def _on_search_complete(self, results: list):
+    def _on_search_complete(self, generation: int, page: dict):
         """Handle search completion from worker thread."""
+        if generation != self.search_generation:
+            return  # Stale page from a previous search
+        
         self.btn_search.setEnabled(True)
+        self.btn_load_more.setEnabled(True)
         
         # Store results for filtering/sorting
-        self.current_results = results
-        
-        # Update filter chips
-        self._update_filter_chips(results)
+        self.current_results.extend(page['results'])
+        self.current_page = page['page']
+        self.page_count = page['page_count']
+        self.total_results = page['total']
         
-        # Display results
-        self._display_results(results)
+        # Update filter chips and display (respecting active filters/sort)
+        self._apply_filters_and_sort()
+        if not self.current_results:
+            self._update_filter_chips([])
+            self._display_results([])
         
-        logger.info(f"_on_search_complete: Displayed {len(results)} results")
+        logger.info(f"_on_search_complete: Displayed {len(self.current_results)} of {self.total_results} results")
     
-    def _on_search_error(self, error_message: str):
+    def _on_search_error(self, generation: int, error_message: str):
         """Handle search error from worker thread."""
+        if generation != self.search_generation:
+            return
+        
         self.btn_search.setEnabled(True)
+        self.btn_load_more.setEnabled(True)
         self.lbl_status.setText(f"The Archives remain silent: {error_message}")
         logger.error(f"_on_search_error: {error_message}")
 
@@ -638,6 +778,10 @@ class DocumentSearchWindow(QMainWindow):
             QMessageBox.information(self, "Success", "Search index rebuilt successfully.")
             # Clear current results
             self.table.setRowCount(0)
+            self.current_query = ""
+            self.current_results = []
+            self.search_generation += 1
+            self.btn_load_more.hide()
             self.lbl_status.setText("Index rebuilt. Search again.")
         except Exception as e:
             progress.close()
@@ -1,26 +1,77 @@
 """
 Graph Physics Engine for Mindscape.
 Implements a Force-Directed Graph layout algorithm (Fruchterman-Reingold inspired).
+
+Node state lives in NumPy arrays so a tick is a handful of array operations.
+Repulsion is summed exactly for small graphs and with a Barnes-Hut quadtree
+for large ones, which brings the cost from O(n²) down to about O(n log n).
 """
-import math
+import numpy as np
 from PyQt6.QtCore import QPointF
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Generic, List, Optional, Set, Tuple, TypeVar, Union, overload
+
+# Bits per axis of the quadtree's Morton codes (deepest level of the tree)
+QUADTREE_DEPTH = 16
+# Rows of the all-pairs distance matrix computed at once
+EXACT_BLOCK_ROWS = 512
+
+
+_T = TypeVar("_T")
+
+
+class _Column(Generic[_T]):
+    """Descriptor exposing one field of a node stored in the engine's arrays."""
+
+    def __init__(self, array: str, column: Optional[int] = None, *, cast: Callable[[Any], _T]):
+        self.array = array
+        self.column = column
+        self.cast = cast
+
+    def _key(self, node: "PhysicsNode") -> Union[int, Tuple[int, int]]:
+        return node.index if self.column is None else (node.index, self.column)
+
+    def _values(self, node: "PhysicsNode") -> np.ndarray:
+        return getattr(node.physics, self.array)
+
+    @overload
+    def __get__(self, node: None, owner: Optional[type] = None) -> "_Column[_T]": ...
+    @overload
+    def __get__(self, node: "PhysicsNode", owner: Optional[type] = None) -> _T: ...
+
+    def __get__(self, node: Optional["PhysicsNode"], owner: Optional[type] = None) -> Union["_Column[_T]", _T]:
+        if node is None:
+            return self
+        return self.cast(self._values(node)[self._key(node)])
+
+    def __set__(self, node: "PhysicsNode", value: _T) -> None:
+        self._values(node)[self._key(node)] = value
+
 
-@dataclass
 class PhysicsNode:
     """
     Physics Node class definition.
     
+    A handle onto one row of the engine's arrays: reading or assigning
+    x, y, vx, vy, mass, radius or fixed goes straight to the simulation.
     """
-    id: int
-    x: float
-    y: float
-    vx: float = 0.0
-    vy: float = 0.0
-    mass: float = 1.0
-    radius: float = 80.0 # Interaction radius (approx half width)
-    fixed: bool = False # If true, physics won't move it (e.g. being dragged)
+    __slots__ = ("id", "physics", "index")
+
+    x = _Column("_pos", 0, cast=float)
+    y = _Column("_pos", 1, cast=float)
+    vx = _Column("_vel", 0, cast=float)
+    vy = _Column("_vel", 1, cast=float)
+    mass = _Column("_mass", cast=float)
+    radius = _Column("_radius", cast=float)  # Interaction radius (approx half width)
+    fixed = _Column("_fixed", cast=bool)  # If true, physics won't move it (e.g. being dragged)
+
+    def __init__(self, physics: "GraphPhysics", node_id: int, index: int):
+        self.id = node_id
+        self.physics = physics
+        self.index = index  # Row in the engine's arrays; moves when another node is removed
+
+    def __repr__(self) -> str:
+        return f"PhysicsNode(id={self.id}, x={self.x:.1f}, y={self.y:.1f}, vx={self.vx:.2f}, vy={self.vy:.2f})"
 
 @dataclass
 class PhysicsEdge:
@@ -46,6 +97,8 @@ class GraphPhysics:
         center_force: Description of center_force.
         RECENTER_GAIN: Description of RECENTER_GAIN.
         bounds: Description of bounds.
+        theta: Barnes-Hut opening angle (0 sums every pair exactly).
+        exact_limit: Node count up to which repulsion is summed over all pairs.
     
     """
     def __init__(self):
@@ -64,6 +117,23 @@ class GraphPhysics:
         self.RECENTER_GAIN = 0.0   # Disable recentering to remove bias
         self.bounds = 5000.0       # Soft clamp boundary radius
         
+        # Repulsion solver: a cell of width s seen from distance d is treated as
+        # one body at its centre of mass when s / d < theta
+        self.theta = 0.7
+        self.exact_limit = 256
+
+        # Node rows (the first len(self.nodes) are live)
+        self._ids: List[int] = []
+        self._pos: np.ndarray = np.zeros((0, 2))
+        self._vel: np.ndarray = np.zeros((0, 2))
+        self._mass: np.ndarray = np.zeros(0)
+        self._radius: np.ndarray = np.zeros(0)
+        self._fixed: np.ndarray = np.zeros(0, dtype=bool)
+
+        self._edge_pairs: Set[FrozenSet[int]] = set()
+        self._edge_arrays: Optional[Tuple[np.ndarray, ...]] = None
+        self._edge_count = 0
+
     def add_node(self, node_id: int, x: float, y: float, mass: float = 1.0):
         """
         Add node logic.
@@ -75,8 +145,19 @@ class GraphPhysics:
             mass: Description of mass.
         
         """
-        if node_id not in self.nodes:
-            self.nodes[node_id] = PhysicsNode(id=node_id, x=x, y=y, mass=mass)
+        if node_id in self.nodes:
+            return
+        index = len(self._ids)
+        if index == len(self._pos):
+            self._grow(max(64, 2 * index))
+        self._pos[index] = (x, y)
+        self._vel[index] = 0.0
+        self._mass[index] = mass
+        self._radius[index] = 80.0
+        self._fixed[index] = False
+        self._ids.append(node_id)
+        self.nodes[node_id] = PhysicsNode(self, node_id, index)
+        self._edge_arrays = None
             
     def remove_node(self, node_id: int):
         """
@@ -87,9 +168,20 @@ class GraphPhysics:
         
         """
         if node_id in self.nodes:
-            del self.nodes[node_id]
+            # Move the last row into the freed one
+            index = self.nodes.pop(node_id).index
+            last = len(self._ids) - 1
+            if index != last:
+                moved_id = self._ids[last]
+                for array in (self._pos, self._vel, self._mass, self._radius, self._fixed):
+                    array[index] = array[last]
+                self._ids[index] = moved_id
+                self.nodes[moved_id].index = index
+            self._ids.pop()
         # Remove associated edges
         self.edges = [e for e in self.edges if e.source_id != node_id and e.target_id != node_id]
+        self._edge_pairs = {pair for pair in self._edge_pairs if node_id not in pair}
+        self._edge_arrays = None
             
     def add_edge(self, source_id: int, target_id: int, length: float = 250.0, stiffness: float = 0.05):
         # Avoid duplicate edges
@@ -103,12 +195,13 @@ class GraphPhysics:
             stiffness: Description of stiffness.
         
         """
-        for e in self.edges:
-            if (e.source_id == source_id and e.target_id == target_id) or \
-               (e.source_id == target_id and e.target_id == source_id):
-                   return
+        pair = frozenset((source_id, target_id))
+        if pair in self._edge_pairs:
+            return
                    
+        self._edge_pairs.add(pair)
         self.edges.append(PhysicsEdge(source_id, target_id, length, stiffness))
+        self._edge_arrays = None
         
     def clear(self):
         """
@@ -117,6 +210,9 @@ class GraphPhysics:
         """
         self.nodes.clear()
         self.edges.clear()
+        self._ids.clear()
+        self._edge_pairs.clear()
+        self._edge_arrays = None
         
     def set_position(self, node_id: int, x: float, y: float):
         """
@@ -129,10 +225,9 @@ class GraphPhysics:
         
         """
         if node_id in self.nodes:
-            self.nodes[node_id].x = x
-            self.nodes[node_id].y = y
-            self.nodes[node_id].vx = 0
-            self.nodes[node_id].vy = 0
+            index = self.nodes[node_id].index
+            self._pos[index] = (x, y)
+            self._vel[index] = 0.0
             
     def set_fixed(self, node_id: int, is_fixed: bool):
         """
@@ -144,114 +239,60 @@ class GraphPhysics:
         
         """
         if node_id in self.nodes:
-            self.nodes[node_id].fixed = is_fixed
+            index = self.nodes[node_id].index
+            self._fixed[index] = is_fixed
             if is_fixed:
-                self.nodes[node_id].vx = 0
-                self.nodes[node_id].vy = 0
+                self._vel[index] = 0.0
 
     def tick(self, dt: float = 0.016):
         """Step the simulation."""
+        n = len(self._ids)
+        if not n:
+            return
+        pos, vel, fixed = self._pos[:n], self._vel[:n], self._fixed[:n]
+        free = ~fixed
         
         # Adaptive repulsion scaling by graph size
-        node_ids = list(self.nodes.keys())
-        scale = max(1.0, len(node_ids) / 50.0)
+        scale = max(1.0, n / 50.0)
         repulsion = self.REPULSION / scale
 
-        # 1. Apply Repulsion (Node vs Node)
-        for i in range(len(node_ids)):
-            n1 = self.nodes[node_ids[i]]
-            
-            # Optional center gravity (currently disabled)
-            if self.center_force:
-                dist_center = math.sqrt(n1.x*n1.x + n1.y*n1.y) or 1.0
-                n1.vx -= (n1.x / dist_center) * self.center_force * dist_center
-                n1.vy -= (n1.y / dist_center) * self.center_force * dist_center
-            
-            for j in range(i + 1, len(node_ids)):
-                n2 = self.nodes[node_ids[j]]
-                
-                dx = n1.x - n2.x
-                dy = n1.y - n2.y
-                dist_sq = dx*dx + dy*dy
-                
-                if dist_sq < 1: dist_sq = 1 # Avoid div by zero
-                
-                dist = math.sqrt(dist_sq)
-                
-                # F = k / dist^2
-                force = repulsion / dist_sq
-                
-                fx = (dx / dist) * force
-                fy = (dy / dist) * force
-                
-                if not n1.fixed:
-                    n1.vx += fx
-                    n1.vy += fy
-                if not n2.fixed:
-                    n2.vx -= fx
-                    n2.vy -= fy
-                    
-        # 2. Apply Springs (Edges)
-        for edge in self.edges:
-            if edge.source_id not in self.nodes or edge.target_id not in self.nodes:
-                continue
-                
-            n1 = self.nodes[edge.source_id]
-            n2 = self.nodes[edge.target_id]
-            
-            dx = n2.x - n1.x
-            dy = n2.y - n1.y
-            dist = math.sqrt(dx*dx + dy*dy) or 1.0
-            
-            # Hooke's Law: F = k * (current_dist - desired_length)
-            displacement = dist - edge.length
-            force = edge.stiffness * displacement
+        # Optional center gravity (currently disabled)
+        if self.center_force:
+            vel[free] -= pos[free] * self.center_force
             
-            fx = (dx / dist) * force
-            fy = (dy / dist) * force
+        # 1. Apply Repulsion (Node vs Node), F = k / dist^2
+        if n <= self.exact_limit or self.theta <= 0:
+            push = _exact_repulsion(pos)
+        else:
+            push = _barnes_hut_repulsion(pos, self.theta)
+        vel[free] += repulsion * push[free]
             
-            if not n1.fixed:
-                n1.vx += fx
-                n1.vy += fy
-            if not n2.fixed:
-                n2.vx -= fx
-                n2.vy -= fy
+        # 2. Apply Springs (Edges), Hooke's Law: F = k * (current_dist - desired_length)
+        source, target, length, stiffness = self._edges_as_arrays()
+        if len(source):
+            delta = pos[target] - pos[source]
+            dist = np.hypot(delta[:, 0], delta[:, 1])
+            dist[dist == 0] = 1.0
+            force = delta * (stiffness * (dist - length) / dist)[:, None]
+            pull = np.zeros_like(pos)
+            for axis in (0, 1):
+                pull[:, axis] = (np.bincount(source, force[:, axis], minlength=n)
+                                 - np.bincount(target, force[:, axis], minlength=n))
+            vel[free] += pull[free]
                 
         # 3. Update Positions (Integration)
-        for node in self.nodes.values():
-            if node.fixed:
-                continue
+        v = vel[free] * self.DAMPING
+        speed = np.hypot(v[:, 0], v[:, 1])
+        fast = speed > self.MAX_SPEED
+        v[fast] *= (self.MAX_SPEED / speed[fast])[:, None]  # Speed Limit
+        v[speed < 0.05] = 0.0
+        p = pos[free] + v
                 
-            # Damping
-            node.vx *= self.DAMPING
-            node.vy *= self.DAMPING
-            
-            # Speed Limit
-            speed = math.sqrt(node.vx*node.vx + node.vy*node.vy)
-            if speed > self.MAX_SPEED:
-                scale = self.MAX_SPEED / speed
-                node.vx *= scale
-                node.vy *= scale
-            elif speed < 0.05:
-                node.vx = 0.0
-                node.vy = 0.0
-                
-            node.x += node.vx
-            node.y += node.vy
-
-            # Soft bounds clamp to avoid runaway coordinates
-            if node.x > self.bounds:
-                node.x = self.bounds
-                node.vx *= -0.2
-            if node.x < -self.bounds:
-                node.x = -self.bounds
-                node.vx *= -0.2
-            if node.y > self.bounds:
-                node.y = self.bounds
-                node.vy *= -0.2
-            if node.y < -self.bounds:
-                node.y = -self.bounds
-                node.vy *= -0.2
+        # Soft bounds clamp to avoid runaway coordinates
+        outside = np.abs(p) > self.bounds
+        p = np.clip(p, -self.bounds, self.bounds)
+        v[outside] *= -0.2
+        pos[free], vel[free] = p, v
 
         # 4. Recentering to prevent global drift (light touch)
         # Recenter disabled; keep pure physics to avoid bias
@@ -267,5 +308,166 @@ class GraphPhysics:
             Result of get_position operation.
         """
         if node_id in self.nodes:
-            return QPointF(self.nodes[node_id].x, self.nodes[node_id].y)
-        return QPointF(0, 0)
\ No newline at end of file
+            index = self.nodes[node_id].index
+            return QPointF(float(self._pos[index, 0]), float(self._pos[index, 1]))
+        return QPointF(0, 0)
+
+    def _grow(self, capacity: int):
+        """Reallocate the node arrays with room for ``capacity`` rows."""
+        def grown(array: np.ndarray) -> np.ndarray:
+            bigger = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            bigger[:len(array)] = array
+            return bigger
+
+        self._pos, self._vel = grown(self._pos), grown(self._vel)
+        self._mass, self._radius, self._fixed = grown(self._mass), grown(self._radius), grown(self._fixed)
+
+    def _edges_as_arrays(self) -> Tuple[np.ndarray, ...]:
+        """Row indices, lengths and stiffnesses of the edges between live nodes."""
+        if self._edge_arrays is None or self._edge_count != len(self.edges):
+            live = [e for e in self.edges if e.source_id in self.nodes and e.target_id in self.nodes]
+            self._edge_arrays = (
+                np.array([self.nodes[e.source_id].index for e in live], dtype=np.intp),
+                np.array([self.nodes[e.target_id].index for e in live], dtype=np.intp),
+                np.array([e.length for e in live], dtype=float),
+                np.array([e.stiffness for e in live], dtype=float),
+            )
+            self._edge_count = len(self.edges)
+        return self._edge_arrays
+
+
+def _exact_repulsion(pos: np.ndarray) -> np.ndarray:
+    """Sum of (p_i - p_j) / max(|p_i - p_j|², 1)^1.5 over all j, for every i."""
+    push = np.empty_like(pos)
+    for start in range(0, len(pos), EXACT_BLOCK_ROWS):
+        delta = pos[start:start + EXACT_BLOCK_ROWS, None, :] - pos[None, :, :]
+        dist_sq = np.maximum(np.einsum("ijk,ijk->ij", delta, delta), 1.0)  # Avoid div by zero
+        push[start:start + EXACT_BLOCK_ROWS] = np.einsum("ijk,ij->ik", delta, dist_sq ** -1.5)
+    return push
+
+
+def _spread_bits(v: np.ndarray) -> np.ndarray:
+    """Insert a zero bit above each of the low 16 bits (for Morton interleaving)."""
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    return (v | (v << 1)) & 0x55555555
+
+
+def _ranges(first: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenation of arange(first[i], first[i] + counts[i]) for every i."""
+    ends = np.cumsum(counts)
+    return np.repeat(first - ends + counts, counts) + np.arange(ends[-1] if len(ends) else 0)
+
+
+def _no_cells() -> np.ndarray:
+    return np.zeros(0, dtype=np.intp)
+
+
+@dataclass
+class _QuadLevel:
+    """One depth of the linear quadtree, cells in Morton order."""
+    first: np.ndarray  # First (sorted) point of each cell
+    count: np.ndarray  # Points in each cell
+    com_x: np.ndarray  # Centre of mass of each cell
+    com_y: np.ndarray
+    cell_of: np.ndarray  # Cell each sorted point falls in
+    # Each cell's first child and child count on the next level (empty at the deepest)
+    first_child: np.ndarray = field(default_factory=_no_cells)
+    children: np.ndarray = field(default_factory=_no_cells)
+
+
+def _build_quadtree(pos: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float, List[_QuadLevel]]:
+    """
+    Linear quadtree over the points, one level at a time.
+
+    Points are sorted along a Morton curve, so every cell at every level
+    holds a contiguous run of them. Returns the sort order, the sorted
+    points, the root width and the levels. Levels stop once every cell
+    holds a single point (or at QUADTREE_DEPTH, where coincident points
+    share a leaf).
+    """
+    lo = pos.min(axis=0)
+    width = float((pos.max(axis=0) - lo).max()) or 1.0
+    cells = 1 << QUADTREE_DEPTH
+    grid = np.minimum(((pos - lo) * (cells / width)).astype(np.int64), cells - 1)
+    code = _spread_bits(grid[:, 0]) | (_spread_bits(grid[:, 1]) << 1)
+    order = np.argsort(code, kind="stable")
+    code, points = code[order], pos[order]
+
+    n = len(points)
+    levels: List[_QuadLevel] = []
+    for depth in range(QUADTREE_DEPTH + 1):
+        key = code >> (2 * (QUADTREE_DEPTH - depth))
+        first = np.flatnonzero(np.concatenate(([True], key[1:] != key[:-1])))
+        count = np.diff(np.append(first, n))
+        levels.append(_QuadLevel(
+            first=first,
+            count=count,
+            com_x=np.add.reduceat(points[:, 0], first) / count,
+            com_y=np.add.reduceat(points[:, 1], first) / count,
+            cell_of=np.repeat(np.arange(len(first)), count),
+        ))
+        if len(first) == n:
+            break
+
+    for parent, child in zip(levels, levels[1:]):
+        owner = parent.cell_of[child.first]
+        parent.children = np.bincount(owner, minlength=len(parent.first))
+        parent.first_child = np.cumsum(parent.children) - parent.children
+    return order, points, width, levels
+
+
+def _barnes_hut_repulsion(pos: np.ndarray, theta: float) -> np.ndarray:
+    """
+    Barnes-Hut approximation of _exact_repulsion.
+
+    Every point walks the quadtree from the root; all walks advance together
+    one level at a time as flat (point, cell) arrays. A cell far enough away
+    (width / distance < theta), or holding a single other point, acts as its
+    point count at its centre of mass; a nearer cell is replaced by its
+    children, or summed point by point at the deepest level.
+    """
+    order, points, width, levels = _build_quadtree(pos)
+    n = len(points)
+    px, py = points[:, 0].copy(), points[:, 1].copy()
+    push_x, push_y = np.zeros(n), np.zeros(n)
+
+    def add(bodies: np.ndarray, dx: np.ndarray, dy: np.ndarray, weight: Union[np.ndarray, float]) -> None:
+        dist_sq = np.maximum(dx * dx + dy * dy, 1.0)
+        w = weight / (dist_sq * np.sqrt(dist_sq))
+        push_x[:] += np.bincount(bodies, dx * w, minlength=n)
+        push_y[:] += np.bincount(bodies, dy * w, minlength=n)
+
+    bodies = np.arange(n)
+    cells = np.zeros(n, dtype=np.intp)
+    theta_sq = theta * theta
+    for depth, level in enumerate(levels):
+        if not len(bodies):
+            break
+        count = level.count.take(cells)
+        dx = px.take(bodies) - level.com_x.take(cells)
+        dy = py.take(bodies) - level.com_y.take(cells)
+        cell_width = width / (1 << depth)
+        far = (count == 1) | (cell_width * cell_width < theta_sq * (dx * dx + dy * dy))
+        far &= level.cell_of.take(bodies) != cells
+        hits = np.flatnonzero(far)
+        add(bodies.take(hits), dx.take(hits), dy.take(hits), count.take(hits))
+
+        near = np.flatnonzero(~far & (count > 1))
+        bodies, cells = bodies.take(near), cells.take(near)
+        if depth == len(levels) - 1:
+            # Deepest level: sum the cell's points one by one, skipping the point itself
+            sizes = level.count.take(cells)
+            others = _ranges(level.first.take(cells), sizes)
+            bodies = np.repeat(bodies, sizes)
+            keep = others != bodies
+            bodies, others = bodies[keep], others[keep]
+            add(bodies, px.take(bodies) - px.take(others), py.take(bodies) - py.take(others), 1.0)
+            break
+        children = level.children.take(cells)
+        bodies, cells = np.repeat(bodies, children), _ranges(level.first_child.take(cells), children)
+
+    push = np.empty_like(pos)
+    push[order, 0], push[order, 1] = push_x, push_y
+    return push
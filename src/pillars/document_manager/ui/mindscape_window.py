@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (
     QStackedWidget, QListWidget, QListWidgetItem, QHBoxLayout,
     QPushButton, QLabel
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 import qtawesome as qta
 from .mindscape_tree import MindscapeTreeWidget
 from .mindscape_page import MindscapePageWidget
@@ -63,6 +63,45 @@ class SearchResultWidget(QWidget):
         lbl_snippet.setMaximumHeight(60) # Limit height (approx 3 lines) -> ellide handling is manual usually but wrap is ok
         layout.addWidget(lbl_snippet)
 
+class NotebookSearchSignals(QObject):
+    """Signals for NotebookSearchWorker."""
+    finished = pyqtSignal(int, str, list)  # (generation, query, results)
+    error = pyqtSignal(int, str)           # (generation, message)
+
+
+class NotebookSearchWorker(QRunnable):
+    """
+    Runs a notebook search off the UI thread.
+
+    Each search carries the generation it was issued in; the window drops
+    results from superseded generations, and a worker that starts after its
+    generation is already stale skips the query entirely.
+    """
+    def __init__(self, query: str, generation: int, is_current):
+        """
+        Args:
+            query: Text to search for.
+            generation: Search generation this worker belongs to.
+            is_current: Callable returning True while ``generation`` is still wanted.
+        """
+        super().__init__()
+        self.query = query
+        self.generation = generation
+        self.is_current = is_current
+        self.signals = NotebookSearchSignals()
+
+    @pyqtSlot()
+    def run(self) -> None:
+        if not self.is_current(self.generation):
+            return
+        try:
+            with notebook_service_context() as svc:
+                results = svc.search_global(self.query)
+            self.signals.finished.emit(self.generation, self.query, results)
+        except Exception as e:
+            self.signals.error.emit(self.generation, str(e))
+
+
 class MindscapeWindow(QMainWindow):
     """
     Revised Mindscape Window (OneNote Style).
@@ -182,6 +221,11 @@ class MindscapeWindow(QMainWindow):
         self.search_timer.setSingleShot(True)
         self.search_timer.setInterval(300) # Debounce 300ms
         
+        # Every keystroke bumps the generation so in-flight searches go stale
+        self._search_generation = 0
+        self._search_pool = QThreadPool(self)
+        self._search_pool.setMaxThreadCount(1)
+        
         self.search_input.textChanged.connect(self._on_search_text_changed)
         self.search_timer.timeout.connect(self._perform_search)
         self.results_list.itemClicked.connect(self._on_result_clicked)
@@ -190,6 +234,7 @@ class MindscapeWindow(QMainWindow):
         self.page.clear()
 
     def _on_search_text_changed(self, text: str) -> None:
+        self._search_generation += 1
         if not text:
             # Show Tree
             self.sidebar_stack.setCurrentIndex(0)
@@ -204,13 +249,28 @@ class MindscapeWindow(QMainWindow):
             return
             
         self.sidebar_stack.setCurrentIndex(1) # Show Results
-        self.results_list.clear()
         self.results_header.setText("Searching...")
         
+        # Drop queued searches that have not started yet; they are stale now
+        self._search_pool.clear()
+        worker = NotebookSearchWorker(text, self._search_generation, self._is_current_search)
+        worker.signals.finished.connect(self._on_search_finished)
+        worker.signals.error.connect(self._on_search_error)
+        self._search_pool.start(worker)
+
+    def _is_current_search(self, generation: int) -> bool:
+        return generation == self._search_generation
+
+    def _on_search_error(self, generation: int, message: str) -> None:
+        if self._is_current_search(generation):
+            self.results_header.setText(f"Error: {message}")
+
+    def _on_search_finished(self, generation: int, text: str, results: list) -> None:
+        if not self._is_current_search(generation):
+            return  # A newer keystroke superseded this search
+        
+        self.results_list.clear()
         try:
-            with notebook_service_context() as svc:
-                results = svc.search_global(text)
-                
             self.results_header.setText(f"Found {len(results)} matches")
             
             for res in results:
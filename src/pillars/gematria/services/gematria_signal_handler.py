@@ -4,11 +4,13 @@ This service subscribes to the GematriaBus and provides Gematria calculations
 to any pillar that requests them, preserving pillar sovereignty per The Covenant.
 
 The handler is initialized at application startup and remains active for the
-entire session, responding to calculation requests via PyQt signals.
+entire session, responding to calculation requests via PyQt signals. It also
+registers itself as the bus's in-process resolver, so synchronous callers
+(spreadsheet formulas) reach the calculators without a signal round trip.
 """
 from PyQt6.QtCore import QObject
 from shared.signals import gematria_bus
-from typing import Dict
+from typing import Any, Dict, List, Sequence
 import logging
 
 # Import all calculator classes
@@ -43,6 +45,7 @@ class GematriaSignalHandler(QObject):
     - Maintains a registry of all available calculators
     - Responds to calculation_requested with calculation_completed
     - Responds to cipher_list_requested with cipher_list_completed
+    - Serves gematria_bus.calculate/calculate_many via calculate_batch
     
     The handler preserves pillar sovereignty by allowing other pillars to
     request calculations without importing Gematria pillar classes directly.
@@ -56,6 +59,7 @@ class GematriaSignalHandler(QObject):
         # Subscribe to signals
         gematria_bus.calculation_requested.connect(self._handle_calculation)
         gematria_bus.cipher_list_requested.connect(self._handle_cipher_list)
+        gematria_bus.register_resolver(self.calculate_batch)
         
         logger.info(f"GematriaSignalHandler initialized with {len(self._registry)} calculators")
     
@@ -121,27 +125,42 @@ class GematriaSignalHandler(QObject):
         
         return {c.name.upper(): c for c in calculators}
     
-    def _handle_calculation(self, text: str, cipher: str):
+    def calculate_batch(self, texts: Sequence[str], cipher: str) -> List[Any]:
         """
-        Handle a calculation request and emit the result.
+        Calculate many texts with one calculator lookup.
         
         Args:
-            text: The text to calculate
+            texts: The texts to calculate
             cipher: The cipher name (case-insensitive)
+            
+        Returns:
+            One value per text: the calculated int, or an error string
+            ("#CIPHER? (name)" for an unknown cipher, "#ERROR!" on failure)
         """
-        cipher_key = cipher.upper()
-        calculator = self._registry.get(cipher_key)
-        
+        calculator = self._registry.get(cipher.upper())
         if not calculator:
             logger.warning(f"Unknown cipher requested: {cipher}")
-            result = f"#CIPHER? ({cipher})"
-        else:
+            return [f"#CIPHER? ({cipher})"] * len(texts)
+        
+        results: List[Any] = []
+        for text in texts:
             try:
-                result = calculator.calculate(text)
-                logger.debug(f"Calculated '{text}' using {cipher}: {result}")
+                results.append(calculator.calculate(text))
             except Exception as e:
                 logger.error(f"Calculation error for '{text}' using {cipher}: {e}")
-                result = "#ERROR!"
+                results.append("#ERROR!")
+        return results
+    
+    def _handle_calculation(self, text: str, cipher: str):
+        """
+        Handle a calculation request and emit the result.
+        
+        Args:
+            text: The text to calculate
+            cipher: The cipher name (case-insensitive)
+        """
+        result = self.calculate_batch([text], cipher)[0]
+        logger.debug(f"Calculated '{text}' using {cipher}: {result}")
         
         # Emit response
         gematria_bus.calculation_completed.emit(text, cipher, result)
@@ -13,7 +13,7 @@ from PyQt6.QtWidgets import (
     QTextBrowser, QSplitter, QFrame
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from typing import Optional
+from typing import Dict, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -78,7 +78,7 @@ class InterlinearToolsPanel(QWidget):
         tq_input_layout = QHBoxLayout()
         tq_input_layout.addWidget(QLabel("TQ Value:"))
         self.tq_input = QLineEdit()
-        self.tq_input.setPlaceholderText("Enter TQ value...")
+        self.tq_input.setPlaceholderText("TQ value, list (1, 2) or range (1-9)...")
         self.tq_input.returnPressed.connect(self._on_tq_lookup)
         tq_input_layout.addWidget(self.tq_input)
 
@@ -270,16 +270,21 @@ class InterlinearToolsPanel(QWidget):
         layout.addStretch()
 
     def _on_tq_lookup(self):
-        """Handle TQ value lookup request."""
+        """Handle TQ value lookup request (a value, a comma list, or a range)."""
         value_text = self.tq_input.text().strip()
         if not value_text:
             return
 
         try:
-            tq_value = int(value_text)
-            self._find_words_by_tq(tq_value)
+            if '-' in value_text:
+                low, high = value_text.split('-', 1)
+                self._find_words_in_tq_range(int(low), int(high))
+            elif ',' in value_text:
+                self._find_words_by_tq_values([int(v) for v in value_text.split(',') if v.strip()])
+            else:
+                self._find_words_by_tq(int(value_text))
         except ValueError:
-            self.info_label.setText("⚠️ Please enter a valid numeric TQ value.")
+            self.info_label.setText("⚠️ Please enter a TQ value, a list (1, 2) or a range (1-9).")
 
     def _find_words_by_tq(self, tq_value: int):
         """Find all words in concordance with the given TQ value."""
@@ -309,6 +314,49 @@ class InterlinearToolsPanel(QWidget):
             logger.error(f"Error finding words by TQ value: {e}", exc_info=True)
             self.info_label.setText(f"Error: {e}")
 
+    def _find_words_by_tq_values(self, tq_values: List[int]):
+        """Find the words for several TQ values, grouped by value."""
+        try:
+            from shared.services.lexicon.holy_key_service import HolyKeyService
+
+            self._show_grouped_words(HolyKeyService().find_words_by_tq_values(tq_values))
+        except Exception as e:
+            logger.error(f"Error finding words by TQ values: {e}", exc_info=True)
+            self.info_label.setText(f"Error: {e}")
+
+    def _find_words_in_tq_range(self, low: int, high: int):
+        """Find the words whose TQ value lies in a range, grouped by value."""
+        try:
+            from shared.services.lexicon.holy_key_service import HolyKeyService
+
+            self._show_grouped_words(HolyKeyService().find_words_in_tq_range(low, high))
+        except Exception as e:
+            logger.error(f"Error finding words by TQ value: {e}", exc_info=True)
+            self.info_label.setText(f"Error: {e}")
+
+    def _show_grouped_words(self, grouped: Dict[int, List[Dict]]):
+        """List words under a header per TQ value."""
+        self.tq_results.clear()
+        total = 0
+        for value, words in grouped.items():
+            if not words:
+                continue
+            header = QListWidgetItem(f"— {value} —")
+            header.setFlags(Qt.ItemFlag.NoItemFlags)
+            self.tq_results.addItem(header)
+            for word_data in words:
+                word = word_data.get('word', '')
+                item = QListWidgetItem(f"{word} ({word_data.get('frequency', 0)} occurrences)")
+                item.setData(Qt.ItemDataRole.UserRole, word)
+                self.tq_results.addItem(item)
+            total += len(words)
+
+        values_with_words = sum(1 for words in grouped.values() if words)
+        if total:
+            self.info_label.setText(f"Found {total} words across {values_with_words} TQ values")
+        else:
+            self.info_label.setText("No words found for those TQ values")
+
     def _on_tq_result_selected(self, item: QListWidgetItem):
         """Handle double-click on TQ result - explore the word."""
         word = item.data(Qt.ItemDataRole.UserRole)
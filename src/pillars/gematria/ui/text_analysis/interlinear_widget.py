@@ -442,6 +442,8 @@ class InterlinearDocumentView(QWidget):
         self.multi_lang_calculator = multi_lang_calculator
         self.key_service = key_service
         self._verses = []
+        self._verse_words: List[List[str]] = []
+        self._resolver = None
 
         self._setup_ui()
         
@@ -495,7 +497,8 @@ class InterlinearDocumentView(QWidget):
                 item.widget().deleteLater()
                 
         # Add verse widgets
-        for v in verses:
+        self._verse_words = []
+        for index, v in enumerate(verses):
             verse_widget = InterlinearVerseWidget(
                 calculator=self.calculator,
                 key_service=self.key_service,
@@ -505,7 +508,10 @@ class InterlinearDocumentView(QWidget):
                 verse_text=v.get('text', ''),
                 verse_number=v.get('verse_number')
             )
+            self._verse_words.append(verse_widget._tokenize(v.get('text', '')))
             verse_widget.word_clicked.connect(self._on_word_clicked)
+            # Reading moves forward: warm the next verse while this one is studied
+            verse_widget.word_clicked.connect(lambda *_, i=index: self._prefetch_verse(i + 1))
             
             # Add separator
             frame = QFrame()
@@ -516,6 +522,43 @@ class InterlinearDocumentView(QWidget):
             self.verses_layout.insertWidget(self.verses_layout.count() - 1, frame)
             
         self.lbl_info.setText(f"Interlinear View ({len(verses)} verses)")
+        self._prefetch_verse(0)
+
+    def _lexicon_resolver(self):
+        """Lazily create the resolver; its result cache is shared across windows."""
+        if self._resolver is None:
+            from shared.services.lexicon.lexicon_resolver import LexiconResolver
+            self._resolver = LexiconResolver()
+        return self._resolver
+
+    @staticmethod
+    def _is_classical_script(word: str) -> bool:
+        """True for Hebrew/Greek words, which the compact lexicons cover."""
+        return any('\u0590' <= c <= '\u05ff' or '\u0370' <= c <= '\u03ff' or '\u1f00' <= c <= '\u1fff'
+                   for c in word)
+
+    def _prefetch_verse(self, index: int):
+        """Warm the lexicon cache with the Hebrew/Greek words of verse ``index``."""
+        if 0 <= index < len(self._verse_words):
+            words = [w for w in self._verse_words[index] if self._is_classical_script(w)]
+            if words:
+                self._lexicon_resolver().prefetch(words)
+
+    def _lookup_lexicon(self, words: List[str], language: Optional[str] = None) -> Dict[str, List[Any]]:
+        """
+        Batch lexicon lookup for Hebrew/Greek words (served from the prefetch cache).
+
+        ``language`` ("Greek"/"Hebrew") also admits transliterated words.
+        """
+        if language is None:
+            words = [w for w in words if self._is_classical_script(w)]
+        if not words:
+            return {}
+        try:
+            return self._lexicon_resolver().lookup_many(words, [language] if language else None)
+        except Exception as e:
+            logger.debug(f"Lexicon lookup failed for {words}: {e}")
+            return {}
         
     def _on_word_clicked(self, word: str, tq_value: int, key_id: int, etymology_chain: Optional[List[str]] = None):
         """Show word details dialog with enriched data.
@@ -673,6 +716,7 @@ class InterlinearDocumentView(QWidget):
             def_by_type: defaultdict[str, list] = defaultdict(list)
             for d in definitions:
                 def_by_type[d.type.upper()].append(d.content)
+            lexicon_entries = [] if definitions else self._lookup_lexicon([word]).get(word, [])
             
             # Definitions section
             if definitions:
@@ -766,6 +810,19 @@ class InterlinearDocumentView(QWidget):
                                 {content_clean}
                             </div>
                             """)
+            elif lexicon_entries:
+                # Not enriched yet: fall back to the classical lexicons
+                html_parts.append(f"<h2 style='color: #7c3aed; border-bottom: 2px solid #e9d5ff; padding-bottom: 5px; margin-top: 20px;'>📖 Lexicon ({len(lexicon_entries)} entries)</h2>")
+                for entry in lexicon_entries:
+                    translit = f" <i style='color: #6b7280;'>{entry.transliteration}</i>" if entry.transliteration else ""
+                    html_parts.append(f"""
+                    <div style='background: #f9fafb; padding: 12px; margin: 5px 0; 
+                                border-left: 3px solid #c4b5fd; border-radius: 4px;'>
+                        <b>{entry.word}</b>{translit}
+                        <span style='color: #6b7280; font-size: 11px; margin-left: 8px;'>{entry.source}</span><br>
+                        {entry.definition or entry.etymology or ''}
+                    </div>
+                    """)
             else:
                 html_parts.append("""
                 <div style='background: #fef3c7; padding: 15px; margin: 20px 0; border-radius: 4px; 
@@ -1002,14 +1059,12 @@ class InterlinearDocumentView(QWidget):
             # If no etymology data, try classical lexicons for Greek/Hebrew, then comprehensive lexicon
             lexicon_entries = []
             if not relations:
-                if is_greek:
-                    from shared.services.lexicon.classical_lexicon_service import ClassicalLexiconService
-                    lexicon_service = ClassicalLexiconService()
-                    lexicon_entries = lexicon_service.lookup_greek(word, prefer_classical=True)
-                elif is_hebrew:
-                    from shared.services.lexicon.classical_lexicon_service import ClassicalLexiconService
-                    lexicon_service = ClassicalLexiconService()
-                    lexicon_entries = lexicon_service.lookup_hebrew(word)
+                if is_greek or is_hebrew:
+                    # Strong's/Perseus/Kaikki through the shared cache. Native script
+                    # needs no hint (and then hits what the verse prefetch warmed);
+                    # transliterated words are routed by the language hint.
+                    hint = None if has_greek or has_hebrew else ("Greek" if is_greek else "Hebrew")
+                    lexicon_entries = self._lookup_lexicon([word], hint).get(word, [])
                 else:
                     # For other languages, try comprehensive lexicon service
                     from shared.services.lexicon.comprehensive_lexicon_service import ComprehensiveLexiconService
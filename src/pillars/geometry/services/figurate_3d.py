@@ -7,6 +7,29 @@ from __future__ import annotations
 import math
 from typing import List, Tuple
 
+import numpy as np
+
+Point3D = Tuple[float, float, float]
+
+
+def _as_points(array: np.ndarray) -> List[Point3D]:
+    """(N, 3) array -> list of (x, y, z) tuples, as the windows consume them."""
+    return list(map(tuple, array.tolist()))
+
+
+def _square_layer(width: int, z: float, spacing: float) -> np.ndarray:
+    """A centered width x width layer at height z, row-major."""
+    offset = (width - 1) / 2.0
+    row, col = np.divmod(np.arange(width * width), width)
+    return np.column_stack(((col - offset) * spacing, (row - offset) * spacing, np.full(width * width, z)))
+
+
+def _cube(n: int, spacing: float) -> np.ndarray:
+    """A centered n x n x n lattice, z outermost and x innermost."""
+    offset = (n - 1) / 2.0
+    z, y, x = np.indices((n, n, n)).reshape(3, -1)
+    return np.column_stack(((x - offset) * spacing, (y - offset) * spacing, (z - offset) * spacing))
+
 
 # -----------------------------------------------------------------------------
 # Isometric Projection
@@ -110,40 +133,26 @@ def tetrahedral_points(n: int, spacing: float = 1.0) -> List[Tuple[float, float,
     
     Builds triangular layers stacked vertically.
     """
-    points = []
-    
-    # Pre-calculate layer offsets to ensure perfect centering
-    # For a regular tetrahedron of spheres, the centroid of each layer
-    # should align with the Z-axis (x=0, y=0).
-    
-    for layer in range(n):
-        layer_size = layer + 1
-        z = layer * spacing * 0.816  # Height of regular tetrahedron
-        
-        # 1. Generate local layer points
-        layer_points = []
-        for row in range(layer_size):
-            for col in range(row + 1):
-                # Triangular grid coordinates
-                # x grows with col
-                # y grows with row
-                # We start with a generic corner alignment
-                raw_x = (col - row / 2.0) * spacing
-                raw_y = row * spacing * 0.866 # sqrt(3)/2
-                layer_points.append((raw_x, raw_y, z))
-        
-        # 2. Calculate Centroid
-        if not layer_points:
-            continue
-            
-        avg_x = sum(p[0] for p in layer_points) / len(layer_points)  # type: ignore[reportUnknownArgumentType, reportUnknownVariableType]
-        avg_y = sum(p[1] for p in layer_points) / len(layer_points)  # type: ignore[reportUnknownArgumentType, reportUnknownVariableType]
-        
-        # 3. Center the layer
-        for lx, ly, lz in layer_points:  # type: ignore[reportUnknownVariableType]
-            points.append((lx - avg_x, ly - avg_y, lz))
-    
-    return points
+    if n < 1:
+        return []
+
+    # Layer k holds rows 0..k of a triangular grid; in row-major order those
+    # are the first T(k+1) entries of the largest layer's grid.
+    rows, cols = np.tril_indices(n)
+    sizes = np.arange(1, n + 1) * np.arange(2, n + 2) // 2
+    layer = np.repeat(np.arange(n), sizes)
+    index = np.arange(sizes.sum()) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    row, col = rows[index], cols[index]
+
+    raw_x = (col - row / 2.0) * spacing
+    raw_y = row * spacing * 0.866  # sqrt(3)/2
+    z = layer * spacing * 0.816  # Height of regular tetrahedron
+
+    # Center each layer on the Z-axis so the layers stack into a regular tetrahedron
+    starts = np.cumsum(sizes) - sizes
+    avg_x = np.add.reduceat(raw_x, starts) / sizes
+    avg_y = np.add.reduceat(raw_y, starts) / sizes
+    return _as_points(np.column_stack((raw_x - avg_x[layer], raw_y - avg_y[layer], z)))
 
 
 # -----------------------------------------------------------------------------
@@ -247,32 +256,10 @@ def square_pyramidal_points(n: int, spacing: float = 1.0) -> List[Tuple[float, f
     
     Builds square layers stacked vertically, each smaller than the one below.
     """
-    points = []
-    
-    # Generate from Top (Apex) to Bottom (Base)
-    # So that the first point (Index 1) is at the top.
-    
-    for i in range(n):
-        # i=0 -> Apex (Top layer)
-        # i=n-1 -> Base (Bottom layer)
-        
-        # Logical layer index from top 
-        # Size grows as we go down: 1x1, 2x2, ...
-        layer_width = i + 1
-        
-        # Z coordinate goes from High to Low
-        z = (n - 1 - i) * spacing
-        
-        # Center the layer
-        offset = (layer_width - 1) / 2.0
-        
-        for row in range(layer_width):
-            for col in range(layer_width):
-                x = (col - offset) * spacing
-                y = (row - offset) * spacing
-                points.append((x, y, z))
-    
-    return points
+    # Generate from Top (Apex) to Bottom (Base), so the first point
+    # (Index 1) is at the top: layer i is (i+1) x (i+1) at z = n-1-i.
+    layers = [_square_layer(i + 1, (n - 1 - i) * spacing, spacing) for i in range(n)]
+    return _as_points(np.concatenate(layers)) if layers else []
 
 
 # -----------------------------------------------------------------------------
@@ -294,55 +281,21 @@ def octahedral_points(n: int, spacing: float = 1.0) -> List[Tuple[float, float,
     
     Two square pyramids joined at the base.
     """
-    points = []
-    
-    # An Octahedral number of order n can be visualized as two square pyramids
-    # of order n and n-1 joined at their bases.
-    # To look like a solid octahedron, we should center the shared base (size n)
-    # at z=0, and stack smaller layers above and below.
-    
-    # 1. Middle Layer (Base) - Size N x N
-    # z = 0
-    # Construct:
-    mid_size = n
-    mid_offset = (mid_size - 1) / 2.0
-    for row in range(mid_size):
-        for col in range(mid_size):
-            points.append((
-                (col - mid_offset) * spacing,
-                (row - mid_offset) * spacing,
-                0.0
-            ))
-            
-    # 2. Symmetric Upper and Lower Pyramids
-    # Layers decrease size from (N-1) down to 1
-    for i in range(1, n):
-        layer_size = n - i
-        offset = (layer_size - 1) / 2.0
-        
-        # Upper Layer (+Z)
-        z_up = i * spacing * 0.816 # Scale height for better proportions? Or just spacing.
-        # Regular octahedron: height of pyramid = base_width / sqrt(2). 
-        # spacing * (n)/sqrt(2)? Let's stick to spacing for integer grid first.
-        # User accepted spacing for cube, but octahedron might look better scaled.
-        # Let's use simple spacing for now to match other figures.
-        z_up = i * spacing
-        
-        # Lower Layer (-Z)
-        z_down = -i * spacing
-        
-        for row in range(layer_size):
-            for col in range(layer_size):
-                x = (col - offset) * spacing
-                y = (row - offset) * spacing
-                
-                # Add Top Point
-                points.append((x, y, z_up))
-                
-                # Add Bottom Point
-                points.append((x, y, z_down))
+    if n < 1:
+        return []
 
-    return points
+    # An Octahedral number of order n is two square pyramids of order n and
+    # n-1 joined at their bases: the shared N x N base sits at z=0, and layers
+    # of size N-1 down to 1 are stacked symmetrically above and below.
+    layers = [_square_layer(n, 0.0, spacing)]
+    for i in range(1, n):
+        # Simple spacing heights, to match the other figures
+        up = _square_layer(n - i, i * spacing, spacing)
+        down = up.copy()
+        down[:, 2] = -i * spacing
+        # Each top point is followed by its mirror below
+        layers.append(np.stack((up, down), axis=1).reshape(-1, 3))
+    return _as_points(np.concatenate(layers))
 
 
 # -----------------------------------------------------------------------------
@@ -361,19 +314,9 @@ def cubic_number(n: int) -> int:
 
 def cubic_points(n: int, spacing: float = 1.0) -> List[Tuple[float, float, float]]:
     """Generate 3D coordinates for a cubic arrangement."""
-    points = []
-    offset = (n - 1) / 2
-    
-    for z in range(n):
-        for y in range(n):
-            for x in range(n):
-                points.append((
-                    (x - offset) * spacing,
-                    (y - offset) * spacing,
-                    (z - offset) * spacing
-                ))
-    
-    return points
+    if n < 1:
+        return []
+    return _as_points(_cube(n, spacing))
 
 
 # -----------------------------------------------------------------------------
@@ -398,7 +341,11 @@ def centered_cubic_number(n: int) -> int:
 # -----------------------------------------------------------------------------
 def project_points_isometric(points_3d: List[Tuple[float, float, float]]) -> List[Tuple[float, float]]:
     """Project a list of 3D points to 2D isometric coordinates."""
-    return [isometric_project(x, y, z) for x, y, z in points_3d]
+    points = np.asarray(points_3d, dtype=float).reshape(-1, 3)
+    angle = math.pi / 6
+    screen_x = (points[:, 0] - points[:, 1]) * math.cos(angle)
+    screen_y = (points[:, 0] + points[:, 1]) * math.sin(angle) - points[:, 2]
+    return list(zip(screen_x.tolist(), screen_y.tolist()))
 
 
 # -----------------------------------------------------------------------------
@@ -420,25 +367,20 @@ def project_dynamic(
     cy, sy = math.cos(yaw), math.sin(yaw)
     cp, sp = math.cos(pitch), math.sin(pitch)
     
-    projected = []
-    for x, y, z in points_3d:
-        # 1. Yaw (World Rotation)
-        x1 = x * cy - y * sy
-        y1 = x * sy + y * cy
-        z1 = z
-        
-        # 2. Pitch (Camera Tilt)
-        # Rotate around X axis
-        # y becomes depth, z becomes screen Y
-        _y2 = y1 * cp - z1 * sp
-        z2 = y1 * sp + z1 * cp
-        
-        # 3. Project Orthographically
-        # Screen X = x1
-        # Screen Y = -z2 (Z is Up in World, Y is Down in Screen)
-        projected.append((x1, -z2))
-        
-    return projected
+    points = np.asarray(points_3d, dtype=float).reshape(-1, 3)
+    x, y, z = points[:, 0], points[:, 1], points[:, 2]
+
+    # 1. Yaw (World Rotation)
+    x1 = x * cy - y * sy
+    y1 = x * sy + y * cy
+
+    # 2. Pitch (Camera Tilt) around the X axis: y becomes depth, z screen Y
+    z2 = y1 * sp + z * cp
+
+    # 3. Project Orthographically
+    # Screen X = x1
+    # Screen Y = -z2 (Z is Up in World, Y is Down in Screen)
+    return list(zip(x1.tolist(), (-z2).tolist()))
 
 
 def get_layer_for_point(point_3d: Tuple[float, float, float], spacing: float = 1.0) -> int:
@@ -454,41 +396,16 @@ def centered_cubic_points(n: int, spacing: float = 1.0) -> List[Tuple[float, flo
     1. Outer Cube of size n (lattice points)
     2. Inner Cube of size n-1 (in the cell centers of the outer cube)
     """
-    points = []
-    
-    # 1. Outer Cube (n x n x n)
-    # Centered at (0,0,0)
-    outer_offset = (n - 1) / 2.0
-    for z in range(n):
-        for y in range(n):
-            for x in range(n):
-                points.append((
-                    (x - outer_offset) * spacing,
-                    (y - outer_offset) * spacing,
-                    (z - outer_offset) * spacing
-                ))
-                
-    # 2. Inner Cube ((n-1) x (n-1) x (n-1))
-    # Centered in the voids.
-    # The voids are at half-integer steps relative to outer grid.
+    if n < 1:
+        return []
+
+    # 1. Outer Cube (n x n x n), centered at (0,0,0)
+    # 2. Inner Cube ((n-1)^3), also centered, so it lands in the voids at
+    #    half-integer steps of the outer grid
+    cubes = [_cube(n, spacing)]
     if n > 1:
-        inner_n = n - 1
-        inner_offset = (inner_n - 1) / 2.0
-        # Check alignment:
-        # Outer 2x2: -0.5, 0.5. Center 0.
-        # Inner 1x1: 0. 
-        # They naturally align if both centered at 0.
-        
-        for z in range(inner_n):
-            for y in range(inner_n):
-                for x in range(inner_n):
-                    points.append((
-                        (x - inner_offset) * spacing,
-                        (y - inner_offset) * spacing,
-                        (z - inner_offset) * spacing
-                    ))
-                    
-    return points
+        cubes.append(_cube(n - 1, spacing))
+    return _as_points(np.concatenate(cubes))
 
 
 # -----------------------------------------------------------------------------
@@ -0,0 +1,318 @@
+"""
+History Journal - The Unbroken Ledger.
+Append-only JSON Lines store for geometry calculation history.
+"""
+import bisect
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Entries kept; older ones drop out of the index and vanish at the next compaction
+MAX_ENTRIES = 5000
+# Compact once superseded records are this many and outnumber the live ones
+COMPACT_MIN_DEAD = 200
+PAGE_SIZE = 50
+
+
+def _encode(record: Dict) -> bytes:
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _identity(stat: os.stat_result) -> tuple:
+    return (stat.st_dev, stat.st_ino)
+
+
+class HistoryJournal:
+    """
+    The Unbroken Ledger: every change to the history is one appended line.
+
+        {"op": "save", "entry": {...}}                 entry["timestamp"] is its id
+        {"op": "note", "timestamp": "...", "note": "..."}
+        {"op": "delete", "timestamp": "..."}
+        {"op": "clear"}
+
+    Replaying the journal builds an in-memory index (byte offset of each live
+    entry, by shape and by timestamp), so a save is one append whatever the
+    history size, and a page reads only the entries it returns. A torn last
+    line from a crash mid-write is ignored and cut off before the next append.
+    Compaction rewrites the live entries to a temporary file and swaps it in
+    atomically, so the journal is never half-written.
+
+    Another instance may append to or compact the same file: when the file
+    gains complete records, shrinks or is replaced, the index is rebuilt
+    before the next read or write.
+    """
+
+    def __init__(self, path: str, legacy_path: Optional[str] = None, max_entries: int = MAX_ENTRIES):
+        """
+        Bind the journal to a file (created on first write).
+
+        Args:
+            path: Journal file (JSON Lines).
+            legacy_path: Old whole-file JSON history, imported once if the journal does not exist.
+            max_entries: Entries retained, newest first.
+        """
+        self.path = path
+        self.legacy_path = legacy_path
+        self.max_entries = max_entries
+        self._loaded = False
+        self._size = 0  # End of the valid journal prefix
+        self._dead = 0  # Records no longer needed by a replay
+        self._identity: Optional[tuple] = None  # (device, inode) of the file last indexed
+        self._offsets: Dict[str, int] = {}
+        self._shapes: Dict[str, str] = {}
+        self._notes: Dict[str, str] = {}
+        self._order: List[str] = []  # Live timestamps, ascending
+        self._by_shape: Dict[str, List[str]] = {}
+
+    # --- Queries ---
+
+    def count(self, shape_name: Optional[str] = None) -> int:
+        """Number of live entries, optionally of one shape."""
+        self._ensure_loaded()
+        return len(self._order if shape_name is None else self._by_shape.get(shape_name, []))
+
+    def page(self, shape_name: Optional[str] = None, before: Optional[str] = None,
+             limit: int = PAGE_SIZE) -> List[Dict]:
+        """
+        Entries newest first, optionally of one shape and older than ``before``.
+
+        Pass the last timestamp of a page as ``before`` to get the next one.
+        """
+        self._ensure_loaded()
+        stamps = self._order if shape_name is None else self._by_shape.get(shape_name, [])
+        end = len(stamps) if before is None else bisect.bisect_left(stamps, before)
+        wanted = stamps[max(end - limit, 0):end][::-1]
+        return self._read(wanted)
+
+    # --- Changes ---
+
+    def append(self, entry: Dict) -> None:
+        """Record a new entry (replacing any entry with the same timestamp)."""
+        self._ensure_loaded()
+        offset = self._write(_encode({"op": "save", "entry": entry}))
+        self._apply_save(entry, offset)
+        self._trim()
+        self._maybe_compact()
+
+    def set_note(self, timestamp: str, note: str) -> bool:
+        """Change an entry's note. Returns False if there is no such entry."""
+        self._ensure_loaded()
+        if timestamp not in self._offsets:
+            return False
+        self._write(_encode({"op": "note", "timestamp": timestamp, "note": note}))
+        self._apply_note(timestamp, note)
+        self._maybe_compact()
+        return True
+
+    def delete(self, timestamp: str) -> bool:
+        """Remove an entry. Returns False if there is no such entry."""
+        self._ensure_loaded()
+        if timestamp not in self._offsets:
+            return False
+        self._write(_encode({"op": "delete", "timestamp": timestamp}))
+        if timestamp in self._offsets:  # Unless another writer removed it meanwhile
+            self._apply_delete(timestamp)
+        self._dead += 1
+        self._maybe_compact()
+        return True
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._ensure_loaded()
+        self._reset_index()
+        self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the journal with only the live entries, atomically."""
+        self._ensure_loaded()
+        self._rewrite(self._read(self._order))
+        logger.debug(f"Compacted geometry history journal to {len(self._order)} entries")
+
+    def _rewrite(self, entries: List[Dict]) -> None:
+        """Replace the journal with one save record per entry (oldest first)."""
+        temp_path = self.path + ".tmp"
+        offsets: Dict[str, int] = {}
+        position = 0
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(temp_path, "wb") as f:
+            for entry in entries:
+                line = _encode({"op": "save", "entry": entry})
+                offsets[entry["timestamp"]] = position
+                f.write(line)
+                position += len(line)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self._offsets, self._notes = offsets, {}
+        self._size, self._dead = position, 0
+        self._identity = _identity(os.stat(self.path))
+
+    # --- Journal file ---
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            self._refresh()
+            return
+        self._loaded = True
+        if not os.path.exists(self.path) and self.legacy_path and os.path.exists(self.legacy_path):
+            self._import_legacy(self.legacy_path)
+            return
+        self._replay()
+
+    def _refresh(self) -> None:
+        """Replay the journal if another writer changed it since it was indexed."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if self._identity is not None:
+                self._replay()
+            return
+        if _identity(stat) != self._identity or stat.st_size < self._size:
+            self._replay()  # Replaced (compacted elsewhere) or cut short
+        elif stat.st_size > self._size:
+            with open(self.path, "rb") as f:
+                f.seek(self._size)
+                if b"\n" in f.read():
+                    self._replay()  # Complete records appended elsewhere
+
+    def _replay(self) -> None:
+        self._reset_index()
+        self._size = self._dead = 0
+        self._identity = None
+        try:
+            with open(self.path, "rb") as f:
+                self._identity = _identity(os.fstat(f.fileno()))
+                data = f.read()
+        except FileNotFoundError:
+            return
+        position = 0
+        while position < len(data):
+            end = data.find(b"\n", position)
+            if end < 0:
+                logger.warning(f"Ignoring torn final record in {self.path} ({len(data) - position} bytes)")
+                break
+            try:
+                record = json.loads(data[position:end])
+                self._apply(record, position)
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping unreadable history record at byte {position}: {e}")
+                self._dead += 1
+            position = end + 1
+        self._size = position
+        self._trim()
+
+    def _apply(self, record: Dict, offset: int) -> None:
+        op = record["op"]
+        if op == "save":
+            self._apply_save(record["entry"], offset)
+        elif op == "note":
+            self._apply_note(record["timestamp"], record["note"])
+        elif op == "delete":
+            self._apply_delete(record["timestamp"])
+            self._dead += 1
+        elif op == "clear":
+            self._dead += len(self._order) + 1
+            self._reset_index()
+
+    def _apply_save(self, entry: Dict, offset: int) -> None:
+        timestamp = entry["timestamp"]
+        if timestamp in self._offsets:
+            self._apply_delete(timestamp)
+        shape = entry.get("shape_name", "")
+        self._offsets[timestamp] = offset
+        self._shapes[timestamp] = shape
+        bisect.insort(self._order, timestamp)
+        bisect.insort(self._by_shape.setdefault(shape, []), timestamp)
+
+    def _apply_note(self, timestamp: str, note: str) -> None:
+        if timestamp in self._offsets:
+            if timestamp in self._notes:
+                self._dead += 1
+            self._notes[timestamp] = note
+        else:
+            self._dead += 1
+
+    def _apply_delete(self, timestamp: str) -> None:
+        # The entry's save record (and any note) become dead weight
+        self._dead += 1 + (timestamp in self._notes)
+        del self._offsets[timestamp]
+        self._notes.pop(timestamp, None)
+        shape = self._shapes.pop(timestamp)
+        self._order.pop(bisect.bisect_left(self._order, timestamp))
+        stamps = self._by_shape[shape]
+        stamps.pop(bisect.bisect_left(stamps, timestamp))
+        if not stamps:
+            del self._by_shape[shape]
+
+    def _reset_index(self) -> None:
+        self._offsets, self._shapes, self._notes = {}, {}, {}
+        self._order, self._by_shape = [], {}
+
+    def _trim(self) -> None:
+        while len(self._order) > self.max_entries:
+            self._apply_delete(self._order[0])
+
+    def _maybe_compact(self) -> None:
+        if self._dead >= COMPACT_MIN_DEAD and self._dead > len(self._order):
+            self.compact()
+
+    def _write(self, line: bytes) -> int:
+        """Append one record durably; returns its offset."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        while True:
+            self._refresh()
+            with open(self.path, "a+b") as f:
+                if self._identity is not None and _identity(os.fstat(f.fileno())) != self._identity:
+                    continue  # Replaced since the refresh
+                f.seek(self._size)
+                tail = f.read()
+                if b"\n" in tail:
+                    continue  # Another writer appended since the refresh
+                if tail:
+                    # Only an unterminated last line (a crash mid-write) follows the valid prefix
+                    f.truncate(self._size)
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+                self._identity = _identity(os.fstat(f.fileno()))
+            break
+        offset = self._size
+        self._size += len(line)
+        return offset
+
+    def _read(self, timestamps: List[str]) -> List[Dict]:
+        if not timestamps:
+            return []
+        entries = []
+        with open(self.path, "rb") as f:
+            for timestamp in timestamps:
+                f.seek(self._offsets[timestamp])
+                entry = json.loads(f.readline())["entry"]
+                if timestamp in self._notes:
+                    entry["note"] = self._notes[timestamp]
+                entries.append(entry)
+        return entries
+
+    def _import_legacy(self, legacy_path: str) -> None:
+        """Move the old whole-file history (newest first) into the journal."""
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                history = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not import legacy geometry history: {e}")
+            history = []
+        self._reset_index()
+        entries = {}
+        for entry in reversed(history if isinstance(history, list) else []):
+            if isinstance(entry, dict) and entry.get("timestamp"):
+                self._apply_save(entry, 0)
+                entries[entry["timestamp"]] = entry
+        self._trim()
+        # Write every entry in one atomic step, then retire the old file
+        self._rewrite([entries[timestamp] for timestamp in self._order])
+        os.replace(legacy_path, legacy_path + ".migrated")
+        logger.info(f"Imported {len(self._order)} geometry history entries into {self.path}")
@@ -0,0 +1,59 @@
+"""Wavefront OBJ export for solid payloads."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TextIO, Union
+
+import numpy as np
+
+from ..shared.solid_payload import MeshBuffers, SolidPayload
+
+
+def _write_faces(stream: TextIO, buffers: MeshBuffers) -> None:
+    """Write ``f`` records, one vectorized block per run of equal-sized faces."""
+    offsets = buffers.face_offsets
+    sizes = np.diff(offsets)
+    if not len(sizes):
+        return
+    # Runs of consecutive faces with the same vertex count (a torus is one run)
+    breaks = np.flatnonzero(np.diff(sizes)) + 1
+    run_starts = np.concatenate(([0], breaks))
+    run_ends = np.concatenate((breaks, [len(sizes)]))
+    for start, end in zip(run_starts.tolist(), run_ends.tolist()):
+        size = int(sizes[start])
+        if size < 3:
+            continue
+        block = buffers.face_indices[offsets[start]:offsets[end]].reshape(-1, size) + 1
+        np.savetxt(stream, block, fmt='f' + ' %d' * size)
+
+
+def write_obj(payload: SolidPayload, target: Union[str, Path, TextIO]) -> None:
+    """
+    Write a payload as a Wavefront OBJ file.
+
+    Vertices and faces are written straight from ``payload.mesh_buffers()``,
+    so array-backed payloads export without building tuple lists. Payloads
+    without faces are written as ``l`` line records from their edges.
+
+    Args:
+        payload: The solid to export
+        target: File path or an open text stream
+    """
+    if isinstance(target, (str, Path)):
+        with open(target, 'w', encoding='utf-8') as stream:
+            write_obj(payload, stream)
+        return
+
+    buffers = payload.mesh_buffers()
+    target.write(
+        f"# {len(buffers.vertices)} vertices, {len(buffers.face_offsets) - 1} faces, "
+        f"{len(buffers.edges)} edges\n"
+    )
+    np.savetxt(target, buffers.vertices, fmt='v %.9g %.9g %.9g')
+    if len(buffers.face_indices):
+        _write_faces(target, buffers)
+    elif len(buffers.edges):
+        np.savetxt(target, buffers.edges + 1, fmt='l %d %d')
+
+
+__all__ = ['write_obj']
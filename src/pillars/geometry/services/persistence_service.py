@@ -1,37 +1,43 @@
 """
 Persistence Service - The Chronicle.
-Manages JSON file persistence for geometry calculation history and notes.
+Manages the journal of geometry calculation history and notes.
 """
-import json
 import os
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
 
 from .base_shape import GeometricShape
+from .history_journal import HistoryJournal, PAGE_SIZE
 
-HISTORY_FILE = os.path.expanduser("~/.isopgem/geometry_history.json")
+HISTORY_FILE = os.path.expanduser("~/.isopgem/geometry_history.jsonl")
+# Whole-file history written by earlier versions; imported once
+LEGACY_HISTORY_FILE = os.path.expanduser("~/.isopgem/geometry_history.json")
 
 logger = logging.getLogger(__name__)
 
+_journal: Optional[HistoryJournal] = None
+
+
 class PersistenceService:
     """
     The Chronicle: Manages persistence of geometry calculations.
+
+    History lives in an append-only journal (see HistoryJournal), so saving
+    costs the same however long the history grows, and readers page through
+    it by shape instead of loading everything.
     """
-    
+
     @staticmethod
-    def _ensure_history_file():
-        if not os.path.exists(os.path.dirname(HISTORY_FILE)):
-            os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
-        if not os.path.exists(HISTORY_FILE):
-            with open(HISTORY_FILE, 'w') as f:
-                json.dump([], f)
+    def _journal() -> HistoryJournal:
+        global _journal
+        if _journal is None or _journal.path != HISTORY_FILE:
+            _journal = HistoryJournal(HISTORY_FILE, legacy_path=LEGACY_HISTORY_FILE)
+        return _journal
 
     @staticmethod
     def save_calculation(shape: GeometricShape):
         """Save the current state of a shape to history."""
-        PersistenceService._ensure_history_file()
-        
         # Generate Summary
         # Take up to 3 properties, preferring those with values
         summary_parts = []
@@ -55,41 +61,22 @@ class PersistenceService:
             "note": "",
             "data": shape.to_dict()
         }
-        
+
         try:
-            with open(HISTORY_FILE, 'r') as f:
-                history = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            history = []
-            
-        # Add new entry
-        history.insert(0, entry)
-        
-        # Limit to 50
-        history = history[:50]
-        
-        with open(HISTORY_FILE, 'w') as f:
-            json.dump(history, f, indent=2)
+            PersistenceService._journal().append(entry)
+        except OSError as e:
+            logger.warning(
+                "Failed to save geometry history (%s): %s",
+                type(e).__name__,
+                e,
+            )
 
     @staticmethod
     def update_note(timestamp: str, note_text: str):
         """Update the note for a specific history entry."""
-        PersistenceService._ensure_history_file()
         try:
-            with open(HISTORY_FILE, 'r') as f:
-                history = json.load(f)
-                
-            updated = False
-            for entry in history:
-                if entry.get("timestamp") == timestamp:
-                    entry["note"] = note_text
-                    updated = True
-                    break
-            
-            if updated:
-                with open(HISTORY_FILE, 'w') as f:
-                    json.dump(history, f, indent=2)
-        except (OSError, json.JSONDecodeError, TypeError) as e:
+            PersistenceService._journal().set_note(timestamp, note_text)
+        except OSError as e:
             logger.warning(
                 "Failed to update geometry note (%s): %s",
                 type(e).__name__,
@@ -99,19 +86,9 @@ class PersistenceService:
     @staticmethod
     def delete_calculation(timestamp: str):
         """Delete a history entry by timestamp."""
-        PersistenceService._ensure_history_file()
         try:
-            with open(HISTORY_FILE, 'r') as f:
-                history = json.load(f)
-            
-            # Filter out the item with matching timestamp
-            new_history = [entry for entry in history if entry.get("timestamp") != timestamp]
-            
-            if len(new_history) < len(history):
-                with open(HISTORY_FILE, 'w') as f:
-                    json.dump(new_history, f, indent=2)
-                    
-        except (OSError, json.JSONDecodeError, TypeError) as e:
+            PersistenceService._journal().delete(timestamp)
+        except OSError as e:
             logger.warning(
                 "Failed to delete geometry history item (%s): %s",
                 type(e).__name__,
@@ -119,13 +96,28 @@ class PersistenceService:
             )
 
     @staticmethod
-    def get_recent_calculations() -> List[Dict]:
-        """Get list of recent calculations."""
-        PersistenceService._ensure_history_file()
+    def get_recent_calculations(limit: int = PAGE_SIZE) -> List[Dict]:
+        """Get list of recent calculations, newest first."""
+        return PersistenceService.get_calculations(limit=limit)
+
+    @staticmethod
+    def get_calculations(
+        shape_name: Optional[str] = None,
+        before: Optional[str] = None,
+        limit: int = PAGE_SIZE,
+    ) -> List[Dict]:
+        """
+        Get one page of calculations, newest first.
+
+        Args:
+            shape_name: Only calculations of this shape (all shapes if None).
+            before: Only calculations older than this timestamp; pass the last
+                timestamp of the previous page to continue.
+            limit: Page size.
+        """
         try:
-            with open(HISTORY_FILE, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError, OSError) as e:
+            return PersistenceService._journal().page(shape_name, before, limit)
+        except (OSError, ValueError) as e:
             logger.warning(
                 "Failed to read geometry history (%s): %s",
                 type(e).__name__,
@@ -133,11 +125,15 @@ class PersistenceService:
             )
             return []
 
+    @staticmethod
+    def count_calculations(shape_name: Optional[str] = None) -> int:
+        """Number of saved calculations, optionally of one shape."""
+        return PersistenceService._journal().count(shape_name)
+
     @staticmethod
     def clear_history():
         """
         Clear history logic.
         
         """
-        with open(HISTORY_FILE, 'w') as f:
-            json.dump([], f)
\ No newline at end of file
+        PersistenceService._journal().clear()
@@ -5,8 +5,10 @@ import math
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, cast
 
-from ..shared.solid_payload import Face, SolidLabel, SolidPayload, Vec3
-from .solid_geometry import Vec3, edges_from_faces
+import numpy as np
+
+from ..shared.solid_payload import ArraySolidPayload, SolidLabel, SolidPayload
+from .solid_geometry import grid_quads
 from .solid_property import SolidProperty
 
 
@@ -53,42 +55,22 @@ class SphereSolidService:
 
         metrics = SphereSolidService.compute_metrics(radius)
         
-        vertices: List[Vec3] = []
-        faces: List[Tuple[int, ...]] = []
-        
-        # Generate UV Sphere
-        for ring in range(rings + 1):
-            theta = ring * math.pi / rings # 0 to pi
-            sin_theta = math.sin(theta)
-            cos_theta = math.cos(theta)
-            
-            for seg in range(segments):
-                phi = seg * 2 * math.pi / segments # 0 to 2pi
-                sin_phi = math.sin(phi)
-                cos_phi = math.cos(phi)
-                
-                x = radius * sin_theta * cos_phi
-                y = radius * sin_theta * sin_phi
-                z = radius * cos_theta
-                
-                vertices.append((x, y, z))
-                
-        # Faces
-        for ring in range(rings):
-            for seg in range(segments):
-                v1 = ring * segments + seg
-                v2 = ring * segments + (seg + 1) % segments
-                v3 = (ring + 1) * segments + (seg + 1) % segments
-                v4 = (ring + 1) * segments + seg
-                
-                faces.append((v1, v2, v3, v4))
-                
-        edges = edges_from_faces(faces)
-        
-        payload = SolidPayload(
-            vertices=vertices,
-            edges=edges,
-            faces=cast(List[Face], faces),
+        # Generate UV Sphere: theta 0..pi by ring, phi 0..2pi by segment
+        theta = np.arange(rings + 1) * math.pi / rings
+        phi = np.arange(segments) * 2 * math.pi / segments
+        sin_theta = np.sin(theta)
+
+        vertices = np.empty((rings + 1, segments, 3))
+        vertices[..., 0] = radius * np.outer(sin_theta, np.cos(phi))
+        vertices[..., 1] = radius * np.outer(sin_theta, np.sin(phi))
+        vertices[..., 2] = (radius * np.cos(theta))[:, None]
+
+        # Faces (ring, seg), (ring, seg+1), (ring+1, seg+1), (ring+1, seg)
+        faces = grid_quads(rings + 1, segments, wrap_rows=False)[:, [0, 3, 2, 1]]
+
+        payload = ArraySolidPayload(
+            vertices=vertices.reshape(-1, 3),
+            faces=faces,
             labels=[
                 SolidLabel(text=f"r = {radius:.2f}", position=(0, 0, radius * 1.1))
             ],
@@ -5,17 +5,10 @@ import math
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
-from ..shared.solid_payload import SolidLabel, SolidPayload
-from .solid_geometry import (
-    Vec3,
-    vec_add,
-    vec_cross,
-    vec_normalize,
-    vec_scale,
-    edges_from_faces,
-    vec_sub,
-    vec_length
-)
+import numpy as np
+
+from ..shared.solid_payload import ArraySolidPayload, SolidLabel, SolidPayload
+from .solid_geometry import Vec3, grid_quads
 from .solid_property import SolidProperty
 
 
@@ -55,6 +48,12 @@ class TorusKnotMeshConfig:
     radial_segments: int = 10    # Reduced for filled rendering performance
 
 
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Unit rows; zero rows stay zero (like vec_normalize)."""
+    lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths > 0)
+
+
 class TorusKnotSolidService:
     """Generates payloads for (p,q) torus knot solids."""
 
@@ -89,15 +88,13 @@ class TorusKnotSolidService:
         metrics = TorusKnotSolidService._compute_metrics(p, q, major_radius, minor_radius, tube_radius)
         
         vertices, faces = TorusKnotSolidService._generate_mesh(p, q, major_radius, minor_radius, tube_radius, config)
-        edges = edges_from_faces(faces)
         
         labels = [
             SolidLabel(text=f"P={p}, Q={q}", position=(0.0, major_radius + minor_radius + tube_radius, 0.0)),
         ]
 
-        payload = SolidPayload(
+        payload = ArraySolidPayload(
             vertices=vertices,
-            edges=edges,
             faces=faces,
             labels=labels,
             metadata={
@@ -451,21 +448,15 @@ class TorusKnotSolidService:
         # L = Integral of |r'(t)| dt from 0 to 2pi
         # Simple numerical integration
         n_steps = 1000
-        length = 0.0
-        _dt = (2 * math.pi) / n_steps
         
         # Curve:
         # x = (R + r cos(qt)) cos(pt)
         # y = (R + r cos(qt)) sin(pt)
         # z = r sin(qt)
         
-        prev_p = TorusKnotSolidService._curve_point(0, p, q, R, r)
-        for i in range(1, n_steps + 1):
-            t = (i / n_steps) * 2 * math.pi
-            curr_p = TorusKnotSolidService._curve_point(t, p, q, R, r)
-            dist = vec_length(vec_sub(curr_p, prev_p))
-            length += dist
-            prev_p = curr_p
+        t = np.arange(n_steps + 1) / n_steps * 2 * math.pi
+        curve = TorusKnotSolidService._curve_points(t, p, q, R, r)
+        length = float(np.linalg.norm(np.diff(curve, axis=0), axis=1).sum())
 
         # Torus Volume ~ Length * (pi * tube_r^2)
         # Torus Area ~ Length * (2 * pi * tube_r)
@@ -483,176 +474,92 @@ class TorusKnotSolidService:
 
     @staticmethod
     def _curve_point(t: float, p: int, q: int, R: float, r: float) -> Vec3:
-        # r_val = R + r * cos(q*t)
-        r_val = R + r * math.cos(q * t)
-        
-        # x = r_val * cos(p*t)
-        x = r_val * math.cos(p * t)
-        
-        # y = r_val * sin(p*t)
-        y = r_val * math.sin(p * t)
-        
-        # z = r * sin(q*t)
-        # Wait, usually z comes out of the R plane? 
-        # Yes, standard torus parameterization axis is Z.
-        z = r * math.sin(q * t)
+        x, y, z = TorusKnotSolidService._curve_points(np.array([t]), p, q, R, r)[0].tolist()
         return (x, y, z)
 
     @staticmethod
-    def _generate_mesh(p: int, q: int, R: float, r: float, tube_r: float, config: TorusKnotMeshConfig) -> Tuple[List[Vec3], List[Tuple[int, ...]]]:
-        vertices = []
-        faces = []
-        
+    def _curve_points(t: np.ndarray, p: int, q: int, R: float, r: float) -> np.ndarray:
+        # Standard torus parameterization, Z axis up:
+        # x = (R + r*cos(q*t)) * cos(p*t)
+        # y = (R + r*cos(q*t)) * sin(p*t)
+        # z = r * sin(q*t)
+        r_val = R + r * np.cos(q * t)
+        return np.column_stack((r_val * np.cos(p * t), r_val * np.sin(p * t), r * np.sin(q * t)))
+
+    @staticmethod
+    def _generate_mesh(p: int, q: int, R: float, r: float, tube_r: float, config: TorusKnotMeshConfig) -> Tuple[np.ndarray, np.ndarray]:
         segments = config.tubular_segments
         radial_seg = config.radial_segments
-        
-        # 1. Compute curve points & tangents using forward difference or analytical derivative
-        _curve_frames = [] # List of (pos, T, N, B)
-        
-        # Calculate points for 0 to 2pi (inclusive to find total twist)
-        total_steps = segments
-        points = []
-        tangents = []
-        
-        for i in range(total_steps + 1):
-            t = (i / total_steps) * 2 * math.pi
-            pos = TorusKnotSolidService._curve_point(t, p, q, R, r)
-            points.append(pos)
-            
-            # Analytical derivative for T is better, but numerical is fine for now
-            # Central difference or forward
-            t_next = (t + 0.0001)
-            pos_next = TorusKnotSolidService._curve_point(t_next, p, q, R, r)
-            tangent = vec_normalize(vec_sub(pos_next, pos))
-            tangents.append(tangent)
-
-        # 2. Parallel Transport First Pass
-        # Initial Frame at i=0
+
+        # 1. Curve points for 0..2pi (inclusive, to measure the total twist)
+        #    and forward-difference tangents
+        t = np.arange(segments + 1) / segments * 2 * math.pi
+        points = TorusKnotSolidService._curve_points(t, p, q, R, r)
+        ahead = TorusKnotSolidService._curve_points(t + 0.0001, p, q, R, r)
+        tangents = _normalize_rows(ahead - points)
+
+        # 2. Parallel transport. The rotation carrying each tangent onto the
+        #    next (Rodrigues: axis prev_T x curr_T, angle between them) is
+        #    computed for every step at once; only carrying N along is a scan.
         T0 = tangents[0]
-        # Robust initial Normal: use simplified heuristic or arbitrary axis
-        # If T is up, use X. If T is X, use Y.
-        if abs(T0[2]) < 0.9:
-            up = (0, 0, 1)
-        else:
-            up = (1, 0, 0)
-        N0 = vec_normalize(vec_cross(T0, up))
-        B0 = vec_normalize(vec_cross(T0, N0))
-        
-        _current_N = N0
-        parallel_frames = [(points[0], T0, N0, B0)]
-        
-        for i in range(1, total_steps + 1):
-            _prev_pos, prev_T, prev_N, _prev_B = parallel_frames[-1]  # type: ignore[reportUnknownVariableType, reportUnusedVariable]
-            curr_pos = points[i]
-            curr_T = tangents[i]
-            
-            # Transport prev_N to current frame
-            # Axis of rotation A = prev_T x curr_T
-            axis = vec_cross(prev_T, curr_T)  # type: ignore[reportUndefinedVariable, reportUnknownArgumentType]
-            
-            # If collinear (straight line), just update T
-            if vec_length(axis) < 1e-9:
-                curr_N = prev_N
-            else:
-                 axis = vec_normalize(axis)
-                 # Angle between tangents
-                 dot = prev_T[0]*curr_T[0] + prev_T[1]*curr_T[1] + prev_T[2]*curr_T[2]  # type: ignore[reportUndefinedVariable, reportUnknownVariableType]
-                 # Clamp for safety
-                 phi = math.acos(max(-1.0, min(1.0, dot)))
-                 
-                 # Rotate prev_N around axis by phi
-                 # Rodrigues rotation formula
-                 # v_rot = v cos(phi) + (k x v) sin(phi) + k (k . v) (1 - cos(phi))
-                 cos_phi = math.cos(phi)
-                 sin_phi = math.sin(phi)
-                 k_cross_v = vec_cross(axis, prev_N)
-                 k_dot_v = axis[0]*prev_N[0] + axis[1]*prev_N[1] + axis[2]*prev_N[2]  # type: ignore[reportUndefinedVariable, reportUnknownVariableType]
-                 
-                 term1 = vec_scale(prev_N, cos_phi)
-                 term2 = vec_scale(k_cross_v, sin_phi)
-                 term3 = vec_scale(axis, k_dot_v * (1 - cos_phi))
-                 
-                 curr_N = vec_add(vec_add(term1, term2), term3)
-                 curr_N = vec_normalize(curr_N)
-
-            # Re-orthogonalize to ensure perfect N-T orthogonality
-            # N = N - (N . T) * T
-            dot_val = curr_N[0]*curr_T[0] + curr_N[1]*curr_T[1] + curr_N[2]*curr_T[2]
-            curr_N = vec_sub(curr_N, vec_scale(curr_T, dot_val))
-            curr_N = vec_normalize(curr_N)
-            
-            curr_B = vec_normalize(vec_cross(curr_T, curr_N))
-            
-            parallel_frames.append((curr_pos, curr_T, curr_N, curr_B))
-
-        # 3. Calculate Correction Twist Angle
-        # Compare frame at 2pi (index segments) with frame at 0
-        # They are at the same spatial point.
-        first_N = parallel_frames[0][2]
-        last_N = parallel_frames[segments][2]
-        
-        # Angle alpha between first_N and last_N (in the plane normal to T)
-        # We can use atan2(det, dot) where det = (first_N x last_N) . T
-        cross_Ns = vec_cross(first_N, last_N)
-        T_end = parallel_frames[segments][1]
-        det = cross_Ns[0]*T_end[0] + cross_Ns[1]*T_end[1] + cross_Ns[2]*T_end[2]
-        dot = first_N[0]*last_N[0] + first_N[1]*last_N[1] + first_N[2]*last_N[2]
-        
-        total_twist = math.atan2(det, dot)
-        
-        # 4. Generate Final Twisted Frames & Vertices
-        for i in range(segments):
-            pos, _T, N_transport, B_transport = parallel_frames[i]  # type: ignore[reportUnknownVariableType, reportUnusedVariable]
-            
-            # Twist adjustment
-            # We want to distribute -total_twist over the length
-            theta = -(total_twist * (i / segments))
-            
-            cos_theta = math.cos(theta)
-            sin_theta = math.sin(theta)
-            
-            # Rotate N, B around T
-            # N_final = N cos + B sin
-            # B_final = -N sin + B cos
-            
-            N_final_x = N_transport[0]*cos_theta + B_transport[0]*sin_theta
-            N_final_y = N_transport[1]*cos_theta + B_transport[1]*sin_theta
-            N_final_z = N_transport[2]*cos_theta + B_transport[2]*sin_theta
-            N_final = (N_final_x, N_final_y, N_final_z)
-            
-            B_final_x = -N_transport[0]*sin_theta + B_transport[0]*cos_theta
-            B_final_y = -N_transport[1]*sin_theta + B_transport[1]*cos_theta
-            B_final_z = -N_transport[2]*sin_theta + B_transport[2]*cos_theta
-            B_final = (B_final_x, B_final_y, B_final_z)
-            
-            # Generate Tube Ring
-            for j in range(radial_seg):
-                angle = (j / radial_seg) * 2 * math.pi
-                cos_a = math.cos(angle)
-                sin_a = math.sin(angle)
-                
-                off_x = vec_scale(N_final, tube_r * cos_a)
-                off_y = vec_scale(B_final, tube_r * sin_a)
-                offset = vec_add(off_x, off_y)
-                
-                vertex = vec_add(pos, offset)
-                vertices.append(vertex)
-                
-        # 5. Generate Faces
-        for i in range(segments):
-            next_i = (i + 1) % segments
-            
-            for j in range(radial_seg):
-                next_j = (j + 1) % radial_seg
-                
-                idx_bl = i * radial_seg + j
-                idx_br = next_i * radial_seg + j
-                idx_tr = next_i * radial_seg + next_j
-                idx_tl = i * radial_seg + next_j
-                
-                faces.append((idx_bl, idx_br, idx_tr, idx_tl))
-
-        return vertices, faces
+        up = np.array([0.0, 0.0, 1.0]) if abs(T0[2]) < 0.9 else np.array([1.0, 0.0, 0.0])
+        N0 = _normalize_rows(np.cross(T0, up)[None, :])[0]
+
+        axes = np.cross(tangents[:-1], tangents[1:])
+        straight = np.linalg.norm(axes, axis=1) < 1e-9
+        axes = _normalize_rows(axes)
+        dots = np.clip(np.einsum('ij,ij->i', tangents[:-1], tangents[1:]), -1.0, 1.0)
+        phis = np.arccos(dots)
+        cos_phis, sin_phis = np.cos(phis), np.sin(phis)
+
+        normals = np.empty((segments + 1, 3))
+        normals[0] = N0
+        nx, ny, nz = N0.tolist()
+        steps = zip(
+            straight.tolist(), axes.tolist(), cos_phis.tolist(), sin_phis.tolist(), tangents[1:].tolist()
+        )
+        for i, (is_straight, (kx, ky, kz), cos_phi, sin_phi, (tx, ty, tz)) in enumerate(steps, start=1):
+            if not is_straight:
+                # v_rot = v cos(phi) + (k x v) sin(phi) + k (k . v) (1 - cos(phi))
+                k_dot_v = kx * nx + ky * ny + kz * nz
+                scale = k_dot_v * (1 - cos_phi)
+                nx, ny, nz = (
+                    nx * cos_phi + (ky * nz - kz * ny) * sin_phi + kx * scale,
+                    ny * cos_phi + (kz * nx - kx * nz) * sin_phi + ky * scale,
+                    nz * cos_phi + (kx * ny - ky * nx) * sin_phi + kz * scale,
+                )
+                length = math.sqrt(nx * nx + ny * ny + nz * nz) or 1.0
+                nx, ny, nz = nx / length, ny / length, nz / length
+            # Re-orthogonalize against the tangent: N = N - (N . T) T
+            dot_val = nx * tx + ny * ty + nz * tz
+            nx, ny, nz = nx - tx * dot_val, ny - ty * dot_val, nz - tz * dot_val
+            length = math.sqrt(nx * nx + ny * ny + nz * nz) or 1.0
+            nx, ny, nz = nx / length, ny / length, nz / length
+            normals[i] = (nx, ny, nz)
+        binormals = _normalize_rows(np.cross(tangents, normals))
+
+        # 3. Correction twist: angle from the first N to the transported N
+        #    at 2pi (same point), measured about the tangent
+        first_N, last_N = normals[0], normals[segments]
+        det = float(np.dot(np.cross(first_N, last_N), tangents[segments]))
+        total_twist = math.atan2(det, float(np.dot(first_N, last_N)))
+
+        # 4. Spread -total_twist along the curve, rotating N and B about T
+        theta = -(total_twist * (np.arange(segments) / segments))
+        cos_theta, sin_theta = np.cos(theta)[:, None], np.sin(theta)[:, None]
+        N_t, B_t = normals[:segments], binormals[:segments]
+        N_final = N_t * cos_theta + B_t * sin_theta
+        B_final = -N_t * sin_theta + B_t * cos_theta
+
+        # 5. Tube rings: pos + N * (tube_r cos a) + B * (tube_r sin a)
+        angle = np.arange(radial_seg) / radial_seg * 2 * math.pi
+        off_x = N_final[:, None, :] * (tube_r * np.cos(angle))[None, :, None]
+        off_y = B_final[:, None, :] * (tube_r * np.sin(angle))[None, :, None]
+        vertices = points[:segments, None, :] + (off_x + off_y)
+
+        # 6. Quads around the tube, closing both the ring and the loop
+        faces = grid_quads(segments, radial_seg)
+        return vertices.reshape(-1, 3), faces
 
 
 class TorusKnotSolidCalculator:
@@ -5,8 +5,10 @@ import math
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
-from ..shared.solid_payload import SolidLabel, SolidPayload
-from .solid_geometry import Vec3, edges_from_faces
+import numpy as np
+
+from ..shared.solid_payload import ArraySolidPayload, SolidLabel, SolidPayload
+from .solid_geometry import grid_quads
 from .solid_property import SolidProperty
 
 
@@ -70,7 +72,6 @@ class TorusSolidService:
         metrics = TorusSolidService._compute_metrics(major_radius, minor_radius)
         
         vertices, faces = TorusSolidService._generate_mesh(major_radius, minor_radius, config)
-        edges = edges_from_faces(faces)
         
         # Labels usually at center or strategic points
         labels = [
@@ -78,9 +79,8 @@ class TorusSolidService:
             SolidLabel(text=f"r = {minor_radius:.2f}", position=(major_radius + minor_radius, 0.0, 0.0)),
         ]
 
-        payload = SolidPayload(
+        payload = ArraySolidPayload(
             vertices=vertices,
-            edges=edges,
             faces=faces,
             labels=labels,
             metadata={
@@ -419,65 +419,26 @@ class TorusSolidService:
         )
 
     @staticmethod
-    def _generate_mesh(R: float, r: float, config: TorusMeshConfig) -> Tuple[List[Vec3], List[Tuple[int, ...]]]:
-        vertices = []
-        faces = []
-        
+    def _generate_mesh(R: float, r: float, config: TorusMeshConfig) -> Tuple[np.ndarray, np.ndarray]:
         div_u = config.major_segments
         div_v = config.minor_segments
-        
-        # Generate vertices
-        # u goes around the tube (minor angle)
-        # v goes around the torus hole (major angle)
-        # Wait, usually u=major, v=minor. Let's stick to standard conv:
-        # phi (major) in [0, 2pi], theta (minor) in [0, 2pi]
-        
-        for i in range(div_u):
-            major_angle = (i / div_u) * 2 * math.pi
-            cos_major = math.cos(major_angle)
-            sin_major = math.sin(major_angle)
-            
-            for j in range(div_v):
-                minor_angle = (j / div_v) * 2 * math.pi
-                cos_minor = math.cos(minor_angle)
-                sin_minor = math.sin(minor_angle)
-                
-                # Formula:
-                # x = (R + r*cos(theta)) * cos(phi)
-                # y = (R + r*cos(theta)) * sin(phi)
-                # z = r * sin(theta)
-                
-                # Using Y as UP axis?
-                # Usually in this app Y is UP? Let's check cube.
-                # Cube: (-1, -1, -1) to (1, 1, 1). 
-                # Let's assume Z is UP for geometry, or Y? 
-                # Let's verify standard orientation. Usually standard math Z is up.
-                # But implementation might vary. Let's assume Z is UP.
-                
-                x = (R + r * cos_minor) * cos_major
-                y = (R + r * cos_minor) * sin_major
-                z = r * sin_minor
-                
-                vertices.append((x, y, z))
-
-        # Generate Faces (Quads)
-        for i in range(div_u):
-            next_i = (i + 1) % div_u
-            for j in range(div_v):
-                next_j = (j + 1) % div_v
-                
-                # Indices in the flat list
-                # current vertex = i * div_v + j
-                
-                idx_bl = i * div_v + j           # Bottom Left
-                idx_br = next_i * div_v + j      # Bottom Right
-                idx_tr = next_i * div_v + next_j # Top Right
-                idx_tl = i * div_v + next_j      # Top Left
-                
-                # Winding order? Let's try CCW
-                faces.append((idx_bl, idx_br, idx_tr, idx_tl))
-
-        return vertices, faces
+
+        # phi (major) in [0, 2pi) by rows, theta (minor) in [0, 2pi) by columns; Z is up.
+        # x = (R + r*cos(theta)) * cos(phi)
+        # y = (R + r*cos(theta)) * sin(phi)
+        # z = r * sin(theta)
+        major = np.arange(div_u) / div_u * 2 * math.pi
+        minor = np.arange(div_v) / div_v * 2 * math.pi
+        ring = R + r * np.cos(minor)
+
+        vertices = np.empty((div_u, div_v, 3))
+        vertices[..., 0] = np.outer(np.cos(major), ring)
+        vertices[..., 1] = np.outer(np.sin(major), ring)
+        vertices[..., 2] = r * np.sin(minor)
+
+        # Quads (i, j), (i+1, j), (i+1, j+1), (i, j+1), wrapping both ways
+        faces = grid_quads(div_u, div_v)
+        return vertices.reshape(-1, 3), faces
 
 
 class TorusSolidCalculator:
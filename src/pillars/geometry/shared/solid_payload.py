@@ -1,4 +1,5 @@
 """Backward compatibility shim for SolidPayload."""
 from shared.services.geometry.solid_payload import (
-    SolidPayload, SolidLabel, Vec3, Edge, Face, Vertex
+    SolidPayload, SolidLabel, Vec3, Edge, Face, Vertex,
+    ArraySolidPayload, MeshBuffers, ArrayRows, FaceRows
 )
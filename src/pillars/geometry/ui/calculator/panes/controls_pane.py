@@ -10,6 +10,9 @@ from ....services.persistence_service import PersistenceService
 from ..view_model import GeometryViewModel
 from ...liturgy_styles import LiturgyPanels, LiturgyTabs, LiturgyToolbar, LiturgyColors, LiturgyButtons
 
+# History entries fetched per scroll step
+HISTORY_PAGE_SIZE = 50
+
 class ControlsPane(QWidget):
     """
     Right panel: Display options, camera controls, and export tools.
@@ -95,6 +98,7 @@ class ControlsPane(QWidget):
             }}
         """)
         self.history_list.itemDoubleClicked.connect(self._restore_history_item)
+        self.history_list.verticalScrollBar().valueChanged.connect(self._on_history_scrolled)
         
         layout.addWidget(self.history_list)
         
@@ -105,24 +109,37 @@ class ControlsPane(QWidget):
 
     def _refresh_history(self):
         self.history_list.clear()
-        recent = PersistenceService.get_recent_calculations()
-        current_shape = self.view_model.shape_name
-        
-        for entry in recent:
-            if entry.get("shape_name") == current_shape:
-                timestamp = entry.get("timestamp", "").split("T")[1][:8] # HH:MM:SS  # type: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                summary = entry.get("summary", "No details")
-                note = entry.get("note", "")
-                
-                display_text = f"[{timestamp}] {summary}"
-                if note:
-                    display_text += f"\nNote: {note}"
-                    
-                item = QListWidgetItem(display_text)
-                # Store full entry in user role (so we have timestamp for note updates)
-                item.setData(Qt.ItemDataRole.UserRole, entry) 
-                self.history_list.addItem(item)
-                
+        self._history_exhausted = False
+        self._load_more_history()
+
+    def _load_more_history(self):
+        """Append the next page of the current shape's history."""
+        if self._history_exhausted:
+            return
+        before = None
+        if self.history_list.count():
+            before = self.history_list.item(self.history_list.count() - 1).data(Qt.ItemDataRole.UserRole)["timestamp"]
+        page = PersistenceService.get_calculations(self.view_model.shape_name, before, HISTORY_PAGE_SIZE)
+        self._history_exhausted = len(page) < HISTORY_PAGE_SIZE
+
+        for entry in page:
+            timestamp = entry.get("timestamp", "").split("T")[1][:8] # HH:MM:SS  # type: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            summary = entry.get("summary", "No details")
+            note = entry.get("note", "")
+
+            display_text = f"[{timestamp}] {summary}"
+            if note:
+                display_text += f"\nNote: {note}"
+
+            item = QListWidgetItem(display_text)
+            # Store full entry in user role (so we have timestamp for note updates)
+            item.setData(Qt.ItemDataRole.UserRole, entry)
+            self.history_list.addItem(item)
+
+    def _on_history_scrolled(self, value: int):
+        if value >= self.history_list.verticalScrollBar().maximum():
+            self._load_more_history()
+
     def _show_history_context_menu(self, pos):
         item = self.history_list.itemAt(pos)
         if not item:
@@ -0,0 +1,318 @@
+"""Vectorized projection, culling, shading and depth sorting for Geometry3DView."""
+from __future__ import annotations
+
+from collections.abc import Sequence as SequenceABC
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QPointF
+from PyQt6.QtGui import QColor, QMatrix4x4, QPolygonF
+
+from ...shared.solid_payload import SolidPayload
+
+# Light from top-left-front, as in the original per-face loop
+LIGHT_DIRECTION = np.array([-0.5, 0.5, 1.0]) / np.linalg.norm([-0.5, 0.5, 1.0])
+MIN_INTENSITY = 0.1
+
+
+@dataclass
+class MeshArrays:
+    """
+    A SolidPayload flattened into arrays, built once per payload.
+
+    Face ``i`` owns ``face_indices[face_offsets[i]:face_offsets[i + 1]]``;
+    faces with fewer than three vertices are dropped and ``face_ids`` maps
+    the rest back to their payload index (for ``face_colors``).
+    """
+    vertices: np.ndarray        # (N, 3) float64
+    face_offsets: np.ndarray    # (F + 1,) int64
+    face_indices: np.ndarray    # (M,) int64
+    face_ids: np.ndarray        # (F,) int64 payload face index
+    normals: np.ndarray         # (F, 3) unit normals, outward on closed meshes (zero if degenerate)
+    centroids: np.ndarray       # (F, 3)
+    colors: np.ndarray          # (F, 4) RGBA from face_colors
+    has_color: np.ndarray       # (F,) bool, False -> theme default
+    edges: np.ndarray           # (E, 2) int64
+    cull_back_faces: bool       # closed, orientable and opaque
+
+    @property
+    def face_count(self) -> int:
+        return len(self.face_ids)
+
+
+def rotation_3x3(matrix: QMatrix4x4) -> np.ndarray:
+    """Row-major rotation block of a QMatrix4x4 (whose data() is column-major)."""
+    return np.array(matrix.data(), dtype=np.float64).reshape(4, 4).T[:3, :3]
+
+
+def _fan_triangles(face_offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(face, first slot, k) of the fan triangles (v0, vk, vk+1) of every face."""
+    counts = np.diff(face_offsets)
+    tri_counts = counts - 2
+    tri_face = np.repeat(np.arange(len(counts)), tri_counts)
+    k = np.arange(tri_counts.sum()) - np.repeat(np.cumsum(tri_counts) - tri_counts, tri_counts) + 1
+    return tri_face, face_offsets[:-1][tri_face], k
+
+
+def _outward_signs(vertices: np.ndarray, face_indices: np.ndarray, face_offsets: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Per-face +1/-1 that turns first-three-vertex normals outward.
+
+    Returns None unless the mesh is a closed, orientable surface (every
+    edge shared by exactly two faces). Many solids list their faces with
+    mixed winding, so orientation is propagated across shared edges and
+    each connected shell is then pointed outward by its signed volume.
+    """
+    face_count = len(face_offsets) - 1
+    counts = np.diff(face_offsets)
+    if not face_count or not len(face_indices) or len(face_indices) % 2:
+        return None
+
+    nxt = np.arange(1, len(face_indices) + 1)
+    nxt[face_offsets[1:] - 1] = face_offsets[:-1]
+    a, b = face_indices, face_indices[nxt]
+    face_of = np.repeat(np.arange(face_count), counts)
+    codes = np.minimum(a, b) * len(vertices) + np.maximum(a, b)
+    order = np.argsort(codes, kind='stable')
+    ordered = codes[order]
+    if np.any(a == b) or np.any(ordered[0::2] != ordered[1::2]) or np.any(ordered[2::2] == ordered[1:-1:2]):
+        return None
+
+    first, second = order[0::2], order[1::2]
+    # Two faces agree when they walk their shared edge in opposite directions
+    flips = (a[first] == a[second]).tolist()
+    neighbours: List[List[Tuple[int, bool]]] = [[] for _ in range(face_count)]
+    for f1, f2, flip in zip(face_of[first].tolist(), face_of[second].tolist(), flips):
+        neighbours[f1].append((f2, flip))
+        neighbours[f2].append((f1, flip))
+
+    flipped = [False] * face_count
+    shell = [-1] * face_count
+    shells = 0
+    for seed in range(face_count):
+        if shell[seed] >= 0:
+            continue
+        shell[seed] = shells
+        stack = [seed]
+        while stack:
+            face = stack.pop()
+            for other, flip in neighbours[face]:
+                expected = flipped[face] != flip
+                if shell[other] < 0:
+                    shell[other] = shells
+                    flipped[other] = expected
+                    stack.append(other)
+                elif flipped[other] != expected:
+                    return None  # non-orientable
+        shells += 1
+
+    signs = np.where(flipped, -1.0, 1.0)
+    shell_of = np.asarray(shell)
+    tri_face, base, k = _fan_triangles(face_offsets)
+    v0 = vertices[face_indices[base]]
+    v1 = vertices[face_indices[base + k]]
+    v2 = vertices[face_indices[base + k + 1]]
+    volumes = np.einsum('ij,ij->i', v0, np.cross(v1, v2)) * signs[tri_face]
+    shell_volume = np.bincount(shell_of[tri_face], weights=volumes, minlength=shells)
+    if np.any(shell_volume == 0):
+        return None
+    return signs * np.sign(shell_volume)[shell_of]
+
+
+def build_mesh_arrays(payload: SolidPayload) -> MeshArrays:
+    """Flatten a payload and precompute its face normals and centroids."""
+    # Array-backed payloads hand over their own buffers, so nothing is copied here
+    buffers = payload.mesh_buffers()
+    vertices = buffers.vertices
+    sizes = np.diff(buffers.face_offsets)
+    if (sizes >= 3).all():
+        face_offsets, face_indices = buffers.face_offsets, buffers.face_indices
+        face_ids = np.arange(len(sizes))
+    else:
+        keep = sizes >= 3
+        face_ids = np.flatnonzero(keep)
+        face_indices = buffers.face_indices[np.repeat(keep, sizes)]
+        face_offsets = np.zeros(len(face_ids) + 1, dtype=np.int64)
+        np.cumsum(sizes[keep], out=face_offsets[1:])
+    counts = np.diff(face_offsets)
+    starts = face_offsets[:-1]
+    face_count = len(face_ids)
+
+    if face_count:
+        ring = vertices[face_indices]
+        centroids = np.add.reduceat(ring, starts, axis=0) / counts[:, None]
+        # Normal from the first three vertices, as the per-face loop did
+        p0, p1, p2 = ring[starts], ring[starts + 1], ring[starts + 2]
+        normals = np.cross(p1 - p0, p2 - p0)
+        lengths = np.linalg.norm(normals, axis=1)
+        normals = np.divide(normals, lengths[:, None], out=np.zeros_like(normals), where=lengths[:, None] > 0)
+    else:
+        centroids = np.zeros((0, 3))
+        normals = np.zeros((0, 3))
+
+    colors = np.zeros((face_count, 4))
+    has_color = np.zeros(face_count, dtype=bool)
+    row_of_face = np.full(len(sizes), -1, dtype=np.int64)
+    row_of_face[face_ids] = np.arange(face_count)
+    for face_id, raw in enumerate((payload.face_colors or [])[:len(sizes)]):
+        row = row_of_face[face_id]
+        if raw and row >= 0:
+            color = QColor(*raw)
+            colors[row] = (color.red(), color.green(), color.blue(), color.alpha())
+            has_color[row] = True
+
+    edges = buffers.edges
+
+    # Back faces can only be skipped when nothing shows through: the mesh
+    # must be a closed surface and drawn opaque.
+    cull = False
+    if face_count and bool((colors[has_color, 3] >= 255).all()):
+        signs = _outward_signs(vertices, face_indices, face_offsets)
+        if signs is not None:
+            normals = normals * signs[:, None]
+            cull = True
+
+    return MeshArrays(
+        vertices=vertices,
+        face_offsets=face_offsets,
+        face_indices=face_indices,
+        face_ids=face_ids,
+        normals=normals,
+        centroids=centroids,
+        colors=colors,
+        has_color=has_color,
+        edges=edges,
+        cull_back_faces=cull,
+    )
+
+
+def _polygon(points: np.ndarray) -> QPolygonF:
+    """QPolygonF filled straight from an (n, 2) float64 array."""
+    polygon = QPolygonF()
+    polygon.resize(len(points))
+    buffer = polygon.data()
+    buffer.setsize(points.nbytes)
+    np.frombuffer(buffer, dtype=np.float64)[:] = points.ravel()
+    return polygon
+
+
+@dataclass
+class ProjectedMesh:
+    """
+    One projected view of a mesh, relative to the view center (pan excluded).
+
+    Depends only on rotation, scale and default color, so the view keeps
+    it and the Qt polygons built from it while the user pans.
+    """
+    key: Tuple
+    points: np.ndarray          # (N, 2) screen offsets from the pan center
+    order: np.ndarray           # visible faces (mesh rows), back to front
+    intensity: np.ndarray       # (F,) flat shading factor
+    rgba: np.ndarray            # (len(order), 4) shaded fill colors in draw order
+    mesh: MeshArrays
+    _polygons: Optional[List[QPolygonF]] = field(default=None, repr=False)
+    _colors: Optional[List[QColor]] = field(default=None, repr=False)
+    _edge_lines: Optional[QPolygonF] = field(default=None, repr=False)
+
+    def polygons(self) -> List[QPolygonF]:
+        """Face polygons in draw order."""
+        if self._polygons is None:
+            # Gather only the visible faces' rings, already in draw order
+            offsets = self.mesh.face_offsets
+            counts = np.diff(offsets)[self.order]
+            ends = np.cumsum(counts)
+            slots = np.arange(ends[-1] if len(ends) else 0) + np.repeat(offsets[self.order] - (ends - counts), counts)
+            ring = self.points[self.mesh.face_indices[slots]]
+            self._polygons = [_polygon(ring[start:end]) for start, end in zip([0, *ends[:-1].tolist()], ends.tolist())]
+        return self._polygons
+
+    def colors(self) -> List[QColor]:
+        """Shaded face colors in draw order."""
+        if self._colors is None:
+            self._colors = [QColor(r, g, b, a) for r, g, b, a in self.rgba.tolist()]
+        return self._colors
+
+    def edge_lines(self) -> QPolygonF:
+        """Edge end points in pairs, for ``QPainter.drawLines``."""
+        if self._edge_lines is None:
+            self._edge_lines = _polygon(self.points[self.mesh.edges].reshape(-1, 2))
+        return self._edge_lines
+
+
+def project_mesh(
+    mesh: MeshArrays,
+    rotation: np.ndarray,
+    scale: float,
+    default_rgba: Sequence[int],
+    key: Tuple = (),
+) -> ProjectedMesh:
+    """
+    Rotate, project, cull, shade and depth-sort the whole mesh at once.
+
+    Args:
+        mesh: Arrays from ``build_mesh_arrays``
+        rotation: 3x3 camera rotation (``rotation_3x3``)
+        scale: Pixels per world unit
+        default_rgba: Fill for faces without a color of their own
+        key: Cache key stored on the result
+    """
+    rotated = mesh.vertices @ rotation.T
+    points = np.column_stack((rotated[:, 0] * scale, -rotated[:, 1] * scale))
+
+    normals = mesh.normals @ rotation.T
+    depth = mesh.centroids @ rotation[2]
+    intensity = np.clip((normals @ LIGHT_DIRECTION + 1.0) * 0.5, MIN_INTENSITY, 1.0)
+
+    if mesh.cull_back_faces:
+        candidates = np.flatnonzero(normals[:, 2] >= 0.0)
+    else:
+        candidates = np.arange(mesh.face_count)
+    # Farthest first; stable so coplanar faces keep payload order
+    order = candidates[np.argsort(depth[candidates], kind='stable')]
+
+    base = np.where(mesh.has_color[:, None], mesh.colors, np.asarray(default_rgba, dtype=np.float64))[order]
+    rgba = np.empty((len(order), 4), dtype=np.int64)
+    rgba[:, :3] = (base[:, :3] * intensity[order, None]).astype(np.int64)
+    rgba[:, 3] = base[:, 3]
+
+    return ProjectedMesh(
+        key=key,
+        points=points,
+        order=order,
+        intensity=intensity,
+        rgba=rgba,
+        mesh=mesh,
+    )
+
+
+class ScreenPoints(SequenceABC):
+    """Projected vertices as a read-only sequence of QPointF, built on access."""
+
+    def __init__(self, points: np.ndarray, offset_x: float, offset_y: float):
+        """
+        Args:
+            points: (N, 2) offsets from the pan center
+            offset_x: Pan center x in widget coordinates
+            offset_y: Pan center y in widget coordinates
+        """
+        self.array = points + (offset_x, offset_y)
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [QPointF(x, y) for x, y in self.array[index].tolist()]
+        x, y = self.array[index]
+        return QPointF(float(x), float(y))
+
+    def nearest(self, x: float, y: float, threshold: float) -> Tuple[Optional[int], float]:
+        """Index and distance of the closest point within ``threshold``."""
+        if not len(self.array):
+            return None, threshold
+        dist = np.hypot(self.array[:, 0] - x, self.array[:, 1] - y)
+        index = int(np.argmin(dist))
+        if dist[index] < threshold:
+            return index, float(dist[index])
+        return None, threshold
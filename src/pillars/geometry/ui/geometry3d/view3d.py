@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from PyQt6.QtCore import QPoint, QPointF, QRectF, Qt, pyqtSignal
 from PyQt6.QtGui import (
     QColor,
@@ -22,6 +23,14 @@ from PyQt6.QtGui import (
 from PyQt6.QtWidgets import QWidget
 
 from ...shared.solid_payload import SolidPayload
+from .mesh_projection import (
+    MeshArrays,
+    ProjectedMesh,
+    ScreenPoints,
+    build_mesh_arrays,
+    project_mesh,
+    rotation_3x3,
+)
 from ...services.measurement_utils import (
     distance_3d, 
     polygon_area_3d, 
@@ -178,8 +187,13 @@ class Geometry3DView(QWidget):
         self._selected_vertex_indices: List[int] = []  # Base polygon vertices
         self._apex_vertex_index: Optional[int] = None  # For 3D volume (pyramid apex)
         self._hovered_vertex_index: Optional[int] = None
-        self._last_screen_points: List[QPointF] = []
+        self._last_screen_points: ScreenPoints = ScreenPoints(np.empty((0, 2)), 0.0, 0.0)
         self._loop_closed = False  # True when base polygon is closed
+
+        # Per-payload mesh arrays and the last projected frame
+        self._mesh: Optional[MeshArrays] = None
+        self._mesh_payload: Optional[SolidPayload] = None
+        self._frame: Optional[ProjectedMesh] = None
     
     # ------------------------------------------------------------------
     # 2D-to-3D Conversion
@@ -661,106 +675,28 @@ class Geometry3DView(QWidget):
             return
 
         matrix, scale, pan_offset = self._projection_parameters()
-        
-        # 1. Transform all vertices to World Space (rotated) and Screen Space
-        transformed_verts = []
-        screen_points = []
-        
-        for vx, vy, vz in payload.vertices:
-            vec = QVector3D(vx, vy, vz)
-            rotated = matrix * vec
-            transformed_verts.append(rotated)
-            
-            sx = rotated.x() * scale + pan_offset.x()
-            sy = -rotated.y() * scale + pan_offset.y()
-            screen_points.append(QPointF(sx, sy))
-
-        # 2. Collect and Sort Faces (Painter's Algorithm)
-        #    Sort by centroid Z (depth). Positive Z is towards camera in standard OpenGL,
-        #    but here let's check coordinate system. Qt 3D usually: Y up, X right, Z out of screen?
-        #    Actually we just need relative sort.
-        
-        faces_to_draw = []
-        light_dir = QVector3D(-0.5, 0.5, 1.0).normalized() # Light from top-left-front
-        
-        if payload.faces:
-            for i, face_indices in enumerate(payload.faces):
-                # Calc Centroid & Normal
-                v_positions = [transformed_verts[i] for i in face_indices]
-                if len(v_positions) < 3:
-                    continue
-                    
-                # Centroid Z for sorting
-                z_sum = sum(v.z() for v in v_positions)  # type: ignore[reportUnknownArgumentType, reportUnknownMemberType, reportUnknownVariableType]
-                centroid_z = z_sum / len(v_positions)
-                
-                # Normal (using first 3 points, assuming planar-ish)
-                v0 = v_positions[0]
-                v1 = v_positions[1]
-                v2 = v_positions[2]
-                normal = QVector3D.crossProduct(v1 - v0, v2 - v0).normalized()
-                
-                # Flat Shading
-                # Dot product: -1 (backlit) to 1 (facing light)
-                # Clamp to [0, 1] for simple diffuse
-                dot = QVector3D.dotProduct(normal, light_dir)
-                intensity = max(0.1, min(1.0, (dot + 1.0) * 0.5)) # Remap -1..1 to 0..1 for ambient+diffuse look
-                
-                faces_to_draw.append((centroid_z, face_indices, intensity, i))
-                
-            # Sort: Farthest Z first.
-            # In our camera, if distance is positive, larger Z might be closer?
-            # Camera rotation is simple rotation. 
-            # Usually Z-buffer sorts by depth.
-            # Let's try sorting by Z descending (paint farthest/smallest Z first? No, paint farthest Z first).
-            # If Z points to viewer, negative Z is far. So paint smallest Z first.
-            faces_to_draw.sort(key=lambda x: x[0])   # type: ignore[reportUnknownLambdaType, reportUnknownMemberType]
-
-            # 3. Draw Faces (if enabled)
-            if self._show_faces:
-                painter.setPen(Qt.PenStyle.NoPen)
-                for _, indices, intensity, original_idx in faces_to_draw:  # type: ignore[reportUnknownVariableType]
-                    poly = [screen_points[i] for i in indices]
-                    
-                    
-                    # Color Logic
-                    base_color = None
-                    if payload.face_colors and original_idx < len(payload.face_colors):
-                         raw_color = payload.face_colors[original_idx]
-                         if raw_color:
-                             base_color = QColor(*raw_color)
-                    
-                    if base_color:
-                        # Modulate intensity
-                        # Scaling RGB
-                        r = int(base_color.red() * intensity)
-                        g = int(base_color.green() * intensity)
-                        b = int(base_color.blue() * intensity)
-                        alpha = base_color.alpha()
-                    else:
-                        # Use theme default face color
-                        base = self._color_theme.face_default
-                        r = int(base.red() * intensity)
-                        g = int(base.green() * intensity)
-                        b = int(base.blue() * intensity)
-                        alpha = base.alpha()
-
-                    color = QColor(r, g, b, alpha)
-                    painter.setBrush(color)
-                    
-                    qpoly = [p.toPoint() for p in poly] # drawPolygon needs QPoint  # type: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                    painter.drawPolygon(qpoly)
-
-        # 4. Draw Edges (Wireframe overlay - if enabled)
-        if self._show_edges:
-            edge_pen = QPen(self._color_theme.edge, 1.0)
-            painter.setPen(edge_pen)
+        frame = self._projected_frame(payload, matrix, scale)
+        screen_points = ScreenPoints(frame.points, pan_offset.x(), pan_offset.y())
+
+        # Faces and edges are cached relative to the view center, so a pan
+        # only moves the painter; culled faces are already left out and the
+        # rest arrive sorted back to front (painter's algorithm).
+        if self._show_faces and len(frame.order):
+            painter.save()
+            painter.translate(pan_offset)
+            painter.setPen(Qt.PenStyle.NoPen)
+            for polygon, color in zip(frame.polygons(), frame.colors()):
+                painter.setBrush(color)
+                painter.drawPolygon(polygon)
+            painter.restore()
+
+        if self._show_edges and len(frame.mesh.edges):
+            painter.save()
+            painter.translate(pan_offset)
+            painter.setPen(QPen(self._color_theme.edge, 1.0))
             painter.setBrush(Qt.BrushStyle.NoBrush)
-            
-            for edge in payload.edges:
-                if len(edge) != 2: continue
-                i, j = edge
-                painter.drawLine(screen_points[i], screen_points[j])
+            painter.drawLines(frame.edge_lines())
+            painter.restore()
 
         # Store screen points for hit detection
         self._last_screen_points = screen_points
@@ -769,9 +705,7 @@ class Geometry3DView(QWidget):
         center_point = None
         if payload.vertices and self._measure_mode:
             # Calculate 3D center
-            cx = sum(v[0] for v in payload.vertices) / len(payload.vertices)
-            cy = sum(v[1] for v in payload.vertices) / len(payload.vertices)
-            cz = sum(v[2] for v in payload.vertices) / len(payload.vertices)
+            cx, cy, cz = frame.mesh.vertices.mean(axis=0).tolist()
             # Project to screen space
             center_vec = QVector3D(cx, cy, cz)
             rotated_center = matrix * center_vec
@@ -942,8 +876,29 @@ class Geometry3DView(QWidget):
         )
         return matrix, scale, pan_offset
 
+    def _mesh_arrays(self, payload: SolidPayload) -> MeshArrays:
+        """Arrays (normals, centroids, colors) for ``payload``, built once per payload."""
+        if self._mesh is None or self._mesh_payload is not payload:
+            self._mesh = build_mesh_arrays(payload)
+            self._mesh_payload = payload
+            self._frame = None
+        return self._mesh
+
+    def _projected_frame(self, payload: SolidPayload, matrix: QMatrix4x4, scale: float) -> ProjectedMesh:
+        """Projected, culled and depth-sorted mesh; reused while only the pan changes."""
+        mesh = self._mesh_arrays(payload)
+        default = self._color_theme.face_default
+        default_rgba = (default.red(), default.green(), default.blue(), default.alpha())
+        key = (self._camera.yaw_deg, self._camera.pitch_deg, scale, default_rgba)
+        if self._frame is None or self._frame.key != key:
+            self._frame = project_mesh(mesh, rotation_3x3(matrix), scale, default_rgba, key)
+        return self._frame
+
     def _project_vertices(self, payload: SolidPayload, matrix: QMatrix4x4, scale: float, pan_offset: QPointF):
-        return [self._project_point(vx, vy, vz, matrix, scale, pan_offset) for vx, vy, vz in payload.vertices]
+        vertices = np.asarray(payload.vertices, dtype=np.float64).reshape(-1, 3)
+        rotated = vertices @ rotation_3x3(matrix).T
+        points = np.column_stack((rotated[:, 0] * scale, -rotated[:, 1] * scale))
+        return ScreenPoints(points, pan_offset.x(), pan_offset.y())
 
     @staticmethod
     def _project_point(
@@ -1084,7 +1039,7 @@ class Geometry3DView(QWidget):
         painter.drawLine(origin, QPointF(origin.x() - axis_length * 0.6, origin.y() + axis_length * 0.6))
         painter.drawText(origin + QPointF(-axis_length * 0.6 - 10, axis_length * 0.6 + 10), "Z")
 
-    def _draw_vertices(self, painter: QPainter, screen_points: List[QPointF], payload: SolidPayload, center_point: QPointF = None):
+    def _draw_vertices(self, painter: QPainter, screen_points: Sequence[QPointF], payload: SolidPayload, center_point: QPointF = None):
         """Draw vertex markers at each vertex, including optional center."""
         painter.save()
         
@@ -1115,13 +1070,18 @@ class Geometry3DView(QWidget):
         # Draw Mesh Vertices
         # Optimization: If too many vertices, only draw selected/hovered to avoid clutter
         show_all_vertices = len(screen_points) <= 1000  # Increased from 200 to handle tessellated spheres
+        if show_all_vertices:
+            indices = range(len(screen_points))
+        else:
+            marked = set(self._selected_vertex_indices)
+            if self._hovered_vertex_index is not None:
+                marked.add(self._hovered_vertex_index)
+            indices = sorted(i for i in marked if 0 <= i < len(screen_points))
 
-        for i, point in enumerate(screen_points):
+        for i in indices:
+            point = screen_points[i]
             is_selected = i in self._selected_vertex_indices
             is_hovered = i == self._hovered_vertex_index
-            
-            if not show_all_vertices and not is_selected and not is_hovered:
-                continue
 
             # Highlight selected vertices
             if is_selected:
@@ -1148,7 +1108,7 @@ class Geometry3DView(QWidget):
 
         painter.restore()
 
-    def _draw_measurement(self, painter: QPainter, screen_points: List[QPointF], payload: SolidPayload):
+    def _draw_measurement(self, painter: QPainter, screen_points: Sequence[QPointF], payload: SolidPayload):
         """Draw measurement lines between all selected vertices and show distances."""
         if len(self._selected_vertex_indices) < 2 or not payload.vertices:
             return
@@ -1413,18 +1373,8 @@ class Geometry3DView(QWidget):
         if threshold is None:
             threshold = self._snap_threshold
         
-        min_dist = threshold
-        nearest_idx = None
-        
         # Check regular vertices
-        for i, screen_pt in enumerate(self._last_screen_points):
-            dx = pos.x() - screen_pt.x()
-            dy = pos.y() - screen_pt.y()
-            dist = math.sqrt(dx * dx + dy * dy)
-            
-            if dist < min_dist:
-                min_dist = dist
-                nearest_idx = i
+        nearest_idx, min_dist = self._last_screen_points.nearest(pos.x(), pos.y(), threshold)
         
         # Check center point (-1)
         if getattr(self, '_center_screen_point', None):
@@ -1439,7 +1389,7 @@ class Geometry3DView(QWidget):
                 
         return nearest_idx
     
-    def _draw_angles(self, painter: QPainter, screen_points: List[QPointF], payload: SolidPayload):
+    def _draw_angles(self, painter: QPainter, screen_points: Sequence[QPointF], payload: SolidPayload):
         """Draw angle measurements at each vertex of the closed polygon."""
         if not self._selected_vertex_indices or len(self._selected_vertex_indices) < 3:
             return
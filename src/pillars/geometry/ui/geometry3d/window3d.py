@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import (
     QApplication,
     QCheckBox,
     QDialog,
+    QFileDialog,
     QFrame,
     QHBoxLayout,
     QLabel,
@@ -26,6 +27,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtGui import QAction, QDoubleValidator
 
 from ...shared.solid_payload import SolidPayload
+from ...services.mesh_export import write_obj
 from ..calculator.widgets.formula_dialog import FormulaDialog
 from shared.ui import WindowManager
 from shared.ui.theme import COLORS, set_archetype
@@ -536,6 +538,12 @@ class Geometry3DWindow(QMainWindow):
         summary_btn.clicked.connect(self._copy_measurement_summary)
         layout.addWidget(summary_btn)
 
+        export_btn = QPushButton("Export Mesh (OBJ)…")
+        export_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        export_btn.setStyleSheet(self._secondary_button_style())
+        export_btn.clicked.connect(self._export_mesh)
+        layout.addWidget(export_btn)
+
         # Canon Export Section (hidden until Canon path active)
         canon_section = QFrame()
         canon_section.setObjectName("CanonExportSection")
@@ -1763,6 +1771,23 @@ class Geometry3DWindow(QMainWindow):
         if clipboard:
             clipboard.setPixmap(pixmap)
 
+    def _export_mesh(self):
+        payload = self._current_payload
+        if not payload or not payload.vertices:
+            return
+        title = self.windowTitle() or "solid"
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Mesh", f"{title}.obj", "Wavefront OBJ (*.obj)"
+        )
+        if not path:
+            return
+        try:
+            write_obj(payload, path)
+        except OSError as e:
+            logger.error(f"Mesh export to {path} failed: {e}")
+            if self._status_label:
+                self._status_label.setText(f"Export failed: {e}")
+
     def _copy_measurement_summary(self):
         title = self.windowTitle() or "3D Solid"
         lines = [f"{title} Measurements"]
@@ -8,14 +8,21 @@ The Three Principles of Synthesis:
     2. Timbre - Waveform type (Sine/Triangle/Sawtooth from Skin)
     3. Entrainment - Amplitude pulse rate (4-13 Hz from Body)
 """
-import math
-import struct
 import tempfile
 import wave
 from typing import Optional
 
+import numpy as np
+
+from shared.utils.byte_budget_lru import ByteBudgetLRU
+
 from ..models.amun_sound import SoundFrame, WaveformSpec
 
+# Rendered PCM kept for reuse (4 s of stereo 16-bit audio is ~700 KB)
+WAVEFORM_CACHE_BYTES = 64 * 1024 * 1024
+
+_waveform_cache = ByteBudgetLRU(WAVEFORM_CACHE_BYTES)
+
 
 class AmunAudioService:
     """Service for generating entraining audio from SoundFrames."""
@@ -67,88 +74,87 @@ class AmunAudioService:
         - Additive synthesis based on waveform spec
         - Amplitude modulation at entrainment pulse rate
         - Smooth fade in/out
+        
+        Rendered tones are cached by ditrune and synthesis parameters, so
+        scales and sequences that repeat a ditrune reuse its samples.
         """
-        data = bytearray()
+        n_samples = int(duration * AmunAudioService.SAMPLE_RATE)
+        key = (
+            frame.decimal, frame.frequency, frame.waveform, frame.pulse_rate, n_samples, volume,
+        )
+        data = _waveform_cache.get(key)
+        if data is None:
+            data = AmunAudioService._render_pcm(
+                frame.frequency, frame.waveform, frame.pulse_rate, n_samples, volume
+            )
+            _waveform_cache.put(key, data)
+        return data
+    
+    @staticmethod
+    def _render_pcm(
+        freq: float,
+        waveform: WaveformSpec,
+        pulse_rate: float,
+        n_samples: int,
+        volume: float,
+    ) -> bytes:
+        """Render a tone as interleaved stereo 16-bit PCM, all samples at once."""
         sample_rate = AmunAudioService.SAMPLE_RATE
-        n_samples = int(duration * sample_rate)
-        two_pi = 2 * math.pi
+        two_pi = 2 * np.pi
+        t = np.arange(n_samples) / sample_rate
         
-        # Extract parameters
-        freq = frame.frequency
-        waveform = frame.waveform
-        pulse_rate = frame.pulse_rate
+        # 1. Generate waveform (additive synthesis)
+        wave_val = AmunAudioService._generate_waveform(t, freq, waveform, two_pi)
         
-        # Fade envelope (avoid clicks)
-        fade_time = 0.3  # seconds
-        fade_samples = int(fade_time * sample_rate)
+        # 2. Apply entrainment pulse (amplitude modulation)
+        # Pulse oscillates between 0.3 and 1.0 for gentle breathing effect
+        pulse_env = 0.65 + 0.35 * np.sin(two_pi * pulse_rate * t)
         
-        for i in range(n_samples):
-            t = i / sample_rate
-            
-            # 1. Generate waveform (additive synthesis)
-            wave_val = AmunAudioService._generate_waveform(
-                t, freq, waveform, two_pi
-            )
-            
-            # 2. Apply entrainment pulse (amplitude modulation)
-            # Pulse oscillates between 0.3 and 1.0 for gentle breathing effect
-            pulse_phase = two_pi * pulse_rate * t
-            pulse_env = 0.65 + 0.35 * math.sin(pulse_phase)
-            
-            # 3. Apply fade in/out
-            fade_env = 1.0
-            if i < fade_samples:
-                # Fade in
-                fade_env = 0.5 * (1 - math.cos(math.pi * i / fade_samples))
-            elif i > n_samples - fade_samples:
-                # Fade out
-                remaining = n_samples - i
-                fade_env = 0.5 * (1 - math.cos(math.pi * remaining / fade_samples))
-            
-            # 4. Combine
-            sample = wave_val * pulse_env * fade_env * volume
-            
-            # Convert to 16-bit integer
-            sample_int = int(sample * AmunAudioService.MAX_AMP)
-            sample_int = max(-32767, min(32767, sample_int))
-            
-            # Stereo (same on both channels)
-            data.extend(struct.pack('<hh', sample_int, sample_int))
+        # 3. Apply fade in/out (avoid clicks)
+        fade_samples = int(0.3 * sample_rate)
+        i = np.arange(n_samples)
+        fade_env = np.ones(n_samples)
+        fade_in = i < fade_samples
+        fade_env[fade_in] = 0.5 * (1 - np.cos(np.pi * i[fade_in] / fade_samples))
+        fade_out = ~fade_in & (i > n_samples - fade_samples)
+        remaining = n_samples - i[fade_out]
+        fade_env[fade_out] = 0.5 * (1 - np.cos(np.pi * remaining / fade_samples))
         
-        return bytes(data)
+        # 4. Combine and convert to 16-bit integer (truncating, as int() does)
+        sample = wave_val * pulse_env * fade_env * volume
+        sample_int = np.clip(sample * AmunAudioService.MAX_AMP, -32767, 32767).astype('<i2')
+        
+        # Stereo (same on both channels)
+        return np.repeat(sample_int, AmunAudioService.CHANNELS).tobytes()
     
     @staticmethod
     def _generate_waveform(
-        t: float,
+        t: np.ndarray,
         freq: float,
         waveform: WaveformSpec,
         two_pi: float,
-    ) -> float:
+    ) -> np.ndarray:
         """
-        Generate waveform sample using additive synthesis.
+        Generate waveform samples using additive synthesis.
         
         Args:
-            t: Time in seconds.
+            t: Sample times in seconds.
             freq: Fundamental frequency in Hz.
             waveform: WaveformSpec with harmonic parameters.
             two_pi: Pre-calculated 2*pi.
         
         Returns:
-            Sample value in range [-1, 1].
+            Sample values in range [-1, 1].
         """
-        val = 0.0
+        # Odd-only waveforms skip the even harmonics
+        step = 2 if waveform.odd_harmonics else 1
+        harmonics = np.arange(1, waveform.max_harmonic + 1, step, dtype=float)
         
-        for h in range(1, waveform.max_harmonic + 1):
-            # Skip even harmonics for odd-only waveforms
-            if waveform.odd_harmonics and h % 2 == 0:
-                continue
-            
-            # Calculate harmonic amplitude with rolloff
-            harmonic_amp = 1.0 / (h ** waveform.rolloff_exp)
-            
-            # Add harmonic
-            phase = two_pi * freq * h * t
-            val += math.sin(phase) * harmonic_amp
+        # Calculate harmonic amplitudes with rolloff
+        harmonic_amps = 1.0 / (harmonics ** waveform.rolloff_exp)
+        
+        # Sum every partial in one product: (harmonics) @ (harmonics x samples)
+        val = harmonic_amps @ np.sin(np.outer(harmonics, two_pi * freq * t))
         
         # Normalize to prevent clipping
         # Approximate normalization based on harmonic count
@@ -161,6 +167,11 @@ class AmunAudioService:
         
         return val / norm
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached waveforms."""
+        _waveform_cache.clear()
+    
     @staticmethod
     def _generate_silence(duration: float) -> str:
         """Generate a silent WAV file."""
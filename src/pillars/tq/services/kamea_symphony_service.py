@@ -10,8 +10,13 @@ import tempfile
 from typing import Optional, List
 import struct
 
+from shared.utils.byte_budget_lru import ByteBudgetLRU
+
 from ..models.symphony_config import SYMPHONY_FAMILIES, SymphonyNucleation, OCTAVE_FREQUENCIES, SCALE_RATIOS
 
+# Rendered nucleations kept per service (4 s of stereo float64 is ~2.8 MB)
+SYMPHONY_CACHE_BYTES = 64 * 1024 * 1024
+
 class KameaSymphonyService:
     """
     Cinematic Audio Engine for the Kamea.
@@ -26,6 +31,7 @@ class KameaSymphonyService:
         
         """
         self._reverb_impulse = self._generate_reverb_impulse()
+        self._rendered = ByteBudgetLRU(SYMPHONY_CACHE_BYTES, lambda audio: audio.nbytes)
 
     def generate_wav_file(self, nucleation: SymphonyNucleation, duration: float = 4.0) -> str:
         """Generates audio and returns path to a temporary WAV file."""
@@ -79,6 +85,11 @@ class KameaSymphonyService:
         return temp_file.name
 
     def _synthesize(self, nuc: SymphonyNucleation, duration: float) -> np.ndarray:
+        """Rendered audio for a nucleation; repeats in sequences and chords reuse it."""
+        key = (nuc.core, nuc.skin, nuc.pyx_count, nuc.hierarchy_class, tuple(nuc.coordinates), duration)
+        return self._rendered.get_or_build(key, lambda: self._render(nuc, duration))
+
+    def _render(self, nuc: SymphonyNucleation, duration: float) -> np.ndarray:
         """Core synthesis logic pipeline."""
         # 1. Calculate Base Frequency
         base_freq = OCTAVE_FREQUENCIES[nuc.pyx_count] if nuc.pyx_count < len(OCTAVE_FREQUENCIES) else 261.63
@@ -131,7 +142,8 @@ class KameaSymphonyService:
         max_val = np.max(np.abs(final_mix))
         if max_val > 0:
             final_mix = final_mix / max_val * 0.9
-            
+
+        final_mix.flags.writeable = False  # Shared through the render cache
         return final_mix
 
     def _generate_voice(self, core: str, freq: float, duration: float) -> np.ndarray:
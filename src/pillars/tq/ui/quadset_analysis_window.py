@@ -23,6 +23,7 @@ from shared.models.gematria import CalculationEntity
 from shared.ui.theme import COLORS, get_card_style, get_app_stylesheet
 
 import logging
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
@@ -1360,6 +1361,9 @@ class QuadsetAnalysisWindow(QMainWindow):
         tasks.append(("upper_diff", result.upper_diff.decimal))
         tasks.append(("lower_diff", result.lower_diff.decimal))
         
+        # Lexical correspondences for all six values in one indexed query
+        lexicon_words = self._fetch_lexicon_words([value for _, value in tasks])
+        
         for key, value in tasks:
             # Update sidebar label to show actual number
             if hasattr(self, 'gem_list_items') and key in self.gem_list_items:
@@ -1368,10 +1372,24 @@ class QuadsetAnalysisWindow(QMainWindow):
             # Populate the table
             table = self.gem_tables.get(key)  # type: ignore[reportUnknownArgumentType, reportUnknownMemberType, reportUnknownVariableType]
             if table:
-                self._populate_gematria_table(table, value, key)  # type: ignore[reportUnknownArgumentType]
+                self._populate_gematria_table(table, value, key, lexicon_words.get(value, []))  # type: ignore[reportUnknownArgumentType]
 
-    def _populate_gematria_table(self, table: QTableWidget, value: int, key: str = ""):
-        """Fetch rows from DB where value matches and populate table."""
+    def _fetch_lexicon_words(self, values: list[int]) -> dict[int, list[dict]]:
+        """Master Key words for each TQ value (value -> [{'word', 'frequency'}])."""
+        try:
+            from shared.services.lexicon.holy_key_service import HolyKeyService
+            return HolyKeyService().find_words_by_tq_values(values)
+        except Exception:
+            logger.exception("Error fetching lexicon words for %s", values)
+            return {}
+
+    def _populate_gematria_table(self, table: QTableWidget, value: int, key: str = "",
+                                 lexicon_words: Optional[list[dict]] = None):
+        """Fetch rows from DB where value matches and populate table.
+
+        ``lexicon_words`` (Master Key words with this TQ value) are appended
+        as "TQ Lexicon" rows so they can be filtered like any method.
+        """
         table.setRowCount(0)
         
         # Track unique languages and methods for filter population
@@ -1387,7 +1405,9 @@ class QuadsetAnalysisWindow(QMainWindow):
                 table.setHorizontalHeaderLabels(["Word", "Method", "Tags", "Notes", "Language"])
                 table.setColumnHidden(4, True)  # Hide language column
                 
-                table.setRowCount(len(entries))
+                lexicon_words = lexicon_words or []
+                table.setSortingEnabled(False)
+                table.setRowCount(len(entries) + len(lexicon_words))
                 for row, entry in enumerate(entries):
                     # Word
                     table.setItem(row, 0, QTableWidgetItem(entry.text))
@@ -1427,6 +1447,16 @@ class QuadsetAnalysisWindow(QMainWindow):
                     # Track method separately
                     methods.add(entry.method)
                 
+                for row, lex in enumerate(lexicon_words, start=len(entries)):
+                    table.setItem(row, 0, QTableWidgetItem(lex['word']))
+                    table.setItem(row, 1, QTableWidgetItem("TQ Lexicon"))
+                    table.setItem(row, 2, QTableWidgetItem(""))
+                    table.setItem(row, 3, QTableWidgetItem(f"Frequency: {lex['frequency']}"))
+                    table.setItem(row, 4, QTableWidgetItem(""))
+                if lexicon_words:
+                    methods.add("TQ Lexicon")
+                table.setSortingEnabled(True)
+                
                 table.resizeRowsToContents()
                 
                 # Update filter combo boxes
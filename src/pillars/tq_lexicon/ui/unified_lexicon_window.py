@@ -27,9 +27,13 @@ from PyQt6.QtGui import QColor, QFont
 from shared.services.lexicon.holy_key_service import HolyKeyService
 from shared.services.lexicon.enrichment_service import EnrichmentService
 from shared.services.lexicon.concordance_indexer_service import ConcordanceIndexerService
+from shared.services.lexicon.concordance_indexing_job import ConcordanceIndexingJob
+from shared.async_tasks import get_task_manager
 
 logger = logging.getLogger(__name__)
 
+REINDEX_TASK_NAME = "Reindex Concordance"
+
 
 class ParseAndIndexWorker(QThread):
     """Background worker for parse + index."""
@@ -110,6 +114,9 @@ class UnifiedLexiconWindow(QMainWindow):
     4. Master Key - Full word database with definitions
     """
 
+    # Progress of the "Reindex All" task, emitted from its worker thread
+    reindex_progress = pyqtSignal(int, int, str)
+
     def __init__(self, window_manager=None, parent=None, **kwargs):
         super().__init__(parent)
         self.window_manager = window_manager
@@ -120,12 +127,14 @@ class UnifiedLexiconWindow(QMainWindow):
         self._active_document: Optional[Dict[str, Any]] = None
         self._documents: List[Dict[str, Any]] = []
         self._worker: Optional[ParseAndIndexWorker] = None
+        self._reindex_job: Optional[ConcordanceIndexingJob] = None
 
         # Services
         self.service = HolyKeyService()
         self.indexer = ConcordanceIndexerService()
 
         self._build_ui()
+        self.reindex_progress.connect(self._on_progress)
         self._load_documents()
 
     def _build_ui(self):
@@ -259,6 +268,13 @@ class UnifiedLexiconWindow(QMainWindow):
         self.btn_parse_index.setEnabled(False)
         btn_row.addWidget(self.btn_parse_index)
 
+        self.btn_reindex_all = QPushButton("⟳ Reindex All")
+        self.btn_reindex_all.setToolTip(
+            "Parse and re-index every holy book as one background task; only changed verses are rewritten"
+        )
+        self.btn_reindex_all.clicked.connect(self._on_reindex_all)
+        btn_row.addWidget(self.btn_reindex_all)
+
         btn_row.addStretch()
 
         btn_refresh = QPushButton("↻ Refresh")
@@ -705,10 +721,98 @@ class UnifiedLexiconWindow(QMainWindow):
         self.txt_import_results.setPlainText(f"❌ Error:\n{error_msg}")
         QMessageBox.critical(self, "Error", f"Processing failed:\n{error_msg}")
 
+    def _on_reindex_all(self):
+        """Rebuild the concordance for every listed holy book, or cancel a running rebuild."""
+        if self._reindex_job is not None:
+            self._cancel_reindex()
+            return
+
+        document_ids = [doc['id'] for doc in self._documents]
+        if not document_ids:
+            return
+
+        reply = QMessageBox.question(
+            self, "Reindex All",
+            f"Parse and re-index all {len(document_ids)} holy books?\n\n"
+            "Unchanged verses are skipped; an interrupted run resumes where it stopped.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        self._reindex_job = ConcordanceIndexingJob(self.indexer.db.db_path, reindex=True)
+        self._set_processing(True)
+        self.btn_reindex_all.setText("■ Cancel Reindex")
+        self.txt_import_results.clear()
+
+        get_task_manager().create_task(
+            self._reindex_job.run_documents,
+            kwargs={
+                'document_ids': document_ids,
+                'progress_callback': self.reindex_progress.emit,
+            },
+            task_name=REINDEX_TASK_NAME,
+            on_complete=self._on_reindex_finished,
+            on_error=self._on_reindex_error,
+            on_cancelled=self._on_reindex_cancelled,
+        )
+
+    def _cancel_reindex(self):
+        """Stop the rebuild after the verse range being written."""
+        if self._reindex_job is None:
+            return
+        self.btn_reindex_all.setEnabled(False)
+        self.statusBar().showMessage("Cancelling after the current verse range...")
+        self._reindex_job.cancel()
+        get_task_manager().cancel_task(REINDEX_TASK_NAME)
+
+    def _end_reindex(self):
+        self._reindex_job = None
+        self.btn_reindex_all.setText("⟳ Reindex All")
+        self._set_processing(False)
+        self.btn_parse_index.setEnabled(self._active_document is not None)
+
+    def _on_reindex_finished(self, results):
+        self._end_reindex()
+
+        errors = [error for result in results for error in result.errors]
+        lines = [
+            f"✓ Reindexed {len(results)} documents",
+            "=" * 40,
+            f"  Words: {sum(r.total_words for r in results)}",
+            f"  New keys: {sum(r.new_keys_added for r in results)}",
+            f"  Occurrences: {sum(r.occurrences_added for r in results)}",
+        ]
+        if errors:
+            lines.append(f"\n⚠️ Errors: {len(errors)}")
+            lines.extend(f"  {error}" for error in errors[:20])
+
+        self.txt_import_results.setPlainText("\n".join(lines))
+        self.statusBar().showMessage("Concordance reindexed")
+        self._load_documents()
+        self._search_master_key(self.txt_mk_search.text())
+
+    def _on_reindex_cancelled(self):
+        self._end_reindex()
+        self.txt_import_results.setPlainText(
+            "Reindex cancelled. Completed verse ranges are kept; run it again to resume."
+        )
+        self.statusBar().showMessage("Reindex cancelled")
+        self._load_documents()
+
+    def _on_reindex_error(self, error: Exception):
+        self._end_reindex()
+        logger.error(f"Concordance reindex failed: {error}")
+        self.txt_import_results.setPlainText(f"❌ Error:\n{error}")
+        QMessageBox.critical(self, "Error", f"Reindex failed:\n{error}")
+
     def _set_processing(self, processing: bool):
         self.progress_bar.setVisible(processing)
         self.btn_parse_index.setEnabled(not processing)
         self.tbl_documents.setEnabled(not processing)
+        if self._reindex_job is None:
+            # While a rebuild runs this button is its cancel action
+            self.btn_reindex_all.setEnabled(not processing)
 
     # =========================================================================
     # CANDIDATES (Tab 2)
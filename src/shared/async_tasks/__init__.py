@@ -3,6 +3,7 @@ Async/Background Task Manager for Isopgem.
 
 This module provides background task execution without freezing the UI:
 - QThreadPool-based workers for parallel execution
+- Process-pool backend for CPU-bound work (picklable callables)
 - Progress tracking with signals
 - Task cancellation
 - Error handling integration
@@ -24,10 +25,17 @@ Usage:
         on_progress=update_progress
     )
     task.start()
+
+    # CPU-bound work in worker processes (bypasses the GIL)
+    get_task_manager().create_task(
+        sweep_range, args=(0, 10_000), backend="process",
+        on_partial=show_hit, on_complete=display_results, timeout=60
+    )
 """
 
 from .worker import BackgroundTask, BackgroundWorker
 from .decorators import run_in_background, async_method
+from .process_pool import ProcessPool, ProcessTask, TaskCancelled, TaskReporter
 from .manager import TaskManager, get_task_manager
 
 __all__ = [
@@ -35,6 +43,12 @@ __all__ = [
     "BackgroundTask",
     "BackgroundWorker",
 
+    # Process backend
+    "ProcessPool",
+    "ProcessTask",
+    "TaskCancelled",
+    "TaskReporter",
+
     # Decorators
     "run_in_background",
     "async_method",
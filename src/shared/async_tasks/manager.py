@@ -6,6 +6,8 @@ Provides centralized management of all background tasks:
 - Cancel all tasks
 - Monitor task status
 - Task queue management
+- Choice of backend per task: threads (I/O, light work) or processes
+  (CPU-bound pure Python, which threads serialize on the GIL)
 """
 """
 SHARED JUSTIFICATION:
@@ -14,11 +16,16 @@ SHARED JUSTIFICATION:
 - CRITERION: 2 (Essential for app to function)
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from PyQt6.QtCore import QThreadPool, QObject, pyqtSignal
 import logging
 
-from .worker import BackgroundTask
+from .worker import BackgroundTask, WorkerSignals
+from .process_pool import ProcessPool, ProcessTask
+
+# Backends accepted by TaskManager.create_task
+THREAD_BACKEND = "thread"
+PROCESS_BACKEND = "process"
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +43,12 @@ class TaskManager(QObject):
         task1 = manager.create_task(func1, task_name="Task 1")
         task2 = manager.create_task(func2, task_name="Task 2")
 
+        # CPU-bound work in a worker process, with live partial results
+        task3 = manager.create_task(
+            sweep_quadsets, args=(start, stop), backend="process",
+            on_partial=add_row, timeout=120,
+        )
+
         # Monitor
         print(f"Active tasks: {manager.active_count()}")
 
@@ -49,45 +62,59 @@ class TaskManager(QObject):
     task_failed = pyqtSignal(str, Exception)  # task_name, error
     task_cancelled = pyqtSignal(str)  # task_name
 
-    def __init__(self, max_threads: int = 4):
+    def __init__(self, max_threads: int = 4, max_processes: Optional[int] = None):
         """
         Initialize task manager.
 
         Args:
             max_threads: Maximum number of concurrent threads
+            max_processes: Worker processes for the process backend
+                (defaults to the CPU count; started on first use)
         """
         super().__init__()
 
         # Create dedicated thread pool
         self.thread_pool = QThreadPool()
         self.thread_pool.setMaxThreadCount(max_threads)
+        self.max_processes = max_processes
+        self._process_pool: Optional[ProcessPool] = None
 
         # Track active tasks
-        self.tasks: Dict[str, BackgroundTask] = {}
+        self.tasks: Dict[str, Union[BackgroundTask, ProcessTask]] = {}
         self._task_counter = 0
 
         logger.info(f"TaskManager initialized with {max_threads} max threads")
 
+    @property
+    def process_pool(self) -> ProcessPool:
+        """Worker processes for the process backend (created on first use)."""
+        if self._process_pool is None:
+            self._process_pool = ProcessPool(max_workers=self.max_processes)
+        return self._process_pool
+
     def create_task(
         self,
         func,
         args=(),
         kwargs=None,
         task_name: Optional[str] = None,
+        backend: str = THREAD_BACKEND,
         **options
-    ) -> BackgroundTask:
+    ) -> Union[BackgroundTask, ProcessTask]:
         """
         Create and start a background task.
 
         Args:
-            func: Function to execute
+            func: Function to execute (picklable for the process backend)
             args: Positional arguments
             kwargs: Keyword arguments
             task_name: Human-readable name
-            **options: Additional options (on_complete, on_error, etc.)
+            backend: "thread" (QThreadPool) or "process" (ProcessPool)
+            **options: Additional options (on_complete, on_error, etc.; the
+                process backend also takes on_partial and timeout)
 
         Returns:
-            BackgroundTask instance
+            BackgroundTask or ProcessTask instance
         """
         # Generate unique task name
         if not task_name:
@@ -95,34 +122,52 @@ class TaskManager(QObject):
             task_name = f"Task-{self._task_counter}"
 
         # Create task
-        task = BackgroundTask(
-            func=func,
-            args=args,
-            kwargs=kwargs or {},
-            task_name=task_name,
-            thread_pool=self.thread_pool,
-            **options
-        )
+        if backend == PROCESS_BACKEND:
+            task = ProcessTask(
+                func=func,
+                args=args,
+                kwargs=kwargs or {},
+                task_name=task_name,
+                pool=self.process_pool,
+                **options
+            )
+            signals: WorkerSignals = task.signals
+        elif backend == THREAD_BACKEND:
+            task = BackgroundTask(
+                func=func,
+                args=args,
+                kwargs=kwargs or {},
+                task_name=task_name,
+                thread_pool=self.thread_pool,
+                **options
+            )
+            signals = task.worker.signals
+        else:
+            raise ValueError(f"Unknown task backend: {backend}")
 
         # Connect signals for tracking
-        task.worker.signals.started.connect(
+        signals.started.connect(
             lambda: self._on_task_started(task_name)
         )
-        task.worker.signals.finished.connect(
+        signals.finished.connect(
             lambda result: self._on_task_completed(task_name)
         )
-        task.worker.signals.error.connect(
+        signals.error.connect(
             lambda error: self._on_task_failed(task_name, error)
         )
-        task.worker.signals.cancelled.connect(
+        signals.cancelled.connect(
             lambda: self._on_task_cancelled(task_name)
         )
 
         # Track task
         self.tasks[task_name] = task
 
-        # Start task
-        task.start()
+        # Start task (the process backend rejects unpicklable work here)
+        try:
+            task.start()
+        except Exception:
+            del self.tasks[task_name]
+            raise
 
         return task
 
@@ -171,6 +216,16 @@ class TaskManager(QObject):
             timeout_ms: Timeout in milliseconds
         """
         self.thread_pool.waitForDone(timeout_ms)
+        if self._process_pool is not None:
+            self._process_pool.wait(timeout_ms / 1000)
+
+    def shutdown(self):
+        """Cancel all tasks and stop the worker processes."""
+        self.cancel_all()
+        self.thread_pool.waitForDone(5000)
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
 
     # Internal event handlers
 
@@ -208,8 +263,7 @@ class TaskManager(QObject):
 
     def __del__(self):
         """Cleanup on deletion."""
-        self.cancel_all()
-        self.thread_pool.waitForDone(5000)
+        self.shutdown()
 
 
 # Global task manager instance
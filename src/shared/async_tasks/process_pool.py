@@ -0,0 +1,498 @@
+"""
+Process-pool backend for CPU-bound background tasks.
+
+QThreadPool workers share the GIL, so pure-Python number crunching (ELS
+searches, batch gematria, quadset sweeps) gains nothing from more threads.
+This backend runs picklable callables in worker processes and relays their
+progress, partial results and outcome back as Qt signals.
+"""
+"""
+SHARED JUSTIFICATION:
+- RATIONALE: Core Infrastructure
+- USED BY: TaskManager (process backend)
+- CRITERION: 2 (Essential for app to function)
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+from PyQt6.QtCore import pyqtSignal
+import inspect
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import signal
+import threading
+import time
+import traceback
+
+from shared.errors import AppError, ErrorCode
+from shared.errors.codes import get_user_message
+from .worker import BackgroundTask, WorkerSignals
+
+logger = logging.getLogger(__name__)
+
+# How often the listener checks deadlines and worker health while idle
+_POLL_SECONDS = 0.05
+
+
+class TaskCancelled(Exception):
+    """Raised inside a process task (by TaskReporter.check) to stop cooperatively."""
+
+
+class TaskReporter:
+    """
+    Child-side handle passed to process tasks that declare a ``reporter`` parameter.
+
+    Example:
+        def sweep(numbers, reporter):
+            hits = []
+            for i, n in enumerate(numbers):
+                reporter.check()                 # stop here if cancelled/timed out
+                if is_match(n):
+                    hits.append(n)
+                    reporter.partial(n)          # -> ProcessTask.signals.partial
+                reporter.progress(i + 1, len(numbers))
+            return hits
+    """
+
+    def __init__(self, task_id: int, slot: int, events, cancel_flags):
+        self._task_id = task_id
+        self._slot = slot
+        self._events = events
+        self._cancel_flags = cancel_flags
+
+    def progress(self, current: int, total: int, message: str = "") -> None:
+        """Report progress (current, total, message)."""
+        self._events.put(("progress", self._task_id, (int(current), int(total), str(message))))
+
+    def partial(self, result: Any) -> None:
+        """Send a partial result to the UI before the task finishes."""
+        self._events.put(("partial", self._task_id, pickle.dumps(result, pickle.HIGHEST_PROTOCOL)))
+
+    @property
+    def cancelled(self) -> bool:
+        """True once the task has been cancelled or has run past its timeout."""
+        return self._cancel_flags[self._slot] == self._task_id
+
+    def check(self) -> None:
+        """Raise TaskCancelled if the task should stop."""
+        if self.cancelled:
+            raise TaskCancelled()
+
+
+def _worker_main(slot: int, tasks, events, cancel_flags) -> None:
+    """Worker process loop: run one task at a time until told to stop."""
+    # Ctrl+C in the terminal reaches the whole process group; the parent handles it
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        item = tasks.get()
+        if item is None:
+            return
+        task_id, payload, wants_reporter = item
+        try:
+            func, args, kwargs = pickle.loads(payload)
+            if wants_reporter:
+                kwargs = dict(kwargs, reporter=TaskReporter(task_id, slot, events, cancel_flags))
+            result = func(*args, **kwargs)
+            # Pickle here so an unpicklable result fails the task instead of the queue feeder
+            events.put(("finished", task_id, pickle.dumps(result, pickle.HIGHEST_PROTOCOL)))
+        except TaskCancelled:
+            events.put(("cancelled", task_id, None))
+        except Exception as e:
+            try:
+                error = pickle.dumps(e, pickle.HIGHEST_PROTOCOL)
+                pickle.loads(error)
+            except Exception:
+                error = None
+            events.put(("error", task_id, (error, f"{type(e).__name__}: {e}", traceback.format_exc())))
+
+
+class ProcessTaskSignals(WorkerSignals):
+    """WorkerSignals plus partial results streamed from the worker process."""
+
+    # Emitted for each TaskReporter.partial() call (result)
+    partial = pyqtSignal(object)
+
+
+class ProcessTask:
+    """
+    High-level interface for a task run on a ProcessPool.
+
+    Mirrors BackgroundTask: callbacks are connected to ``signals`` and run on
+    the UI thread. ``func`` and its arguments must be picklable (module-level
+    functions, not lambdas or bound methods of Qt objects). If ``func`` has a
+    ``reporter`` parameter it receives a TaskReporter.
+
+    Example:
+        task = ProcessTask(
+            func=search_els,
+            args=(text, skip),
+            task_name="ELS Search",
+            on_partial=add_hit,
+            on_complete=show_results,
+            timeout=60,
+            pool=pool,
+        )
+        task.start()
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        task_name: str = "Background Task",
+        on_complete: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        on_progress: Optional[Callable[[int, int, str], None]] = None,
+        on_partial: Optional[Callable[[Any], None]] = None,
+        on_cancelled: Optional[Callable[[], None]] = None,
+        timeout: Optional[float] = None,
+        pool: Optional["ProcessPool"] = None
+    ):
+        """
+        Initialize process task.
+
+        Args:
+            func: Picklable function to execute in a worker process
+            args: Positional arguments for func
+            kwargs: Keyword arguments for func
+            task_name: Human-readable name
+            on_complete: Callback when task finishes (receives result)
+            on_error: Callback when task fails or times out (receives exception)
+            on_progress: Callback for progress updates (current, total, message)
+            on_partial: Callback for partial results
+            on_cancelled: Callback when task is cancelled
+            timeout: Seconds the task may run before it is stopped
+            pool: Process pool to run on (required to start)
+        """
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.task_name = task_name
+        self.timeout = timeout
+        self.pool = pool
+        self.signals = ProcessTaskSignals()
+        self._cancel_requested = False
+
+        if on_complete:
+            self.signals.finished.connect(on_complete)
+
+        if on_error:
+            self.signals.error.connect(on_error)
+        else:
+            self.signals.error.connect(self._default_error_handler)
+
+        if on_progress:
+            self.signals.progress.connect(on_progress)
+
+        if on_partial:
+            self.signals.partial.connect(on_partial)
+
+        if on_cancelled:
+            self.signals.cancelled.connect(on_cancelled)
+
+    @property
+    def wants_reporter(self) -> bool:
+        try:
+            return "reporter" in inspect.signature(self.func).parameters
+        except (ValueError, TypeError):
+            return False
+
+    def start(self):
+        """Queue the task on its process pool."""
+        if self.pool is None:
+            raise ValueError(f"ProcessTask '{self.task_name}' has no process pool")
+        logger.info(f"Starting process task: {self.task_name}")
+        self.pool.submit(self)
+
+    def cancel(self):
+        """Request cancellation of the task."""
+        self._cancel_requested = True
+        if self.pool is not None:
+            self.pool.cancel(self)
+
+    def is_cancelled(self) -> bool:
+        """Check if task has been cancelled."""
+        return self._cancel_requested
+
+    _default_error_handler = BackgroundTask._default_error_handler
+
+
+@dataclass
+class _Job:
+    """Pool bookkeeping for one submitted task."""
+    id: int
+    task: ProcessTask
+    payload: bytes
+    slot: Optional[int] = None
+    deadline: Optional[float] = None
+    stop_reason: Optional[str] = None  # "cancel" or "timeout"
+    kill_at: Optional[float] = None
+
+
+@dataclass
+class _Worker:
+    process: Any
+    tasks: Any
+    job_id: Optional[int] = None
+
+
+class ProcessPool:
+    """
+    Fixed-size pool of worker processes for ProcessTasks.
+
+    Workers start on demand (spawned, so Qt state is never forked) and are
+    reused. A listener thread relays worker events to each task's signals,
+    enforces timeouts and notices crashed workers.
+
+    Cancellation and timeouts are cooperative first: the task's reporter
+    reports ``cancelled`` and ``check()`` raises. A task that ignores it for
+    ``kill_grace`` seconds has its worker terminated and replaced.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, start_method: str = "spawn",
+                 kill_grace: Optional[float] = 2.0):
+        """
+        Initialize the pool (no processes start until the first task).
+
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count)
+            start_method: multiprocessing start method
+            kill_grace: Seconds a stopped task may keep running before its
+                worker is terminated (None: never terminate)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.kill_grace = kill_grace
+        self._ctx = multiprocessing.get_context(start_method)
+        self._events = self._ctx.Queue()
+        self._cancel_flags = self._ctx.Array("q", self.max_workers, lock=False)
+        self._workers: List[Optional[_Worker]] = [None] * self.max_workers
+        self._pending: Deque[_Job] = deque()
+        self._jobs: Dict[int, _Job] = {}
+        self._by_task: Dict[int, int] = {}  # id(ProcessTask) -> job id
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._idle = threading.Condition(self._lock)
+        self._listener: Optional[threading.Thread] = None
+        self._closed = False
+
+        logger.info(f"ProcessPool initialized with {self.max_workers} max workers")
+
+    # Public API
+
+    def submit(self, task: ProcessTask) -> None:
+        """Queue a task. Raises if the pool is shut down or the task cannot be pickled."""
+        payload = pickle.dumps((task.func, task.args, task.kwargs), pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ProcessPool has been shut down")
+            job = _Job(next(self._ids), task, payload)
+            self._jobs[job.id] = job
+            self._by_task[id(task)] = job.id
+            self._pending.append(job)
+            self._ensure_listener()
+            self._dispatch()
+
+    def cancel(self, task: ProcessTask) -> bool:
+        """Cancel a queued or running task. Returns False if it is not in the pool."""
+        with self._lock:
+            job = self._jobs.get(self._by_task.get(id(task), 0))
+            if job is None:
+                return False
+            if job.slot is None:
+                self._pending.remove(job)
+                self._finish(job, "cancelled")
+            else:
+                self._stop(job, "cancel")
+            return True
+
+    def cancel_all(self) -> None:
+        """Cancel every queued and running task."""
+        with self._lock:
+            for job in list(self._jobs.values()):
+                self.cancel(job.task)
+
+    def active_count(self) -> int:
+        """Number of queued and running tasks."""
+        with self._lock:
+            return len(self._jobs)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until every task has finished. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._jobs, timeout)
+
+    def warm_up(self) -> None:
+        """Start every worker process now rather than on first use."""
+        with self._lock:
+            for slot in range(self.max_workers):
+                self._ensure_worker(slot)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Cancel outstanding tasks and stop the worker processes."""
+        with self._lock:
+            if self._closed:
+                return
+            self.cancel_all()
+            self._closed = True
+            workers = [w for w in self._workers if w is not None]
+            self._workers = [None] * self.max_workers
+            for worker in workers:
+                worker.tasks.put(None)
+        for worker in workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join(1.0)
+        self._events.put(("stop", 0, None))
+        if self._listener is not None:
+            self._listener.join(timeout)
+        self._events.close()
+        self._events.cancel_join_thread()
+        with self._lock:
+            for job in list(self._jobs.values()):
+                self._finish(job, "cancelled")
+
+    # Dispatch (lock held)
+
+    def _ensure_listener(self) -> None:
+        if self._listener is None:
+            self._listener = threading.Thread(target=self._listen, name="ProcessPool-listener", daemon=True)
+            self._listener.start()
+
+    def _ensure_worker(self, slot: int) -> _Worker:
+        worker = self._workers[slot]
+        if worker is None or not worker.process.is_alive():
+            tasks = self._ctx.SimpleQueue()
+            process = self._ctx.Process(
+                target=_worker_main, args=(slot, tasks, self._events, self._cancel_flags),
+                name=f"ProcessPool-worker-{slot}", daemon=True,
+            )
+            process.start()
+            worker = self._workers[slot] = _Worker(process, tasks)
+        return worker
+
+    def _dispatch(self) -> None:
+        # Prefer idle live workers, then start new ones
+        free = [s for s, w in enumerate(self._workers) if w is not None and w.job_id is None]
+        free += [s for s, w in enumerate(self._workers) if w is None]
+        while self._pending and free:
+            slot = free.pop(0)
+            job = self._pending.popleft()
+            worker = self._ensure_worker(slot)
+            worker.job_id = job.id
+            job.slot = slot
+            if job.task.timeout is not None:
+                job.deadline = time.monotonic() + job.task.timeout
+            self._cancel_flags[slot] = 0
+            worker.tasks.put((job.id, job.payload, job.task.wants_reporter))
+            job.task.signals.started.emit()
+
+    def _stop(self, job: _Job, reason: str) -> None:
+        if job.stop_reason is None:
+            job.stop_reason = reason
+            self._cancel_flags[job.slot] = job.id
+            if self.kill_grace is not None:
+                job.kill_at = time.monotonic() + self.kill_grace
+
+    def _finish(self, job: _Job, outcome: str, payload: Any = None) -> None:
+        """Release a job and emit its final signal."""
+        self._jobs.pop(job.id, None)
+        self._by_task.pop(id(job.task), None)
+        if job.slot is not None and self._workers[job.slot] is not None:
+            self._workers[job.slot].job_id = None
+        signals = job.task.signals
+        name = job.task.task_name
+
+        if job.stop_reason == "timeout":
+            logger.warning(f"Process task timed out after {job.task.timeout}s: {name}")
+            signals.error.emit(AppError(
+                code=ErrorCode.ERR_SYS_TIMEOUT,
+                message=f"Background task timed out after {job.task.timeout}s",
+                user_message=get_user_message(ErrorCode.ERR_SYS_TIMEOUT),
+                context={"task": name},
+            ))
+        elif job.stop_reason == "cancel" or outcome == "cancelled":
+            logger.debug(f"Process task cancelled: {name}")
+            signals.cancelled.emit()
+        elif outcome == "finished":
+            logger.debug(f"Process task completed: {name}")
+            signals.finished.emit(payload)
+        else:
+            cause, message, details = payload
+            logger.error(f"Process task failed: {name} - {message}")
+            signals.error.emit(AppError(
+                code=ErrorCode.ERR_SYS_UNKNOWN,
+                message=f"Background task failed: {message}",
+                details=details,
+                cause=cause,
+                context={"task": name},
+            ))
+        self._idle.notify_all()
+
+    # Listener thread
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                kind, job_id, payload = self._events.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                kind = None
+            except (EOFError, OSError):
+                return
+            if kind == "stop":
+                return
+            with self._lock:
+                if kind is not None:
+                    self._handle_event(kind, job_id, payload)
+                self._check_workers()
+                if not self._closed:
+                    self._dispatch()
+
+    def _handle_event(self, kind: str, job_id: int, payload: Any) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return  # Late event from a task that was already settled
+        try:
+            if kind == "progress":
+                if job.stop_reason is None:
+                    job.task.signals.progress.emit(*payload)
+            elif kind == "partial":
+                if job.stop_reason is None:
+                    job.task.signals.partial.emit(pickle.loads(payload))
+            elif kind == "finished":
+                self._finish(job, "finished", pickle.loads(payload))
+            elif kind == "cancelled":
+                self._finish(job, "cancelled")
+            elif kind == "error":
+                error, message, details = payload
+                self._finish(job, "error", (pickle.loads(error) if error else None, message, details))
+        except Exception as e:
+            # e.g. a result class that cannot be unpickled in this process
+            logger.error(f"Could not deliver process task event '{kind}': {e}", exc_info=True)
+            if job.id in self._jobs and kind != "progress":
+                self._finish(job, "error", (e, f"{type(e).__name__}: {e}", traceback.format_exc()))
+
+    def _check_workers(self) -> None:
+        now = time.monotonic()
+        for slot, worker in enumerate(self._workers):
+            if worker is None or worker.job_id is None:
+                continue
+            job = self._jobs[worker.job_id]
+            if job.deadline is not None and now >= job.deadline:
+                self._stop(job, "timeout")
+            if job.kill_at is not None and now >= job.kill_at:
+                logger.warning(f"Terminating worker {slot}: '{job.task.task_name}' ignored its stop request")
+                worker.process.terminate()
+                worker.process.join(1.0)
+                self._workers[slot] = None
+                self._finish(job, "cancelled")
+            elif not worker.process.is_alive():
+                code = worker.process.exitcode
+                self._workers[slot] = None
+                self._finish(job, "error", (None, f"worker process exited with code {code}", None))
@@ -137,6 +137,9 @@ class MemoryConfig:
     calculator_cache_size: int = 256
     correspondence_cache_size: int = 64
 
+    # Cymatics per-mode basis fields (a 512x512 float32 field is 1 MB)
+    cymatics_basis_cache_mb: int = 128
+
     # Lazy loading behavior
     lazy_load_lexicons: bool = True
     preload_hebrew_greek: bool = False  # Set True for faster first lookup
@@ -147,6 +150,7 @@ class MemoryConfig:
         return cls(
             max_lexicon_cache_mb=int(os.getenv("ISOPGEM_MAX_CACHE_MB", "100")),
             enable_auto_cache_clear=os.getenv("ISOPGEM_AUTO_CACHE_CLEAR", "1") == "1",
+            cymatics_basis_cache_mb=int(os.getenv("ISOPGEM_CYMATICS_CACHE_MB", "128")),
         )
 
 
@@ -172,6 +176,7 @@ class FeatureConfig:
     # Performance features
     enable_performance_logging: bool = False
     enable_memory_profiling: bool = False
+    preload_pillar_hubs: bool = False  # Build unopened pillar tabs while the app is idle
 
     # UI features
     enable_animations: bool = True
@@ -188,6 +193,7 @@ class FeatureConfig:
             enable_etymology_web_fallback=os.getenv("ISOPGEM_ETY_WEB", "1") == "1",
             enable_performance_logging=os.getenv("ISOPGEM_PERF_LOG", "0") == "1",
             enable_memory_profiling=os.getenv("ISOPGEM_MEM_PROFILE", "0") == "1",
+            preload_pillar_hubs=os.getenv("ISOPGEM_PRELOAD_HUBS", "0") == "1",
         )
 
 
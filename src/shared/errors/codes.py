@@ -34,6 +34,7 @@ class ErrorCode:
     ERR_SYS_PERMISSION_DENIED = "ERR_SYS_PERMISSION_DENIED"
     ERR_SYS_DISK_FULL = "ERR_SYS_DISK_FULL"
     ERR_SYS_CONFIG_INVALID = "ERR_SYS_CONFIG_INVALID"
+    ERR_SYS_TIMEOUT = "ERR_SYS_TIMEOUT"
 
     # ========================================================================
     # File / Data Errors (ERR_DATA_*)
@@ -136,6 +137,7 @@ ERROR_MESSAGES: dict[str, str] = {
     ErrorCode.ERR_SYS_PERMISSION_DENIED: "Permission denied to access this resource",
     ErrorCode.ERR_SYS_DISK_FULL: "Not enough disk space",
     ErrorCode.ERR_SYS_CONFIG_INVALID: "Invalid configuration",
+    ErrorCode.ERR_SYS_TIMEOUT: "The operation took too long and was stopped",
 
     # Data errors
     ErrorCode.ERR_DATA_FILE_NOT_FOUND: "File not found",
@@ -11,7 +11,7 @@ Refactoring plan: See wiki/04_prophecies/shared_folder_audit_2026-01-13.md
 """
 
 """Document database model."""
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, LargeBinary
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, LargeBinary, Boolean
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from shared.database import Base
@@ -26,7 +26,7 @@ class DocumentImage(Base):
     id = Column(Integer, primary_key=True, index=True)
     document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), index=True)
     hash = Column(String(64), index=True)  # SHA256 for deduplication
-    data = Column(LargeBinary)  # Compressed image binary
+    data = Column(LargeBinary, nullable=True)  # Legacy inline binary; NULL when held in the image store
     mime_type = Column(String(50))  # image/png, image/jpeg, etc.
     original_filename = Column(String, nullable=True)  # Original filename if available
     width = Column(Integer, nullable=True)  # Image dimensions for layout
@@ -39,6 +39,28 @@ class DocumentImage(Base):
     def __repr__(self):
         return f"<DocumentImage(id={self.id}, doc={self.document_id}, mime={self.mime_type})>"
 
+class ImageBlob(Base):
+    """
+    Content-addressed image bytes shared by every document that embeds them.
+
+    The bytes live in the sharded on-disk image store (see
+    ``ImageBlobStore``); this row only tracks how they are stored and how
+    many ``DocumentImage`` rows still reference them.
+    """
+
+    __tablename__ = "image_blobs"
+    __table_args__ = {'extend_existing': True}
+
+    hash = Column(String(64), primary_key=True)  # SHA256 of the original bytes
+    size = Column(Integer)  # Original size in bytes
+    stored_size = Column(Integer)  # Size on disk
+    compressed = Column(Boolean, default=False)  # zlib applied before storing
+    ref_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<ImageBlob(hash={self.hash[:12]}, refs={self.ref_count})>"
+
 class DocumentLink(Base):
     """Association table for linking documents (Zettelkasten/Wiki-links)."""
     __tablename__ = "document_links"
@@ -0,0 +1,126 @@
+"""
+Content-addressed, sharded on-disk store for document image bytes.
+
+SHARED JUSTIFICATION:
+- RATIONALE: Core Infrastructure (storage backend of ImageRepository)
+- USED BY: Document_manager
+- CRITERION: 2 (Essential for app to function)
+"""
+import logging
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Formats that are already entropy-coded; zlib only burns CPU on them.
+COMPRESSED_MIME_SUBTYPES = {"png", "jpg", "jpeg", "gif", "webp", "avif", "heic"}
+
+# Magic-byte prefixes for the same formats, in case the MIME type lies.
+_COMPRESSED_SIGNATURES = (
+    b"\x89PNG\r\n\x1a\n",
+    b"\xff\xd8\xff",
+    b"GIF87a",
+    b"GIF89a",
+)
+
+
+def is_precompressed(data: bytes, mime_type: Optional[str]) -> bool:
+    """Return True when the image format is already compressed."""
+    subtype = (mime_type or "").split("/")[-1].lower()
+    if subtype in COMPRESSED_MIME_SUBTYPES:
+        return True
+    if data.startswith(_COMPRESSED_SIGNATURES):
+        return True
+    # RIFF....WEBP
+    return data[:4] == b"RIFF" and data[8:12] == b"WEBP"
+
+
+def default_store_dir() -> Path:
+    """Image store directory, kept next to the main database."""
+    from shared import database
+    return Path(database.DB_PATH).parent / "image_store"
+
+
+class ImageBlobStore:
+    """
+    Sharded directory of image blobs named by their SHA-256 hash.
+
+    Layout: ``<root>/ab/cd/abcdef...`` so no directory grows past a few
+    hundred entries. Writes go through a temp file and ``os.replace`` so a
+    crash never leaves a truncated blob under its final name.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        """
+        Args:
+            root: Store directory. Defaults to ``image_store`` beside the main DB.
+        """
+        self.root = Path(root) if root is not None else default_store_dir()
+
+    def path_for(self, hash: str) -> Path:
+        return self.root / hash[:2] / hash[2:4] / hash
+
+    def exists(self, hash: str) -> bool:
+        return self.path_for(hash).exists()
+
+    def put(
+        self,
+        hash: str,
+        data: bytes,
+        mime_type: Optional[str] = None,
+        compress: bool = True,
+    ) -> Tuple[int, bool]:
+        """
+        Store raw image bytes under their hash.
+
+        Args:
+            hash: SHA-256 hex digest of ``data``
+            data: Original image bytes
+            mime_type: MIME type, used to skip compressing PNG/JPEG/etc.
+            compress: Allow zlib for formats that are not already compressed
+
+        Returns:
+            (stored_size, compressed)
+        """
+        payload = data
+        compressed = False
+        if compress and not is_precompressed(data, mime_type):
+            candidate = zlib.compress(data, level=6)
+            if len(candidate) < len(data):
+                payload = candidate
+                compressed = True
+
+        target = self.path_for(hash)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(payload)
+            os.replace(tmp_path, target)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return len(payload), compressed
+
+    def get(self, hash: str, compressed: bool) -> Optional[bytes]:
+        """Read and, if needed, decompress a blob. Returns None if missing."""
+        try:
+            payload = self.path_for(hash).read_bytes()
+        except FileNotFoundError:
+            logger.warning("ImageBlobStore: blob %s missing from %s", hash, self.root)
+            return None
+        return zlib.decompress(payload) if compressed else payload
+
+    def delete(self, hash: str) -> bool:
+        """Remove a blob file. Returns True if a file was removed."""
+        try:
+            self.path_for(hash).unlink()
+            return True
+        except FileNotFoundError:
+            return False
@@ -12,25 +12,55 @@ Refactoring plan: See wiki/04_prophecies/shared_folder_audit_2026-01-13.md
 
 """Repository for DocumentImage model."""
 import hashlib
+import logging
 import zlib
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from shared.models.document_manager.document import DocumentImage
+from shared.models.document_manager.document import DocumentImage, ImageBlob
+from shared.repositories.document_manager.image_blob_store import ImageBlobStore
+from shared.utils.byte_budget_lru import ByteBudgetLRU
+
+logger = logging.getLogger(__name__)
+
+# Decoded image bytes keyed by content hash, shared by every repository
+# instance so docimg:// lookups from any editor hit the same cache.
+DECODED_CACHE_BYTES = 64 * 1024 * 1024
+
+_decoded_cache = ByteBudgetLRU(DECODED_CACHE_BYTES)
+
+
+def clear_image_caches() -> None:
+    """Drop all cached decoded images."""
+    _decoded_cache.clear()
 
 
 class ImageRepository:
-    """Repository for managing document images."""
+    """
+    Repository for managing document images.
+
+    Each ``DocumentImage`` row is a per-document reference (its ID is what
+    ``docimg://`` URLs point at). The bytes themselves are content-addressed
+    in an ``ImageBlobStore`` shared across documents, with an ``ImageBlob``
+    row counting the references. Rows created before the store existed keep
+    their bytes inline in ``DocumentImage.data`` and are still readable.
+    """
 
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, store: Optional[ImageBlobStore] = None):
         """
           init   logic.
         
         Args:
             db: Description of db.
+            store: Blob store; defaults to the store beside the main database.
         
         """
         self.db = db
+        self.store = store or ImageBlobStore()
+        # Hashes whose ImageBlob rows were deleted but whose files stay until
+        # the deletion is committed (see purge_released_blobs)
+        self._released: Set[str] = set()
 
     def get(self, image_id: int) -> Optional[DocumentImage]:
         """Get an image by ID."""
@@ -49,6 +79,10 @@ class ImageRepository:
             DocumentImage.hash == hash
         ).first()
 
+    def get_blob(self, hash: str) -> Optional[ImageBlob]:
+        """Get the shared blob record for a content hash."""
+        return self.db.get(ImageBlob, hash)
+
     def create(
         self,
         document_id: int,
@@ -69,7 +103,8 @@ class ImageRepository:
             original_filename: Optional original filename
             width: Optional image width
             height: Optional image height
-            compress: Whether to compress the data (default True)
+            compress: Whether the store may zlib the bytes (default True).
+                Already-compressed formats (PNG, JPEG, ...) are never recompressed.
             
         Returns:
             The created DocumentImage
@@ -82,14 +117,12 @@ class ImageRepository:
         if existing:
             return existing
         
-        # Compress if requested
-        if compress:
-            data = zlib.compress(data, level=6)
+        self._acquire_blob(hash, data, mime_type, compress)
         
         image = DocumentImage(
             document_id=document_id,
             hash=hash,
-            data=data,
+            data=None,
             mime_type=mime_type,
             original_filename=original_filename,
             width=width,
@@ -99,25 +132,162 @@ class ImageRepository:
         self.db.flush()  # Get the ID without committing
         return image
 
+    def _acquire_blob(self, hash: str, data: bytes, mime_type: str, compress: bool = True) -> ImageBlob:
+        """Add a reference to the blob for ``hash``, storing the bytes if new."""
+        blob = self.get_blob(hash)
+        if blob is not None and self.store.exists(hash):
+            blob.ref_count = (blob.ref_count or 0) + 1
+            return blob
+
+        stored_size, compressed = self.store.put(hash, data, mime_type, compress=compress)
+        if blob is None:
+            blob = ImageBlob(hash=hash, size=len(data), ref_count=0)
+            self.db.add(blob)
+        blob.stored_size = stored_size
+        blob.compressed = compressed
+        blob.ref_count = (blob.ref_count or 0) + 1
+        return blob
+
     def get_decompressed_data(self, image: DocumentImage) -> bytes:
         """Get decompressed image data."""
-        try:
-            return zlib.decompress(image.data)
-        except zlib.error:
-            # Data wasn't compressed
-            return image.data
+        if image.data is not None:
+            # Legacy row with inline bytes
+            try:
+                return zlib.decompress(image.data)
+            except zlib.error:
+                # Data wasn't compressed
+                return image.data
+
+        cached = _decoded_cache.get(image.hash)
+        if cached is not None:
+            return cached
+
+        blob = self.get_blob(image.hash)
+        data = self.store.get(image.hash, bool(blob.compressed)) if blob else None
+        if data is None:
+            return b""
+        _decoded_cache.put(image.hash, data)
+        return data
+
+    def release_blobs(self, hashes: Iterable[str]) -> int:
+        """
+        Recount references for ``hashes`` and drop blobs nobody uses.
+
+        Call after deleting ``DocumentImage`` rows (including via cascade).
+        Only the ``ImageBlob`` rows are deleted here; the files stay on disk
+        until ``purge_released_blobs`` runs after the caller commits, so a
+        rollback never leaves a row pointing at a missing file.
+
+        Returns:
+            Number of blob rows deleted.
+        """
+        hashes = list({h for h in hashes if h})
+        if not hashes:
+            return 0
+        self.db.flush()
+
+        removed = 0
+        # SQLite caps bound parameters per statement, so work in chunks
+        chunk_size = 500
+        for i in range(0, len(hashes), chunk_size):
+            chunk = hashes[i:i + chunk_size]
+            counts = dict(
+                self.db.query(DocumentImage.hash, func.count(DocumentImage.id))
+                .filter(DocumentImage.hash.in_(chunk), DocumentImage.data.is_(None))
+                .group_by(DocumentImage.hash)
+                .all()
+            )
+            for blob in self.db.query(ImageBlob).filter(ImageBlob.hash.in_(chunk)).all():
+                blob.ref_count = counts.get(blob.hash, 0)
+                if blob.ref_count == 0:
+                    self.db.delete(blob)
+                    self._released.add(blob.hash)
+                    removed += 1
+        return removed
+
+    def purge_released_blobs(self) -> int:
+        """
+        Delete the files of blobs released by ``release_blobs``.
+
+        Call after committing. A hash whose ``ImageBlob`` row still exists
+        (the transaction rolled back, or another session stored the same
+        image again since) keeps its file.
+
+        Returns:
+            Number of files removed from the store.
+        """
+        hashes, self._released = list(self._released), set()
+        if not hashes:
+            return 0
+
+        live: Set[str] = set()
+        chunk_size = 500
+        for i in range(0, len(hashes), chunk_size):
+            chunk = hashes[i:i + chunk_size]
+            live.update(h for (h,) in self.db.query(ImageBlob.hash).filter(ImageBlob.hash.in_(chunk)).all())
+
+        removed = 0
+        for hash in hashes:
+            if hash in live:
+                continue
+            self.store.delete(hash)
+            _decoded_cache.discard(hash)
+            removed += 1
+        return removed
+
+    def sweep_blobs(self) -> int:
+        """Recount every blob's references and remove unreferenced blobs."""
+        return self.release_blobs(h for (h,) in self.db.query(ImageBlob.hash).all())
+
+    def hashes_for_document(self, document_id: int) -> Set[str]:
+        """Content hashes referenced by a document's images."""
+        return {
+            h for (h,) in self.db.query(DocumentImage.hash)
+            .filter(DocumentImage.document_id == document_id)
+            .all()
+        }
+
+    def migrate_inline_images(self, batch_size: int = 200) -> int:
+        """
+        Move legacy inline image bytes into the shared blob store.
+
+        Returns:
+            Number of DocumentImage rows migrated.
+        """
+        migrated = 0
+        while True:
+            rows = (
+                self.db.query(DocumentImage)
+                .filter(DocumentImage.data.isnot(None))
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            for image in rows:
+                data = self.get_decompressed_data(image)
+                image.hash = hashlib.sha256(data).hexdigest()
+                self._acquire_blob(image.hash, data, image.mime_type or "")
+                image.data = None
+                migrated += 1
+            self.db.commit()
+        return migrated
 
     def delete_by_document(self, document_id: int) -> int:
-        """Delete all images for a document."""
+        """Delete all images for a document (purge blobs after committing)."""
+        hashes = self.hashes_for_document(document_id)
         count = self.db.query(DocumentImage).filter(
             DocumentImage.document_id == document_id
         ).delete()
+        self.release_blobs(hashes)
         return count
 
     def delete(self, image_id: int) -> bool:
-        """Delete a specific image."""
+        """Delete a specific image (purge blobs after committing)."""
         image = self.get(image_id)
         if image:
+            hash = image.hash
             self.db.delete(image)
+            self.release_blobs([hash])
             return True
-        return False
\ No newline at end of file
+        return False
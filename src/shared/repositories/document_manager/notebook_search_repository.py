@@ -0,0 +1,203 @@
+"""
+SQLite FTS5 index over notebook pages (documents that belong to a section).
+
+SHARED JUSTIFICATION:
+- RATIONALE: Core Infrastructure (search backend of NotebookService)
+- USED BY: Document_manager
+- CRITERION: 2 (Essential for app to function)
+"""
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "notebook_fts"
+
+# The index uses ``documents`` as external content, so page text is never
+# duplicated. Only rows with a section are indexed; the triggers keep the
+# index in step with inserts, edits, moves between sections and deletes.
+_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, content,
+        content='documents', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON documents
+    WHEN new.section_id IS NOT NULL BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON documents
+    WHEN old.section_id IS NOT NULL BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    # One trigger with ordered statements: the old tokens must be removed
+    # before the new ones go in, and SQLite does not order separate triggers.
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, content, section_id ON documents
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        SELECT 'delete', old.id, old.title, old.content WHERE old.section_id IS NOT NULL;
+        INSERT INTO {FTS_TABLE}(rowid, title, content)
+        SELECT new.id, new.title, new.content WHERE new.section_id IS NOT NULL;
+    END
+    """,
+]
+
+# Title matches weigh more than body matches in bm25 ranking.
+TITLE_WEIGHT = 5.0
+CONTENT_WEIGHT = 1.0
+SNIPPET_TOKENS = 16
+
+_ready_lock = threading.Lock()
+_ready_databases: set = set()
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class NotebookSearchHit:
+    """A ranked notebook page match."""
+    page_id: int
+    title: str
+    snippet: str
+    notebook_name: str
+    section_name: str
+    rank: float
+
+
+def build_match_query(query: str) -> str:
+    """
+    Turn free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted (so FTS5 operators in user input are inert) and the
+    last word is a prefix match, which makes search-as-you-type find
+    ``"gemat"`` -> ``gematria`` before the word is finished.
+    """
+    tokens = _TOKEN_PATTERN.findall(query)
+    if not tokens:
+        return ""
+    parts = [f'"{token}"' for token in tokens]
+    parts[-1] += "*"
+    return " ".join(parts)
+
+
+class NotebookSearchRepository:
+    """Ranked full-text search over notebook pages."""
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: Active SQLAlchemy session on the main database.
+        """
+        self.db = db
+
+    def _database_key(self) -> str:
+        return str(self.db.get_bind().url)
+
+    def ensure_index(self) -> bool:
+        """
+        Create the FTS table and triggers on first use and populate them.
+
+        Returns:
+            False if this SQLite build has no FTS5 support.
+        """
+        key = self._database_key()
+        if key in _ready_databases:
+            return True
+
+        with _ready_lock:
+            if key in _ready_databases:
+                return True
+            try:
+                existed = self.db.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type='table' AND name=:name"),
+                    {"name": FTS_TABLE},
+                ).first() is not None
+                for statement in _SCHEMA:
+                    self.db.execute(text(statement))
+                if not existed:
+                    self._populate()
+                self.db.commit()
+            except OperationalError as e:
+                self.db.rollback()
+                logger.warning("Notebook FTS5 index unavailable, falling back to scans: %s", e)
+                return False
+            _ready_databases.add(key)
+        return True
+
+    def _populate(self) -> None:
+        self.db.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')"))
+        self.db.execute(text(
+            f"INSERT INTO {FTS_TABLE}(rowid, title, content) "
+            "SELECT id, title, content FROM documents WHERE section_id IS NOT NULL"
+        ))
+
+    def rebuild(self) -> None:
+        """Re-index every notebook page from scratch."""
+        if not self.ensure_index():
+            return
+        self._populate()
+        self.db.commit()
+
+    def search(self, query: str, limit: int = 50) -> Optional[List[NotebookSearchHit]]:
+        """
+        Search notebook pages, best matches first.
+
+        Args:
+            query: Free text as typed by the user
+            limit: Maximum number of hits
+
+        Returns:
+            Ranked hits, or None if the FTS index is unavailable.
+        """
+        if not self.ensure_index():
+            return None
+
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        rows = self.db.execute(
+            text(
+                f"""
+                SELECT d.id, d.title,
+                       snippet({FTS_TABLE}, 1, '', '', '...', {SNIPPET_TOKENS}) AS snippet,
+                       n.title, s.title,
+                       bm25({FTS_TABLE}, {TITLE_WEIGHT}, {CONTENT_WEIGHT}) AS rank
+                FROM {FTS_TABLE}
+                JOIN documents d ON d.id = {FTS_TABLE}.rowid
+                JOIN sections s ON s.id = d.section_id
+                JOIN notebooks n ON n.id = s.notebook_id
+                WHERE {FTS_TABLE} MATCH :match
+                ORDER BY rank
+                LIMIT :limit
+                """
+            ),
+            {"match": match, "limit": limit},
+        ).all()
+
+        return [
+            NotebookSearchHit(
+                page_id=row[0],
+                title=row[1] or "",
+                snippet=row[2] or "",
+                notebook_name=row[3] or "",
+                section_name=row[4] or "",
+                rank=row[5],
+            )
+            for row in rows
+        ]
@@ -13,9 +13,12 @@ Refactoring plan: See wiki/04_prophecies/shared_folder_audit_2026-01-13.md
 
 """Whoosh-based repository for searching documents."""
 import logging
+import math
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Any, Iterable, List, Optional, Dict, Tuple
 from datetime import datetime
 
 from whoosh import index
@@ -28,6 +31,49 @@ from shared.models.document_manager.document import Document
 
 logger = logging.getLogger(__name__)
 
+# Fields whose postings contribute to a result's hit count.
+HIT_COUNT_FIELDS = ("content", "title")
+
+# Recent query -> result page entries, shared by every repository instance
+# (DocumentService builds a fresh repository per session).
+PAGE_CACHE_SIZE = 64
+HIGHLIGHT_CACHE_SIZE = 512
+
+_cache_lock = threading.Lock()
+_page_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_highlight_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: Tuple[Any, ...]) -> Optional[Any]:
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache: OrderedDict, key: Tuple[Any, ...], value: Any, max_size: int) -> None:
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def _copy_page(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached page so callers cannot mutate the shared entry."""
+    page = dict(entry)
+    page['results'] = [dict(result) for result in entry['results']]
+    return page
+
+
+def clear_search_caches() -> None:
+    """Drop all cached result pages and highlight snippets."""
+    with _cache_lock:
+        _page_cache.clear()
+        _highlight_cache.clear()
+
+
 class DocumentSearchRepository:
     """Repository for managing document search index using Whoosh."""
     
@@ -147,6 +193,65 @@ class DocumentSearchRepository:
             writer.cancel()
             raise e
 
+    def _parse(self, query_str: str):
+        parser = MultifieldParser(["title", "content", "author"], schema=self.schema)
+        return parser.parse(query_str)
+
+    def _cache_key(self, *parts: Any) -> Tuple[Any, ...]:
+        # The index generation changes on every commit, so stale entries from
+        # before a write can never be served (even if another instance wrote).
+        return (str(self.index_dir), self.ix.latest_generation()) + parts
+
+    @staticmethod
+    def _hit_counts(searcher, query, docnums: Iterable[int]) -> Dict[int, int]:
+        """
+        Count term occurrences per document straight from the postings.
+
+        The TEXT fields record positions, so each posting already carries the
+        in-document frequency; no stored text has to be scanned.
+        """
+        counts = dict.fromkeys(docnums, 0)
+        if not counts:
+            return counts
+
+        reader = searcher.reader()
+        for fieldname in HIT_COUNT_FIELDS:
+            # Query one field at a time: Whoosh's existing_terms() reuses its
+            # ``fieldname`` argument as a loop variable, so an unfiltered call
+            # drops every field after the first.
+            try:
+                terms = query.existing_terms(reader, expand=True, fieldname=fieldname)
+            except Exception:
+                continue
+
+            for _, text in terms:
+                try:
+                    matcher = reader.postings(fieldname, text)
+                except Exception:
+                    continue
+                while matcher.is_active():
+                    docnum = matcher.id()
+                    if docnum in counts:
+                        counts[docnum] += int(matcher.value_as("frequency"))
+                    matcher.next()
+        return counts
+
+    @staticmethod
+    def _hit_to_dict(hit, hit_count: int) -> Dict[str, Any]:
+        return {
+            'id': int(hit['id']),
+            'title': hit['title'],
+            'file_type': hit['file_type'],
+            'collection': hit.get('collection') or '',
+            'created_at': hit['created_at'],
+            'hit_count': hit_count,
+        }
+
+    @staticmethod
+    def _configure_highlighter(results) -> None:
+        results.fragmenter.maxchars = 300
+        results.fragmenter.surround = 50
+
     def search(self, query_str: str, limit: Optional[int] = None) -> List[Dict]:
         """
         Search for documents.
@@ -158,40 +263,103 @@ class DocumentSearchRepository:
         Returns:
             List of dictionaries containing document info (id, title, etc.)
         """
-        import re
-        
         with self.ix.searcher() as searcher:
-            parser = MultifieldParser(["title", "content", "author"], schema=self.schema)
-            query = parser.parse(query_str)
+            query = self._parse(query_str)
             
             results = searcher.search(query, limit=limit)
-            results.fragmenter.maxchars = 300
-            results.fragmenter.surround = 50
-            
-            # Extract base search terms for hit counting (strip wildcards)
-            base_terms = re.sub(r'[*?]', '', query_str).strip().lower()
+            self._configure_highlighter(results)
+            counts = self._hit_counts(searcher, query, [r.docnum for r in results])
             
             # Return list of dicts, service will map back to DB objects if needed
             # or UI can use these directly for display
             output = []
             for r in results:
-                # Count total hits in full content + title
-                full_text = (r.get('content') or '') + ' ' + (r.get('title') or '')
-                # Case-insensitive count of search term
-                hit_count = len(re.findall(re.escape(base_terms), full_text, re.IGNORECASE))
-                
-                output.append({
-                    'id': int(r['id']),
-                    'title': r['title'],
-                    'file_type': r['file_type'],
-                    'collection': r.get('collection') or '',
-                    'created_at': r['created_at'],
-                    'highlights': r.highlights("content") or r.highlights("title") or "",
-                    'hit_count': hit_count
-                })
+                entry = self._hit_to_dict(r, counts.get(r.docnum, 0))
+                entry['highlights'] = r.highlights("content") or r.highlights("title") or ""
+                output.append(entry)
             
             return output
 
+    def search_page(self, query_str: str, page: int = 1, page_size: int = 50) -> Dict[str, Any]:
+        """
+        Search for documents one page at a time, without highlights.
+
+        Highlights are the expensive part of a search on large documents, so
+        they are produced separately via ``get_highlights`` for the rows that
+        are actually shown. Pages are cached per (query, page, page_size)
+        until the index changes.
+
+        Args:
+            query_str: The search query
+            page: 1-based page number
+            page_size: Number of results per page
+
+        Returns:
+            Dict with 'results' (list of result dicts), 'total', 'page',
+            'page_size' and 'page_count'.
+        """
+        page = max(1, page)
+        key = self._cache_key("page", query_str, page, page_size)
+        cached = _cache_get(_page_cache, key)
+        if cached is not None:
+            return _copy_page(cached)
+
+        with self.ix.searcher() as searcher:
+            query = self._parse(query_str)
+            results = searcher.search_page(query, page, pagelen=page_size)
+            hits = list(results)
+            counts = self._hit_counts(searcher, query, [r.docnum for r in hits])
+            total = results.total
+            entry = {
+                'results': [self._hit_to_dict(r, counts.get(r.docnum, 0)) for r in hits],
+                'total': total,
+                'page': results.pagenum,
+                'page_size': page_size,
+                'page_count': max(1, math.ceil(total / page_size)) if page_size else 1,
+            }
+
+        _cache_put(_page_cache, key, entry, PAGE_CACHE_SIZE)
+        return _copy_page(entry)
+
+    def get_highlights(self, query_str: str, doc_ids: Iterable[int]) -> Dict[int, str]:
+        """
+        Build highlight snippets for specific documents only.
+
+        Args:
+            query_str: The search query the snippets should reflect
+            doc_ids: Document IDs of the rows being displayed
+
+        Returns:
+            Mapping of document ID to highlighted HTML snippet.
+        """
+        output: Dict[int, str] = {}
+        missing: List[int] = []
+        for doc_id in doc_ids:
+            cached = _cache_get(_highlight_cache, self._cache_key("hl", query_str, doc_id))
+            if cached is None:
+                missing.append(doc_id)
+            else:
+                output[doc_id] = cached
+        if not missing:
+            return output
+
+        with self.ix.searcher() as searcher:
+            query = self._parse(query_str)
+            wanted = [searcher.document_number(id=str(doc_id)) for doc_id in missing]
+            allowed = {docnum for docnum in wanted if docnum is not None}
+            results = searcher.search(query, limit=None, filter=allowed) if allowed else []
+            if allowed:
+                self._configure_highlighter(results)
+            for r in results:
+                doc_id = int(r['id'])
+                snippet = r.highlights("content") or r.highlights("title") or ""
+                output[doc_id] = snippet
+                _cache_put(_highlight_cache, self._cache_key("hl", query_str, doc_id), snippet, HIGHLIGHT_CACHE_SIZE)
+
+        for doc_id in missing:
+            output.setdefault(doc_id, "")
+        return output
+
     def rebuild_index(self, documents: List[Document]):
         """
         Rebuild the entire index from a list of documents.
@@ -201,6 +369,8 @@ class DocumentSearchRepository:
         try:
             # Create fresh index (overwrites old one)
             self.ix = index.create_in(str(self.index_dir), self.schema)
+            # A fresh index restarts its generation count, so drop cached pages
+            clear_search_caches()
             
             # Now add all documents
             writer = self.ix.writer()
@@ -226,4 +396,5 @@ class DocumentSearchRepository:
     def clear_index(self):
         """Clear the entire search index."""
         # Re-create index to clear it
-        self.ix = index.create_in(str(self.index_dir), self.schema)
\ No newline at end of file
+        self.ix = index.create_in(str(self.index_dir), self.schema)
+        clear_search_caches()
\ No newline at end of file
@@ -7,12 +7,74 @@ SHARED JUSTIFICATION:
 
 import sqlite3
 import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import Iterable, Iterator, List, Optional, Tuple, Dict
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Statements reused by KeyDatabaseSession; sqlite3 keeps them prepared in the
+# connection's statement cache because the SQL text never changes.
+_SQL_INSERT_WORD = "INSERT OR IGNORE INTO master_key (word, tq_value) VALUES (?, ?)"
+_SQL_UPDATE_TQ = "UPDATE master_key SET tq_value = ? WHERE id = ? AND tq_value != ?"
+_SQL_INSERT_OCCURRENCE = """INSERT OR IGNORE INTO word_occurrences
+    (key_id, document_id, document_title, verse_id, verse_number,
+     word_position, original_form, context_snippet)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+_SQL_TOUCH = "INSERT OR IGNORE INTO temp.touched_keys (key_id) VALUES (?)"
+
+# Stay well under SQLite's bound-parameter limit
+_IN_CHUNK = 500
+
+# (key_id, document_id, document_title, verse_id, verse_number,
+#  word_position, original_form, context_snippet)
+OccurrenceRow = Tuple[int, int, str, Optional[int], Optional[int], int, str, str]
+
+# Trigram FTS5 index over master_key.word for substring search. It uses
+# master_key as external content, so words are not stored twice; the
+# triggers keep it in step with inserts, renames and deletes.
+TRIGRAM_TABLE = "master_key_trigram"
+_TRIGRAM_SCHEMA = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {TRIGRAM_TABLE} USING fts5(
+        word, content='master_key', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TRIGRAM_TABLE}_ai AFTER INSERT ON master_key BEGIN
+        INSERT INTO {TRIGRAM_TABLE}(rowid, word) VALUES (new.id, new.word);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TRIGRAM_TABLE}_ad AFTER DELETE ON master_key BEGIN
+        INSERT INTO {TRIGRAM_TABLE}({TRIGRAM_TABLE}, rowid, word) VALUES ('delete', old.id, old.word);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {TRIGRAM_TABLE}_au AFTER UPDATE OF word ON master_key BEGIN
+        INSERT INTO {TRIGRAM_TABLE}({TRIGRAM_TABLE}, rowid, word) VALUES ('delete', old.id, old.word);
+        INSERT INTO {TRIGRAM_TABLE}(rowid, word) VALUES (new.id, new.word);
+    END
+    """,
+]
+
+# Queries shorter than a trigram go through the word index as prefixes
+TRIGRAM_MIN_QUERY = 3
+
+# Search totals stop counting here; beyond it the total is approximate
+SEARCH_COUNT_LIMIT = 50_000
+_SEARCH_CACHE_SIZE = 256
+
+_SORT_COLUMNS = {
+    'word': 'word',
+    'tq_value': 'tq_value',
+    'frequency': 'frequency',
+    'id': 'id',
+}
+
 @dataclass
 class KeyEntry:
     id: int
@@ -42,6 +104,170 @@ class WordOccurrence:
     original_form: str    # Original form as found (preserves case)
     context_snippet: str  # KWIC snippet
 
+class KeyDatabaseSession:
+    """
+    One connection and one transaction for a bulk write run.
+
+    Word ids are kept in memory for the whole run, occurrences go in with
+    ``executemany``, and ``master_key.frequency`` is recomputed for the
+    touched keys with a single aggregate UPDATE when the session closes,
+    instead of one UPDATE per occurrence. Obtain one via
+    ``KeyDatabase.session()``.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self._word_ids: Dict[str, int] = {}
+        self._tq_values: Dict[str, int] = {}
+        self.new_keys = 0
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS touched_keys (key_id INTEGER PRIMARY KEY)")
+        conn.execute("DELETE FROM temp.touched_keys")
+
+    def get_ids(self, words: Iterable[str]) -> Dict[str, int]:
+        """Resolve existing words to ids (one IN query per chunk of unknown words)."""
+        result: Dict[str, int] = {}
+        unknown: List[str] = []
+        for word in dict.fromkeys(w.lower() for w in words):
+            key_id = self._word_ids.get(word)
+            if key_id is None:
+                unknown.append(word)
+            else:
+                result[word] = key_id
+
+        for start in range(0, len(unknown), _IN_CHUNK):
+            chunk = unknown[start:start + _IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT word, id, tq_value FROM master_key WHERE word IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            for row in rows:
+                self._word_ids[row[0]] = row[1]
+                self._tq_values[row[0]] = row[2]
+                result[row[0]] = row[1]
+        return result
+
+    def ensure_words(self, tq_values: Dict[str, int]) -> Dict[str, int]:
+        """
+        Get ids for words, adding missing ones and syncing TQ values.
+
+        Args:
+            tq_values: word -> TQ value
+
+        Returns:
+            word (lowercased) -> key id
+        """
+        wanted = {word.lower(): tq for word, tq in tq_values.items()}
+        ids = self.get_ids(wanted)
+
+        missing = [(word, tq) for word, tq in wanted.items() if word not in ids]
+        if missing:
+            # rowcount, unlike total_changes, leaves out trigger writes
+            self.new_keys += self.conn.executemany(_SQL_INSERT_WORD, missing).rowcount
+            ids.update(self.get_ids(word for word, _ in missing))
+
+        stale = [
+            (tq, ids[word], tq)
+            for word, tq in wanted.items()
+            if word in ids and self._tq_values.get(word) != tq
+        ]
+        if stale:
+            self.conn.executemany(_SQL_UPDATE_TQ, stale)
+            for word, tq in wanted.items():
+                self._tq_values[word] = tq
+        return ids
+
+    def add_occurrences(self, rows: List[OccurrenceRow]) -> int:
+        """
+        Bulk-insert word occurrences, skipping duplicates.
+
+        Returns:
+            Number of rows actually inserted.
+        """
+        if not rows:
+            return 0
+        inserted = self.conn.executemany(_SQL_INSERT_OCCURRENCE, rows).rowcount
+        self.conn.executemany(_SQL_TOUCH, {(row[0],) for row in rows})
+        return inserted
+
+    def clear_document_occurrences(self, document_id: int) -> int:
+        """Remove a document's occurrences; frequencies are fixed up on close."""
+        self.conn.execute(
+            "INSERT OR IGNORE INTO temp.touched_keys "
+            "SELECT DISTINCT key_id FROM word_occurrences WHERE document_id = ?",
+            (document_id,),
+        )
+        cursor = self.conn.execute("DELETE FROM word_occurrences WHERE document_id = ?", (document_id,))
+        self.conn.execute("DELETE FROM indexed_verses WHERE document_id = ?", (document_id,))
+        self.conn.execute("DELETE FROM indexed_documents WHERE document_id = ?", (document_id,))
+        return cursor.rowcount
+
+    def clear_verse_occurrences(
+        self, document_id: int, verse_id: Optional[int], verse_number: Optional[int]
+    ) -> int:
+        """Remove the occurrences of one verse (matched on id and number)."""
+        where = "document_id = ? AND verse_id IS ? AND verse_number IS ?"
+        params = (document_id, verse_id, verse_number)
+        self.conn.execute(
+            f"INSERT OR IGNORE INTO temp.touched_keys SELECT DISTINCT key_id FROM word_occurrences WHERE {where}",
+            params,
+        )
+        cursor = self.conn.execute(f"DELETE FROM word_occurrences WHERE {where}", params)
+        return cursor.rowcount
+
+    # --- checkpoints ---
+
+    def verse_checkpoints(self, document_id: int) -> Dict[str, Tuple[Optional[int], Optional[int], str]]:
+        """verse_key -> (verse_id, verse_number, text_hash) for indexed verses."""
+        rows = self.conn.execute(
+            "SELECT verse_key, verse_id, verse_number, text_hash FROM indexed_verses WHERE document_id = ?",
+            (document_id,),
+        ).fetchall()
+        return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+    def record_verses(
+        self,
+        document_id: int,
+        verses: List[Tuple[str, Optional[int], Optional[int], str]],
+    ) -> None:
+        """Checkpoint verses as indexed: (verse_key, verse_id, verse_number, text_hash)."""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO indexed_verses VALUES (?, ?, ?, ?, ?)",
+            [(document_id,) + tuple(verse) for verse in verses],
+        )
+
+    def forget_verses(self, document_id: int, verse_keys: List[str]) -> None:
+        self.conn.executemany(
+            "DELETE FROM indexed_verses WHERE document_id = ? AND verse_key = ?",
+            [(document_id, key) for key in verse_keys],
+        )
+
+    def mark_document_complete(self, document_id: int, document_title: str, verse_count: int) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO indexed_documents (document_id, document_title, verse_count) VALUES (?, ?, ?)",
+            (document_id, document_title, verse_count),
+        )
+
+    def clear_document_complete(self, document_id: int) -> None:
+        self.conn.execute("DELETE FROM indexed_documents WHERE document_id = ?", (document_id,))
+
+    def is_document_complete(self, document_id: int) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM indexed_documents WHERE document_id = ?", (document_id,)
+        ).fetchone() is not None
+
+    def refresh_frequencies(self) -> int:
+        """Recompute ``frequency`` for every touched key in one UPDATE."""
+        cursor = self.conn.execute(
+            """UPDATE master_key SET frequency = (
+                   SELECT COUNT(*) FROM word_occurrences wo WHERE wo.key_id = master_key.id
+               )
+               WHERE id IN (SELECT key_id FROM temp.touched_keys)"""
+        )
+        self.conn.execute("DELETE FROM temp.touched_keys")
+        return cursor.rowcount
+
+
 class KeyDatabase:
     """
     Manages the SQLite database for the Holy Book Key system.
@@ -59,6 +285,15 @@ class KeyDatabase:
         else:
             self.db_path = Path(db_path)
             
+        self._trigram_available = False
+        # Search keeps one read connection so PRAGMA data_version can tell
+        # when another connection has committed and the caches are stale.
+        self._read_conn: Optional[sqlite3.Connection] = None
+        self._read_lock = threading.Lock()
+        self._data_version: Optional[int] = None
+        self._count_cache: "OrderedDict[str, int]" = OrderedDict()
+        self._page_bounds: "OrderedDict[Tuple, Dict[int, Tuple]]" = OrderedDict()
+        self._value_cache: "OrderedDict[Tuple, Dict[int, List[Tuple[str, int]]]]" = OrderedDict()
         self._init_db()
 
     def _get_conn(self) -> sqlite3.Connection:
@@ -186,9 +421,78 @@ class KeyDatabase:
         except sqlite3.OperationalError:
             pass  # Column already exists
         
+        # 8. Indexing checkpoints: the verse text each indexed verse was
+        # built from (resume + reindex diffing) and finished documents
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS indexed_verses (
+                document_id INTEGER NOT NULL,
+                verse_key TEXT NOT NULL,
+                verse_id INTEGER,
+                verse_number INTEGER,
+                text_hash TEXT NOT NULL,
+                PRIMARY KEY (document_id, verse_key)
+            ) WITHOUT ROWID
+        """)
+        
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS indexed_documents (
+                document_id INTEGER PRIMARY KEY,
+                document_title TEXT NOT NULL,
+                verse_count INTEGER NOT NULL,
+                completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # 9. Sort-column indexes for keyset pagination (rowid breaks ties)
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_master_key_tq_value ON master_key(tq_value)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_master_key_frequency ON master_key(frequency)")
+        
+        # Covering index for TQ value lookups: rows come back per value,
+        # most frequent first, without touching the table
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS ix_master_key_tq_lookup
+            ON master_key(tq_value, frequency DESC, word, is_active)
+        """)
+        
+        # 10. Trigram index for substring search
+        try:
+            existed = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = ?", (TRIGRAM_TABLE,)
+            ).fetchone() is not None
+            for statement in _TRIGRAM_SCHEMA:
+                cursor.execute(statement)
+            if not existed:
+                cursor.execute(f"INSERT INTO {TRIGRAM_TABLE}({TRIGRAM_TABLE}) VALUES ('rebuild')")
+            self._trigram_available = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Trigram index unavailable, master key search will scan: {e}")
+            self._trigram_available = False
+        
         conn.commit()
         conn.close()
 
+    @contextmanager
+    def session(self) -> Iterator[KeyDatabaseSession]:
+        """
+        Open a write session: one connection, one transaction.
+
+        Commits (after refreshing frequencies) when the block exits normally
+        and rolls back if it raises.
+        """
+        conn = self._get_conn()
+        conn.execute("PRAGMA busy_timeout=30000")
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            session = KeyDatabaseSession(conn)
+            yield session
+            session.refresh_frequencies()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
     def reset_database(self):
         """
         DANGEROUS: Drops all tables and re-initializes.
@@ -203,7 +507,10 @@ class KeyDatabase:
         cursor = conn.cursor()
         
         try:
-            tables = ['word_occurrences', 'occurrences', 'definitions', 'master_key', 'ignored_words', 'etymologies']
+            tables = [
+                'word_occurrences', 'occurrences', 'definitions', TRIGRAM_TABLE, 'master_key',
+                'ignored_words', 'etymologies', 'indexed_verses', 'indexed_documents'
+            ]
             for table in tables:
                 cursor.execute(f"DROP TABLE IF EXISTS {table}")
             
@@ -293,40 +600,68 @@ class KeyDatabase:
     ) -> Tuple[List[KeyEntry], int]:
         """Search keys with pagination and sorting.
         
+        Queries of three or more characters match anywhere in the word
+        through the trigram index; shorter ones are prefix matches on the
+        word index. Totals are cached (and capped at SEARCH_COUNT_LIMIT), and
+        stepping to the next page seeks from the previous page's last row
+        instead of re-reading every row before it with OFFSET.
+        
         Args:
             query: Search term (partial match on word)
             page: Page number (1-indexed)
             page_size: Results per page
             sort_by: Column to sort by ('word', 'tq_value', 'frequency', 'id')
             descending: Sort direction
+            
+        Returns:
+            (entries on the page, total matches)
         """
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        
-        param = f"%{query.lower()}%"
-        offset = (page - 1) * page_size
-        
-        # 1. Get Total Count
-        cursor.execute("SELECT COUNT(*) FROM master_key WHERE word LIKE ? AND is_active = 1", (param,))
-        total_count = cursor.fetchone()[0]
-        
-        # 2. Build sort clause
-        sort_col_map = {
-            'word': 'word',
-            'tq_value': 'tq_value',
-            'frequency': 'frequency',
-            'id': 'id'
-        }
-        sort_col = sort_col_map.get(sort_by, 'word')
+        q = query.lower()
+        page = max(1, page)
+        sort_col = _SORT_COLUMNS.get(sort_by, 'word')
         direction = 'DESC' if descending else 'ASC'
         
-        # 3. Get Page Results
-        cursor.execute(
-            f"SELECT * FROM master_key WHERE word LIKE ? AND is_active = 1 ORDER BY {sort_col} {direction} LIMIT ? OFFSET ?", 
-            (param, page_size, offset)
-        )
-        rows = cursor.fetchall()
-        conn.close()
+        with self._read_lock:
+            conn = self._search_conn()
+            where, params = self._search_filter(q)
+            
+            # 1. Total (cached until another connection commits)
+            total_count = self._count_cache.get(q)
+            if total_count is None:
+                total_count = conn.execute(
+                    f"SELECT COUNT(*) FROM (SELECT 1 FROM master_key WHERE {where} LIMIT ?)",
+                    (*params, SEARCH_COUNT_LIMIT),
+                ).fetchone()[0]
+                self._remember(self._count_cache, q, total_count)
+            else:
+                self._count_cache.move_to_end(q)
+            
+            # 2. Page: seek past the previous page's last row when we know it
+            bounds_key = (q, sort_col, descending, page_size)
+            bounds = self._page_bounds.get(bounds_key)
+            if bounds is None:
+                bounds = {}
+                self._remember(self._page_bounds, bounds_key, bounds)
+            else:
+                self._page_bounds.move_to_end(bounds_key)
+            
+            order = f"ORDER BY {sort_col} {direction}, id {direction}"
+            after = bounds.get(page - 1)
+            if page == 1:
+                sql = f"SELECT * FROM master_key WHERE {where} {order} LIMIT ?"
+                args = (*params, page_size)
+            elif after is not None:
+                op = '<' if descending else '>'
+                sql = f"SELECT * FROM master_key WHERE {where} AND ({sort_col}, id) {op} (?, ?) {order} LIMIT ?"
+                args = (*params, *after, page_size)
+            else:
+                sql = f"SELECT * FROM master_key WHERE {where} {order} LIMIT ? OFFSET ?"
+                args = (*params, page_size, (page - 1) * page_size)
+            rows = conn.execute(sql, args).fetchall()
+            
+            if rows:
+                last = rows[-1]
+                bounds[page] = (last[sort_col], last['id'])
         
         results = [
             KeyEntry(
@@ -339,6 +674,115 @@ class KeyDatabase:
             for row in rows
         ]
         return results, total_count
+    
+    def get_words_by_tq_values(
+        self,
+        tq_values: Iterable[int],
+        limit_per_value: int = 100
+    ) -> Dict[int, List[Tuple[str, int]]]:
+        """
+        Active words for each of several TQ values, in one indexed query.
+        
+        Args:
+            tq_values: The values to look up (e.g. a quadset's members)
+            limit_per_value: Maximum words returned per value
+            
+        Returns:
+            value -> [(word, frequency)], most frequent first; every
+            requested value is present, possibly with an empty list.
+        """
+        values = sorted({int(v) for v in tq_values})
+        if not values:
+            return {}
+        cache_key = ('values', tuple(values), limit_per_value)
+        placeholders = ",".join("?" * len(values))
+        grouped = self._words_by_tq(cache_key, f"tq_value IN ({placeholders})", values, limit_per_value)
+        return {value: grouped.get(value, []) for value in values}
+    
+    def get_words_in_tq_range(
+        self,
+        low: int,
+        high: int,
+        limit_per_value: int = 100
+    ) -> Dict[int, List[Tuple[str, int]]]:
+        """
+        Active words with a TQ value in [low, high], grouped by value.
+        
+        Returns:
+            value -> [(word, frequency)], most frequent first; only values
+            that have words appear.
+        """
+        cache_key = ('range', low, high, limit_per_value)
+        return dict(self._words_by_tq(cache_key, "tq_value BETWEEN ? AND ?", [low, high], limit_per_value))
+    
+    def _words_by_tq(
+        self,
+        cache_key: Tuple,
+        condition: str,
+        params: List[int],
+        limit_per_value: int
+    ) -> Dict[int, List[Tuple[str, int]]]:
+        with self._read_lock:
+            conn = self._search_conn()
+            cached = self._value_cache.get(cache_key)
+            if cached is not None:
+                self._value_cache.move_to_end(cache_key)
+                return cached
+            
+            # The window runs in ix_master_key_tq_lookup order, so each
+            # value's rows are read already ranked and cut at the limit.
+            rows = conn.execute(
+                f"""SELECT tq_value, word, frequency FROM (
+                        SELECT tq_value, word, COALESCE(frequency, 0) AS frequency,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY tq_value ORDER BY frequency DESC, word
+                               ) AS rank
+                        FROM master_key INDEXED BY ix_master_key_tq_lookup
+                        WHERE {condition} AND is_active = 1
+                    ) WHERE rank <= ?
+                    ORDER BY tq_value, rank""",
+                (*params, limit_per_value),
+            ).fetchall()
+            
+            grouped: Dict[int, List[Tuple[str, int]]] = {}
+            for row in rows:
+                grouped.setdefault(row[0], []).append((row[1], row[2]))
+            self._remember(self._value_cache, cache_key, grouped)
+            return grouped
+    
+    def _search_filter(self, q: str) -> Tuple[str, Tuple]:
+        """WHERE clause and parameters selecting active keys that match ``q``."""
+        if not q:
+            return "is_active = 1", ()
+        if len(q) < TRIGRAM_MIN_QUERY:
+            # Prefix range: a seek on the UNIQUE(word) index
+            return "word >= ? AND word < ? AND is_active = 1", (q, q + "\U0010ffff")
+        if self._trigram_available:
+            phrase = '"' + q.replace('"', '""') + '"'
+            return (
+                f"id IN (SELECT rowid FROM {TRIGRAM_TABLE} WHERE {TRIGRAM_TABLE} MATCH ?) AND is_active = 1",
+                (phrase,),
+            )
+        return "word LIKE ? AND is_active = 1", (f"%{q}%",)
+    
+    def _search_conn(self) -> sqlite3.Connection:
+        """The persistent read connection; drops search caches after foreign commits."""
+        if self._read_conn is None:
+            self._read_conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+            self._read_conn.row_factory = sqlite3.Row
+        version = self._read_conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._data_version = version
+            self._count_cache.clear()
+            self._page_bounds.clear()
+            self._value_cache.clear()
+        return self._read_conn
+    
+    @staticmethod
+    def _remember(cache: OrderedDict, key, value) -> None:
+        cache[key] = value
+        if len(cache) > _SEARCH_CACHE_SIZE:
+            cache.popitem(last=False)
         
     # --- Definition Operations ---
 
@@ -583,6 +1027,10 @@ class KeyDatabase:
             (document_id,)
         )
         deleted = cursor.rowcount
+        
+        # Drop indexing checkpoints so the next run starts clean
+        cursor.execute("DELETE FROM indexed_verses WHERE document_id = ?", (document_id,))
+        cursor.execute("DELETE FROM indexed_documents WHERE document_id = ?", (document_id,))
         conn.commit()
         conn.close()
         return deleted
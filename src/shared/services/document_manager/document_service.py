@@ -31,7 +31,7 @@ from shared.services.document_manager.utils.image_utils import (
     restore_images_in_html,
     has_embedded_images
 )
-from shared.models.document_manager.document import Document, DocumentImage
+from shared.models.document_manager.document import Document, DocumentImage, ImageBlob
 from shared.models.document_manager.document_verse import DocumentVerse
 from shared.models.document_manager.dtos import DocumentMetadataDTO
 from sqlalchemy import func
@@ -226,6 +226,23 @@ class DocumentService:
         """Search documents and return results with highlights."""
         return self.search_repo.search(query, limit=limit)
 
+    def search_documents_page(self, query: str, page: int = 1, page_size: int = 50) -> Dict[str, Any]:
+        """Search documents one page at a time; snippets come from get_search_highlights."""
+        start = time.perf_counter()
+        result = self.search_repo.search_page(query, page=page, page_size=page_size)
+        logger.debug(
+            "DocumentService: search page %s for '%s' (%s total) in %.1f ms",
+            page,
+            query,
+            result['total'],
+            (time.perf_counter() - start) * 1000,
+        )
+        return result
+
+    def get_search_highlights(self, query: str, doc_ids: List[int]) -> Dict[int, str]:
+        """Return highlight snippets for the given documents only."""
+        return self.search_repo.get_highlights(query, doc_ids)
+
     def get_all_documents(self) -> List[Document]:
         """
         Retrieve all documents logic.
@@ -313,6 +330,17 @@ class DocumentService:
             data = self.image_repo.get_decompressed_data(img)
             return data, img.mime_type
         return None
+
+    def migrate_images_to_store(self) -> int:
+        """Move inline image blobs from the main DB into the shared image store."""
+        start = time.perf_counter()
+        count = self.image_repo.migrate_inline_images()
+        logger.info(
+            "DocumentService: migrated %s inline images to the image store in %.1f ms",
+            count,
+            (time.perf_counter() - start) * 1000,
+        )
+        return count
     
     def update_document(self, doc_id: int, **kwargs: Any) -> Optional[Document]:
         """
@@ -407,9 +435,14 @@ class DocumentService:
             Result of delete_document operation.
         """
         start = time.perf_counter()
+        image_hashes = self.image_repo.hashes_for_document(doc_id)
         success = self.repo.delete(doc_id)
         if success:
             self.search_repo.delete_document(doc_id)
+            if image_hashes:
+                self.image_repo.release_blobs(image_hashes)
+                self.db.commit()
+                self.image_repo.purge_released_blobs()
         logger.debug(
             "DocumentService: delete_document %s success=%s in %.1f ms",
             doc_id,
@@ -423,6 +456,9 @@ class DocumentService:
         start = time.perf_counter()
         count = self.repo.delete_all()
         self.search_repo.clear_index()
+        self.image_repo.sweep_blobs()
+        self.db.commit()
+        self.image_repo.purge_released_blobs()
         logger.debug(
             "DocumentService: delete_all_documents removed %s entries in %.1f ms",
             count,
@@ -445,8 +481,10 @@ class DocumentService:
         """Get database statistics."""
         doc_count = self.db.query(func.count(Document.id)).scalar()
         img_count = self.db.query(func.count(DocumentImage.id)).scalar()
-        # Sum of image data size (in bytes)
-        img_size_bytes = self.db.query(func.sum(func.length(DocumentImage.data))).scalar() or 0
+        # Sum of image data size (in bytes): legacy inline rows plus the shared store
+        inline_bytes = self.db.query(func.sum(func.length(DocumentImage.data))).scalar() or 0
+        store_bytes = self.db.query(func.sum(ImageBlob.stored_size)).scalar() or 0
+        img_size_bytes = inline_bytes + store_bytes
         
         return {
             "document_count": doc_count,
@@ -495,11 +533,18 @@ class DocumentService:
             # We process in chunks.
             orphan_list = list(orphan_ids)
             chunk_size = 500
+            orphan_hashes = set()
             for i in range(0, len(orphan_list), chunk_size):
                 chunk = orphan_list[i:i + chunk_size]
+                orphan_hashes.update(
+                    h for (h,) in self.db.query(DocumentImage.hash).filter(DocumentImage.id.in_(chunk)).all()
+                )
                 self.db.query(DocumentImage).filter(DocumentImage.id.in_(chunk)).delete(synchronize_session=False)
             
+            # Drop shared blobs that no other document references
+            self.image_repo.release_blobs(orphan_hashes)
             self.db.commit()
+            self.image_repo.purge_released_blobs()
             deleted_count = len(orphan_ids)
             
         logger.info(
@@ -30,6 +30,7 @@ from urllib.parse import quote
 
 import requests
 
+from shared.services.lexicon.etymology_db_service import STORE_FILENAME, EtymologyDbService
 from shared.services.lexicon.lexicon_resolver import LexiconResolver
 from shared.config import get_config
 
@@ -76,6 +77,8 @@ class EtymologyService:
         self._etymology_db_path = config.paths.etymology_db / "etymology.csv.gz"
         self._etymology_db_word_index_path = config.paths.etymology_db / "word_index.json"
         self._etymology_db_word_index: Optional[Dict[str, Dict[str, int]]] = None
+        self._etymology_db_store_path = config.paths.etymology_db / STORE_FILENAME
+        self._etymology_db_service: Optional[EtymologyDbService] = None
 
         # Check if web fallback is enabled
         self._enable_web_fallback = config.features.enable_etymology_web_fallback
@@ -395,31 +398,67 @@ class EtymologyService:
             logger.error(f"Failed to load etymology word index: {e}")
             self._etymology_db_word_index = {}
 
-    def _lookup_etymology_db(self, word: str) -> Optional[Dict[str, str]]:
-        """Streamed lookup using word_index.json to avoid loading entire graph into memory."""
-        try:
-            self._load_etymology_word_index()
-            if not self._etymology_db_word_index:
-                return None
+    def _etymology_store_rows(self, word: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Relations for ``word`` from the SQLite etymology store.
 
-            entry = self._etymology_db_word_index.get(word.lower())
-            if not entry:
-                return None
+        English entries win; other languages are used when English has none.
+        Returns None when the store has not been built.
+        """
+        if not self._etymology_db_store_path.exists():
+            return None
+        if self._etymology_db_service is None:
+            self._etymology_db_service = EtymologyDbService()
+        service = self._etymology_db_service
+        if service.store is None:
+            return None
 
-            start_row = entry.get("start_row", 0)
-            count = entry.get("count", 0)
-            if start_row <= 0 or count <= 0:
-                return None
+        relations = service.get_etymologies(word, lang="English", max_results=200)
+        if not relations:
+            relations = service.get_etymologies(word, lang=None, max_results=200)
+        return [
+            {
+                "reltype": rel.reltype,
+                "related_term": rel.related_term or "",
+                "related_lang": rel.related_lang or "",
+            }
+            for rel in relations
+        ]
+
+    def _etymology_csv_rows(self, word: str) -> List[Dict[str, str]]:
+        """Stream a word's rows out of the CSV using word_index.json (English only)."""
+        self._load_etymology_word_index()
+        if not self._etymology_db_word_index:
+            return []
+
+        entry = self._etymology_db_word_index.get(word.lower())
+        if not entry:
+            return []
+
+        start_row = entry.get("start_row", 0)
+        count = entry.get("count", 0)
+        if start_row <= 0 or count <= 0:
+            return []
+
+        results: List[Dict[str, str]] = []
+        with gzip.open(self._etymology_db_path, 'rt', encoding='utf-8', errors='replace') as f:
+            reader = csv.DictReader(f)
+            for row_num, row in enumerate(reader, start=1):
+                if row_num < start_row:
+                    continue
+                if row_num >= start_row + count:
+                    break
+                results.append(row)
+        return results
 
-            results: List[Dict[str, str]] = []
-            with gzip.open(self._etymology_db_path, 'rt', encoding='utf-8', errors='replace') as f:
-                reader = csv.DictReader(f)
-                for row_num, row in enumerate(reader, start=1):
-                    if row_num < start_row:
-                        continue
-                    if row_num >= start_row + count:
-                        break
-                    results.append(row)
+    def _lookup_etymology_db(self, word: str) -> Optional[Dict[str, str]]:
+        """Etymology graph lookup: indexed SQLite store, else streamed CSV rows."""
+        try:
+            results = self._etymology_store_rows(word)
+            source_details = "Data from etymology_db (indexed SQLite store)"
+            if results is None:
+                results = self._etymology_csv_rows(word)
+                source_details = "Data from etymology_db using word_index.json (memory-safe stream)"
 
             if not results:
                 return None
@@ -469,9 +508,9 @@ class EtymologyService:
                 return None
 
             return {
-                "source": "Etymology Graph (streamed)",
+                "source": "Etymology Graph",
                 "origin": "<hr>".join(html_parts),
-                "details": "Data from etymology_db using word_index.json (memory-safe stream)"
+                "details": source_details
             }
         except Exception as e:
             logger.error(f"Etymology DB lookup failed: {e}")
@@ -23,6 +23,7 @@ from contextlib import contextmanager
 
 from shared.models.document_manager.notebook import Notebook, Section
 from shared.models.document_manager.document import Document
+from shared.repositories.document_manager.notebook_search_repository import NotebookSearchRepository
 from sqlalchemy import or_
 from dataclasses import dataclass
 
@@ -285,7 +286,24 @@ class NotebookService:
         """
         if not query or len(query) < 2:
             return []
-            
+        
+        hits = NotebookSearchRepository(self.db).search(query, limit=50)
+        if hits is not None:
+            return [
+                SearchResult(
+                    page_id=hit.page_id,
+                    title=hit.title,
+                    snippet=hit.snippet,
+                    notebook_name=hit.notebook_name,
+                    section_name=hit.section_name,
+                )
+                for hit in hits
+            ]
+        
+        return self._search_global_scan(query)
+    
+    def _search_global_scan(self, query: str) -> List[SearchResult]:
+        """Fallback substring scan for SQLite builds without FTS5."""
         search_term = f"%{query}%"
         
         # Query Documents, join Sections and Notebooks
@@ -1,5 +1,5 @@
 """Shared geometry services and solids."""
-from .solid_payload import SolidPayload, SolidLabel
+from .solid_payload import ArraySolidPayload, MeshBuffers, SolidPayload, SolidLabel
 from .cube import CubeSolidService
 from .tetrahedron import TetrahedronSolidService
 from .octahedron import OctahedronSolidService
@@ -11,7 +11,7 @@ from .archimedean import (
 )
 
 __all__ = [
-    'SolidPayload', 'SolidLabel',
+    'SolidPayload', 'SolidLabel', 'ArraySolidPayload', 'MeshBuffers',
     'CubeSolidService',
     'TetrahedronSolidService',
     'OctahedronSolidService',
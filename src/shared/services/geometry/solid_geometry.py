@@ -4,6 +4,8 @@ from __future__ import annotations
 from typing import Iterable, List, Sequence, Tuple
 import math
 
+import numpy as np
+
 Vec3 = Tuple[float, float, float]
 Vertex = Vec3
 Edge = Tuple[int, int]
@@ -235,6 +237,56 @@ def edges_from_faces(faces: Sequence[Face]) -> List[Tuple[int, int]]:
     return sorted(edge_set)
 
 
+def edges_from_face_arrays(face_indices: np.ndarray, face_offsets: np.ndarray) -> np.ndarray:
+    """
+    Array form of ``edges_from_faces`` for CSR faces.
+
+    Args:
+        face_indices: Flat vertex indices of all faces.
+        face_offsets: (F + 1,) offsets; face ``i`` spans ``[offsets[i], offsets[i + 1])``.
+
+    Returns:
+        (E, 2) sorted unique ``(low, high)`` vertex pairs, in the same order
+        as ``edges_from_faces``.
+    """
+    sizes = np.diff(face_offsets)
+    keep = np.repeat(sizes >= 2, sizes)
+    following = np.arange(1, len(face_indices) + 1)
+    following[face_offsets[1:][sizes > 0] - 1] = face_offsets[:-1][sizes > 0]
+    a = face_indices[keep]
+    b = face_indices[following[keep]] if len(face_indices) else a
+    low = np.minimum(a, b).astype(np.int64)
+    high = np.maximum(a, b).astype(np.int64)
+    distinct = low != high
+    if not distinct.any():
+        return np.zeros((0, 2), dtype=np.int64)
+    # One int64 key per pair sorts like the (low, high) tuples
+    span = int(high.max()) + 1
+    keys = np.unique(low[distinct] * span + high[distinct])
+    return np.column_stack((keys // span, keys % span))
+
+
+def grid_quads(rows: int, cols: int, wrap_rows: bool = True, wrap_cols: bool = True) -> np.ndarray:
+    """
+    Quads over a row-major ``rows x cols`` vertex grid.
+
+    Each quad is ``(r, c), (r+1, c), (r+1, c+1), (r, c+1)``; wrapped
+    directions join the last row/column back to the first (tubes, tori).
+
+    Returns:
+        (F, 4) int64 vertex indices.
+    """
+    r0, c0 = np.meshgrid(
+        np.arange(rows if wrap_rows else rows - 1),
+        np.arange(cols if wrap_cols else cols - 1),
+        indexing='ij',
+    )
+    r1 = (r0 + 1) % rows
+    c1 = (c0 + 1) % cols
+    quads = np.stack((r0 * cols + c0, r1 * cols + c0, r1 * cols + c1, r0 * cols + c1), axis=-1)
+    return quads.reshape(-1, 4).astype(np.int64)
+
+
 def face_centroid(vertices: Sequence[Vec3], face: Face) -> Vec3:
     """
     Face centroid logic.
@@ -302,6 +354,8 @@ __all__ = [
     'compute_surface_area',
     'compute_volume',
     'edges_from_faces',
+    'edges_from_face_arrays',
+    'grid_quads',
     'face_centroid',
     'angle_around_axis',
 ]
\ No newline at end of file
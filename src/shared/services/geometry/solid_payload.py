@@ -1,8 +1,11 @@
 """Shared 3D solid payload structures."""
 from __future__ import annotations
 
+from collections.abc import Sequence as SequenceABC
 from dataclasses import dataclass, field
-from typing import List, Optional, Sequence, Tuple
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 Vec3 = Tuple[float, float, float]
 Vertex = Vec3
@@ -21,6 +24,125 @@ class SolidLabel:
     align_center: bool = True
 
 
+@dataclass(frozen=True)
+class MeshBuffers:
+    """
+    A solid's mesh as arrays.
+
+    Face ``i`` is ``face_indices[face_offsets[i]:face_offsets[i + 1]]``
+    (CSR layout), so faces of mixed sizes share one index array.
+    """
+    vertices: np.ndarray        # (N, 3) float64
+    face_offsets: np.ndarray    # (F + 1,) int64
+    face_indices: np.ndarray    # (M,) int64
+    edges: np.ndarray           # (E, 2) int64
+
+    @classmethod
+    def from_sequences(
+        cls,
+        vertices: Sequence[Vec3],
+        faces: Sequence[Face],
+        edges: Sequence[Edge],
+    ) -> 'MeshBuffers':
+        """Pack list-of-tuples geometry into arrays (copies)."""
+        counts = np.fromiter((len(face) for face in faces), dtype=np.int64, count=len(faces))
+        offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        indices = np.fromiter(
+            (index for face in faces for index in face), dtype=np.int64, count=int(offsets[-1])
+        )
+        return cls(
+            vertices=np.asarray(vertices, dtype=np.float64).reshape(-1, 3),
+            face_offsets=offsets,
+            face_indices=indices,
+            edges=np.asarray(edges, dtype=np.int64).reshape(-1, 2),
+        )
+
+    @property
+    def face_sizes(self) -> np.ndarray:
+        return np.diff(self.face_offsets)
+
+
+class ArrayRows(SequenceABC):
+    """
+    Read-only tuple view over the rows of a 2-D array.
+
+    Lets code written for lists of tuples (``for x, y, z in vertices``,
+    ``vertices[i]``, ``len(vertices)``) read an array without copying it;
+    ``np.asarray(view)`` hands back the array itself.
+    """
+
+    __slots__ = ('array',)
+
+    def __init__(self, array: np.ndarray):
+        self.array = array
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [tuple(row) for row in self.array[index].tolist()]
+        return tuple(self.array[index].tolist())
+
+    def __iter__(self) -> Iterator[tuple]:
+        return map(tuple, self.array.tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        return self.array if dtype is None else self.array.astype(dtype, copy=False)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ArrayRows):
+            return np.array_equal(self.array, other.array)
+        if isinstance(other, SequenceABC):
+            return list(self) == [tuple(item) for item in other]
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} rows)"
+
+
+class FaceRows(SequenceABC):
+    """Read-only view of CSR faces as index tuples."""
+
+    __slots__ = ('indices', 'offsets')
+
+    def __init__(self, indices: np.ndarray, offsets: np.ndarray):
+        self.indices = indices
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("face index out of range")
+        return tuple(self.indices[self.offsets[index]:self.offsets[index + 1]].tolist())
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        flat = self.indices.tolist()
+        bounds = self.offsets.tolist()
+        return (tuple(flat[start:end]) for start, end in zip(bounds, bounds[1:]))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, FaceRows):
+            return np.array_equal(self.offsets, other.offsets) and np.array_equal(self.indices, other.indices)
+        if isinstance(other, SequenceABC):
+            return list(self) == [tuple(face) for face in other]
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"FaceRows({len(self)} faces)"
+
+
 @dataclass
 class SolidPayload:
     """
@@ -84,4 +206,94 @@ class SolidPayload:
         xs = [v[0] for v in self.vertices]
         ys = [v[1] for v in self.vertices]
         zs = [v[2] for v in self.vertices]
-        return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
\ No newline at end of file
+        return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
+
+    def mesh_buffers(self) -> MeshBuffers:
+        """The mesh as arrays (packed from the lists on each call)."""
+        return MeshBuffers.from_sequences(self.vertices, self.faces, self.edges)
+
+
+class ArraySolidPayload(SolidPayload):
+    """
+    SolidPayload whose mesh lives in NumPy arrays.
+
+    ``vertices``, ``faces`` and ``edges`` are read-only tuple views over the
+    arrays, so existing consumers keep working, while ``mesh_buffers()``
+    returns the arrays themselves for the 3D view and exporters.
+    """
+
+    def __init__(
+        self,
+        *,
+        vertices: np.ndarray,
+        faces: Optional[np.ndarray] = None,
+        face_offsets: Optional[np.ndarray] = None,
+        edges: Optional[np.ndarray] = None,
+        labels: Optional[List[SolidLabel]] = None,
+        metadata: Optional[dict] = None,
+        face_colors: Optional[List[Optional[Tuple[int, int, int, int]]]] = None,
+        suggested_scale: Optional[float] = None,
+        dual: Optional['SolidPayload'] = None,
+    ) -> None:
+        """
+        Args:
+            vertices: (N, 3) vertex positions
+            faces: (F, k) index array for faces of one size, or the flat
+                CSR index array when ``face_offsets`` is given
+            face_offsets: (F + 1,) CSR offsets into ``faces``
+            edges: (E, 2) vertex pairs; derived from the faces when omitted
+        """
+        from .solid_geometry import edges_from_face_arrays
+
+        vertex_array = np.ascontiguousarray(vertices, dtype=np.float64).reshape(-1, 3)
+        if faces is None:
+            face_indices = np.zeros(0, dtype=np.int64)
+            offsets = np.zeros(1, dtype=np.int64)
+        elif face_offsets is None:
+            grid = np.asarray(faces, dtype=np.int64)
+            size = grid.shape[1] if grid.ndim == 2 else 0
+            face_indices = grid.reshape(-1)
+            offsets = np.arange(len(grid) + 1, dtype=np.int64) * size
+        else:
+            face_indices = np.asarray(faces, dtype=np.int64).reshape(-1)
+            offsets = np.asarray(face_offsets, dtype=np.int64)
+        if edges is None:
+            edge_array = edges_from_face_arrays(face_indices, offsets)
+        else:
+            edge_array = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+
+        self._buffers = MeshBuffers(
+            vertices=vertex_array,
+            face_offsets=offsets,
+            face_indices=face_indices,
+            edges=edge_array,
+        )
+        self.labels = list(labels) if labels is not None else []
+        self.metadata = dict(metadata) if metadata is not None else {}
+        self.face_colors = list(face_colors) if face_colors is not None else []
+        self.suggested_scale = suggested_scale
+        self.dual = dual
+
+    @property
+    def vertices(self) -> ArrayRows:  # type: ignore[override]
+        return ArrayRows(self._buffers.vertices)
+
+    @property
+    def faces(self) -> FaceRows:  # type: ignore[override]
+        return FaceRows(self._buffers.face_indices, self._buffers.face_offsets)
+
+    @property
+    def edges(self) -> ArrayRows:  # type: ignore[override]
+        return ArrayRows(self._buffers.edges)
+
+    def bounds(self) -> Optional[Tuple[Vec3, Vec3]]:
+        vertices = self._buffers.vertices
+        if not len(vertices):
+            return None
+        low = vertices.min(axis=0).tolist()
+        high = vertices.max(axis=0).tolist()
+        return (low[0], low[1], low[2]), (high[0], high[1], high[2])
+
+    def mesh_buffers(self) -> MeshBuffers:
+        """The payload's own arrays (no copy)."""
+        return self._buffers
\ No newline at end of file
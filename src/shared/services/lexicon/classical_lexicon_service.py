@@ -29,8 +29,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Dict
 import re
+import sqlite3
 import unicodedata
 
+from .kaikki_store import get_kaikki_store, query_keys
+from .perseus_index import PerseusOffsetIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,51 +102,30 @@ class ClassicalLexiconService:
         self.data_dir = data_dir
         self._strongs_greek: Optional[List[Dict]] = None
         self._strongs_hebrew: Optional[List[Dict]] = None
+        # Folded word/transliteration -> entry positions, built with the lists
+        self._strongs_greek_folds: Dict[str, List[int]] = {}
+        self._strongs_hebrew_folds: Dict[str, List[int]] = {}
         self._perseus_loaded = False
         self._perseus_path = data_dir / "perseus_lsj.xml"
+        self._perseus_offset_index: Optional[PerseusOffsetIndex] = None
         self._lsj_cex_path = data_dir / "lsj_index.txt"
         self._lsj_cex_index: Optional[Dict[str, Dict]] = None
         self._kaikki_path = data_dir / "kaikki.org-dictionary-AncientGreek-words.jsonl"
-        self._kaikki_index: Optional[Dict[str, Dict]] = None
         self._kaikki_hebrew_path = data_dir / "kaikki.org-dictionary-Hebrew-words.jsonl"
-        self._kaikki_hebrew_index: Optional[Dict[str, Dict]] = None
         self._kaikki_latin_path = data_dir / "kaikki.org-dictionary-Latin.jsonl"
-        self._kaikki_latin_index: Optional[Dict[str, Dict]] = None
         self._kaikki_english_path = data_dir / "kaikki.org-dictionary-English.jsonl"
-        self._kaikki_english_index: Optional[Dict[str, Dict]] = None
         self._kaikki_sanskrit_path = data_dir / "kaikki.org-dictionary-Sanskrit.jsonl"
-        self._kaikki_sanskrit_index: Optional[Dict[str, Dict]] = None
         self._kaikki_aramaic_path = data_dir / "kaikki.org-dictionary-Aramaic.jsonl"
-        self._kaikki_aramaic_index: Optional[Dict[str, Dict]] = None
         self._kaikki_pie_path = data_dir / "kaikki.org-dictionary-ProtoIndoEuropean.jsonl"
-        self._kaikki_pie_index: Optional[Dict[str, Dict]] = None
 
-        # Compact index/artifacts for faster UI loads (built by scripts/build_kaikki_indexes.py)
+        # Compact artifacts for faster UI loads (built by scripts/build_kaikki_indexes.py).
+        # Every Kaikki file is looked up through the shared on-disk key store.
         self._kaikki_index_dir = data_dir / "indexes"
         self._kaikki_english_compact_data_path = self._kaikki_index_dir / "kaikki-english-mini.jsonl"
-        self._kaikki_english_compact_index_path = self._kaikki_index_dir / "kaikki-english-index.json"
-        self._kaikki_english_compact_index: Optional[Dict[str, int]] = None
-        self._kaikki_english_compact_handle = None
-
         self._kaikki_latin_compact_data_path = self._kaikki_index_dir / "kaikki-latin-mini.jsonl"
-        self._kaikki_latin_compact_index_path = self._kaikki_index_dir / "kaikki-latin-index.json"
-        self._kaikki_latin_compact_index: Optional[Dict[str, int]] = None
-        self._kaikki_latin_compact_handle = None
-
         self._kaikki_sanskrit_compact_data_path = self._kaikki_index_dir / "kaikki-sanskrit-mini.jsonl"
-        self._kaikki_sanskrit_compact_index_path = self._kaikki_index_dir / "kaikki-sanskrit-index.json"
-        self._kaikki_sanskrit_compact_index: Optional[Dict[str, int]] = None
-        self._kaikki_sanskrit_compact_handle = None
-
         self._kaikki_aramaic_compact_data_path = self._kaikki_index_dir / "kaikki-aramaic-mini.jsonl"
-        self._kaikki_aramaic_compact_index_path = self._kaikki_index_dir / "kaikki-aramaic-index.json"
-        self._kaikki_aramaic_compact_index: Optional[Dict[str, int]] = None
-        self._kaikki_aramaic_compact_handle = None
-
         self._kaikki_pie_compact_data_path = self._kaikki_index_dir / "kaikki-pie-mini.jsonl"
-        self._kaikki_pie_compact_index_path = self._kaikki_index_dir / "kaikki-pie-index.json"
-        self._kaikki_pie_compact_index: Optional[Dict[str, int]] = None
-        self._kaikki_pie_compact_handle = None
 
     def lookup_greek(self, word: str, prefer_classical: bool = False) -> List[LexiconEntry]:
         """
@@ -179,6 +162,35 @@ class ClassicalLexiconService:
         results.extend(self._query_strongs_hebrew(word))
         return results
 
+    def lookup_greek_many(self, words: List[str], prefer_classical: bool = False) -> Dict[str, List[LexiconEntry]]:
+        """
+        Bulk ``lookup_greek``: one batched Kaikki probe for all words.
+
+        Returns:
+            word -> entries, in the same order ``lookup_greek`` gives
+        """
+        kaikki = self._kaikki_entries(self._kaikki_path, words, "Ancient Greek", phonetic=True)
+        results: Dict[str, List[LexiconEntry]] = {}
+        for word in words:
+            entry_data = kaikki.get(word)
+            kaikki_results = self._kaikki_full_entry(entry_data, word, "Ancient Greek") if entry_data else []
+            strongs_results = self._query_strongs_greek(word)
+            if prefer_classical:
+                results[word] = kaikki_results + strongs_results
+            else:
+                results[word] = strongs_results + kaikki_results
+        return results
+
+    def lookup_hebrew_many(self, words: List[str]) -> Dict[str, List[LexiconEntry]]:
+        """Bulk ``lookup_hebrew``: one batched Kaikki probe for all words."""
+        kaikki = self._kaikki_entries(self._kaikki_hebrew_path, words, "Hebrew")
+        results: Dict[str, List[LexiconEntry]] = {}
+        for word in words:
+            entry_data = kaikki.get(word)
+            kaikki_results = self._kaikki_full_entry(entry_data, word, "Hebrew") if entry_data else []
+            results[word] = kaikki_results + self._query_strongs_hebrew(word)
+        return results
+
     def lookup_latin(self, word: str) -> List[LexiconEntry]:
         """Look up a Latin word (kaikki.org)."""
         return self._query_kaikki_latin(word)
@@ -215,6 +227,7 @@ class ClassicalLexiconService:
         try:
             with open(json_path, 'r', encoding='utf-8') as f:
                 self._strongs_greek = json.load(f)
+            self._strongs_greek_folds = self._fold_strongs(self._strongs_greek)
             logger.info(f"Loaded {len(self._strongs_greek)} Strong's Greek entries")
         except Exception as e:
             logger.error(f"Failed to load Strong's Greek: {e}")
@@ -236,288 +249,76 @@ class ClassicalLexiconService:
         try:
             with open(json_path, 'r', encoding='utf-8') as f:
                 self._strongs_hebrew = json.load(f)
+            self._strongs_hebrew_folds = self._fold_strongs(self._strongs_hebrew)
             logger.info(f"Loaded {len(self._strongs_hebrew)} Strong's Hebrew entries")
         except Exception as e:
             logger.error(f"Failed to load Strong's Hebrew: {e}")
             self._strongs_hebrew = []
 
-    def _load_kaikki(self):
-        """Lazy-load kaikki.org Wiktionary JSONL into memory with fuzzy indexing."""
-        if self._kaikki_index is not None:
-            return
-
-        if not self._kaikki_path.exists():
-            logger.warning(f"Kaikki.org dictionary not found at {self._kaikki_path}")
-            self._kaikki_index = {}
-            return
-
-        try:
-            self._kaikki_index = {}
-            entry_count = 0
-            
-            with open(self._kaikki_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    try:
-                        data = json.loads(line)
-                        word = data.get('word', '')
-                        if not word:
-                            continue
-                        
-                        entry_count += 1
-                        
-                        # Index by exact Unicode
-                        self._kaikki_index[word] = data
-                        
-                        # Also index lowercase
-                        word_lower = word.lower()
-                        if word_lower != word and word_lower not in self._kaikki_index:
-                            self._kaikki_index[word_lower] = data
-                        
-                        # Index without accents for fuzzy matching
-                        word_no_accents = remove_accents(word_lower)
-                        if word_no_accents != word_lower and word_no_accents not in self._kaikki_index:
-                            self._kaikki_index[word_no_accents] = data
-                        
-                        # Also index without hyphens (for compound words)
-                        word_no_hyphen = word_no_accents.replace('-', '')
-                        if word_no_hyphen != word_no_accents and word_no_hyphen not in self._kaikki_index:
-                            self._kaikki_index[word_no_hyphen] = data
-                        
-                        # Phonetic normalization for vowel confusion (βετα → βῆτα)
-                        word_phonetic = phonetic_normalize_greek(word_lower)
-                        if word_phonetic != word_no_hyphen and word_phonetic not in self._kaikki_index:
-                            self._kaikki_index[word_phonetic] = data
-                        
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Invalid JSON at line {line_num}: {e}")
-                        continue
-            
-            logger.info(f"Loaded {entry_count} kaikki.org entries ({len(self._kaikki_index)} index keys)")
-            
-        except Exception as e:
-            logger.error(f"Failed to load kaikki.org: {e}")
-            self._kaikki_index = {}
-
-    def _load_kaikki_hebrew(self):
-        """Lazy-load kaikki.org Hebrew Wiktionary JSONL into memory with fuzzy indexing."""
-        if self._kaikki_hebrew_index is not None:
-            return
-
-        if not self._kaikki_hebrew_path.exists():
-            logger.warning(f"Kaikki.org Hebrew dictionary not found at {self._kaikki_hebrew_path}")
-            self._kaikki_hebrew_index = {}
-            return
-
-        try:
-            self._kaikki_hebrew_index = {}
-            entry_count = 0
-            
-            with open(self._kaikki_hebrew_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    try:
-                        data = json.loads(line)
-                        word = data.get('word', '')
-                        if not word:
-                            continue
-                        
-                        entry_count += 1
-                        
-                        # Index by exact Unicode
-                        self._kaikki_hebrew_index[word] = data
-                        
-                        # Also index lowercase
-                        word_lower = word.lower()
-                        if word_lower != word and word_lower not in self._kaikki_hebrew_index:
-                            self._kaikki_hebrew_index[word_lower] = data
-                        
-                        # Index without accents/vowel points for fuzzy matching
-                        word_no_accents = remove_accents(word_lower)
-                        if word_no_accents != word_lower and word_no_accents not in self._kaikki_hebrew_index:
-                            self._kaikki_hebrew_index[word_no_accents] = data
-                        
-                        # Also index without hyphens (for compound words)
-                        word_no_hyphen = word_no_accents.replace('-', '')
-                        if word_no_hyphen != word_no_accents and word_no_hyphen not in self._kaikki_hebrew_index:
-                            self._kaikki_hebrew_index[word_no_hyphen] = data
-                        
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Invalid JSON at line {line_num}: {e}")
-                        continue
-            
-            logger.info(f"Loaded {entry_count} kaikki.org Hebrew entries ({len(self._kaikki_hebrew_index)} index keys)")
-            
-        except Exception as e:
-            logger.error(f"Failed to load kaikki.org Hebrew: {e}")
-            self._kaikki_hebrew_index = {}
-
-    def _load_kaikki_generic(self, language_name: str, path_attr: str, index_attr: str):
-        """Generic loader for kaikki.org dictionaries."""
-        if getattr(self, index_attr) is not None:
-            return
-
-        path = getattr(self, path_attr)
-        if not path.exists():
-            logger.warning(f"Kaikki.org {language_name} dictionary not found at {path}")
-            setattr(self, index_attr, {})
-            return
+    @staticmethod
+    def _fold_strongs(entries: List[Dict]) -> Dict[str, List[int]]:
+        """Index Strong's entries by accent-free lowercase word and transliteration."""
+        folds: Dict[str, List[int]] = {}
+        for position, entry in enumerate(entries):
+            keys = {
+                remove_accents(value.lower())
+                for value in (entry.get('word', ''), entry.get('translit', ''))
+                if value
+            }
+            for key in keys:
+                folds.setdefault(key, []).append(position)
+        return folds
+
+    def _kaikki_entry(self, data_path: Path, word: str, language_name: str,
+                      phonetic: bool = False) -> Optional[Dict]:
+        """Fetch one Kaikki entry dict from disk via the shared key store."""
+        if not data_path.exists():
+            logger.debug(f"Kaikki.org {language_name} data not found at {data_path}")
+            return None
 
         try:
-            index = {}
-            entry_count = 0
-            
-            with open(path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    try:
-                        data = json.loads(line)
-                        word = data.get('word', '')
-                        if not word:
-                            continue
-                        
-                        entry_count += 1
-                        
-                        # Index by exact Unicode
-                        index[word] = data
-                        
-                        # Also index lowercase
-                        word_lower = word.lower()
-                        if word_lower != word and word_lower not in index:
-                            index[word_lower] = data
-                        
-                        # Index without accents for fuzzy matching
-                        word_no_accents = remove_accents(word_lower)
-                        if word_no_accents != word_lower and word_no_accents not in index:
-                            index[word_no_accents] = data
-                        
-                        # Also index without hyphens (for compound words)
-                        word_no_hyphen = word_no_accents.replace('-', '')
-                        if word_no_hyphen != word_no_accents and word_no_hyphen not in index:
-                            index[word_no_hyphen] = data
-                        
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Invalid JSON at line {line_num}: {e}")
-                        continue
-            
-            setattr(self, index_attr, index)
-            logger.info(f"Loaded {entry_count} kaikki.org {language_name} entries ({len(index)} index keys)")
-            
-        except Exception as e:
-            logger.error(f"Failed to load kaikki.org {language_name}: {e}")
-            setattr(self, index_attr, {})
+            store = get_kaikki_store(self._kaikki_index_dir)
+            return store.lookup(data_path, query_keys(word, phonetic), phonetic)
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Kaikki.org {language_name} lookup failed: {e}")
+            return None
 
-    def _load_compact_index(self, language_name: str, index_path_attr: str, index_attr: str):
-        """Lazy-load compact index (key -> byte offset) for a language."""
-        if getattr(self, index_attr) is not None:
-            return
-
-        index_path = getattr(self, index_path_attr)
-        if not index_path.exists():
-            logger.warning(f"Compact index for {language_name} not found at {index_path}")
-            setattr(self, index_attr, {})
-            return
+    def _kaikki_entries(self, data_path: Path, words: List[str], language_name: str,
+                        phonetic: bool = False) -> Dict[str, Optional[Dict]]:
+        """Bulk form of ``_kaikki_entry``."""
+        if not words or not data_path.exists():
+            return {}
 
         try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                setattr(self, index_attr, json.load(f))
-        except Exception as e:
-            logger.error(f"Failed to load compact index for {language_name}: {e}")
-            setattr(self, index_attr, {})
-
-    def _query_compact_kaikki(self, word: str, language_name: str, index_path_attr: str, index_attr: str,
-                               data_path_attr: str, handle_attr: str) -> List[LexiconEntry]:
-        """Query compact Kaikki mini file via index + byte seek."""
-        self._load_compact_index(language_name, index_path_attr, index_attr)
-
-        index = getattr(self, index_attr, {})
-        if not index:
+            store = get_kaikki_store(self._kaikki_index_dir)
+            probes = {word: query_keys(word, phonetic) for word in words}
+            return store.lookup_many(data_path, probes, phonetic)
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Kaikki.org {language_name} bulk lookup failed: {e}")
+            return {}
+
+    def _query_compact_kaikki(self, word: str, language_name: str, data_path_attr: str) -> List[LexiconEntry]:
+        """Query a compact Kaikki mini file via the key store + byte seek."""
+        data = self._kaikki_entry(getattr(self, data_path_attr), word, language_name)
+        if not data:
             return []
 
-        data_path = getattr(self, data_path_attr)
-        if not data_path.exists():
-            return []
-
-        # Open handle lazily
-        handle = getattr(self, handle_attr)
-        if handle is None:
-            try:
-                handle = open(data_path, 'r', encoding='utf-8')
-                setattr(self, handle_attr, handle)
-            except Exception as e:
-                logger.error(f"Failed to open compact data file for {language_name}: {e}")
-                return []
-
-        word_lower = word.lower()
-        word_no_accents = remove_accents(word_lower)
-        word_no_hyphen = word_no_accents.replace('-', '')
-        search_variants = [word, word_lower, word_no_accents, word_no_hyphen]
-
-        # PIE/Wiktionary lemmas often omit leading asterisks; include starless variants.
-        expanded_variants = []
-        for variant in search_variants:
-            expanded_variants.append(variant)
-            stripped = variant.lstrip('*')
-            if stripped != variant:
-                expanded_variants.append(stripped)
-
-        # Preserve order but drop duplicates
-        seen = set()
-        deduped_variants = []
-        for v in expanded_variants:
-            if v in seen:
-                continue
-            seen.add(v)
-            deduped_variants.append(v)
-
-        for variant in deduped_variants:
-            offset = index.get(variant)
-            if offset is None:
-                continue
-            try:
-                handle.seek(offset)
-                line = handle.readline()
-                if not line:
-                    continue
-                data = json.loads(line)
-                lemma = data.get('word', word)
-                pos = data.get('pos', 'unknown')
-                romanization = data.get('romanization', '')
-                glosses = data.get('glosses', [])
-                definition = '; '.join(glosses[:8]) if glosses else ''
-                ety = data.get('etymology_text') or None
-                morphology = f"Part of speech: {pos}" if pos != 'unknown' else None
-                return [LexiconEntry(
-                    word=lemma,
-                    language=language_name,
-                    transliteration=romanization,
-                    definition=definition,
-                    etymology=ety,
-                    morphology=morphology,
-                    source="Kaikki.org Wiktionary (compact)"
-                )]
-            except Exception as e:
-                logger.error(f"Compact query failed for {language_name}: {e}")
-                continue
-
-        return []
-
-    def _load_kaikki_latin(self):
-        """Lazy-load kaikki.org Latin dictionary."""
-        self._load_kaikki_generic("Latin", "_kaikki_latin_path", "_kaikki_latin_index")
-
-    def _load_kaikki_english(self):
-        """Lazy-load kaikki.org English dictionary."""
-        self._load_kaikki_generic("English", "_kaikki_english_path", "_kaikki_english_index")
-
-    def _load_kaikki_sanskrit(self):
-        """Lazy-load kaikki.org Sanskrit dictionary."""
-        self._load_kaikki_generic("Sanskrit", "_kaikki_sanskrit_path", "_kaikki_sanskrit_index")
-
-    def _load_kaikki_aramaic(self):
-        """Lazy-load kaikki.org Aramaic dictionary."""
-        self._load_kaikki_generic("Aramaic", "_kaikki_aramaic_path", "_kaikki_aramaic_index")
-
-    def _load_kaikki_pie(self):
-        """Lazy-load kaikki.org Proto-Indo-European dictionary."""
-        self._load_kaikki_generic("Proto-Indo-European", "_kaikki_pie_path", "_kaikki_pie_index")
+        lemma = data.get('word', word)
+        pos = data.get('pos', 'unknown')
+        romanization = data.get('romanization', '')
+        glosses = data.get('glosses', [])
+        definition = '; '.join(glosses[:8]) if glosses else ''
+        ety = data.get('etymology_text') or None
+        morphology = f"Part of speech: {pos}" if pos != 'unknown' else None
+        return [LexiconEntry(
+            word=lemma,
+            language=language_name,
+            transliteration=romanization,
+            definition=definition,
+            etymology=ety,
+            morphology=morphology,
+            source="Kaikki.org Wiktionary (compact)"
+        )]
 
     def _load_lsj_cex(self):
         """Lazy-load LSJ CEX index into memory."""
@@ -653,8 +454,7 @@ class ClassicalLexiconService:
             return []
 
         results = []
-        word_normalized = word.strip()
-        word_lower = word_normalized.lower()
+        word_lower = word.strip().lower()
         word_no_accents = remove_accents(word_lower)
         
         # Special case: Greek letter names to single letters
@@ -670,44 +470,26 @@ class ClassicalLexiconService:
         # Check if user is searching for a letter name
         letter_to_search = letter_names.get(word_lower) or letter_names.get(word_no_accents)
 
-        for entry in self._strongs_greek:
-            # Match on Greek word or transliteration (case-insensitive, accent-insensitive)
-            match = False
-
-            entry_word = entry.get('word', '')
-            entry_translit = entry.get('translit', '')
-            
-            # NEW: Check if searching for a letter name
-            if letter_to_search and entry_word == letter_to_search:
-                match = True
-
-            # Try multiple matching strategies:
-            # 1. Exact match
-            if not match and entry_word and entry_word == word_normalized:
-                match = True
-            elif not match and entry_translit and entry_translit == word_normalized:
-                match = True
-            # 2. Case-insensitive match
-            elif not match and entry_word and entry_word.lower() == word_lower:
-                match = True
-            elif not match and entry_translit and entry_translit.lower() == word_lower:
-                match = True
-            # 3. Accent-insensitive match (for transliterations)
-            elif not match and entry_translit and remove_accents(entry_translit.lower()) == word_no_accents:
-                match = True
-            elif entry_word and remove_accents(entry_word.lower()) == word_no_accents:
-                match = True
-
-            if match:
-                results.append(LexiconEntry(
-                    word=entry.get('word', word),
-                    language="Greek",
-                    transliteration=entry.get('translit', ''),
-                    definition=entry.get('definition', ''),
-                    etymology=entry.get('derivation'),
-                    strong_number=entry.get('strongs'),
-                    source="Strong's"
-                ))
+        # Exact and case-insensitive matches are subsumed by the accent-free
+        # fold, so one dict probe replaces the scan over every entry.
+        positions = set(self._strongs_greek_folds.get(word_no_accents, ()))
+        if letter_to_search:
+            positions.update(
+                i for i in self._strongs_greek_folds.get(remove_accents(letter_to_search.lower()), ())
+                if self._strongs_greek[i].get('word', '') == letter_to_search
+            )
+
+        for position in sorted(positions):
+            entry = self._strongs_greek[position]
+            results.append(LexiconEntry(
+                word=entry.get('word', word),
+                language="Greek",
+                transliteration=entry.get('translit', ''),
+                definition=entry.get('definition', ''),
+                etymology=entry.get('derivation'),
+                strong_number=entry.get('strongs'),
+                source="Strong's"
+            ))
 
         return results
 
@@ -719,77 +501,27 @@ class ClassicalLexiconService:
             return []
 
         results = []
-        word_normalized = word.strip()
-        word_lower = word_normalized.lower()
+        word_lower = word.strip().lower()
         word_no_accents = remove_accents(word_lower)
 
-        for entry in self._strongs_hebrew:
-            # Match on Hebrew word or transliteration (with fuzzy matching)
-            match = False
-
-            entry_word = entry.get('word', '')
-            entry_translit = entry.get('translit', '')
-            
-            # Try multiple matching strategies:
-            # 1. Exact match
-            if not match and entry_word and entry_word == word_normalized:
-                match = True
-            elif not match and entry_translit and entry_translit == word_normalized:
-                match = True
-            # 2. Case-insensitive match
-            elif not match and entry_word and entry_word.lower() == word_lower:
-                match = True
-            elif not match and entry_translit and entry_translit.lower() == word_lower:
-                match = True
-            # 3. Accent-insensitive match (for vowel points)
-            elif not match and entry_translit and remove_accents(entry_translit.lower()) == word_no_accents:
-                match = True
-            elif entry_word and remove_accents(entry_word.lower()) == word_no_accents:
-                match = True
-
-            if match:
-                results.append(LexiconEntry(
-                    word=entry.get('word', word),
-                    language="Hebrew",
-                    transliteration=entry.get('translit', ''),
-                    definition=entry.get('definition', ''),
-                    etymology=entry.get('derivation'),
-                    strong_number=entry.get('strongs'),
-                    source="Strong's"
-                ))
+        # Exact and case-insensitive matches are subsumed by the accent-free
+        # fold, so one dict probe replaces the scan over every entry.
+        for position in self._strongs_hebrew_folds.get(word_no_accents, ()):
+            entry = self._strongs_hebrew[position]
+            results.append(LexiconEntry(
+                word=entry.get('word', word),
+                language="Hebrew",
+                transliteration=entry.get('translit', ''),
+                definition=entry.get('definition', ''),
+                etymology=entry.get('derivation'),
+                strong_number=entry.get('strongs'),
+                source="Strong's"
+            ))
 
         return results
 
-    def _query_kaikki(self, word: str) -> List[LexiconEntry]:
-        """Query kaikki.org Wiktionary for a Greek word."""
-        self._load_kaikki()
-        
-        if not self._kaikki_index:
-            return []
-        
-        # Try progressively fuzzier matches
-        word_lower = word.lower()
-        word_no_accents = remove_accents(word_lower)
-        word_no_hyphen = word_no_accents.replace('-', '')
-        word_phonetic = phonetic_normalize_greek(word_lower)
-        
-        search_variants = [
-            word,
-            word_lower,
-            word_no_accents,
-            word_no_hyphen,
-            word_phonetic  # NEW: handles βετα → βῆτα
-        ]
-        
-        entry_data = None
-        for variant in search_variants:
-            if variant in self._kaikki_index:
-                entry_data = self._kaikki_index[variant]
-                break
-        
-        if not entry_data:
-            return []
-        
+    def _kaikki_full_entry(self, entry_data: Dict, word: str, language_name: str) -> List[LexiconEntry]:
+        """Build a LexiconEntry from a full Kaikki (Wiktionary dump) entry."""
         # Extract data
         lemma = entry_data.get('word', word)
         pos = entry_data.get('pos', 'unknown')
@@ -823,7 +555,7 @@ class ClassicalLexiconService:
         
         return [LexiconEntry(
             word=lemma,
-            language="Ancient Greek",
+            language=language_name,
             transliteration=romanization,
             definition=definition,
             etymology=etymology_text if etymology_text else None,
@@ -831,199 +563,47 @@ class ClassicalLexiconService:
             source="Kaikki.org Wiktionary"
         )]
 
+    def _query_kaikki(self, word: str) -> List[LexiconEntry]:
+        """Query kaikki.org Wiktionary for a Greek word."""
+        # Phonetic keys handle vowel confusion (βετα → βῆτα)
+        entry_data = self._kaikki_entry(self._kaikki_path, word, "Ancient Greek", phonetic=True)
+        if not entry_data:
+            return []
+        return self._kaikki_full_entry(entry_data, word, "Ancient Greek")
+
     def _query_kaikki_hebrew(self, word: str) -> List[LexiconEntry]:
         """Query kaikki.org Wiktionary for a Hebrew word."""
-        self._load_kaikki_hebrew()
-        
-        if not self._kaikki_hebrew_index:
-            return []
-        
-        # Try progressively fuzzier matches
-        word_lower = word.lower()
-        word_no_accents = remove_accents(word_lower)
-        word_no_hyphen = word_no_accents.replace('-', '')
-        
-        search_variants = [
-            word,
-            word_lower,
-            word_no_accents,
-            word_no_hyphen
-        ]
-        
-        entry_data = None
-        for variant in search_variants:
-            if variant in self._kaikki_hebrew_index:
-                entry_data = self._kaikki_hebrew_index[variant]
-                break
-        
+        entry_data = self._kaikki_entry(self._kaikki_hebrew_path, word, "Hebrew")
         if not entry_data:
             return []
-        
-        # Extract data
-        lemma = entry_data.get('word', word)
-        pos = entry_data.get('pos', 'unknown')
-        
-        # Get romanization from forms if available
-        romanization = ""
-        forms = entry_data.get('forms', [])
-        for form in forms:
-            if 'romanization' in form.get('tags', []):
-                romanization = form.get('form', '')
-                break
-        if not romanization and forms:
-            # Try to get from first form
-            romanization = forms[0].get('romanization', '')
-        
-        # Extract glosses from senses
-        glosses = []
-        senses = entry_data.get('senses', [])
-        for sense in senses[:10]:  # Limit to first 10 senses
-            sense_glosses = sense.get('glosses', [])
-            if sense_glosses:
-                glosses.extend(sense_glosses)
-        
-        if not glosses:
-            return []
-        
-        definition = '; '.join(glosses[:8])  # Limit to first 8 glosses
-        
-        # Get etymology if available
-        etymology_text = entry_data.get('etymology_text', '')
-        
-        return [LexiconEntry(
-            word=lemma,
-            language="Hebrew",
-            transliteration=romanization,
-            definition=definition,
-            etymology=etymology_text if etymology_text else None,
-            morphology=f"Part of speech: {pos}" if pos != 'unknown' else None,
-            source="Kaikki.org Wiktionary"
-        )]
+        return self._kaikki_full_entry(entry_data, word, "Hebrew")
 
-    def _query_kaikki_generic(self, word: str, language_name: str, index_attr: str) -> List[LexiconEntry]:
-        """Generic query method for kaikki.org dictionaries."""
-        # Load the index dynamically
-        load_method_name = f"_load{index_attr.replace('_index', '')}"
-        if hasattr(self, load_method_name):
-            getattr(self, load_method_name)()
-        
-        index = getattr(self, index_attr, {})
-        if not index:
-            return []
-        
-        # Try progressively fuzzier matches
-        word_lower = word.lower()
-        word_no_accents = remove_accents(word_lower)
-        word_no_hyphen = word_no_accents.replace('-', '')
-        
-        search_variants = [word, word_lower, word_no_accents, word_no_hyphen]
-        
-        entry_data = None
-        for variant in search_variants:
-            if variant in index:
-                entry_data = index[variant]
-                break
-        
+    def _query_kaikki_generic(self, word: str, language_name: str, path_attr: str) -> List[LexiconEntry]:
+        """Generic query method for full kaikki.org dictionaries."""
+        entry_data = self._kaikki_entry(getattr(self, path_attr), word, language_name)
         if not entry_data:
             return []
-        
-        # Extract data
-        lemma = entry_data.get('word', word)
-        pos = entry_data.get('pos', 'unknown')
-        
-        # Get romanization from forms if available
-        romanization = ""
-        forms = entry_data.get('forms', [])
-        for form in forms:
-            if 'romanization' in form.get('tags', []):
-                romanization = form.get('form', '')
-                break
-        if not romanization and forms:
-            romanization = forms[0].get('romanization', '')
-        
-        # Extract glosses from senses
-        glosses = []
-        senses = entry_data.get('senses', [])
-        for sense in senses[:10]:
-            sense_glosses = sense.get('glosses', [])
-            if sense_glosses:
-                glosses.extend(sense_glosses)
-        
-        if not glosses:
-            return []
-        
-        definition = '; '.join(glosses[:8])
-        etymology_text = entry_data.get('etymology_text', '')
-        
-        return [LexiconEntry(
-            word=lemma,
-            language=language_name,
-            transliteration=romanization,
-            definition=definition,
-            etymology=etymology_text if etymology_text else None,
-            morphology=f"Part of speech: {pos}" if pos != 'unknown' else None,
-            source="Kaikki.org Wiktionary"
-        )]
+        return self._kaikki_full_entry(entry_data, word, language_name)
 
     def _query_kaikki_latin(self, word: str) -> List[LexiconEntry]:
         """Query kaikki.org Wiktionary for a Latin word."""
-        compact = self._query_compact_kaikki(
-            word,
-            "Latin",
-            "_kaikki_latin_compact_index_path",
-            "_kaikki_latin_compact_index",
-            "_kaikki_latin_compact_data_path",
-            "_kaikki_latin_compact_handle",
-        )
-        return compact
+        return self._query_compact_kaikki(word, "Latin", "_kaikki_latin_compact_data_path")
 
     def _query_kaikki_english(self, word: str) -> List[LexiconEntry]:
         """Query kaikki.org Wiktionary for an English word."""
-        compact = self._query_compact_kaikki(
-            word,
-            "English",
-            "_kaikki_english_compact_index_path",
-            "_kaikki_english_compact_index",
-            "_kaikki_english_compact_data_path",
-            "_kaikki_english_compact_handle",
-        )
-        return compact
+        return self._query_compact_kaikki(word, "English", "_kaikki_english_compact_data_path")
 
     def _query_kaikki_sanskrit(self, word: str) -> List[LexiconEntry]:
         """Query kaikki.org Wiktionary for a Sanskrit word."""
-        compact = self._query_compact_kaikki(
-            word,
-            "Sanskrit",
-            "_kaikki_sanskrit_compact_index_path",
-            "_kaikki_sanskrit_compact_index",
-            "_kaikki_sanskrit_compact_data_path",
-            "_kaikki_sanskrit_compact_handle",
-        )
-        return compact
+        return self._query_compact_kaikki(word, "Sanskrit", "_kaikki_sanskrit_compact_data_path")
 
     def _query_kaikki_aramaic(self, word: str) -> List[LexiconEntry]:
         """Query kaikki.org Wiktionary for an Aramaic word."""
-        compact = self._query_compact_kaikki(
-            word,
-            "Aramaic",
-            "_kaikki_aramaic_compact_index_path",
-            "_kaikki_aramaic_compact_index",
-            "_kaikki_aramaic_compact_data_path",
-            "_kaikki_aramaic_compact_handle",
-        )
-        return compact
+        return self._query_compact_kaikki(word, "Aramaic", "_kaikki_aramaic_compact_data_path")
 
     def _query_kaikki_pie(self, word: str) -> List[LexiconEntry]:
         """Query kaikki.org Wiktionary for a Proto-Indo-European root."""
-        compact = self._query_compact_kaikki(
-            word,
-            "Proto-Indo-European",
-            "_kaikki_pie_compact_index_path",
-            "_kaikki_pie_compact_index",
-            "_kaikki_pie_compact_data_path",
-            "_kaikki_pie_compact_handle",
-        )
-        return compact
+        return self._query_compact_kaikki(word, "Proto-Indo-European", "_kaikki_pie_compact_data_path")
 
     def _query_perseus_via_cex(self, word: str) -> List[LexiconEntry]:
         """Query Perseus LSJ using CEX index to get entry ID.
@@ -1156,11 +736,122 @@ class ClassicalLexiconService:
         
         return text
 
+    @property
+    def _perseus_index(self) -> PerseusOffsetIndex:
+        """Byte-offset index over the Perseus XML (built on first use)."""
+        if self._perseus_offset_index is None:
+            self._perseus_offset_index = PerseusOffsetIndex(
+                self._perseus_path,
+                self._kaikki_index_dir / "perseus_lsj-offsets.json",
+            )
+        return self._perseus_offset_index
+
+    def _perseus_index_ready(self) -> bool:
+        try:
+            return self._perseus_index.ensure_ready()
+        except Exception as e:
+            logger.warning(f"Perseus offset index unavailable, scanning XML instead: {e}")
+            return False
+
+    def _perseus_entry_free_result(self, elem, lemma: str) -> Optional[LexiconEntry]:
+        """Build a LexiconEntry from an <entryFree> element."""
+        definition_parts = []
+
+        # Get all sense elements (definitions)
+        for sense in elem.findall('.//{http://www.tei-c.org/ns/1.0}sense'):
+            sense_def = self._extract_sense_definition(sense)
+            if sense_def:
+                definition_parts.append(sense_def)
+
+        # Also try without namespace
+        if not definition_parts:
+            for sense in elem.findall('.//sense'):
+                sense_def = self._extract_sense_definition(sense)
+                if sense_def:
+                    definition_parts.append(sense_def)
+
+        if not definition_parts:
+            return None
+        return LexiconEntry(
+            word=lemma,
+            language="Ancient Greek",
+            transliteration="",
+            definition="; ".join(definition_parts[:5]),  # First 5 senses
+            etymology=None,
+            source="Perseus LSJ"
+        )
+
+    def _perseus_entry_result(self, elem) -> Optional[LexiconEntry]:
+        """Build a LexiconEntry from an <entry> element matched by key."""
+        definition_parts = []
+
+        for sense in elem.findall('.//{*}sense'):
+            sense_text = ''.join(sense.itertext()).strip()
+            if sense_text:
+                definition_parts.append(sense_text)
+
+        if not definition_parts:
+            return None
+        return LexiconEntry(
+            word=elem.get('key', ''),
+            language="Greek",
+            transliteration="",  # LSJ uses Greek script
+            definition="; ".join(definition_parts[:3]),  # First 3 senses
+            etymology=None,
+            source="Perseus LSJ"
+        )
+
     def _query_perseus_by_id(self, entry_id: str, lemma: str) -> List[LexiconEntry]:
-        """Query Perseus LSJ by entry ID for fast lookup."""
+        """Query Perseus LSJ by entry ID (seek via the offset index)."""
+        if not self._perseus_path.exists():
+            return []
+
+        if not self._perseus_index_ready():
+            return self._scan_perseus_by_id(entry_id, lemma)
+
+        try:
+            span = self._perseus_index.span_for_id(entry_id)
+            if span is None:
+                return []
+            elem = self._perseus_index.read_entry(span)
+            if elem is None:
+                return []
+            result = self._perseus_entry_free_result(elem, lemma)
+            return [result] if result else []
+        except Exception as e:
+            logger.debug(f"Perseus query failed for entry_id '{entry_id}': {e}")
+            return []
+
+    def _query_perseus(self, word: str) -> List[LexiconEntry]:
+        """Query Perseus Liddell-Scott lexicon by lemma (seek via the offset index)."""
         if not self._perseus_path.exists():
             return []
 
+        if not self._perseus_index_ready():
+            return self._scan_perseus(word)
+
+        try:
+            word_lower = word.lower().strip()
+            results = []
+            for span in self._perseus_index.spans_for_lemma(word_lower):
+                elem = self._perseus_index.read_entry(span)
+                # Only <entry> elements match by key, as in the streamed scan
+                if elem is None or not elem.tag.endswith('entry'):
+                    continue
+                if elem.get('key', '').lower() != word_lower:
+                    continue
+                result = self._perseus_entry_result(elem)
+                if result:
+                    results.append(result)
+                if len(results) >= 3:
+                    break
+            return results
+        except Exception as e:
+            logger.debug(f"Perseus query failed for '{word}': {e}")
+            return []
+
+    def _scan_perseus_by_id(self, entry_id: str, lemma: str) -> List[LexiconEntry]:
+        """Fallback: stream the whole XML until the entry ID turns up."""
         try:
             results = []
             
@@ -1173,31 +864,9 @@ class ClassicalLexiconService:
                     elem_id = elem.get('id', '')
                     
                     if elem_id == entry_id:
-                        # Found it! Extract definition
-                        definition_parts = []
-
-                        # Get all sense elements (definitions)
-                        for sense in elem.findall('.//{http://www.tei-c.org/ns/1.0}sense'):
-                            sense_def = self._extract_sense_definition(sense)
-                            if sense_def:
-                                definition_parts.append(sense_def)
-                        
-                        # Also try without namespace
-                        if not definition_parts:
-                            for sense in elem.findall('.//sense'):
-                                sense_def = self._extract_sense_definition(sense)
-                                if sense_def:
-                                    definition_parts.append(sense_def)
-
-                        if definition_parts:
-                            results.append(LexiconEntry(
-                                word=lemma,
-                                language="Ancient Greek",
-                                transliteration="",
-                                definition="; ".join(definition_parts[:5]),  # First 5 senses
-                                etymology=None,
-                                source="Perseus LSJ"
-                            ))
+                        result = self._perseus_entry_free_result(elem, lemma)
+                        if result:
+                            results.append(result)
                         
                         # Clear element and stop searching
                         elem.clear()
@@ -1212,11 +881,8 @@ class ClassicalLexiconService:
             logger.debug(f"Perseus query failed for entry_id '{entry_id}': {e}")
             return []
 
-    def _query_perseus(self, word: str) -> List[LexiconEntry]:
-        """Query Perseus Liddell-Scott lexicon (streaming XML parse)."""
-        if not self._perseus_path.exists():
-            return []
-
+    def _scan_perseus(self, word: str) -> List[LexiconEntry]:
+        """Fallback: stream the whole XML matching <entry key=...>."""
         try:
             # Stream parse XML to avoid loading 30MB into memory
             results = []
@@ -1231,23 +897,9 @@ class ClassicalLexiconService:
                     key = elem.get('key', '')
 
                     if key.lower() == word_lower:
-                        # Found match - extract definition
-                        definition_parts = []
-
-                        for sense in elem.findall('.//{*}sense'):
-                            sense_text = ''.join(sense.itertext()).strip()
-                            if sense_text:
-                                definition_parts.append(sense_text)
-
-                        if definition_parts:
-                            results.append(LexiconEntry(
-                                word=key,
-                                language="Greek",
-                                transliteration="",  # LSJ uses Greek script
-                                definition="; ".join(definition_parts[:3]),  # First 3 senses
-                                etymology=None,
-                                source="Perseus LSJ"
-                            ))
+                        result = self._perseus_entry_result(elem)
+                        if result:
+                            results.append(result)
 
                     # Clear element to free memory
                     elem.clear()
@@ -19,10 +19,12 @@ without requiring manual method creation for each one.
 
 import json
 import logging
+import sqlite3
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 
+from .kaikki_store import close_kaikki_stores, get_kaikki_store, query_keys
 from .language_config import (
     LANGUAGE_CONFIGS,
     LanguageConfig,
@@ -68,9 +70,6 @@ class ComprehensiveLexiconService:
         self.data_dir = data_dir
         self.index_dir = data_dir / "indexes"
 
-        # Lazy-loaded indexes and file handles (keyed by language slug)
-        self._compact_indexes: Dict[str, Optional[Dict[str, int]]] = {}
-        self._compact_handles: Dict[str, Optional[Any]] = {}
 
         # Strong's dictionaries (legacy support)
         self._strongs_greek: Optional[List[Dict]] = None
@@ -105,6 +104,48 @@ class ComprehensiveLexiconService:
 
         return results
 
+    def lookup_many(self, words: List[str], language: str) -> Dict[str, List[LexiconEntry]]:
+        """
+        Look up many words in one language with batched index probes.
+
+        Args:
+            words: Words to look up (duplicates are resolved once)
+            language: Language name
+
+        Returns:
+            Dict mapping each word to its entries (same as ``lookup``)
+        """
+        lang_config = get_language_by_name(language)
+        if not lang_config:
+            logger.warning(f"Unknown language: {language}")
+            return {word: [] for word in words}
+
+        unique = list(dict.fromkeys(words))
+        results: Dict[str, List[LexiconEntry]] = {word: [] for word in unique}
+        data_path = self._compact_data_path(lang_config)
+        if data_path.exists():
+            try:
+                probes = {word: query_keys(word) for word in unique}
+                found = get_kaikki_store(self.index_dir).lookup_many(data_path, probes)
+            except (sqlite3.Error, OSError) as e:
+                logger.error(f"Compact bulk query failed for {lang_config.name}: {e}")
+                found = {}
+            for word, data in found.items():
+                if data:
+                    results[word] = [self._compact_entry(data, word, lang_config)]
+
+        # Fallback to Strong's for Hebrew/Greek if available
+        if language.lower() in ["hebrew", "greek", "ancient greek"]:
+            for word in unique:
+                if results[word]:
+                    continue
+                if "hebrew" in language.lower():
+                    results[word] = self._query_strongs_hebrew(word)
+                else:
+                    results[word] = self._query_strongs_greek(word)
+
+        return results
+
     def lookup_multi_language(self, word: str, languages: List[str]) -> Dict[str, List[LexiconEntry]]:
         """
         Look up a word across multiple languages.
@@ -146,120 +187,45 @@ class ComprehensiveLexiconService:
 
         return results
 
-    def _load_compact_index(self, lang_config: LanguageConfig) -> bool:
-        """Lazy-load compact index for a language."""
-        slug = lang_config.slug
-
-        # Already attempted to load
-        if slug in self._compact_indexes:
-            return self._compact_indexes[slug] is not None
-
-        index_path = self.index_dir / f"{get_index_filename_base(lang_config)}-index.json"
-
-        if not index_path.exists():
-            logger.debug(f"No index for {lang_config.name} at {index_path}")
-            self._compact_indexes[slug] = None
-            return False
-
-        try:
-            with open(index_path, 'r', encoding='utf-8') as f:
-                self._compact_indexes[slug] = json.load(f)
-            logger.debug(f"Loaded index for {lang_config.name}: {len(self._compact_indexes[slug])} keys")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to load index for {lang_config.name}: {e}")
-            self._compact_indexes[slug] = None
-            return False
-
-    def _get_compact_handle(self, lang_config: LanguageConfig) -> Optional[Any]:
-        """Get or create file handle for compact data file."""
-        slug = lang_config.slug
-
-        # Already have handle
-        if slug in self._compact_handles:
-            return self._compact_handles[slug]
-
-        data_path = self.index_dir / f"{get_index_filename_base(lang_config)}-mini.jsonl"
+    def _compact_data_path(self, lang_config: LanguageConfig) -> Path:
+        return self.index_dir / f"{get_index_filename_base(lang_config)}-mini.jsonl"
 
+    def _query_compact(self, word: str, lang_config: LanguageConfig) -> List[LexiconEntry]:
+        """Query the compact data file for a language via the key store."""
+        data_path = self._compact_data_path(lang_config)
         if not data_path.exists():
             logger.debug(f"No mini data for {lang_config.name} at {data_path}")
-            self._compact_handles[slug] = None
-            return None
-
-        try:
-            handle = open(data_path, 'r', encoding='utf-8')
-            self._compact_handles[slug] = handle
-            return handle
-        except Exception as e:
-            logger.error(f"Failed to open data file for {lang_config.name}: {e}")
-            self._compact_handles[slug] = None
-            return None
-
-    def _query_compact(self, word: str, lang_config: LanguageConfig) -> List[LexiconEntry]:
-        """Query compact index/data files for a language."""
-        # Load index
-        if not self._load_compact_index(lang_config):
             return []
 
-        index = self._compact_indexes[lang_config.slug]
-        if not index:
+        try:
+            data = get_kaikki_store(self.index_dir).lookup(data_path, query_keys(word))
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f"Compact query failed for {lang_config.name}: {e}")
             return []
-
-        # Get file handle
-        handle = self._get_compact_handle(lang_config)
-        if not handle:
+        if not data:
             return []
-
-        # Try multiple search variants
-        from .classical_lexicon_service import remove_accents
-
-        word_lower = word.lower()
-        word_no_accents = remove_accents(word_lower)
-        word_no_hyphen = word_no_accents.replace('-', '')
-
-        # For PIE, also try without leading asterisk
-        search_variants = [word, word_lower, word_no_accents, word_no_hyphen]
-        if word.startswith('*'):
-            search_variants.append(word[1:])
-            search_variants.append(word[1:].lower())
-
-        # Try each variant
-        for variant in search_variants:
-            offset = index.get(variant)
-            if offset is None:
-                continue
-
-            try:
-                handle.seek(offset)
-                line = handle.readline()
-                if not line:
-                    continue
-
-                data = json.loads(line)
-
-                # Extract entry data
-                lemma = data.get('word', word)
-                romanization = data.get('romanization', '')
-                glosses = data.get('glosses', [])
-                definition = '; '.join(glosses[:8]) if glosses else ''
-                etymology_text = data.get('etymology_text') or None
-                pos = data.get('pos', 'unknown')
-                morphology = f"Part of speech: {pos}" if pos != 'unknown' else None
-
-                return [LexiconEntry(
-                    word=lemma,
-                    language=lang_config.name,
-                    transliteration=romanization,
-                    definition=definition,
-                    etymology=etymology_text,
-                    morphology=morphology,
-                    source="Kaikki.org Wiktionary (compact)"
-                )]
-            except Exception as e:
-                logger.error(f"Compact query failed for {lang_config.name}: {e}")
-                continue
-
-        return []
+        return [self._compact_entry(data, word, lang_config)]
+
+    @staticmethod
+    def _compact_entry(data: Dict[str, Any], word: str, lang_config: LanguageConfig) -> LexiconEntry:
+        """Build a LexiconEntry from a compact mini-file row."""
+        lemma = data.get('word', word)
+        romanization = data.get('romanization', '')
+        glosses = data.get('glosses', [])
+        definition = '; '.join(glosses[:8]) if glosses else ''
+        etymology_text = data.get('etymology_text') or None
+        pos = data.get('pos', 'unknown')
+        morphology = f"Part of speech: {pos}" if pos != 'unknown' else None
+
+        return LexiconEntry(
+            word=lemma,
+            language=lang_config.name,
+            transliteration=romanization,
+            definition=definition,
+            etymology=etymology_text,
+            morphology=morphology,
+            source="Kaikki.org Wiktionary (compact)"
+        )
 
     def _load_strongs_greek(self):
         """Lazy-load Strong's Greek dictionary."""
@@ -364,10 +330,7 @@ class ComprehensiveLexiconService:
         available = []
 
         for lang_config in LANGUAGE_CONFIGS:
-            index_path = self.index_dir / f"{get_index_filename_base(lang_config)}-index.json"
-            data_path = self.index_dir / f"{get_index_filename_base(lang_config)}-mini.jsonl"
-
-            if index_path.exists() and data_path.exists():
+            if self._compact_data_path(lang_config).exists():
                 available.append(lang_config.name)
 
         return available
@@ -392,34 +355,16 @@ class ComprehensiveLexiconService:
 
     def clear_caches(self):
         """
-        Clear all loaded indexes and close file handles to free memory.
+        Close the shared lexicon stores and drop loaded dictionaries.
 
-        This is useful when memory usage is high and you want to explicitly
-        free up the loaded lexicon indexes (which can be 37MB+ for English).
+        Key lookups are on disk, so this only releases open data files and
+        SQLite connections (they reopen on the next lookup) and the Strong's
+        dictionaries.
         """
-        # Close all file handles
-        for handle in self._compact_handles.values():
-            if handle:
-                try:
-                    handle.close()
-                except:
-                    pass
-
-        # Clear caches
-        self._compact_indexes.clear()
-        self._compact_handles.clear()
+        close_kaikki_stores()
 
         # Clear Strong's dictionaries
         self._strongs_greek = None
         self._strongs_hebrew = None
 
         logger.debug("Cleared all lexicon caches and closed file handles")
-
-    def __del__(self):
-        """Cleanup: close all open file handles."""
-        for handle in self._compact_handles.values():
-            if handle:
-                try:
-                    handle.close()
-                except:
-                    pass
\ No newline at end of file
@@ -17,9 +17,10 @@ Indexes words from curated document verses into the TQ Lexicon concordance,
 enabling Strong's-style word lookup and cross-referencing across texts.
 """
 
+import hashlib
 import re
 import logging
-from typing import List, Dict, Optional, Tuple, Callable, Any, Sequence
+from typing import List, Dict, Optional, Tuple, Callable, Any, Sequence, Collection
 from dataclasses import dataclass, field
 
 from shared.repositories.lexicon.key_database import KeyDatabase
@@ -28,6 +29,115 @@ from shared.services.gematria.tq_calculator import TQGematriaCalculator
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_PATTERN = re.compile(r'\b(\w+)\b', re.UNICODE)
+
+
+def tokenize_text(
+    text: str,
+    ignored_words: Collection[str],
+    stop_words: Collection[str],
+    min_length: int,
+) -> List[Tuple[str, int, str]]:
+    """
+    Tokenize text into words with positions.
+    
+    Module-level so indexing worker processes can use it without a database.
+    
+    Returns: List of (normalized_word, position, original_form)
+    """
+    # \w matches Unicode word characters including all alphabets
+    tokens = []
+    
+    for position, match in enumerate(_TOKEN_PATTERN.finditer(text)):
+        original = match.group(1)
+        normalized = original.lower()
+        
+        # Skip if too short
+        if len(normalized) < min_length:
+            continue
+            
+        # Skip stop words (English only - don't filter non-English)
+        if normalized in stop_words and normalized.isascii():
+            continue
+            
+        # Skip ignored words
+        if normalized in ignored_words:
+            continue
+            
+        tokens.append((normalized, position, original))
+        
+    return tokens
+
+
+def create_context_snippet(text: str, word: str, max_context: int = 60) -> str:
+    """
+    Create a KWIC (Key Word In Context) snippet.
+    Highlights the target word with uppercase.
+    """
+    # Find word in text (case-insensitive)
+    pattern = re.compile(rf'\b{re.escape(word)}\b', re.IGNORECASE)
+    match = pattern.search(text)
+    
+    if not match:
+        return text[:max_context] + "..." if len(text) > max_context else text
+        
+    start = match.start()
+    end = match.end()
+    
+    # Calculate context window
+    ctx_start = max(0, start - max_context // 2)
+    ctx_end = min(len(text), end + max_context // 2)
+    
+    # Build snippet
+    prefix = "..." if ctx_start > 0 else ""
+    suffix = "..." if ctx_end < len(text) else ""
+    
+    snippet = text[ctx_start:start] + word.upper() + text[end:ctx_end]
+    return prefix + snippet.strip() + suffix
+
+
+def verse_checkpoint(verse: Dict) -> Tuple[str, Optional[int], Optional[int], str]:
+    """
+    Checkpoint identity of a verse: (verse_key, verse_id, verse_number, text_hash).
+    
+    Verses are keyed by id when they have one, else by number; the hash of
+    their text tells a reindex whether the verse changed.
+    """
+    verse_id = verse.get('id')
+    verse_number = verse.get('verse_number') or verse.get('number')
+    key = f"id:{verse_id}" if verse_id is not None else f"n:{verse_number}"
+    text_hash = hashlib.sha1(verse.get('text', '').encode('utf-8')).hexdigest()
+    return key, verse_id, verse_number, text_hash
+
+
+def load_teacher_verses(document_id: int) -> Optional[Tuple[str, List[Dict]]]:
+    """
+    (title, non-ignored verses) from the VerseTeacher system, or None if missing.
+    
+    Parses the document when it has no curated verses yet. Module-level, with
+    its own session, so indexing worker processes can run it.
+    """
+    from shared.database import get_db_session
+    from shared.services.document_manager.verse_teacher_service import VerseTeacherService
+    from shared.repositories.document_manager.document_repository import DocumentRepository
+    
+    with get_db_session() as db:
+        document = DocumentRepository(db).get(document_id)
+        if not document:
+            return None
+        
+        result = VerseTeacherService(db).get_or_parse_verses(document_id)
+        verses = [
+            {
+                'id': v.get('id'),
+                'verse_number': v.get('number') or v.get('verse_number'),
+                'text': v.get('text', '')
+            }
+            for v in result.get('verses', [])
+            if v.get('status', 'auto') != 'ignored'
+        ]
+        return document.title, verses
+
 
 @dataclass
 class IndexingResult:
@@ -91,6 +201,9 @@ class ConcordanceIndexerService:
     # Minimum word length to index
     MIN_WORD_LENGTH = 2
     
+    # Occurrences buffered before each bulk insert
+    OCCURRENCE_BATCH_SIZE = 5000
+    
     def __init__(self, db_path: Optional[str] = None):
         self.db = KeyDatabase(db_path)
         self.calculator = TQGematriaCalculator()
@@ -331,56 +444,14 @@ class ConcordanceIndexerService:
         
         Returns: List of (normalized_word, position, original_form)
         """
-        # Match word tokens - UNICODE AWARE for Greek, Hebrew, Arabic, etc.
-        # \w matches Unicode word characters including all alphabets
-        pattern = re.compile(r'\b(\w+)\b', re.UNICODE)
-        tokens = []
-        
-        for position, match in enumerate(pattern.finditer(text)):
-            original = match.group(1)
-            normalized = original.lower()
-            
-            # Skip if too short
-            if len(normalized) < self.MIN_WORD_LENGTH:
-                continue
-                
-            # Skip stop words (English only - don't filter non-English)
-            if normalized in self.STOP_WORDS and normalized.isascii():
-                continue
-                
-            # Skip ignored words
-            if normalized in self._get_ignored_words():
-                continue
-                
-            tokens.append((normalized, position, original))
-            
-        return tokens
+        return tokenize_text(text, self._get_ignored_words(), self.STOP_WORDS, self.MIN_WORD_LENGTH)
     
     def _create_context_snippet(self, text: str, word: str, max_context: int = 60) -> str:
         """
         Create a KWIC (Key Word In Context) snippet.
         Highlights the target word with uppercase.
         """
-        # Find word in text (case-insensitive)
-        pattern = re.compile(rf'\b{re.escape(word)}\b', re.IGNORECASE)
-        match = pattern.search(text)
-        
-        if not match:
-            return text[:max_context] + "..." if len(text) > max_context else text
-            
-        start = match.start()
-        end = match.end()
-        
-        # Calculate context window
-        ctx_start = max(0, start - max_context // 2)
-        ctx_end = min(len(text), end + max_context // 2)
-        
-        # Build snippet
-        prefix = "..." if ctx_start > 0 else ""
-        suffix = "..." if ctx_end < len(text) else ""
-        
-        snippet = text[ctx_start:start] + word.upper() + text[end:ctx_end]
-        return prefix + snippet.strip() + suffix
+        return create_context_snippet(text, word, max_context)
     
     def index_document(
         self,
@@ -404,15 +475,10 @@ class ConcordanceIndexerService:
             IndexingResult with statistics
         """
         errors = []
-        new_keys = 0
         occurrences = 0
         total_words = 0
         
-        # Clear existing if reindexing
-        if reindex:
-            cleared = self.db.clear_document_occurrences(document_id)
-            logger.info(f"Cleared {cleared} existing occurrences for document {document_id}")
-        elif self.db.is_document_indexed(document_id):
+        if not reindex and self.db.is_document_indexed(document_id):
             # Already indexed and not reindexing
             return IndexingResult(
                 document_id=document_id,
@@ -425,60 +491,65 @@ class ConcordanceIndexerService:
             )
         
         total_verses = len(verses)
-        
-        for i, verse in enumerate(verses):
-            verse_id = verse.get('id')
-            verse_number = verse.get('verse_number') or verse.get('number')
-            verse_text = verse.get('text', '')
-            
-            if not verse_text:
-                continue
-                
-            if progress_callback:
-                progress_callback(i + 1, total_verses, f"Indexing verse {verse_number}")
+        tq_cache: Dict[str, int] = {}
+        checkpoints: List[Tuple[str, Optional[int], Optional[int], str]] = []
+        # Occurrence rows keyed by word until the batch is flushed
+        pending: List[Tuple[str, int, str, Optional[int], Optional[int], int, str, str]] = []
+        
+        # One transaction for the whole document: word ids are resolved in
+        # bulk, occurrences go in with executemany and frequencies are
+        # recomputed once when the session closes.
+        with self.db.session() as session:
+            if reindex:
+                cleared = session.clear_document_occurrences(document_id)
+                logger.info(f"Cleared {cleared} existing occurrences for document {document_id}")
             
-            # Tokenize verse text
-            tokens = self._tokenize_text(verse_text)
+            def flush() -> int:
+                ids = session.ensure_words({row[0]: tq_cache[row[0]] for row in pending})
+                rows = [(ids[row[0]],) + row[1:] for row in pending]
+                pending.clear()
+                return session.add_occurrences(rows)
             
-            for normalized, position, original in tokens:
-                total_words += 1
+            for i, verse in enumerate(verses):
+                verse_id = verse.get('id')
+                verse_number = verse.get('verse_number') or verse.get('number')
+                verse_text = verse.get('text', '')
                 
-                try:
-                    # Calculate TQ value (Standard TQ)
-                    tq_value = self.calculator.calculate(normalized)
-                    
-                    # Add to master_key (or get existing ID and update TQ value)
-                    existing_id = self.db.get_id_by_word(normalized)
-                    if existing_id is None:
-                        key_id = self.db.add_word(normalized, tq_value)
-                        new_keys += 1
-                    else:
-                        key_id = existing_id
-                        # Always update TQ value to ensure standard TQ is used
-                        self.db.update_tq_value(key_id, tq_value)
+                if not verse_text:
+                    continue
                     
-                    # Create context snippet
-                    context = self._create_context_snippet(verse_text, normalized)
-                    
-                    # Add word occurrence
-                    occ_id = self.db.add_word_occurrence(
-                        key_id=key_id,
-                        document_id=document_id,
-                        document_title=document_title,
-                        verse_id=verse_id,
-                        verse_number=verse_number,
-                        word_position=position,
-                        original_form=original,
-                        context_snippet=context
-                    )
+                if progress_callback:
+                    progress_callback(i + 1, total_verses, f"Indexing verse {verse_number}")
+                
+                # Tokenize verse text
+                tokens = self._tokenize_text(verse_text)
+                
+                for normalized, position, original in tokens:
+                    total_words += 1
                     
-                    if occ_id is not None:
-                        occurrences += 1
+                    try:
+                        if normalized not in tq_cache:
+                            # Calculate TQ value (Standard TQ)
+                            tq_cache[normalized] = self.calculator.calculate(normalized)
                         
-                except Exception as e:
-                    error_msg = f"Error indexing '{normalized}' in verse {verse_number}: {e}"
-                    errors.append(error_msg)
-                    logger.warning(error_msg)
+                        context = self._create_context_snippet(verse_text, normalized)
+                        pending.append((
+                            normalized, document_id, document_title, verse_id,
+                            verse_number, position, original, context
+                        ))
+                    except Exception as e:
+                        error_msg = f"Error indexing '{normalized}' in verse {verse_number}: {e}"
+                        errors.append(error_msg)
+                        logger.warning(error_msg)
+                
+                checkpoints.append(verse_checkpoint(verse))
+                if len(pending) >= self.OCCURRENCE_BATCH_SIZE:
+                    occurrences += flush()
+            
+            occurrences += flush()
+            session.record_verses(document_id, checkpoints)
+            session.mark_document_complete(document_id, document_title, total_verses)
+            new_keys = session.new_keys
         
         logger.info(
             f"Indexed document '{document_title}': "
@@ -506,64 +577,67 @@ class ConcordanceIndexerService:
         
         This is the primary entry point for indexing holy books.
         """
-        from shared.database import get_db_session
-        from shared.services.document_manager.verse_teacher_service import VerseTeacherService
-        from shared.repositories.document_manager.document_repository import DocumentRepository
+        loaded = self._load_teacher_verses(document_id)
+        if loaded is None:
+            return IndexingResult(
+                document_id=document_id,
+                document_title="Unknown",
+                total_verses=0,
+                total_words=0,
+                new_keys_added=0,
+                occurrences_added=0,
+                errors=[f"Document {document_id} not found"]
+            )
         
-        with get_db_session() as db:
-            # Get document info
-            doc_repo = DocumentRepository(db)
-            document = doc_repo.get(document_id)
-            
-            if not document:
-                return IndexingResult(
-                    document_id=document_id,
-                    document_title="Unknown",
-                    total_verses=0,
-                    total_words=0,
-                    new_keys_added=0,
-                    occurrences_added=0,
-                    errors=[f"Document {document_id} not found"]
-                )
-            
-            # Get curated verses (excluding ignored ones)
-            verse_service = VerseTeacherService(db)
-            result = verse_service.get_or_parse_verses(document_id)
-            all_verses = result.get('verses', [])
-            
-            # Filter out ignored verses - they should not be indexed
-            verses = [
-                v for v in all_verses 
-                if v.get('status', 'auto') != 'ignored'
-            ]
-            
-            if not verses:
-                return IndexingResult(
-                    document_id=document_id,
-                    document_title=document.title,
-                    total_verses=0,
-                    total_words=0,
-                    new_keys_added=0,
-                    occurrences_added=0,
-                    errors=["No verses found. Parse the document first with Verse Teacher."]
-                )
-            
-            # Convert verse format if needed
-            formatted_verses = []
-            for v in verses:
-                formatted_verses.append({
-                    'id': v.get('id'),
-                    'verse_number': v.get('number') or v.get('verse_number'),
-                    'text': v.get('text', '')
-                })
-            
-            return self.index_document(
+        title, verses = loaded
+        if not verses:
+            return IndexingResult(
                 document_id=document_id,
-                document_title=document.title,
-                verses=formatted_verses,
-                progress_callback=progress_callback,
-                reindex=reindex
+                document_title=title,
+                total_verses=0,
+                total_words=0,
+                new_keys_added=0,
+                occurrences_added=0,
+                errors=["No verses found. Parse the document first with Verse Teacher."]
             )
+        
+        return self.index_document(
+            document_id=document_id,
+            document_title=title,
+            verses=verses,
+            progress_callback=progress_callback,
+            reindex=reindex
+        )
+    
+    def index_documents(
+        self,
+        document_ids: Sequence[int],
+        reindex: bool = False,
+        workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> List[IndexingResult]:
+        """
+        Parse and index many documents' curated verses as one parallel, resumable job.
+        
+        Verse parsing, tokenizing and TQ values all run in the job's process
+        pool. Rerunning after an interruption continues from the last
+        committed verse range. With reindex=True only verses whose text
+        changed since they were indexed are touched.
+        
+        Args:
+            document_ids: Documents to index
+            reindex: Re-index changed verses of already indexed documents
+            workers: Worker processes (None = one per spare CPU, 0 = inline)
+            progress_callback: Optional (current, total, message) callback
+        """
+        from shared.services.lexicon.concordance_indexing_job import ConcordanceIndexingJob
+        
+        job = ConcordanceIndexingJob(self.db.db_path, workers=workers, reindex=reindex)
+        return job.run_documents(document_ids, progress_callback)
+    
+    def _load_teacher_verses(self, document_id: int) -> Optional[Tuple[str, List[Dict]]]:
+        """(title, non-ignored verses) from the VerseTeacher system, or None if missing."""
+        return load_teacher_verses(document_id)
     
     def get_word_references(self, key_id: int) -> List[Dict]:
         """
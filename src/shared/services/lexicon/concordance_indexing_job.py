@@ -0,0 +1,416 @@
+"""
+Parallel, resumable concordance indexing across many documents.
+
+SHARED JUSTIFICATION:
+- RATIONALE: Core Infrastructure (bulk path of ConcordanceIndexerService)
+- USED BY: Gematria, Tq_lexicon (via ConcordanceIndexerService and the Reindex All action)
+- CRITERION: 2 (Essential for app to function)
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+from shared.repositories.lexicon.key_database import KeyDatabase
+from shared.services.lexicon.concordance_indexer_service import (
+    ConcordanceIndexerService,
+    IndexingResult,
+    create_context_snippet,
+    load_teacher_verses,
+    tokenize_text,
+    verse_checkpoint,
+)
+
+logger = logging.getLogger(__name__)
+
+# Verses per work unit; each range is one transaction and one checkpoint
+DEFAULT_RANGE_SIZE = 250
+
+Checkpoint = Tuple[str, Optional[int], Optional[int], str]
+
+
+@dataclass
+class DocumentVerses:
+    """The verses of one document, as handed to the job."""
+    document_id: int
+    document_title: str
+    verses: List[Dict]
+
+
+@dataclass
+class PreparedVerse:
+    """A tokenized verse: its checkpoint and (word, position, original, context) rows."""
+    checkpoint: Checkpoint
+    rows: List[Tuple[str, int, str, str]]
+
+
+@dataclass
+class PreparedRange:
+    """Worker output for one verse range."""
+    verses: List[PreparedVerse]
+    tq_values: Dict[str, int]
+    total_words: int
+    errors: List[str] = field(default_factory=list)
+
+
+# --- worker side ---
+
+_worker_ignored: FrozenSet[str] = frozenset()
+_calculator = None
+
+
+def _get_calculator():
+    global _calculator
+    if _calculator is None:
+        from shared.services.gematria.tq_calculator import TQGematriaCalculator
+        _calculator = TQGematriaCalculator()
+    return _calculator
+
+
+def prepare_range(verses: List[Dict], ignored_words: FrozenSet[str]) -> PreparedRange:
+    """
+    Tokenize a verse range and compute TQ values; touches no database.
+
+    Runs in the worker processes (or inline when the job has no pool).
+    """
+    calculator = _get_calculator()
+    prepared = PreparedRange(verses=[], tq_values={}, total_words=0)
+
+    for verse in verses:
+        text = verse.get('text', '') or ''
+        verse_number = verse.get('verse_number') or verse.get('number')
+        rows = []
+        for normalized, position, original in tokenize_text(
+            text,
+            ignored_words,
+            ConcordanceIndexerService.STOP_WORDS,
+            ConcordanceIndexerService.MIN_WORD_LENGTH,
+        ):
+            prepared.total_words += 1
+            try:
+                if normalized not in prepared.tq_values:
+                    prepared.tq_values[normalized] = calculator.calculate(normalized)
+                rows.append((normalized, position, original, create_context_snippet(text, normalized)))
+            except Exception as e:
+                prepared.errors.append(f"Error indexing '{normalized}' in verse {verse_number}: {e}")
+        prepared.verses.append(PreparedVerse(checkpoint=verse_checkpoint(verse), rows=rows))
+
+    return prepared
+
+
+def _init_worker(ignored_words: FrozenSet[str]) -> None:
+    global _worker_ignored
+    _worker_ignored = ignored_words
+
+
+def _prepare_in_worker(verses: List[Dict]) -> PreparedRange:
+    return prepare_range(verses, _worker_ignored)
+
+
+def _load_in_worker(document_id: int) -> Optional[Tuple[str, List[Dict]]]:
+    return load_teacher_verses(document_id)
+
+
+# --- writer side ---
+
+@dataclass
+class _DocumentPlan:
+    document: DocumentVerses
+    result: IndexingResult
+    # verse_key -> (old verse_id, old verse_number) for verses whose text changed
+    stale: Dict[str, Tuple[Optional[int], Optional[int]]] = field(default_factory=dict)
+    remaining_ranges: int = 0
+
+
+class ConcordanceIndexingJob:
+    """
+    Index many documents into the concordance as one background job.
+
+    Verse parsing (``run_documents``), tokenizing and TQ calculation run in a
+    process pool; this object is the
+    single writer, committing one transaction per verse range. Each range
+    records the text hash of its verses, and a document is marked complete
+    after its last range, so an interrupted run picks up where it stopped.
+    With ``reindex=True`` verses whose text changed are re-indexed, verses
+    that disappeared are dropped and unchanged verses are left alone.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        range_size: int = DEFAULT_RANGE_SIZE,
+        reindex: bool = False,
+    ):
+        """
+        Args:
+            db_path: Concordance database (defaults to KeyDatabase's)
+            workers: Worker processes; 0 prepares ranges inline
+            range_size: Verses per range (transaction and checkpoint)
+            reindex: Re-index changed verses of already indexed documents
+        """
+        self.db = KeyDatabase(db_path)
+        self.workers = max(1, (os.cpu_count() or 2) - 1) if workers is None else workers
+        self.range_size = max(1, range_size)
+        self.reindex = reindex
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop after the range being written; completed ranges stay committed."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def run(
+        self,
+        documents: Sequence[DocumentVerses],
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ) -> List[IndexingResult]:
+        """
+        Index ``documents`` and return one IndexingResult per document.
+
+        Args:
+            documents: Documents with their (non-ignored) verses
+            progress_callback: Optional (current, total, message) callback,
+                counted in verses
+        """
+        self._cancelled.clear()
+        ignored = frozenset(self.db.get_all_ignored())
+        executor = self._start_pool(ignored)
+        try:
+            return self._index(documents, ignored, executor, progress_callback)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def run_documents(
+        self,
+        document_ids: Sequence[int],
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    ) -> List[IndexingResult]:
+        """
+        Parse documents with the VerseTeacher system, then index them.
+
+        Each document is loaded (and parsed, if it has no curated verses) in
+        the worker pool. Missing documents get a result carrying an error.
+
+        Args:
+            document_ids: Documents to parse and index
+            progress_callback: Optional (current, total, message) callback;
+                counted in documents while parsing, then in verses
+        """
+        self._cancelled.clear()
+        ignored = frozenset(self.db.get_all_ignored())
+        executor = self._start_pool(ignored)
+        try:
+            if executor is not None:
+                loads: Iterator[Optional[Tuple[str, List[Dict]]]] = executor.map(_load_in_worker, document_ids)
+            else:
+                loads = (load_teacher_verses(document_id) for document_id in document_ids)
+
+            documents: List[DocumentVerses] = []
+            missing: List[IndexingResult] = []
+            for index, (document_id, loaded) in enumerate(zip(document_ids, loads)):
+                if self.cancelled:
+                    return []
+                if loaded is None:
+                    missing.append(IndexingResult(
+                        document_id=document_id,
+                        document_title="Unknown",
+                        total_verses=0,
+                        total_words=0,
+                        new_keys_added=0,
+                        occurrences_added=0,
+                        errors=[f"Document {document_id} not found"]
+                    ))
+                    continue
+                title, verses = loaded
+                documents.append(DocumentVerses(document_id, title, verses))
+                if progress_callback:
+                    progress_callback(index + 1, len(document_ids), f"Parsed '{title}'")
+
+            return self._index(documents, ignored, executor, progress_callback) + missing
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _start_pool(self, ignored: FrozenSet[str]) -> Optional[Executor]:
+        """The worker pool, or None when ranges are prepared inline."""
+        if self.workers <= 0:
+            return None
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(ignored,),
+        )
+
+    def _index(
+        self,
+        documents: Sequence[DocumentVerses],
+        ignored: FrozenSet[str],
+        executor: Optional[Executor],
+        progress_callback: Optional[Callable[[int, int, str], None]],
+    ) -> List[IndexingResult]:
+        """Prepare ranges on ``executor`` (or inline) and write them in order."""
+        total = sum(len(doc.verses) for doc in documents)
+        done = 0
+        plans: List[_DocumentPlan] = []
+
+        def submit(verses: List[Dict]) -> Future:
+            if executor is not None:
+                return executor.submit(_prepare_in_worker, verses)
+            future: Future = Future()
+            future.set_result(prepare_range(verses, ignored))
+            return future
+
+        # Keep the pool busy while the writer commits, without queueing the
+        # whole corpus in memory at once.
+        max_in_flight = max(2, self.workers * 2)
+        in_flight: Deque[Tuple[_DocumentPlan, Future]] = deque()
+        tasks = self._ranges(documents, plans)
+
+        def fill() -> None:
+            nonlocal done
+            while len(in_flight) < max_in_flight and not self.cancelled:
+                task = next(tasks, None)
+                if task is None:
+                    return
+                plan, verses, skipped = task
+                done += skipped
+                if verses:
+                    in_flight.append((plan, submit(verses)))
+
+        fill()
+        while in_flight and not self.cancelled:
+            plan, future = in_flight.popleft()
+            prepared = future.result()
+            self._write_range(plan, prepared)
+            done += len(prepared.verses)
+            if progress_callback:
+                progress_callback(
+                    done, total,
+                    f"Indexed {len(prepared.verses)} verses of '{plan.document.document_title}'"
+                )
+            fill()
+
+        if self.cancelled:
+            logger.info(f"Concordance indexing cancelled after {done}/{total} verses")
+        for plan in plans:
+            result = plan.result
+            logger.info(
+                f"Indexed document '{result.document_title}': "
+                f"{result.total_words} words, {result.new_keys_added} new keys, "
+                f"{result.occurrences_added} occurrences"
+            )
+        return [plan.result for plan in plans]
+
+    def _ranges(
+        self,
+        documents: Sequence[DocumentVerses],
+        plans: List[_DocumentPlan],
+    ) -> Iterator[Tuple[_DocumentPlan, List[Dict], int]]:
+        """Plan each document lazily and yield (plan, verse range, skipped verse count)."""
+        for document in documents:
+            plan, pending = self._plan_document(document)
+            plans.append(plan)
+            skipped = len(document.verses) - len(pending)
+            ranges = [pending[i:i + self.range_size] for i in range(0, len(pending), self.range_size)]
+            plan.remaining_ranges = len(ranges)
+            if not ranges:
+                yield plan, [], skipped
+                continue
+            for index, verses in enumerate(ranges):
+                yield plan, verses, skipped if index == 0 else 0
+
+    def _plan_document(self, document: DocumentVerses) -> Tuple[_DocumentPlan, List[Dict]]:
+        """Diff a document against its checkpoints; return the verses still to index."""
+        doc_id = document.document_id
+        plan = _DocumentPlan(
+            document=document,
+            result=IndexingResult(
+                document_id=doc_id,
+                document_title=document.document_title,
+                total_verses=len(document.verses),
+                total_words=0,
+                new_keys_added=0,
+                occurrences_added=0,
+            ),
+        )
+
+        with self.db.session() as session:
+            complete = session.is_document_complete(doc_id)
+            checkpoints = session.verse_checkpoints(doc_id)
+
+            if not checkpoints and self.db.is_document_indexed(doc_id):
+                # Indexed before checkpoints existed: nothing to diff against
+                if not self.reindex:
+                    plan.result.errors.append("Document already indexed. Use reindex=True to update.")
+                    return plan, []
+                session.clear_document_occurrences(doc_id)
+            elif complete and not self.reindex:
+                return plan, []
+
+            pending: List[Dict] = []
+            current_keys = set()
+            for verse in document.verses:
+                key, _, _, text_hash = verse_checkpoint(verse)
+                current_keys.add(key)
+                old = checkpoints.get(key)
+                if old is None:
+                    pending.append(verse)
+                elif self.reindex and old[2] != text_hash:
+                    plan.stale[key] = (old[0], old[1])
+                    pending.append(verse)
+
+            if self.reindex:
+                removed = [key for key in checkpoints if key not in current_keys]
+                for key in removed:
+                    verse_id, verse_number, _ = checkpoints[key]
+                    session.clear_verse_occurrences(doc_id, verse_id, verse_number)
+                session.forget_verses(doc_id, removed)
+
+            if pending:
+                session.clear_document_complete(doc_id)
+            else:
+                session.mark_document_complete(doc_id, document.document_title, len(document.verses))
+
+        return plan, pending
+
+    def _write_range(self, plan: _DocumentPlan, prepared: PreparedRange) -> None:
+        """Commit one prepared range and its checkpoints in a single transaction."""
+        document = plan.document
+        doc_id = document.document_id
+
+        with self.db.session() as session:
+            ids = session.ensure_words(prepared.tq_values)
+            rows = []
+            for verse in prepared.verses:
+                key, verse_id, verse_number, _ = verse.checkpoint
+                old = plan.stale.pop(key, None)
+                if old is not None:
+                    session.clear_verse_occurrences(doc_id, old[0], old[1])
+                rows.extend(
+                    (ids[word], doc_id, document.document_title, verse_id, verse_number,
+                     position, original, context)
+                    for word, position, original, context in verse.rows
+                )
+            occurrences = session.add_occurrences(rows)
+            session.record_verses(doc_id, [verse.checkpoint for verse in prepared.verses])
+            if plan.remaining_ranges == 1:
+                session.mark_document_complete(doc_id, document.document_title, len(document.verses))
+            new_keys = session.new_keys
+
+        plan.remaining_ranges -= 1
+        plan.result.total_words += prepared.total_words
+        plan.result.occurrences_added += occurrences
+        plan.result.new_keys_added += new_keys
+        plan.result.errors.extend(prepared.errors)
+        for error in prepared.errors:
+            logger.warning(error)
@@ -12,7 +12,7 @@ Refactoring plan: See wiki/04_prophecies/shared_folder_audit_2026-01-13.md
 
 
 from dataclasses import dataclass
-from typing import List, Callable, Optional
+from typing import Dict, List, Callable, Optional
 import logging
 import requests
 import time
@@ -20,6 +20,7 @@ import time
 from .occult_reference_service import OccultReferenceService
 from .theosophical_glossary_service import TheosophicalGlossaryService
 from .etymology_db_service import EtymologyDbService
+from .comprehensive_lexicon_service import LexiconEntry
 from .lexicon_resolver import LexiconResolver
 
 logger = logging.getLogger(__name__)
@@ -82,7 +83,30 @@ class EnrichmentService:
             self._etymology_service = EtymologyDbService()
         return self._etymology_service
 
-    def get_suggestions(self, word: str) -> List[Suggestion]:
+    # Undefined keys resolved per lexicon batch during enrich_batch
+    BATCH_SIZE = 100
+
+    def _lookup_compact(self, words: List[str]) -> Dict[str, List[LexiconEntry]]:
+        """
+        Batch resolver lookup for the Hebrew/Greek words in ``words``.
+
+        English/Latin words are skipped: they would load the large Kaikki
+        indexes (37MB + 19MB) and Etymology-DB/FreeDict cover them better.
+        """
+        compact = [w for w in dict.fromkeys(words) if self._is_compact_script(w)]
+        if not compact:
+            return {}
+        return self._resolver.lookup_many(compact)
+
+    def _is_compact_script(self, word: str) -> bool:
+        scripts = self._resolver._detect_scripts(word)
+        return bool(scripts & {"hebrew", "greek"}) and "latin" not in scripts
+
+    def get_suggestions(
+        self,
+        word: str,
+        resolver_entries: Optional[List[LexiconEntry]] = None,
+    ) -> List[Suggestion]:
         """
         Fetch all available suggestions for a word.
         Returns a list of Suggestion objects for the UI to display.
@@ -93,26 +117,19 @@ class EnrichmentService:
         3. OpenOccult (local esoteric data)
         4. Etymology-DB (local structured)
         5. FreeDict API (online fallback)
+
+        resolver_entries: entries already fetched by a batch lookup
+        (enrich_batch); when omitted the resolver is queried for this word.
         """
         suggestions = []
 
         # 1. Unified lexicon resolver (Kaikki, Strong's/Perseus, Sefaria)
         # OPTIMIZATION: Only lookup Hebrew/Greek from compact lexicons
-        # Skip English/Latin here since they load huge indexes (37MB + 19MB)
-        # and we have better sources for English (Etymology-DB, FreeDict API)
         try:
-            # Detect script first to avoid loading large English indexes unnecessarily
-            scripts = self._resolver._detect_scripts(word)
-            resolver_results = []
-
-            # Only query compact lexicons for non-English scripts
-            if "hebrew" in scripts:
-                resolver_results.extend(self._resolver.lookup_hebrew(word))
-            elif "greek" in scripts:
-                resolver_results.extend(self._resolver.lookup_greek(word))
-            # Skip "latin" to avoid loading 56MB of indexes for English words
-
-            for r in resolver_results:
+            if resolver_entries is None:
+                resolver_entries = self._lookup_compact([word]).get(word, [])
+
+            for r in resolver_entries:
                 # Treat primary hit as Standard; attach morphology/translit inline
                 segments = [r.definition] if r.definition else []
                 if r.transliteration:
@@ -304,13 +321,22 @@ class EnrichmentService:
             return
 
         total_added = 0
+        batch_entries: Dict[str, List[LexiconEntry]] = {}
         for i, (key_id, word) in enumerate(targets):
+            if i % self.BATCH_SIZE == 0:
+                # Resolve this batch in one pass and warm the next one while
+                # the rate-limited API calls below run.
+                batch = [w for _, w in targets[i:i + self.BATCH_SIZE]]
+                upcoming = [w for _, w in targets[i + self.BATCH_SIZE:i + 2 * self.BATCH_SIZE]]
+                batch_entries = self._lookup_compact(batch)
+                self._resolver.prefetch([w for w in upcoming if self._is_compact_script(w)])
+
             if progress_callback:
                 progress_callback(i + 1, total, f"Enriching: {word}")
             
             # Rate limit for API calls
             time.sleep(0.3)
-            suggestions = self.get_suggestions(word)
+            suggestions = self.get_suggestions(word, batch_entries.get(word, []))
             
             # Principle of Apocalypsis: ALL revelation, no veils
             for s in suggestions:
@@ -26,17 +26,217 @@ Dataset schema:
 - reltype: relationship type
 - related_term_id, related_lang, related_term: etymological source
 - position, group_tag, parent_tag, parent_position: complex relationships
+
+The gzipped CSV can only be read front to back, so it is converted once into
+an indexed SQLite store (``etymology.sqlite`` beside the CSV, see
+``build_etymology_store``). Lookups by (term, lang) and reverse lookups by
+related term are then single index probes for every language.
 """
 import csv
 import gzip
 import json
 import logging
+import os
+import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple
+from typing import Iterable, List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+STORE_FILENAME = "etymology.sqlite"
+STORE_SCHEMA_VERSION = "1"
+
+# Priority order for relationship types (lower sorts first)
+RELTYPE_PRIORITY = {
+    'inherited_from': 1,
+    'borrowed_from': 2,
+    'learned_borrowing_from': 3,
+    'derived_from': 4,
+    'has_root': 5,
+    'compound_of': 6
+}
+DEFAULT_PRIORITY = 10
+
+_STORE_SCHEMA = [
+    """
+    CREATE TABLE relations (
+        term TEXT NOT NULL,
+        term_key TEXT NOT NULL,
+        lang TEXT NOT NULL,
+        reltype TEXT NOT NULL,
+        related_term TEXT,
+        related_key TEXT,
+        related_lang TEXT,
+        position INTEGER NOT NULL DEFAULT 0,
+        priority INTEGER NOT NULL
+    )
+    """,
+    "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+]
+
+# Built after the bulk load; sorting once is far cheaper than maintaining
+# the B-trees row by row.
+_STORE_INDEXES = [
+    "CREATE INDEX idx_relations_term ON relations(term_key, lang, priority, position)",
+    "CREATE INDEX idx_relations_related ON relations(related_key, related_lang)",
+]
+
+_RELATION_COLUMNS = "term, lang, reltype, related_term, related_lang, position"
+
+
+def default_store_path() -> Path:
+    """Location of the SQLite store, next to the etymology CSV."""
+    from shared.config import get_config
+    return get_config().paths.etymology_db / STORE_FILENAME
+
+
+def _store_rows(reader: Iterable[Dict[str, str]]):
+    for row in reader:
+        term = row.get('term') or ''
+        if not term:
+            continue
+        reltype = row.get('reltype') or ''
+        related_term = row.get('related_term') or None
+        position = row.get('position')
+        yield (
+            term,
+            term.lower(),
+            row.get('lang') or '',
+            reltype,
+            related_term,
+            related_term.lower() if related_term else None,
+            row.get('related_lang') or None,
+            int(position) if position and position.isdigit() else 0,
+            RELTYPE_PRIORITY.get(reltype, DEFAULT_PRIORITY),
+        )
+
+
+def build_etymology_store(
+    csv_path: Path,
+    store_path: Optional[Path] = None,
+    batch_size: int = 50_000,
+) -> Path:
+    """
+    Convert the gzipped etymology CSV into an indexed SQLite store.
+
+    The store is written to a temporary file and moved into place, so a
+    reader never sees a half-built database.
+
+    Args:
+        csv_path: Path to ``etymology.csv.gz``
+        store_path: Target database (default: ``etymology.sqlite`` beside the CSV)
+        batch_size: Rows per ``executemany`` batch
+
+    Returns:
+        Path of the finished store.
+    """
+    csv_path = Path(csv_path)
+    store_path = Path(store_path) if store_path else csv_path.parent / STORE_FILENAME
+    tmp_path = store_path.with_name(store_path.name + ".building")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    start = time.perf_counter()
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        for statement in _STORE_SCHEMA:
+            conn.execute(statement)
+
+        total = 0
+        insert = "INSERT INTO relations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        with gzip.open(csv_path, 'rt', encoding='utf-8', errors='replace') as f:
+            batch: List[Tuple] = []
+            for values in _store_rows(csv.DictReader(f)):
+                batch.append(values)
+                if len(batch) >= batch_size:
+                    conn.executemany(insert, batch)
+                    total += len(batch)
+                    batch.clear()
+                    logger.info(f"  Loaded {total:,} relationships...")
+            if batch:
+                conn.executemany(insert, batch)
+                total += len(batch)
+
+        for statement in _STORE_INDEXES:
+            conn.execute(statement)
+
+        source = csv_path.stat()
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("schema_version", STORE_SCHEMA_VERSION),
+            ("source_mtime", str(source.st_mtime)),
+            ("source_size", str(source.st_size)),
+            ("relations", str(total)),
+        ])
+        conn.commit()
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, store_path)
+    _close_store(store_path)
+    logger.info(
+        f"Etymology store built: {total:,} relationships in "
+        f"{time.perf_counter() - start:.1f}s -> {store_path}"
+    )
+    return store_path
+
+
+class _StoreHandle:
+    """Read-only connection to a store, shared by all service instances."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.conn = sqlite3.connect(
+            f"file:{path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self.lock = threading.Lock()
+
+    def query(self, sql: str, params: Tuple) -> List[Tuple]:
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def meta(self) -> Dict[str, str]:
+        return dict(self.query("SELECT key, value FROM meta", ()))
+
+
+_store_handles: Dict[Path, _StoreHandle] = {}
+_store_handles_lock = threading.Lock()
+
+
+def _open_store(path: Path, source: Optional[Path] = None) -> Optional[_StoreHandle]:
+    with _store_handles_lock:
+        handle = _store_handles.get(path)
+        if handle is None:
+            if not path.exists():
+                return None
+            try:
+                handle = _StoreHandle(path)
+                if handle.meta().get("schema_version") != STORE_SCHEMA_VERSION:
+                    logger.warning(f"Etymology store {path} has an old schema; rebuild it")
+                    handle.conn.close()
+                    return None
+                built_from = handle.meta().get("source_mtime")
+                if source is not None and source.exists() and built_from is not None \
+                        and float(built_from) != source.stat().st_mtime:
+                    logger.warning(f"Etymology store {path} is older than {source}; rebuild it")
+            except sqlite3.Error as e:
+                logger.warning(f"Etymology store {path} unreadable: {e}")
+                return None
+            _store_handles[path] = handle
+        return handle
+
+
+def _close_store(path: Path) -> None:
+    with _store_handles_lock:
+        handle = _store_handles.pop(Path(path), None)
+    if handle is not None:
+        handle.conn.close()
+
 
 @dataclass
 class EtymologyRelation:
@@ -69,25 +269,38 @@ class EtymologyDbService:
     Uses word index for instant lookups when available, falls back to scanning.
     """
     
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, csv_path: Optional[Path] = None):
         """
         Initialize the service.
         
         Args:
             db_path: Path to holy_key.db (not used, kept for compatibility)
+            csv_path: Etymology CSV (default: from config); the store and
+                word index are looked up beside it
         """
-        from shared.config import get_config
-        config = get_config()
+        if csv_path is None:
+            from shared.config import get_config
+            csv_path = get_config().paths.etymology_db / "etymology.csv.gz"
         
-        self.csv_path = config.paths.etymology_db / "etymology.csv.gz"
+        self.csv_path = Path(csv_path)
+        self.store_path = self.csv_path.parent / STORE_FILENAME
         self.index_path = self.csv_path.parent / "word_index.json"
         self.index: Optional[Dict[str, Dict[str, int]]] = None
         
         # Check if dataset exists
         self._ensure_loaded()
+
+    @property
+    def store(self) -> Optional[_StoreHandle]:
+        """Shared handle on the SQLite store, or None if it has not been built."""
+        return _open_store(self.store_path, self.csv_path)
     
     def _ensure_loaded(self):
         """Check if CSV exists and load index if available."""
+        if self.store is not None:
+            logger.debug(f"Etymology store ready: {self.store_path}")
+            return
+
         if not self.csv_path.exists():
             logger.warning(f"Etymology CSV not found at {self.csv_path}")
             logger.warning("Download from: https://github.com/droher/etymology-db")
@@ -105,36 +318,93 @@ class EtymologyDbService:
                 logger.warning(f"Failed to load word index: {e}")
                 self.index = None
         else:
-            logger.debug("No word index found - queries will scan CSV (slower)")
-            logger.debug(f"Build index with: python scripts/build_etymology_index.py")
+            logger.debug("No etymology store found - queries will scan CSV (slower)")
+            logger.debug(f"Build store with: python scripts/build_etymology_index.py")
     
     
-    def get_etymologies(self, word: str, lang: str = "English", max_results: int = 10, max_scan_rows: int = 500_000) -> List[EtymologyRelation]:
+    def get_etymologies(self, word: str, lang: Optional[str] = "English", max_results: int = 10, max_scan_rows: int = 500_000) -> List[EtymologyRelation]:
         """
         Get etymology relationships for a word.
         
-        Uses word index for instant lookup if available, otherwise scans CSV.
+        Uses the SQLite store when built (any language), then the English
+        word index, otherwise scans the CSV.
         
         Args:
             word: The word to look up
-            lang: Language (default: English)
+            lang: Language (default: English; None matches any language in the store)
             max_results: Maximum number of results to return
             max_scan_rows: Maximum rows to scan if no index (500k ≈ 2s max)
             
         Returns:
             List of etymology relationships, prioritized by type
         """
+        word_lower = word.lower()
+
+        store = self.store
+        if store is not None:
+            return self._query_store(store, word_lower, lang, max_results)
+
         if not self.csv_path.exists():
             return []
         
-        word_lower = word.lower()
-        
         # Use index if available
         if self.index and lang == "English":
             return self._query_with_index(word_lower, max_results)
         else:
             return self._query_sequential(word_lower, lang, max_results, max_scan_rows)
     
+    def get_descendants(
+        self,
+        related_term: str,
+        related_lang: Optional[str] = None,
+        max_results: int = 50,
+    ) -> List[EtymologyRelation]:
+        """
+        Reverse lookup: terms whose etymology points at ``related_term``.
+
+        Only available once the SQLite store has been built.
+
+        Args:
+            related_term: The source word (e.g. Latin 'lux')
+            related_lang: Restrict to sources in this language (None: any)
+            max_results: Maximum number of results to return
+
+        Returns:
+            Relationships whose ``related_term`` matches, prioritized by type
+        """
+        store = self.store
+        if store is None:
+            return []
+
+        sql = f"SELECT {_RELATION_COLUMNS} FROM relations WHERE related_key = ?"
+        params: Tuple = (related_term.lower(),)
+        if related_lang:
+            sql += " AND related_lang = ?"
+            params += (related_lang,)
+        sql += " ORDER BY priority, lang, term LIMIT ?"
+        return [EtymologyRelation(*row) for row in store.query(sql, params + (max_results,))]
+
+    def _query_store(
+        self,
+        store: _StoreHandle,
+        word: str,
+        lang: Optional[str],
+        max_results: int,
+    ) -> List[EtymologyRelation]:
+        """Indexed (term, lang) lookup against the SQLite store."""
+        sql = f"SELECT {_RELATION_COLUMNS} FROM relations WHERE term_key = ?"
+        params: Tuple = (word,)
+        if lang:
+            sql += " AND lang = ?"
+            params += (lang,)
+        sql += " ORDER BY priority, position LIMIT ?"
+        try:
+            rows = store.query(sql, params + (max_results,))
+        except sqlite3.Error as e:
+            logger.error(f"Error reading etymology store: {e}")
+            return []
+        return [EtymologyRelation(*row) for row in rows]
+
     def _query_with_index(self, word: str, max_results: int) -> List[EtymologyRelation]:
         """Fast indexed lookup."""
         if not self.index or word not in self.index:
@@ -152,15 +422,7 @@ class EtymologyDbService:
         
         results: List[Tuple[int, EtymologyRelation]] = []
         
-        # Priority order for relationship types
-        priority = {
-            'inherited_from': 1,
-            'borrowed_from': 2,
-            'learned_borrowing_from': 3,
-            'derived_from': 4,
-            'has_root': 5,
-            'compound_of': 6
-        }
+        priority = RELTYPE_PRIORITY
         
         try:
             with gzip.open(self.csv_path, 'rt', encoding='utf-8') as f:
@@ -182,7 +444,7 @@ class EtymologyDbService:
                             related_lang=row.get('related_lang'),
                             position=int(row.get('position', 0)) if row.get('position') else 0
                         )
-                        results.append((priority.get(rel.reltype, 10), rel))
+                        results.append((priority.get(rel.reltype, DEFAULT_PRIORITY), rel))
                         found_count += 1
                         
                         # Stop when we've found all expected entries
@@ -200,19 +462,11 @@ class EtymologyDbService:
             logger.error(f"Error reading etymology CSV: {e}")
             return []
     
-    def _query_sequential(self, word: str, lang: str, max_results: int, max_scan_rows: int) -> List[EtymologyRelation]:
+    def _query_sequential(self, word: str, lang: Optional[str], max_results: int, max_scan_rows: int) -> List[EtymologyRelation]:
         """Fallback sequential scan (slower)."""
         results: List[Tuple[int, EtymologyRelation]] = []
         
-        # Priority order for relationship types
-        priority = {
-            'inherited_from': 1,
-            'borrowed_from': 2,
-            'learned_borrowing_from': 3,
-            'derived_from': 4,
-            'has_root': 5,
-            'compound_of': 6
-        }
+        priority = RELTYPE_PRIORITY
         
         try:
             with gzip.open(self.csv_path, 'rt', encoding='utf-8') as f:
@@ -231,7 +485,7 @@ class EtymologyDbService:
                         break
                     
                     # Only match our word and language
-                    if row.get('term', '').lower() == word and row.get('lang') == lang:
+                    if row.get('term', '').lower() == word and (lang is None or row.get('lang') == lang):
                         rel = EtymologyRelation(
                             term=row.get('term', ''),
                             lang=row.get('lang', ''),
@@ -240,7 +494,7 @@ class EtymologyDbService:
                             related_lang=row.get('related_lang'),
                             position=int(row.get('position', 0)) if row.get('position') else 0
                         )
-                        results.append((priority.get(rel.reltype, 10), rel))
+                        results.append((priority.get(rel.reltype, DEFAULT_PRIORITY), rel))
                         
                         # Stop early if we have enough
                         if len(results) >= max_results * 2:  # Get extra to sort
@@ -263,7 +517,12 @@ class EtymologyDbService:
             'csv_exists': self.csv_path.exists()
         }
         
-        if self.index:
+        store = self.store
+        if store is not None:
+            meta = store.meta()
+            stats['indexed_relationships'] = int(meta.get('relations', 0))
+            stats['query_mode'] = 'sqlite store (fast, all languages)'
+        elif self.index:
             stats['indexed_words'] = len(self.index)
             stats['query_mode'] = 'indexed (fast)'
         else:
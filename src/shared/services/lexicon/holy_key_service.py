@@ -3,7 +3,7 @@
 
 SHARED JUSTIFICATION:
 - RATIONALE: Domain Logic (GRANDFATHERED - should move to pillars/lexicon)
-- USED BY: Gematria, Tq_lexicon (7 references)
+- USED BY: Gematria, Tq, Tq_lexicon (8 references)
 - CRITERION: Violation (Single-pillar domain logic)
 
 This module violates the Law of the Substrate but is documented as pre-existing.
@@ -13,7 +13,7 @@ Refactoring plan: See wiki/04_prophecies/shared_folder_audit_2026-01-13.md
 
 import re
 import logging
-from typing import List, Dict, Set, Optional, Tuple
+from typing import Iterable, List, Dict, Set, Optional, Tuple
 from shared.repositories.lexicon.key_database import KeyDatabase
 from shared.services.gematria.tq_calculator import TQGematriaCalculator
 
@@ -188,23 +188,42 @@ class HolyKeyService:
         Returns:
             List of dicts with 'word' and 'frequency' keys
         """
-        conn = self.db._get_conn()
-        cursor = conn.cursor()
+        return self.find_words_by_tq_values([tq_value], limit)[tq_value]
 
-        # Query words with matching TQ value, ordered by occurrence frequency
-        cursor.execute("""
-            SELECT
-                mk.word,
-                COUNT(wo.id) as frequency
-            FROM master_key mk
-            LEFT JOIN word_occurrences wo ON mk.id = wo.key_id
-            WHERE mk.tq_value = ? AND mk.is_active = 1
-            GROUP BY mk.id, mk.word
-            ORDER BY frequency DESC, mk.word ASC
-            LIMIT ?
-        """, (tq_value, limit))
+    def find_words_by_tq_values(self, tq_values: Iterable[int], limit_per_value: int = 100) -> Dict[int, List[Dict]]:
+        """
+        Find the words for several TQ values at once (a quadset, a septad).
 
-        rows = cursor.fetchall()
-        conn.close()
+        One indexed query answers the whole set, and the result is cached
+        until the Master Key changes.
+
+        Args:
+            tq_values: The TQ values to search for
+            limit_per_value: Maximum words per value
+
+        Returns:
+            Dict of value -> list of dicts with 'word' and 'frequency' keys,
+            most frequent first; every requested value is present.
+        """
+        grouped = self.db.get_words_by_tq_values(tq_values, limit_per_value)
+        return self._as_word_dicts(grouped)
 
-        return [{'word': row['word'], 'frequency': row['frequency']} for row in rows]
\ No newline at end of file
+    def find_words_in_tq_range(self, low: int, high: int, limit_per_value: int = 100) -> Dict[int, List[Dict]]:
+        """
+        Find the words whose TQ value lies in [low, high], grouped by value.
+
+        Returns:
+            Dict of value -> list of dicts with 'word' and 'frequency' keys,
+            for the values in the range that have words.
+        """
+        if low > high:
+            low, high = high, low
+        grouped = self.db.get_words_in_tq_range(low, high, limit_per_value)
+        return self._as_word_dicts(grouped)
+
+    @staticmethod
+    def _as_word_dicts(grouped: Dict[int, List[Tuple[str, int]]]) -> Dict[int, List[Dict]]:
+        return {
+            value: [{'word': word, 'frequency': frequency} for word, frequency in words]
+            for value, words in grouped.items()
+        }
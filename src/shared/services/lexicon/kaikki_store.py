@@ -0,0 +1,368 @@
+"""
+On-disk key -> byte offset store for Kaikki (Wiktionary) JSONL dictionaries.
+
+SHARED JUSTIFICATION:
+- RATIONALE: Core Infrastructure (storage backend of the lexicon services)
+- USED BY: Gematria, Document_manager (via Classical/ComprehensiveLexiconService)
+- CRITERION: 2 (Essential for app to function)
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STORE_FILENAME = "kaikki-keys.sqlite"
+
+# Stay well under SQLite's bound-parameter limit
+_IN_CHUNK = 500
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS sources (
+        source TEXT PRIMARY KEY,
+        mtime REAL NOT NULL,
+        size INTEGER NOT NULL,
+        entries INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS keys (
+        source TEXT NOT NULL,
+        key TEXT NOT NULL,
+        offset INTEGER NOT NULL,
+        PRIMARY KEY (source, key)
+    ) WITHOUT ROWID
+    """,
+]
+
+
+def _remove_accents(text: str) -> str:
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', text)
+        if unicodedata.category(c) != 'Mn'
+    )
+
+
+def _phonetic_greek(text: str) -> str:
+    # Same folding as classical_lexicon_service.phonetic_normalize_greek
+    text = _remove_accents(text)
+    return text.replace('η', 'ε').replace('ω', 'ο').replace('Η', 'Ε').replace('Ω', 'Ο')
+
+
+def variant_keys(word: str, phonetic: bool = False) -> List[str]:
+    """
+    Normalized lookup keys for a word, most exact first.
+
+    Both the builder and the lookups use this, so a query finds an entry
+    through any of: exact form, lowercase, accent-stripped, hyphen-stripped
+    and (for Greek) phonetic vowel folding.
+    """
+    lowered = word.lower()
+    no_accents = _remove_accents(lowered)
+    no_hyphen = no_accents.replace('-', '')
+    keys = [word, lowered, no_accents, no_hyphen]
+    if phonetic:
+        keys.append(_phonetic_greek(lowered))
+
+    deduped: List[str] = []
+    for key in keys:
+        if key and key not in deduped:
+            deduped.append(key)
+    return deduped
+
+
+def query_keys(word: str, phonetic: bool = False) -> List[str]:
+    """Keys to probe for a user query; also tries forms without a leading '*'."""
+    expanded: List[str] = []
+    for key in variant_keys(word, phonetic):
+        expanded.append(key)
+        stripped = key.lstrip('*')
+        if stripped != key:
+            expanded.append(stripped)
+
+    deduped: List[str] = []
+    for key in expanded:
+        if key and key not in deduped:
+            deduped.append(key)
+    return deduped
+
+
+class KaikkiStore:
+    """
+    One SQLite key table for every Kaikki data file under a lexicon dir.
+
+    Each JSONL file (full Wiktionary dump or compact ``*-mini.jsonl``) is a
+    *source*. Its keys are built on first lookup, stamped with the file's
+    mtime and size, and rebuilt if the file changes. Exact forms win over
+    folded variants; otherwise the first entry in the file wins. Lookups
+    read a single line by offset through a shared file handle, so memory
+    stays flat however many languages are in use.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: SQLite file holding the key table
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+        self._lock = threading.RLock()
+        self._handles: Dict[Path, BinaryIO] = {}
+        self._ready: Dict[str, Tuple[float, int]] = {}
+
+    # --- sources ---
+
+    @staticmethod
+    def _signature(data_path: Path) -> Optional[Tuple[float, int]]:
+        try:
+            stat = data_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    def ensure_source(self, data_path: Path, phonetic: bool = False) -> bool:
+        """
+        Make sure ``data_path`` has up-to-date keys, building them if needed.
+
+        Returns:
+            False if the data file does not exist.
+        """
+        data_path = Path(data_path)
+        signature = self._signature(data_path)
+        if signature is None:
+            return False
+        source = data_path.name
+        if self._ready.get(source) == signature:
+            return True
+
+        with self._lock:
+            if self._ready.get(source) == signature:
+                return True
+            row = self._conn.execute(
+                "SELECT mtime, size FROM sources WHERE source = ?", (source,)
+            ).fetchone()
+            if row is None or tuple(row) != signature:
+                self._build_source(data_path, source, signature, phonetic)
+                self._close_handle(data_path)
+            self._ready[source] = signature
+        return True
+
+    def _build_source(
+        self,
+        data_path: Path,
+        source: str,
+        signature: Tuple[float, int],
+        phonetic: bool,
+    ) -> None:
+        start = time.perf_counter()
+        conn = self._conn
+        conn.execute("DELETE FROM keys WHERE source = ?", (source,))
+        conn.execute("DELETE FROM sources WHERE source = ?", (source,))
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS kaikki_variants (key TEXT, offset INTEGER)")
+        conn.execute("DELETE FROM kaikki_variants")
+
+        insert_exact = "INSERT OR IGNORE INTO keys VALUES (?, ?, ?)"
+        insert_variant = "INSERT INTO kaikki_variants VALUES (?, ?)"
+        entries = 0
+        exact_batch: List[Tuple[str, str, int]] = []
+        variant_batch: List[Tuple[str, int]] = []
+
+        for offset, word in self._scan_words(data_path):
+            keys = variant_keys(word, phonetic)
+            exact_batch.append((source, keys[0], offset))
+            variant_batch.extend((key, offset) for key in keys[1:])
+            entries += 1
+            if len(variant_batch) >= 50_000:
+                conn.executemany(insert_exact, exact_batch)
+                conn.executemany(insert_variant, variant_batch)
+                exact_batch.clear()
+                variant_batch.clear()
+
+        conn.executemany(insert_exact, exact_batch)
+        conn.executemany(insert_variant, variant_batch)
+        # Folded variants only fill keys no exact form has claimed; rowid
+        # order keeps the first entry in the file for each variant.
+        conn.execute(
+            "INSERT OR IGNORE INTO keys SELECT ?, key, offset FROM kaikki_variants ORDER BY rowid",
+            (source,),
+        )
+        conn.execute("DELETE FROM kaikki_variants")
+        conn.execute(
+            "INSERT INTO sources VALUES (?, ?, ?, ?)",
+            (source, signature[0], signature[1], entries),
+        )
+        conn.commit()
+        logger.info(
+            f"Indexed {entries:,} Kaikki entries from {source} in "
+            f"{time.perf_counter() - start:.1f}s"
+        )
+
+    @staticmethod
+    def _scan_words(data_path: Path) -> Iterable[Tuple[int, str]]:
+        with open(data_path, 'rb') as f:
+            offset = 0
+            for line_num, line in enumerate(f, 1):
+                line_offset = offset
+                offset += len(line)
+                try:
+                    word = json.loads(line).get('word', '')
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    logger.warning(f"Invalid JSON at line {line_num} of {data_path.name}: {e}")
+                    continue
+                if word:
+                    yield line_offset, word
+
+    # --- lookups ---
+
+    def lookup(self, data_path: Path, keys: Iterable[str], phonetic: bool = False) -> Optional[Dict]:
+        """
+        Return the entry for the first key that matches, or None.
+
+        Args:
+            data_path: JSONL data file (full dump or compact mini file)
+            keys: Probe keys in priority order (see ``query_keys``)
+            phonetic: Index Greek phonetic variants when building this source
+        """
+        data_path = Path(data_path)
+        if not self.ensure_source(data_path, phonetic):
+            return None
+
+        source = data_path.name
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT offset FROM keys WHERE source = ? AND key = ?", (source, key)
+                ).fetchone()
+                if row is None:
+                    continue
+                line = self._read_line(data_path, row[0])
+                if not line:
+                    continue
+                try:
+                    return json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.error(f"Corrupt Kaikki entry at {row[0]} in {source}: {e}")
+        return None
+
+    def lookup_many(
+        self,
+        data_path: Path,
+        probes: Dict[str, List[str]],
+        phonetic: bool = False,
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Bulk form of ``lookup``: resolve many words with a few IN queries.
+
+        Args:
+            data_path: JSONL data file
+            probes: word -> probe keys in priority order
+            phonetic: Index Greek phonetic variants when building this source
+
+        Returns:
+            word -> entry dict (None when nothing matched)
+        """
+        data_path = Path(data_path)
+        results: Dict[str, Optional[Dict]] = {word: None for word in probes}
+        if not probes or not self.ensure_source(data_path, phonetic):
+            return results
+
+        source = data_path.name
+        all_keys = list({key for keys in probes.values() for key in keys})
+        offsets: Dict[str, int] = {}
+        with self._lock:
+            for start in range(0, len(all_keys), _IN_CHUNK):
+                chunk = all_keys[start:start + _IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                offsets.update(self._conn.execute(
+                    f"SELECT key, offset FROM keys WHERE source = ? AND key IN ({placeholders})",
+                    [source, *chunk],
+                ).fetchall())
+
+            chosen: Dict[str, int] = {}
+            for word, keys in probes.items():
+                for key in keys:
+                    if key in offsets:
+                        chosen[word] = offsets[key]
+                        break
+
+            # Read in file order so the seeks only move forward
+            entries: Dict[int, Optional[Dict]] = {}
+            for offset in sorted(set(chosen.values())):
+                line = self._read_line(data_path, offset)
+                try:
+                    entries[offset] = json.loads(line) if line else None
+                except json.JSONDecodeError as e:
+                    logger.error(f"Corrupt Kaikki entry at {offset} in {source}: {e}")
+                    entries[offset] = None
+
+        for word, offset in chosen.items():
+            results[word] = entries.get(offset)
+        return results
+
+    def _read_line(self, data_path: Path, offset: int) -> bytes:
+        handle = self._handles.get(data_path)
+        if handle is None:
+            handle = open(data_path, 'rb')
+            self._handles[data_path] = handle
+        handle.seek(offset)
+        return handle.readline()
+
+    def entry_count(self, data_path: Path) -> int:
+        row = self._conn.execute(
+            "SELECT entries FROM sources WHERE source = ?", (Path(data_path).name,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    # --- lifecycle ---
+
+    def _close_handle(self, data_path: Path) -> None:
+        handle = self._handles.pop(data_path, None)
+        if handle is not None:
+            handle.close()
+
+    def close_handles(self) -> None:
+        """Close the open data files (they reopen on the next lookup)."""
+        with self._lock:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self.close_handles()
+            self._conn.close()
+
+
+_stores: Dict[Path, KaikkiStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_kaikki_store(index_dir: Path) -> KaikkiStore:
+    """Shared store (and file-handle pool) for a lexicon index directory."""
+    path = (Path(index_dir) / STORE_FILENAME).absolute()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = KaikkiStore(path)
+            _stores[path] = store
+        return store
+
+
+def close_kaikki_stores() -> None:
+    """Close every shared store; the next lookup reopens them."""
+    with _stores_lock:
+        stores = list(_stores.values())
+        _stores.clear()
+    for store in stores:
+        store.close()
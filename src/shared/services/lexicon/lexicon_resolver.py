@@ -19,13 +19,61 @@ raw LexiconEntry objects from the underlying services (comprehensive + classical
 """
 
 import logging
-from typing import List, Optional, Set
+import queue
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from .comprehensive_lexicon_service import ComprehensiveLexiconService, LexiconEntry
 from .classical_lexicon_service import ClassicalLexiconService
 
 logger = logging.getLogger(__name__)
 
+# Results shared by every resolver (each window creates its own), keyed by
+# (word, preferred languages).
+LOOKUP_CACHE_SIZE = 4096
+
+_CacheKey = Tuple[str, Tuple[str, ...]]
+_lookup_cache: "OrderedDict[_CacheKey, Tuple[LexiconEntry, ...]]" = OrderedDict()
+_lookup_cache_lock = threading.Lock()
+
+_prefetch_queue: "queue.Queue[Tuple[LexiconResolver, List[str], Optional[List[str]]]]" = queue.Queue()
+_prefetch_thread: Optional[threading.Thread] = None
+_prefetch_thread_lock = threading.Lock()
+
+
+def _cache_get(key: _CacheKey) -> Optional[Tuple[LexiconEntry, ...]]:
+    with _lookup_cache_lock:
+        entries = _lookup_cache.get(key)
+        if entries is not None:
+            _lookup_cache.move_to_end(key)
+        return entries
+
+
+def _cache_put(key: _CacheKey, entries: List[LexiconEntry]) -> None:
+    with _lookup_cache_lock:
+        _lookup_cache[key] = tuple(entries)
+        _lookup_cache.move_to_end(key)
+        while len(_lookup_cache) > LOOKUP_CACHE_SIZE:
+            _lookup_cache.popitem(last=False)
+
+
+def clear_lookup_cache() -> None:
+    """Drop all cached lookup results."""
+    with _lookup_cache_lock:
+        _lookup_cache.clear()
+
+
+def _prefetch_worker() -> None:
+    while True:
+        resolver, words, languages = _prefetch_queue.get()
+        try:
+            resolver.lookup_many(words, languages)
+        except Exception as e:
+            logger.debug(f"Lexicon prefetch failed: {e}")
+        finally:
+            _prefetch_queue.task_done()
+
 
 class LexiconResolver:
     """
@@ -97,34 +145,111 @@ class LexiconResolver:
         Returns:
             List of LexiconEntry objects from all relevant sources
         """
-        results: List[LexiconEntry] = []
+        return self.lookup_many([word], preferred_languages).get(word, [])
+
+    def lookup_many(
+        self,
+        words: Iterable[str],
+        preferred_languages: Optional[List[str]] = None,
+    ) -> Dict[str, List[LexiconEntry]]:
+        """
+        Look up a batch of words (e.g. every word of a verse) at once.
 
-        # Detect script
-        scripts = self._detect_scripts(word)
+        Duplicates are resolved once, cached results come from the shared
+        LRU, and the rest are grouped by script so each lexicon is probed
+        with one batched index query instead of one per word.
+
+        Args:
+            words: Words to look up
+            preferred_languages: Optional list of language names to prioritize
 
-        # Hebrew words
-        if "hebrew" in scripts:
-            results.extend(self.lookup_hebrew(word))
+        Returns:
+            Dict mapping each distinct word to its entries, in input order
+        """
+        languages = tuple(preferred_languages or ())
+        unique = list(dict.fromkeys(words))
+
+        results: Dict[str, List[LexiconEntry]] = {}
+        missing: List[str] = []
+        for word in unique:
+            cached = _cache_get((word, languages))
+            if cached is None:
+                missing.append(word)
+            else:
+                results[word] = list(cached)
+
+        if missing:
+            resolved = self._resolve_many(missing, languages)
+            for word in missing:
+                _cache_put((word, languages), resolved[word])
+                results[word] = resolved[word]
+
+        return {word: results[word] for word in unique}
+
+    def prefetch(self, words: Iterable[str], preferred_languages: Optional[List[str]] = None) -> None:
+        """
+        Warm the shared cache in the background (e.g. the next verse's words).
 
-        # Greek words
-        if "greek" in scripts:
-            results.extend(self.lookup_greek(word))
+        Returns immediately; later ``lookup``/``lookup_many`` calls for these
+        words are then served from the cache.
+        """
+        global _prefetch_thread
+
+        languages = tuple(preferred_languages or ())
+        pending = [word for word in dict.fromkeys(words) if _cache_get((word, languages)) is None]
+        if not pending:
+            return
+
+        with _prefetch_thread_lock:
+            if _prefetch_thread is None or not _prefetch_thread.is_alive():
+                _prefetch_thread = threading.Thread(
+                    target=_prefetch_worker, name="lexicon-prefetch", daemon=True
+                )
+                _prefetch_thread.start()
+        _prefetch_queue.put((self, pending, list(languages) or None))
+
+    def _resolve_many(self, words: List[str], languages: Tuple[str, ...]) -> Dict[str, List[LexiconEntry]]:
+        """Uncached lookups, batched per script and language."""
+        results: Dict[str, List[LexiconEntry]] = {word: [] for word in words}
+        scripts = {word: self._detect_scripts(word) for word in words}
+
+        # A Greek/Hebrew language hint sends transliterated (Latin-script)
+        # words to that lexicon instead of the English/Latin fallback
+        hint = {lang.lower() for lang in languages}
+        for word in words:
+            if scripts[word] <= {"latin"}:
+                if hint & {"greek", "ancient greek"}:
+                    scripts[word] = {"greek"}
+                elif "hebrew" in hint:
+                    scripts[word] = {"hebrew"}
+
+        hebrew = [word for word in words if "hebrew" in scripts[word]]
+        if hebrew:
+            for word, entries in self.classical.lookup_hebrew_many(hebrew).items():
+                results[word].extend(entries)
+
+        greek = [word for word in words if "greek" in scripts[word]]
+        if greek:
+            for word, entries in self.classical.lookup_greek_many(greek, prefer_classical=True).items():
+                results[word].extend(entries)
 
         # Latin/English words (or if no script detected)
-        if "latin" in scripts or not scripts:
+        latin = [word for word in words if "latin" in scripts[word] or not scripts[word]]
+        if latin:
             # Try preferred languages first
-            if preferred_languages:
-                for lang in preferred_languages:
-                    entries = self.comprehensive.lookup(word, lang)
-                    results.extend(entries)
-
-            # If no results yet, try common languages
-            if not results:
-                for lang in ["English", "Latin"]:
-                    entries = self.comprehensive.lookup(word, lang)
-                    results.extend(entries)
-                    if entries:  # Stop after first hit
-                        break
+            for lang in languages:
+                for word, entries in self.comprehensive.lookup_many(latin, lang).items():
+                    results[word].extend(entries)
+
+            # If no results yet, try common languages; stop after first hit
+            pending = [word for word in latin if not results[word]]
+            for lang in ["English", "Latin"]:
+                if not pending:
+                    break
+                found = self.comprehensive.lookup_many(pending, lang)
+                for word in pending:
+                    results[word].extend(found[word])
+                pending = [word for word in pending if not found[word]]
 
         return results
 
@@ -0,0 +1,221 @@
+"""
+Byte-offset index over the Perseus LSJ XML for random-access entry lookups.
+
+SHARED JUSTIFICATION:
+- RATIONALE: Core Infrastructure (storage backend of ClassicalLexiconService)
+- USED BY: Gematria, Document_manager (via ClassicalLexiconService)
+- CRITERION: 2 (Essential for app to function)
+"""
+import json
+import logging
+import mmap
+import os
+import re
+import tempfile
+import threading
+import time
+import unicodedata
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Perseus wraps most lemmas in <entryFree>; a few editions use <entry>.
+# Entries never nest, so the matching close tag ends the fragment.
+_ENTRY_OPEN = re.compile(rb"<(entryFree|entry)(?=[\s>/])([^>]*)>")
+_ATTRIBUTE = re.compile(rb"""([\w:.-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+_NAMESPACE_DECL = re.compile(rb"""\sxmlns(?::[\w.-]+)?\s*=\s*(?:"[^"]*"|'[^']*')""")
+
+
+def lemma_variants(lemma: str) -> List[str]:
+    """Lookup keys for a lemma: as written, lowercased, and accent-free."""
+    lowered = lemma.strip().lower()
+    stripped = ''.join(
+        c for c in unicodedata.normalize('NFD', lowered)
+        if unicodedata.category(c) != 'Mn'
+    )
+    variants = [lemma.strip()]
+    for variant in (lowered, stripped):
+        if variant and variant not in variants:
+            variants.append(variant)
+    return variants
+
+
+def _attributes(raw: bytes) -> Dict[str, str]:
+    return {
+        name.decode(): (double if double is not None else single).decode('utf-8', 'replace')
+        for name, double, single in _ATTRIBUTE.findall(raw)
+    }
+
+
+class PerseusOffsetIndex:
+    """
+    Maps entry ids and lemma variants to (byte offset, length) in the XML.
+
+    The index is built once by a raw byte scan (no XML parsing) and saved as
+    JSON beside the other lexicon indexes. It records the source's mtime and
+    size and is rebuilt automatically when either changes. Lookups seek to
+    the entry and parse just that fragment.
+    """
+
+    def __init__(self, xml_path: Path, index_path: Path):
+        """
+        Args:
+            xml_path: The Perseus LSJ XML file
+            index_path: Where the offset index is stored
+        """
+        self.xml_path = Path(xml_path)
+        self.index_path = Path(index_path)
+        self._by_id: Dict[str, Tuple[int, int]] = {}
+        self._by_lemma: Dict[str, List[Tuple[int, int]]] = {}
+        self._namespaces = ""
+        self._loaded_signature: Optional[Tuple[float, int]] = None
+        self._lock = threading.Lock()
+
+    def _source_signature(self) -> Optional[Tuple[float, int]]:
+        try:
+            stat = self.xml_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    def ensure_ready(self) -> bool:
+        """Load the index, building it first if missing or stale."""
+        signature = self._source_signature()
+        if signature is None:
+            return False
+        if self._loaded_signature == signature:
+            return True
+
+        with self._lock:
+            if self._loaded_signature == signature:
+                return True
+            data = self._read_index_file(signature)
+            if data is None:
+                data = self.build()
+            self._apply(data)
+            self._loaded_signature = signature
+        return True
+
+    def _read_index_file(self, signature: Tuple[float, int]) -> Optional[Dict]:
+        if not self.index_path.exists():
+            return None
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Perseus offset index unreadable, rebuilding: {e}")
+            return None
+        if (
+            data.get('version') != INDEX_VERSION
+            or data.get('source_mtime') != signature[0]
+            or data.get('source_size') != signature[1]
+        ):
+            logger.info("Perseus XML changed since the offset index was built; rebuilding")
+            return None
+        return data
+
+    def build(self) -> Dict:
+        """Scan the XML for entry boundaries and write the index file."""
+        start = time.perf_counter()
+        signature = self._source_signature()
+        entries: List[List] = []
+        namespaces = b""
+
+        with open(self.xml_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            pos = 0
+            while True:
+                match = _ENTRY_OPEN.search(data, pos)
+                if match is None:
+                    break
+                if not entries:
+                    # Fragments are parsed out of context, so carry over the
+                    # namespace declarations made before the first entry.
+                    namespaces = b"".join(_NAMESPACE_DECL.findall(data, 0, match.start()))
+                tag = match.group(1)
+                close = b"</" + tag + b">"
+                if match.group(2).rstrip().endswith(b"/"):
+                    end = match.end()
+                else:
+                    end = data.find(close, match.end())
+                    if end < 0:
+                        break
+                    end += len(close)
+                attrs = _attributes(match.group(2))
+                entries.append([
+                    attrs.get('id', ''),
+                    attrs.get('key', ''),
+                    match.start(),
+                    end - match.start(),
+                ])
+                pos = end
+
+        index = {
+            'version': INDEX_VERSION,
+            'source_mtime': signature[0] if signature else None,
+            'source_size': signature[1] if signature else None,
+            'namespaces': namespaces.decode('utf-8', 'replace'),
+            'entries': entries,
+        }
+        self._write_index_file(index)
+        logger.debug(
+            f"Perseus offset index: {len(entries):,} entries in "
+            f"{time.perf_counter() - start:.2f}s"
+        )
+        return index
+
+    def _write_index_file(self, index: Dict) -> None:
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, prefix=".tmp-")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            # Read-only data dir: keep the index in memory for this session
+            logger.warning(f"Could not save Perseus offset index to {self.index_path}: {e}")
+
+    def _apply(self, data: Dict) -> None:
+        by_id: Dict[str, Tuple[int, int]] = {}
+        by_lemma: Dict[str, List[Tuple[int, int]]] = {}
+        for entry_id, key, offset, length in data['entries']:
+            span = (offset, length)
+            if entry_id:
+                by_id[entry_id] = span
+            if key:
+                for variant in lemma_variants(key):
+                    by_lemma.setdefault(variant, []).append(span)
+        self._by_id = by_id
+        self._by_lemma = by_lemma
+        self._namespaces = data.get('namespaces', '')
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def span_for_id(self, entry_id: str) -> Optional[Tuple[int, int]]:
+        return self._by_id.get(entry_id)
+
+    def spans_for_lemma(self, lemma: str) -> List[Tuple[int, int]]:
+        """Spans of entries whose key matches ``lemma`` (exact, then folded)."""
+        for variant in lemma_variants(lemma):
+            spans = self._by_lemma.get(variant)
+            if spans:
+                return spans
+        return []
+
+    def read_entry(self, span: Tuple[int, int]) -> Optional[ET.Element]:
+        """Seek to one entry and parse only its bytes."""
+        offset, length = span
+        with open(self.xml_path, 'rb') as f:
+            f.seek(offset)
+            fragment = f.read(length)
+        wrapped = b"<fragment" + self._namespaces.encode('utf-8') + b">" + fragment + b"</fragment>"
+        try:
+            root = ET.fromstring(wrapped)
+        except ET.ParseError as e:
+            logger.debug(f"Perseus fragment at {offset} failed to parse: {e}")
+            return None
+        return root[0] if len(root) else None
@@ -29,11 +29,27 @@ Usage:
     ciphers = gematria_bus.request_cipher_list()
     # Returns: list of cipher names
 
+    # Synchronous, memoized path for bulk callers (spreadsheet formulas)
+    value = gematria_bus.calculate("Hello World", "English (TQ)")
+    values = gematria_bus.calculate_many(["Hello", "World"], "English (TQ)")
+
 The Gematria pillar subscribes to this bus and provides calculation services,
-preserving pillar sovereignty while enabling cross-pillar functionality.
+preserving pillar sovereignty while enabling cross-pillar functionality. It
+also registers an in-process resolver, so ``calculate``/``calculate_many``
+call the calculators directly instead of round-tripping through signals and
+a nested event loop.
 """
+from collections import OrderedDict
 from PyQt6.QtCore import QObject, pyqtSignal
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Resolves a batch of texts under one cipher: (texts, cipher) -> results in order
+GematriaResolver = Callable[[Sequence[str], str], List[Any]]
+
+
+def _is_error(value: Any) -> bool:
+    """Error results are strings like "#ERROR!" or "#CIPHER? (name)"."""
+    return isinstance(value, str) and value.startswith("#")
 
 
 class GematriaBus(QObject):
@@ -74,7 +90,80 @@ class GematriaBus(QObject):
         self._last_cipher_list: Optional[List[str]] = None
         self._result_ready = False
         self._cipher_list_ready = False
-    
+        self._resolver: Optional[GematriaResolver] = None
+        self._memo: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self.memo_size = 50000
+
+    def register_resolver(self, resolver: Optional[GematriaResolver]) -> None:
+        """
+        Register the in-process resolver used by ``calculate``/``calculate_many``.
+
+        The Gematria pillar registers its calculator registry here at startup;
+        ``None`` unregisters it. Memoized results are dropped either way.
+        """
+        self._resolver = resolver
+        self._memo.clear()
+
+    @property
+    def has_resolver(self) -> bool:
+        """Whether calculations can run in-process without the signal round trip."""
+        return self._resolver is not None
+
+    def calculate(self, text: str, cipher: str = "English (TQ)") -> Any:
+        """
+        Synchronous, memoized calculation.
+
+        Uses the registered resolver directly; no signals are emitted and no
+        event loop is spun, so it is safe to call thousands of times per
+        recalculation. Falls back to ``request_calculation`` when the Gematria
+        pillar has not registered a resolver.
+
+        Returns:
+            The calculated value (int) or error string ("#CIPHER?", "#ERROR!", ...)
+        """
+        return self.calculate_many([text], cipher)[0]
+
+    def calculate_many(self, texts: Sequence[str], cipher: str = "English (TQ)") -> List[Any]:
+        """
+        Calculate many texts under one cipher with a single resolver call.
+
+        Memoized texts are answered from the cache; the distinct remaining
+        texts are resolved in one batch.
+
+        Returns:
+            One value (or error string) per text, in order
+        """
+        memo = self._memo
+        results: List[Any] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            key = (text, cipher)
+            if key in memo:
+                memo.move_to_end(key)
+                results[i] = memo[key]
+            else:
+                missing.setdefault(text, []).append(i)
+        if not missing:
+            return results
+
+        pending = list(missing)
+        if self._resolver is None:
+            # No in-process resolver: one signal round trip per text, not memoized
+            for text in pending:
+                value = self.request_calculation(text, cipher)
+                for i in missing[text]:
+                    results[i] = value
+            return results
+
+        for text, value in zip(pending, self._resolver(pending, cipher)):
+            if not _is_error(value):  # A failure may be temporary: ask again next time
+                memo[(text, cipher)] = value
+            for i in missing[text]:
+                results[i] = value
+        while len(memo) > self.memo_size:
+            memo.popitem(last=False)
+        return results
+
     def request_calculation(self, text: str, cipher: str = "English (TQ)", timeout_ms: int = 1000) -> Any:
         """
         Synchronous wrapper for calculation requests.
@@ -0,0 +1,176 @@
+"""
+SHARED JUSTIFICATION:
+- RATIONALE: Core Infrastructure
+- USED BY: main (application startup)
+- CRITERION: 2 (Essential for app to function)
+"""
+
+"""
+Startup profiler for IsopGem.
+
+Records how long application startup spends where:
+- per-module import time (cumulative and self, like ``python -X importtime``)
+- named phases (database init, hub construction, ...)
+- marks (seconds since profiling began, e.g. first interactive window)
+
+Phases and marks are always recorded (they cost a perf_counter call).
+Import timing is opt-in because it wraps every module loader while installed.
+
+Usage:
+    from shared.startup_profiler import startup_profiler
+
+    startup_profiler.install()              # start timing imports
+    with startup_profiler.phase("init_db"):
+        init_db()
+    startup_profiler.mark("first_interactive")
+    startup_profiler.write_report(path)     # JSON report
+
+Set ISOPGEM_PROFILE_STARTUP=1 to have main.py install the import hook and
+write the report to the user state directory.
+"""
+import importlib.abc
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+REPORT_NAME = "startup_profile.json"
+
+
+class _TimedLoader:
+    """Wraps a module loader to time ``exec_module``; every other attribute is delegated."""
+
+    def __init__(self, loader: Any, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        # Hand the real loader back so nothing keeps seeing the wrapper
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._profiler._enter_import()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._leave_import(module.__name__, time.perf_counter() - start)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Meta path hook that resolves specs through the remaining finders and times their loaders."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self._profiler)
+        return spec
+
+
+class StartupProfiler:
+    """Collects import times, phase durations and marks for one startup."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.imports: Dict[str, Tuple[float, float]] = {}  # module -> (cumulative, self) seconds
+        self.phases: List[Tuple[str, float, float]] = []   # (name, start offset, seconds)
+        self.marks: Dict[str, float] = {}
+        self._finder: Optional[_TimingFinder] = None
+        self._nested: List[float] = []  # time spent in child imports, per open import
+
+    @property
+    def installed(self) -> bool:
+        return self._finder is not None
+
+    def install(self) -> None:
+        """Start timing imports. Modules already imported are not re-measured."""
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        """Stop timing imports."""
+        if self._finder is not None:
+            if self._finder in sys.meta_path:
+                sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    def _enter_import(self) -> None:
+        self._nested.append(0.0)
+
+    def _leave_import(self, name: str, elapsed: float) -> None:
+        children = self._nested.pop()
+        self.imports[name] = (elapsed, max(elapsed - children, 0.0))
+        if self._nested:
+            self._nested[-1] += elapsed
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a named block of startup work."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start - self.started, time.perf_counter() - start))
+
+    def mark(self, name: str) -> float:
+        """Record (and return) the seconds elapsed since profiling began."""
+        self.marks[name] = time.perf_counter() - self.started
+        return self.marks[name]
+
+    def report(self) -> Dict[str, Any]:
+        """The profile as a JSON-serialisable dict; imports sorted by cumulative time."""
+        imports = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+        return {
+            "python": sys.version.split()[0],
+            "marks": {name: round(seconds, 6) for name, seconds in self.marks.items()},
+            "phases": [
+                {"name": name, "start": round(start, 6), "seconds": round(seconds, 6)}
+                for name, start, seconds in self.phases
+            ],
+            "imports": [
+                {"module": name, "cumulative": round(total, 6), "self": round(own, 6)}
+                for name, (total, own) in imports
+            ],
+        }
+
+    def summary(self, limit: int = 10) -> str:
+        """Human-readable digest: marks, phases and the slowest imports."""
+        lines = [f"{name}: {seconds * 1000:.0f} ms" for name, seconds in self.marks.items()]
+        lines += [f"  {name}: {seconds * 1000:.0f} ms" for name, _, seconds in self.phases]
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+        lines += [f"  import {name}: {own * 1000:.0f} ms self" for name, (_, own) in slowest]
+        return "\n".join(lines)
+
+    def write_report(self, path: Path) -> Path:
+        """Write the JSON report to ``path`` and return it."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        logger.info(f"Startup profile written to {path}")
+        return path
+
+
+# Process-wide profiler; main.py starts it before the heavy imports
+startup_profiler = StartupProfiler()
@@ -0,0 +1,146 @@
+"""
+SHARED JUSTIFICATION:
+- RATIONALE: Core Infrastructure
+- USED BY: main (pillar tabs)
+- CRITERION: 2 (Essential for app to function)
+"""
+
+"""Lazy registry of pillar hubs for the main window tabs.
+
+Each pillar hub is described by a HubSpec (module path and class name, like
+the window entries in navigation_bus.WINDOW_REGISTRY). The registry adds a
+lightweight placeholder tab per spec and imports and constructs the real hub
+only when its tab is first activated, so a session that never opens Astrology
+never pays for Skyfield, and one that never opens Geometry never loads OpenGL.
+
+Hubs that fail to import (e.g. Adyton without OpenGL) keep an explanatory
+placeholder instead of breaking startup. preload_when_idle() builds the
+remaining hubs one per event-loop pass after the window is up.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import importlib
+import logging
+
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QLabel, QTabWidget, QWidget
+
+from shared.startup_profiler import StartupProfiler, startup_profiler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HubSpec:
+    """Where to find a pillar hub and how to label its tab."""
+    key: str
+    title: str
+    module: str
+    class_name: str
+    unavailable_text: str = ""
+
+
+class HubRegistry(QObject):
+    """Owns the pillar tabs and builds each hub the first time it is needed."""
+
+    hub_loaded = pyqtSignal(str, QWidget)  # key, hub widget (or its unavailable placeholder)
+
+    def __init__(self, tabs: QTabWidget, window_manager, profiler: Optional[StartupProfiler] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            tabs: Tab widget that receives one tab per registered hub
+            window_manager: Passed to every hub constructor
+            profiler: Records hub import/construction time (defaults to the startup profiler)
+        """
+        super().__init__(tabs)
+        self.tabs = tabs
+        self.window_manager = window_manager
+        self.profiler = profiler or startup_profiler
+        self._specs: List[HubSpec] = []
+        self._hubs: Dict[str, QWidget] = {}
+        self._failed: Dict[str, str] = {}
+        self._preload_queue: List[str] = []
+        self.tabs.currentChanged.connect(self._on_current_changed)
+
+    def register(self, spec: HubSpec) -> int:
+        """Add a placeholder tab for a hub. Returns its tab index."""
+        placeholder = QLabel(f"Opening {spec.title}…")
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        placeholder.setStyleSheet("color: #94a3b8; font-size: 12pt;")
+        self._specs.append(spec)
+        return self.tabs.addTab(placeholder, spec.title)
+
+    @property
+    def keys(self) -> List[str]:
+        return [spec.key for spec in self._specs]
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self._hubs or key in self._failed
+
+    def hub(self, key: str) -> Optional[QWidget]:
+        """The constructed hub, or None if it is not loaded or failed to load."""
+        return self._hubs.get(key)
+
+    def ensure_loaded(self, key: str) -> Optional[QWidget]:
+        """Import and construct a hub if needed, swapping it into its tab."""
+        if self.is_loaded(key):
+            return self._hubs.get(key)
+        index = self.keys.index(key)
+        spec = self._specs[index]
+        try:
+            with self.profiler.phase(f"import {spec.key} hub"):
+                hub_class = getattr(importlib.import_module(spec.module), spec.class_name)
+            with self.profiler.phase(f"construct {spec.key} hub"):
+                widget = hub_class(self.window_manager)
+        except (ImportError, OSError) as e:
+            logger.warning(f"{spec.title} pillar not available: {e}")
+            self._failed[key] = str(e)
+            widget = QLabel(spec.unavailable_text or f"{spec.title} is not available: {e}")
+            widget.setStyleSheet("color: #888; padding: 20px;")
+            title = f"{spec.title} (Unavailable)"
+        else:
+            self._hubs[key] = widget
+            title = spec.title
+        self._replace_tab(index, widget, title)
+        self.hub_loaded.emit(key, widget)
+        return self._hubs.get(key)
+
+    def load_all(self) -> None:
+        """Construct every hub now (the old eager startup)."""
+        for key in self.keys:
+            self.ensure_loaded(key)
+
+    def preload_when_idle(self, interval_ms: int = 0) -> None:
+        """Build the remaining hubs in the background, one per timer tick."""
+        self._preload_queue = [key for key in self.keys if not self.is_loaded(key)]
+        if self._preload_queue:
+            QTimer.singleShot(interval_ms, lambda: self._preload_next(interval_ms))
+
+    def _preload_next(self, interval_ms: int) -> None:
+        while self._preload_queue and self.is_loaded(self._preload_queue[0]):
+            self._preload_queue.pop(0)
+        if not self._preload_queue:
+            return
+        self.ensure_loaded(self._preload_queue.pop(0))
+        if self._preload_queue:
+            QTimer.singleShot(interval_ms, lambda: self._preload_next(interval_ms))
+
+    def _replace_tab(self, index: int, widget: QWidget, title: str) -> None:
+        # Swap without emitting currentChanged, keeping the user's tab selected
+        current = self.tabs.currentIndex()
+        placeholder = self.tabs.widget(index)
+        blocked = self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, title)
+            self.tabs.setCurrentIndex(current)
+        finally:
+            self.tabs.blockSignals(blocked)
+        if placeholder is not None:
+            placeholder.deleteLater()
+
+    def _on_current_changed(self, index: int) -> None:
+        if 0 <= index < len(self._specs):
+            self.ensure_loaded(self._specs[index].key)
@@ -114,6 +114,18 @@ def test_env_vars() -> Generator[dict, None, None]:
     os.environ.update(original_env)
 
 
+@pytest.fixture(scope="session")
+def qapp():
+    """
+    Provide the QApplication for tests that build widgets or QImages.
+
+    Created once and kept for the whole session: a second QApplication
+    cannot be constructed after the first one is destroyed.
+    """
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
 # ============================================================================
 # Service Fixtures (add more as needed)
 # ============================================================================
@@ -0,0 +1,130 @@
+"""Tests for the compiled Adyton scene arrays and the vectorized painter path."""
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import QPointF, QRect
+from PyQt6.QtGui import QColor, QImage, QMatrix4x4, QPainter, QPolygonF, QVector3D, QVector4D
+
+from pillars.adyton.models.geometry_types import Face3D, Object3D
+from pillars.adyton.models.prism import SevenSidedPrism
+from pillars.adyton.models.throne import ThroneGeometry
+from pillars.adyton.ui.engine.camera import AdytonCamera
+from pillars.adyton.ui.engine.renderer import AdytonRenderer
+from pillars.adyton.ui.engine.scene import AdytonScene
+
+VIEWPORT = QRect(0, 0, 1280, 800)
+
+
+@pytest.fixture(scope="module")
+def temple():
+    scene = AdytonScene()
+    for obj in SevenSidedPrism.build():
+        scene.add_object(obj)
+    scene.add_object(ThroneGeometry.build(y_offset=-9.9))
+    return scene
+
+
+@pytest.fixture
+def camera():
+    cam = AdytonCamera()
+    cam.radius = 1200
+    return cam
+
+
+def _legacy_frame(scene, camera, viewport):
+    """The per-vertex QVector4D projection the renderer used before."""
+    view_matrix = camera.view_matrix()
+    projection = QMatrix4x4()
+    projection.perspective(camera.fov, viewport.width() / max(1, viewport.height()), 10.0, 5000.0)
+    vp = projection * view_matrix
+    half_w, half_h = viewport.width() / 2.0, viewport.height() / 2.0
+
+    projected = []
+    faces = [face for face in scene.get_all_faces() if len(face.vertices) >= 3]
+    for index, face in enumerate(faces):
+        c = view_matrix * QVector4D(face.centroid.x(), face.centroid.y(), face.centroid.z(), 1.0)
+        poly = QPolygonF()
+        ok = True
+        for v in face.vertices:
+            clip = vp * QVector4D(v.x(), v.y(), v.z(), 1.0)
+            if clip.w() <= 0.1:
+                ok = False
+                break
+            poly.append(QPointF(clip.x() / clip.w() * half_w + half_w, half_h - clip.y() / clip.w() * half_h))
+        if ok:
+            projected.append((c.z() + 0.01, index, poly))
+    projected.sort(key=lambda item: item[0])
+    return projected
+
+
+def test_compiled_arrays_shape(temple):
+    arrays = temple.arrays()
+    faces = [f for obj in temple.objects for f in obj.faces if len(f.vertices) >= 3]
+    assert arrays.face_count == len(faces)
+    assert len(arrays.vertices) == sum(len(f.vertices) for f in faces)
+    assert len(arrays.triangles) == sum(len(f.vertices) - 2 for f in faces)
+    assert arrays.triangles.max() < len(arrays.vertices)
+    # Cached until the scene changes
+    assert temple.arrays() is arrays
+
+
+def test_recompiles_when_an_object_moves():
+    square = [QVector3D(0, 0, 0), QVector3D(1, 0, 0), QVector3D(1, 1, 0), QVector3D(0, 1, 0)]
+    obj = Object3D(faces=[Face3D(vertices=square, color=QColor(255, 0, 0), outline_color=QColor(255, 0, 0))])
+    scene = AdytonScene()
+    scene.add_object(obj)
+    first = scene.arrays()
+    assert len(first.outline_vertices) == 0  # outline equal to fill is not drawn
+
+    obj.position = QVector3D(10, 0, 0)
+    moved = scene.arrays()
+    assert moved.version != first.version
+    assert moved.vertices[:, 0].min() == pytest.approx(10.0)
+
+
+def test_vectorized_projection_matches_legacy(temple, camera):
+    frame = AdytonRenderer().prepare_frame(temple, camera, VIEWPORT)
+    legacy = _legacy_frame(temple, camera, VIEWPORT)
+
+    # Same faces, same depth order (faces at equal depth may swap)
+    assert sorted(f.face_index for f in frame) == sorted(index for _, index, _ in legacy)
+    depths = [f.depth for f in frame]
+    assert depths == sorted(depths)
+
+    expected = {index: (depth, poly) for depth, index, poly in legacy}
+    for projected in frame:
+        depth, poly = expected[projected.face_index]
+        assert projected.depth == pytest.approx(depth, abs=1e-3)
+        ours = np.array([(p.x(), p.y()) for p in projected.polygon])
+        theirs = np.array([(p.x(), p.y()) for p in poly])
+        np.testing.assert_allclose(ours, theirs, atol=1e-2)
+
+
+def test_render_paints_headless(temple, camera, qapp):
+    image = QImage(VIEWPORT.width(), VIEWPORT.height(), QImage.Format.Format_ARGB32)
+    painter = QPainter(image)
+    AdytonRenderer().render(painter, temple, camera, VIEWPORT)
+    painter.end()
+    assert image.pixelColor(VIEWPORT.center()) != temple.background_color
+
+
+@pytest.mark.slow
+def test_frame_preparation_benchmark(temple, camera):
+    renderer = AdytonRenderer()
+    renderer.prepare_frame(temple, camera, VIEWPORT)  # compile once
+
+    def timed(fn, frames=10):
+        start = time.perf_counter()
+        for i in range(frames):
+            camera.orbit(3.0, 0.0)
+            fn(temple, camera, VIEWPORT)
+        return (time.perf_counter() - start) / frames
+
+    legacy = timed(_legacy_frame)
+    vectorized = timed(renderer.prepare_frame)
+    print(f"\nframe preparation ({temple.arrays().face_count} faces): legacy {legacy * 1000:.1f} ms, "
+          f"vectorized {vectorized * 1000:.1f} ms ({legacy / vectorized:.1f}x)")
+    assert vectorized * 2 < legacy
@@ -0,0 +1,173 @@
+"""Tests for the sparse correspondence cell store and streaming transfer."""
+import io
+import json
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from pillars.correspondences.models.correspondence_models import CorrespondenceCell, CorrespondenceTable
+from pillars.correspondences.services.cell_store import (
+    ScrollDelta, decode_value, encode_value, grid_delta, read_json, scroll_layout, write_json,
+)
+from pillars.correspondences.services.table_service import TableService
+from shared.database import Base
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tables.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def service(db):
+    return TableService(db)
+
+
+def legacy_table(db, content, name="Legacy"):
+    table = CorrespondenceTable(name=name, content=content)
+    db.add(table)
+    db.commit()
+    return table
+
+
+def test_values_round_trip_with_their_types():
+    for raw in ["Aleph", "=A1*2", 7, 2.5, True, False, "0"]:
+        decoded = decode_value(*encode_value(raw))
+        assert decoded == raw and type(decoded) is type(raw)
+    assert encode_value("") == (None, None, None)
+    assert decode_value(None, None, None) == ""
+
+
+def test_legacy_blobs_migrate_on_first_load(service, db):
+    single = legacy_table(db, {
+        "columns": ["Hebrew", "Value"],
+        "rows": [["Aleph", 1], ["", ""], ["Gimel", "=B1*3"]],
+        "styles": {"1,1": {"bg": "#ff0000"}},
+    })
+    content = service.load_content(single.id)
+
+    assert content["cell_store"] and content["active_scroll_index"] == 0
+    (scroll,) = content["scrolls"]
+    assert scroll["columns"] == ["Hebrew", "Value"]
+    assert scroll["data"] == [["Aleph", 1], ["", ""], ["Gimel", "=B1*3"]]
+    assert scroll["styles"] == {"1,1": {"bg": "#ff0000"}}
+    # The blob is replaced by the layout; empty cells are stored only if styled
+    db.refresh(single)
+    assert single.content["scrolls"] == [scroll_layout("Sheet1", ["Hebrew", "Value"], 3)]
+    assert service.cells.count(single.id) == 5
+
+    multi = legacy_table(db, {
+        "format_version": "2.0",
+        "active_scroll_index": 1,
+        "scrolls": [
+            {"name": "One", "columns": ["A"], "data": [["x"]], "styles": {}},
+            {"name": "Two", "columns": ["A", "B"], "data": [["", "y"]], "styles": {}},
+        ],
+    })
+    content = service.load_content(multi.id)
+    assert content["active_scroll_index"] == 1
+    assert [s["name"] for s in content["scrolls"]] == ["One", "Two"]
+    assert content["scrolls"][1]["data"] == [["", "y"]]
+
+
+def test_save_scrolls_writes_only_the_delta(service, db):
+    data = [[f"r{r}c{c}" for c in range(4)] for r in range(10)]
+    table = service.create_table("Grid", {"columns": list("ABCD"), "data": data})
+    assert service.cells.count(table.id) == 40
+
+    data[3][2] = "changed"
+    data[4][1] = ""
+    delta = grid_delta(data, {}, [(3, 2, 3, 2), (4, 1, 4, 1)], 4)
+    assert len(delta.cells) == 1
+    service.save_scrolls(table.id, 0, [scroll_layout("Sheet1", list("ABCD"), 10)], [delta])
+
+    assert service.cells.count(table.id) == 39
+    assert service.load_content(table.id)["scrolls"][0]["data"] == data
+
+    # A row removed at 2: everything from row 2 down moves up
+    del data[2]
+    delta = grid_delta(data, {}, [(2, 0, None, None)], 4)
+    service.save_scrolls(table.id, 0, [scroll_layout("Sheet1", list("ABCD"), 9)], [delta])
+    assert service.load_content(table.id)["scrolls"][0]["data"] == data
+    assert service.cells.count(table.id) == 35
+
+
+def test_removed_scrolls_and_tables_leave_no_cells(service, db):
+    table = service.create_table("Two", {"scrolls": [
+        {"name": "One", "columns": ["A"], "data": [["x"]]},
+        {"name": "Two", "columns": ["A"], "data": [["y"]]},
+    ]})
+    assert service.cells.count(table.id) == 2
+    service.save_scrolls(table.id, 0, [scroll_layout("One", ["A"], 1)], [ScrollDelta([], [])])
+    assert service.cells.count(table.id) == 1
+
+    service.destroy_table(table.id)
+    assert db.query(CorrespondenceCell).count() == 0
+
+
+def test_csv_streams_in_and_out_of_the_store(service):
+    source = io.StringIO("Name,Value\nAleph,1\n,\nGimel,3,extra\n")
+    table = service.import_csv("Imported", source)
+
+    content = service.load_content(table.id)
+    assert content["scrolls"][0]["columns"] == ["Name", "Value", "Column 3"]
+    assert content["scrolls"][0]["data"] == [["Aleph", "1", ""], ["", "", ""], ["Gimel", "3", "extra"]]
+
+    out = io.StringIO()
+    assert service.export_csv(table.id, 0, out) == 3
+    assert out.getvalue().splitlines() == ["Aleph,1,", ",,", "Gimel,3,extra"]
+
+
+def test_json_streams_rows_a_block_at_a_time():
+    rows = ([f"r{r}", r, "=A1"] for r in range(2500))
+    stream = io.StringIO()
+    assert write_json(stream, "Sheet", ["A", "B", "C"], rows, {(0, 1): {"bold": True}}) == 2500
+
+    document = json.loads(stream.getvalue())
+    assert document["columns"] == ["A", "B", "C"] and document["styles"] == {"0,1": {"bold": True}}
+    assert document["data"][2499] == ["r2499", 2499, "=A1"]
+
+    stream.seek(0)
+    header, blocks = read_json(stream, block_rows=1000)
+    assert header == {"name": "Sheet", "columns": ["A", "B", "C"], "styles": {"0,1": {"bold": True}}}
+    sizes = [len(block) for block in blocks]
+    assert sizes == [1000, 1000, 500]
+
+    # Documents written by other tools are read whole
+    header, blocks = read_json(io.StringIO(json.dumps({"columns": ["A"], "data": [["x"], ["y"]]}, indent=2)))
+    assert header == {"columns": ["A"]} and list(blocks) == [[["x"], ["y"]]]
+
+
+@pytest.mark.slow
+def test_single_edit_save_benchmark_100k_cells(service, db):
+    rows, cols = 5000, 20
+    columns = [f"C{c}" for c in range(cols)]
+    data = [[f"v{r}_{c}" if c % 5 else f"=C1{r}*2" for c in range(cols)] for r in range(rows)]
+    table = service.create_table("Large", {"columns": columns, "data": data})
+    layouts = [scroll_layout("Sheet1", columns, rows)]
+
+    # Before: every save rewrote the whole grid blob
+    legacy = legacy_table(db, {"columns": columns, "data": data}, name="Blob")
+    start = time.perf_counter()
+    for _ in range(3):
+        data[2500][7] = "edited"
+        service.repo.update_content(legacy.id, {"columns": columns, "data": data, "styles": {}})
+    blob_save = (time.perf_counter() - start) / 3
+
+    start = time.perf_counter()
+    for i in range(3):
+        data[2500][7] = f"edited {i}"
+        delta = grid_delta(data, {}, [(2500, 7, 2500, 7)], cols)
+        service.save_scrolls(table.id, 0, layouts, [delta])
+    cell_save = (time.perf_counter() - start) / 3
+
+    print(f"\n{rows * cols:,} cells, one edit: blob save {blob_save * 1000:.1f} ms, cell-store save {cell_save * 1000:.1f} ms")
+    assert service.load_content(table.id)["scrolls"][0]["data"][2500][7] == "edited 2"
+    assert cell_save * 5 < blob_save
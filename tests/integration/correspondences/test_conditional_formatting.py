@@ -0,0 +1,128 @@
+"""Tests for vectorized, cached conditional-formatting evaluation."""
+import random
+import time
+
+import numpy as np
+import pytest
+
+from pillars.correspondences.services.conditional_formatting import (
+    ConditionalManager, ConditionalRule, evaluate_rule,
+)
+
+RED = {"bg": "#ff0000"}
+BLUE = {"bg": "#0000ff"}
+
+
+class Grid:
+    """Value source over a dict of cells that counts the cells it is asked for."""
+
+    def __init__(self, cells):
+        self.cells = cells
+        self.reads = 0
+
+    def __call__(self, top, left, bottom, right):
+        self.reads += (bottom - top + 1) * (right - left + 1)
+        return [[self.cells.get((r, c), "") for c in range(left, right + 1)] for r in range(top, bottom + 1)]
+
+
+def test_vectorized_rules_match_the_scalar_check():
+    manager = ConditionalManager()
+    values = ["", None, 3, "4", "abc", 2.5, True, "10", "ABCdef", 0, "x1"]
+    block = np.empty((1, len(values)), dtype=object)
+    block[0, :] = values
+    for rule_type, threshold in [("GT", "2"), ("LT", 3), ("EQ", "abc"), ("CONTAINS", "C"), ("GT", "x"), ("eq", "3"), ("BETWEEN", 1)]:
+        rule = ConditionalRule(rule_type, threshold, RED, [(0, 0, 0, len(values) - 1)])
+        assert evaluate_rule(rule, block)[0].tolist() == [manager._check_condition(rule, v) for v in values]
+
+
+def test_first_matching_rule_wins_and_results_are_cached():
+    grid = Grid({(r, 0): r for r in range(10)})
+    manager = ConditionalManager()
+    manager.add_rule(ConditionalRule("GT", 6, RED, [(0, 0, 9, 0)]))
+    manager.add_rule(ConditionalRule("GT", 3, BLUE, [(0, 0, 9, 0)]))
+
+    assert [manager.style_at(r, 0, grid) for r in range(10)] == [None] * 4 + [BLUE] * 3 + [RED] * 3
+    reads = grid.reads
+    assert manager.style_at(8, 0, grid) is RED and manager.style_at(3, 5, grid) is None
+    assert grid.reads == reads
+
+
+def test_changed_cells_are_rechecked_alone():
+    grid = Grid({(r, c): r * 10 + c for r in range(50) for c in range(5)})
+    manager = ConditionalManager()
+    manager.add_rule(ConditionalRule("LT", 10, RED, [(0, 0, 49, 4)]))
+    manager.add_rule(ConditionalRule("CONTAINS", "7", BLUE, [(0, 0, 49, 4)]))
+    assert manager.style_at(3, 2, grid) is None
+    assert manager.style_at(0, 2, grid) is RED
+
+    grid.cells[(3, 2)] = 1
+    grid.cells[(0, 2)] = "seven 7"
+    reads = grid.reads
+    manager.invalidate_cells([(3, 2), (0, 2), (400, 400)])
+    assert manager.style_at(3, 2, grid) is RED
+    assert manager.style_at(0, 2, grid) is BLUE
+    assert grid.reads - reads == 2
+
+    # A region change re-evaluates only the rules that cover it
+    manager.add_rule(ConditionalRule("EQ", "x", BLUE, [(100, 0, 101, 0)]))
+    manager.style_at(0, 0, grid)
+    grid.cells[(100, 0)] = "X"
+    reads = grid.reads
+    manager.invalidate_region(100, 0)
+    assert manager.style_at(100, 0, grid) is BLUE
+    assert grid.reads - reads == 2
+
+    # Many changes fall back to re-evaluating the touched rules
+    for r in range(50):
+        for c in range(5):
+            grid.cells[(r, c)] = 100
+    manager.invalidate_cells((r, c) for r in range(50) for c in range(5))
+    assert manager.style_at(0, 0, grid) is None
+    manager.invalidate_all()
+    manager.clear_all_rules()
+    assert manager.style_at(100, 0, grid) is None
+
+
+@pytest.mark.slow
+def test_viewport_repaint_benchmark_20_rules():
+    rows, cols = 2000, 26
+    rng = random.Random(7)
+    words = ["aleph", "beth", "gimel", "daleth", "he", "vav"]
+    cells = {
+        (r, c): (rng.randint(0, 1000) if c % 3 else rng.choice(words) + str(rng.randint(0, 9)))
+        for r in range(rows) for c in range(cols)
+    }
+    grid = Grid(cells)
+    kinds = [("GT", 900), ("LT", 50), ("CONTAINS", "gim"), ("EQ", "he3"), ("GT", 500)]
+    rules = [
+        ConditionalRule(kind, value, {"bg": f"#{i:02x}0000"}, [(0, i % 4, rows - 1, cols - 1 - i % 3)])
+        for i, (kind, value) in enumerate(kinds * 4)
+    ]
+    viewport = [(r, c) for r in range(600, 640) for c in range(cols)]
+
+    # Before: every rule re-checked for every painted cell and role
+    old = ConditionalManager()
+    old.rules = rules
+    start = time.perf_counter()
+    for role in range(2):
+        before = [old.get_style(r, c, cells.get((r, c), "")) for r, c in viewport]
+    per_cell = time.perf_counter() - start
+
+    manager = ConditionalManager()
+    for rule in rules:
+        manager.add_rule(rule)
+    start = time.perf_counter()
+    manager.style_at(0, 0, grid)
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for role in range(2):
+        after = [manager.style_at(r, c, grid) for r, c in viewport]
+    cached = time.perf_counter() - start
+
+    print(
+        f"\n20 rules, {len(viewport)}-cell viewport: per-cell rules {per_cell * 1000:.2f} ms/repaint, "
+        f"cached {cached * 1000:.2f} ms/repaint (first evaluation of {rows * cols:,} cells {first * 1000:.0f} ms)"
+    )
+    assert after == before
+    assert cached * 5 < per_cell
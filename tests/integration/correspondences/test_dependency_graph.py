@@ -0,0 +1,79 @@
+"""Tests for the formula parse cache and the spreadsheet dependency graph."""
+from pillars.correspondences.services.dependency_graph import DependencyGraph
+from pillars.correspondences.services.formula_engine import FormulaEngine, parse_formula
+
+
+class GridContext:
+    """Minimal data context: a dict of (row, col) -> raw value."""
+
+    def __init__(self, cells):
+        self.cells = cells
+
+    def evaluate_cell(self, row, col, visited=None):
+        raw = self.cells.get((row, col), "")
+        if isinstance(raw, str) and raw.startswith("="):
+            return FormulaEngine(self).evaluate(raw, visited)
+        return raw
+
+
+def test_parse_is_cached_by_formula_text():
+    first = parse_formula("SUM(A1:B3) + C4 * 2")
+    assert parse_formula("SUM(A1:B3) + C4 * 2") is first
+    assert first.cells == {(3, 2)}
+    assert first.ranges == ((0, 0, 2, 1),)
+    assert not first.volatile
+
+
+def test_references_cover_nested_calls_and_reversed_ranges():
+    parsed = parse_formula('IF($B$2 > 1, CONCAT(c3, "x"), -SUM(D9:C7))')
+    assert parsed.cells == {(1, 1), (2, 2)}
+    assert parsed.ranges == ((6, 2, 8, 3),)
+    assert parse_formula('ASTRO("Sun", "Sign") & A1').volatile
+    # Names that are not cell references, and oversized ranges, read nothing
+    assert parse_formula("TRUE").cells == frozenset()
+    assert parse_formula("SUM(A1:Z1000)").ranges == ()
+
+
+def test_parse_errors_are_cached_and_reported():
+    parsed = parse_formula("(1 + 2")
+    assert parsed.root is None and parsed.error
+    engine = FormulaEngine(GridContext({}))
+    assert engine.evaluate("=(1 + 2").startswith("#ERROR:")
+    assert engine.evaluate("=NOSUCH(1)") == "#ERROR: Unknown function: NOSUCH"
+
+
+def test_cached_ast_evaluates_like_the_parser():
+    context = GridContext({(0, 0): "3", (0, 1): "4", (1, 0): "hello"})
+    engine = FormulaEngine(context)
+    assert engine.evaluate("=1+2*3") == 7
+    assert engine.evaluate("=2^3^2") == 64.0
+    assert engine.evaluate("=-(A1 + 1) * B1") == -16.0
+    assert engine.evaluate("=A1&B1") == "34"
+    assert engine.evaluate('=IF(A1+0>2,"y","n")') == "y"
+    assert engine.evaluate("=A1<>3") is True
+    assert engine.evaluate("=A2*2") == "#VALUE!"
+    assert engine.evaluate("=SUM(A1:B1, 10)") == 17.0
+    assert engine.evaluate("=SUM(A1:Z1000)") == 0
+
+
+def test_graph_finds_transitive_dependents_through_ranges():
+    graph = DependencyGraph()
+    graph.set_precedents((0, 1), [(0, 0)], [])             # B1 = A1
+    graph.set_precedents((1, 1), [], [(0, 1, 0, 1)])       # B2 = SUM(B1:B1)
+    graph.set_precedents((9, 3), [], [(0, 0, 200, 1)])     # D10 = SUM(A1:B201)
+    graph.set_precedents((5, 5), [(7, 7)], [])             # unrelated
+
+    assert graph.direct_dependents((0, 0)) == {(0, 1), (9, 3)}
+    assert graph.direct_dependents((150, 1)) == {(9, 3)}
+    assert graph.transitive_dependents([(0, 0)]) == {(0, 1), (1, 1), (9, 3)}
+    assert graph.dependents_of_region(7, 0) == {(5, 5), (9, 3)}
+    assert graph.cells_in_region(1, 0, 9, 3) == [(1, 1), (9, 3)]
+
+    graph.remove((9, 3))
+    assert graph.direct_dependents((150, 1)) == set()
+    assert (9, 3) not in graph and len(graph) == 3
+
+    # Re-registering replaces the old precedents
+    graph.set_precedents((0, 1), [(4, 4)], [], volatile=True)
+    assert graph.direct_dependents((0, 0)) == set()
+    assert graph.volatile_cells == {(0, 1)}
@@ -0,0 +1,130 @@
+"""Tests for the in-process gematria resolver behind spreadsheet GEMATRIA()."""
+import time
+
+import pytest
+
+from pillars.correspondences.services.formula_engine import FormulaEngine
+from pillars.gematria.services import TQGematriaCalculator
+from pillars.gematria.services.gematria_signal_handler import GematriaSignalHandler
+from shared.signals import gematria_bus
+
+WORDS = ["light", "logos", "thoth", "sophia", "aeon", "abyss", "sigil", "ogdoad"]
+
+
+class SheetContext:
+    """Dict-backed data context: (row, col) -> raw value; formulas evaluated on demand."""
+
+    def __init__(self, cells):
+        self.cells = cells
+        self.engine = FormulaEngine(self)
+
+    def evaluate_cell(self, row, col, visited=None):
+        raw = self.cells.get((row, col), "")
+        if isinstance(raw, str) and raw.startswith("="):
+            return self.engine.evaluate(raw, visited)
+        return raw
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    # No QApplication and no event loop: any fall back to the signal round trip fails the test
+    def no_round_trip(*args, **kwargs):
+        raise AssertionError("GEMATRIA() went through the signal bus event loop")
+
+    handler = GematriaSignalHandler()
+    monkeypatch.setattr(gematria_bus, "request_calculation", no_round_trip)
+    yield handler
+    gematria_bus.register_resolver(None)
+
+
+def large_sheet(rows: int) -> SheetContext:
+    cells = {}
+    for r in range(rows):
+        cells[(r, 0)] = f"{WORDS[r % len(WORDS)]} {r % 97}"
+        cells[(r, 1)] = f'=GEMATRIA(A{r + 1}, "English (TQ)")'
+    return SheetContext(cells)
+
+
+def test_large_sheet_evaluates_headless(handler):
+    rows = 10000
+    sheet = large_sheet(rows)
+    calculator = TQGematriaCalculator()
+    values = [sheet.evaluate_cell(r, 1) for r in range(rows)]
+    assert values == [calculator.calculate(sheet.cells[(r, 0)]) for r in range(rows)]
+
+
+def test_range_argument_resolves_in_one_batch(handler, monkeypatch):
+    batches = []
+    calculate_batch = handler.calculate_batch
+
+    def counting(texts, cipher):
+        batches.append(list(texts))
+        return calculate_batch(texts, cipher)
+
+    gematria_bus.register_resolver(counting)
+    sheet = SheetContext({(0, 0): "light", (1, 0): "", (2, 0): "logos", (3, 0): "light", (0, 1): "=GEMATRIA(A1:A4)"})
+    calculator = TQGematriaCalculator()
+    assert sheet.evaluate_cell(0, 1) == 2 * calculator.calculate("light") + calculator.calculate("logos")
+    # Empty cells skipped, duplicates resolved once, all in a single call
+    assert batches == [["light", "logos"]]
+
+    # Memoized: evaluating again resolves nothing
+    assert sheet.evaluate_cell(0, 1) == 2 * calculator.calculate("light") + calculator.calculate("logos")
+    assert len(batches) == 1
+
+
+def test_errors_are_not_memoized(handler):
+    calls = []
+
+    def flaky(texts, cipher):
+        calls.append(list(texts))
+        return ["#ERROR!" if len(calls) == 1 else 7 for _ in texts]
+
+    gematria_bus.register_resolver(flaky)
+    assert gematria_bus.calculate("word") == "#ERROR!"
+    assert gematria_bus.calculate("word") == 7
+    assert gematria_bus.calculate("word") == 7
+    assert calls == [["word"], ["word"]]
+
+
+def test_errors_and_unknown_ciphers(handler):
+    sheet = SheetContext({(0, 0): "#DIV/0!", (1, 0): "word"})
+    assert sheet.engine.evaluate("=GEMATRIA(A1:A2)") == "#DIV/0!"
+    assert sheet.engine.evaluate('=GEMATRIA("word", "Nonexistent")') == "#CIPHER? (Nonexistent)"
+    assert sheet.engine.evaluate('=GEMATRIA(A2:A2, "Nonexistent")') == "#CIPHER? (Nonexistent)"
+    assert sheet.engine.evaluate('=GEMATRIA("")') == 0
+    assert gematria_bus.calculate_many([], "English (TQ)") == []
+
+
+def test_memo_is_bounded(handler, monkeypatch):
+    monkeypatch.setattr(gematria_bus, "memo_size", 3)
+    gematria_bus.calculate_many(["a", "b", "c", "d", "e"], "English (TQ)")
+    assert list(gematria_bus._memo) == [("c", "English (TQ)"), ("d", "English (TQ)"), ("e", "English (TQ)")]
+    gematria_bus.register_resolver(handler.calculate_batch)
+    assert not gematria_bus._memo
+
+
+@pytest.mark.slow
+def test_resolver_benchmark_against_signal_round_trip():
+    handler = GematriaSignalHandler()
+    texts = [f"{WORDS[i % len(WORDS)]} {i}" for i in range(10000)]
+    try:
+        start = time.perf_counter()
+        for text in texts[:500]:
+            gematria_bus.request_calculation(text, "English (TQ)")
+        round_trip = (time.perf_counter() - start) / 500
+
+        sheet = large_sheet(10000)
+        start = time.perf_counter()
+        for r in range(10000):
+            sheet.evaluate_cell(r, 1)
+        in_process = (time.perf_counter() - start) / 10000
+    finally:
+        gematria_bus.register_resolver(None)
+        handler.deleteLater()
+
+    print(
+        f"\nGEMATRIA(): signal round trip {round_trip * 1e6:.0f} us/call, "
+        f"in-process resolver {in_process * 1e6:.0f} us/formula"
+    )
+    assert in_process < round_trip
@@ -0,0 +1,145 @@
+"""Tests for incremental recalculation in SpreadsheetModel."""
+import time
+
+import pytest
+
+from pillars.correspondences.ui.spreadsheet_view import SpreadsheetModel
+
+def formula_sheet(rows: int) -> SpreadsheetModel:
+    """Column A numbers; B = A * 2; C = SUM(A:B) of the row; D1 totals column C."""
+    data = [[str(r + 1), f"=A{r + 1}*2", f"=SUM(A{r + 1}:B{r + 1})", ""] for r in range(rows)]
+    data[0][3] = f"=SUM(C1:C{rows})"
+    return SpreadsheetModel({"columns": ["A", "B", "C", "D"], "data": data})
+
+
+def count_evaluations(model: SpreadsheetModel) -> list:
+    calls = []
+    evaluate = model.formula_engine.evaluate
+
+    def counting(content, visited=None):
+        calls.append(content)
+        return evaluate(content, visited)
+
+    model.formula_engine.evaluate = counting
+    return calls
+
+
+def evaluate_all(model: SpreadsheetModel) -> None:
+    for r in range(model.rowCount()):
+        for c in range(model.columnCount()):
+            model.evaluate_cell(r, c)
+
+
+def test_edit_recomputes_only_dependents(qapp):
+    model = formula_sheet(50)
+    evaluate_all(model)
+    assert model.evaluate_cell(0, 3) == sum(3 * (r + 1) for r in range(50))
+
+    calls = count_evaluations(model)
+    model.setData(model.index(9, 0), "100")
+    evaluate_all(model)
+    assert sorted(calls) == sorted(["=A10*2", "=SUM(A10:B10)", "=SUM(C1:C50)"])
+    assert model.evaluate_cell(9, 2) == 300.0
+    assert model.evaluate_cell(0, 3) == sum(3 * (r + 1) for r in range(50)) - 30 + 300
+
+    # Undo restores the old value through the same path
+    calls.clear()
+    model.undo_stack.undo()
+    evaluate_all(model)
+    assert len(calls) == 3
+    assert model.evaluate_cell(9, 2) == 30.0
+
+
+def test_formula_edit_replaces_its_precedents(qapp):
+    model = formula_sheet(5)
+    evaluate_all(model)
+    model.setData(model.index(1, 1), "=A1+A3")
+    assert model.evaluate_cell(1, 1) == 4.0
+
+    calls = count_evaluations(model)
+    model.setData(model.index(1, 0), "50")     # B2 no longer reads A2
+    evaluate_all(model)
+    assert "=A1+A3" not in calls
+    model.setData(model.index(2, 0), "10")     # ...but it does read A3
+    assert model.evaluate_cell(1, 1) == 11.0
+
+
+def test_style_edits_keep_cached_values(qapp):
+    model = formula_sheet(5)
+    evaluate_all(model)
+    calls = count_evaluations(model)
+    from PyQt6.QtCore import Qt
+    model.setData(model.index(0, 0), "#ff0000", Qt.ItemDataRole.BackgroundRole)
+    evaluate_all(model)
+    assert calls == []
+
+
+def test_row_insert_recomputes_cells_that_moved_or_read_moved_cells(qapp):
+    model = formula_sheet(10)
+    evaluate_all(model)
+    calls = count_evaluations(model)
+
+    model.insertRows(5, 1)
+    evaluate_all(model)
+    # Rows 0-4 keep their values (B/C of those rows read nothing that moved);
+    # the moved rows and the column total recalculate.
+    assert "=A1*2" not in calls and "=SUM(A5:B5)" not in calls
+    assert "=SUM(C1:C10)" in calls
+    # Whatever was kept must agree with a from-scratch recalculation
+    values = [[model.evaluate_cell(r, c) for c in range(4)] for r in range(model.rowCount())]
+    model.clear_eval_cache()
+    assert values == [[model.evaluate_cell(r, c) for c in range(4)] for r in range(model.rowCount())]
+
+
+def test_fill_and_sort_invalidate_their_region(qapp):
+    from PyQt6.QtCore import QItemSelectionRange
+    model = formula_sheet(6)
+    evaluate_all(model)
+
+    source = QItemSelectionRange(model.index(0, 0), model.index(0, 0))
+    target = QItemSelectionRange(model.index(0, 0), model.index(2, 0))
+    model.fill_selection(source, target)
+    assert model.evaluate_cell(2, 1) == 2.0
+
+    model.sort_range(0, 0, 5, 0, 0, ascending=False)
+    assert model.get_cell_raw(0, 0) == "6"
+    assert model.evaluate_cell(0, 1) == 12.0
+
+
+def test_volatile_formulas_recalculate_on_any_edit(qapp):
+    model = formula_sheet(3)
+    model._data[2][3] = "=ASTRO(\"Sun\", \"Sign\")"
+    evaluate_all(model)
+    assert (2, 3) in model._dependencies.volatile_cells
+    model.setData(model.index(0, 0), "7")
+    assert (2, 3) not in model._eval_cache
+
+
+@pytest.mark.slow
+def test_single_edit_benchmark_10k_formulas(qapp):
+    rows = 5000
+    model = formula_sheet(rows)
+
+    start = time.perf_counter()
+    evaluate_all(model)
+    full = time.perf_counter() - start
+
+    calls = count_evaluations(model)
+    start = time.perf_counter()
+    model.setData(model.index(2500, 0), "42")
+    evaluate_all(model)
+    incremental = time.perf_counter() - start
+    incremental_count = len(calls)
+
+    # What every edit used to cost: the whole cache thrown away
+    calls.clear()
+    model.clear_eval_cache()
+    evaluate_all(model)
+    full_count = len(calls)
+
+    print(
+        f"\n{2 * rows + 1:,} formulas: full recompute {full_count:,} evaluations in {full * 1000:.0f} ms; "
+        f"one edit {incremental_count} evaluations in {incremental * 1000:.0f} ms"
+    )
+    assert incremental_count == 3
+    assert full_count == 2 * rows + 1
@@ -0,0 +1,86 @@
+"""Tests for SpreadsheetModel dirty tracking against the cell store."""
+import pytest
+from PyQt6.QtCore import Qt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from pillars.correspondences.services.table_service import TableService
+from pillars.correspondences.ui.spreadsheet_view import SpreadsheetModel
+from shared.database import Base
+
+@pytest.fixture
+def service(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'tables.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield TableService(session)
+    session.close()
+    engine.dispose()
+
+
+def open_table(service, rows=20, cols=4):
+    data = [[f"{r}:{c}" for c in range(cols)] for r in range(rows)]
+    table = service.create_table("Tablet", {"columns": [f"C{c}" for c in range(cols)], "data": data})
+    (scroll,) = service.load_content(table.id)["scrolls"]
+    model = SpreadsheetModel(scroll)
+    model.mark_clean()
+    return table.id, model
+
+
+def save(service, table_id, model):
+    delta = model.dirty_delta()
+    service.save_scrolls(table_id, 0, [model.scroll_layout()], [delta])
+    model.mark_clean()
+    return delta
+
+
+def stored_grid(service, table_id):
+    return service.load_content(table_id)["scrolls"][0]
+
+
+def test_new_models_are_wholly_unsaved(qapp):
+    model = SpreadsheetModel({"columns": ["A", "B"], "data": [["x", ""], ["", "y"]]})
+    assert model.is_dirty
+    assert sorted(cell[:3] for cell in model.dirty_delta().cells) == [(0, 0, "x"), (1, 1, "y")]
+
+
+def test_value_and_style_edits_save_one_cell_each(qapp, service):
+    table_id, model = open_table(service)
+    assert not model.is_dirty
+
+    model.setData(model.index(5, 2), "=C1*2")
+    model.setData(model.index(7, 1), "#112233", Qt.ItemDataRole.BackgroundRole)
+    delta = save(service, table_id, model)
+    assert sorted(delta.regions) == [(5, 2, 5, 2), (7, 1, 7, 1)]
+
+    grid = stored_grid(service, table_id)
+    assert grid["data"][5][2] == "=C1*2"
+    assert grid["styles"] == {"7,1": {"bg": "#112233"}}
+
+    # Clearing a cell deletes its record
+    model.setData(model.index(0, 0), "")
+    save(service, table_id, model)
+    assert stored_grid(service, table_id)["data"][0][0] == ""
+    assert service.cells.count(table_id) == 20 * 4 - 1
+
+
+def test_structural_edits_rewrite_from_the_change_onward(qapp, service):
+    table_id, model = open_table(service)
+    model.setData(model.index(3, 0), "#445566", Qt.ItemDataRole.BackgroundRole)
+    save(service, table_id, model)
+
+    model.insertRows(2, 2)
+    model.removeColumns(1, 1)
+    model.sort_range(10, 0, 15, 2, 0, ascending=False)
+    save(service, table_id, model)
+
+    grid = stored_grid(service, table_id)
+    assert grid["columns"] == model._columns
+    assert grid["data"] == model._data
+    assert grid["styles"] == {"5,0": {"bg": "#445566"}}
+
+    model.undo_stack.undo()
+    model.undo_stack.undo()
+    model.undo_stack.undo()
+    save(service, table_id, model)
+    assert stored_grid(service, table_id)["data"] == [[f"{r}:{c}" for c in range(4)] for r in range(20)]
@@ -0,0 +1,184 @@
+"""Tests for the array-based cymatics particle engine and its overlay."""
+import time
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import QPointF, Qt
+from PyQt6.QtGui import QBrush, QColor, QImage, QPainter
+from scipy import ndimage
+
+from pillars.cymatics.models import ParticleState, PlateShape, SimulationParams
+from pillars.cymatics.services import CymaticsParticleService, CymaticsSimulationService
+from pillars.cymatics.ui.cymatics_particle_view import CymaticsParticleView
+
+@pytest.fixture(scope="module")
+def plate():
+    params = SimulationParams(grid_size=256, plate_shape=PlateShape.CIRCULAR, mode_m=3, mode_n=2)
+    return CymaticsSimulationService().simulate(params)
+
+
+def run(service, plate, count=5000, steps=150):
+    state = service.initialize_particles(count, plate.field.shape[0], boundary_mask=plate.boundary_mask)
+    for _ in range(steps):
+        state = service.update_particles(state, plate.field, dt=0.045, boundary_mask=plate.boundary_mask)
+    return state
+
+
+def amplitude_at(plate, positions):
+    cells = (positions * (plate.field.shape[0] - 1)).astype(int)
+    return np.abs(plate.field)[cells[:, 1], cells[:, 0]]
+
+
+def test_seeded_runs_replay_exactly(plate):
+    first, second = run(CymaticsParticleService(seed=7), plate), run(CymaticsParticleService(seed=7), plate)
+    np.testing.assert_array_equal(first.positions, second.positions)
+    np.testing.assert_array_equal(first.velocities, second.velocities)
+    np.testing.assert_array_equal(first.settled, second.settled)
+    assert not np.array_equal(first.positions, run(CymaticsParticleService(seed=8), plate).positions)
+
+
+def test_particles_gather_and_settle_on_nodal_lines(plate):
+    service = CymaticsParticleService(seed=1)
+    start = service.initialize_particles(5000, 256, boundary_mask=plate.boundary_mask)
+    assert start.positions.dtype == np.float32 and len(start.positions) == 5000
+    assert amplitude_at(plate, start.positions).mean() > 0.05
+
+    end = run(service, plate)
+    assert amplitude_at(plate, end.positions).mean() < amplitude_at(plate, start.positions).mean() / 4
+    assert end.settled.mean() > 0.5
+    assert not end.velocities[end.settled].any()
+    assert plate.boundary_mask[tuple(np.flip((end.positions * 255).astype(int), axis=1).T)].all()
+
+
+def test_gradient_is_sampled_bilinearly():
+    grid = np.linspace(0.0, 1.0, 64)
+    xx, yy = np.meshgrid(grid, grid)
+    field = 1.0 + 0.3 * xx + 0.4 * yy  # Plane: |field| descends towards (-0.6, -0.8)
+    service = CymaticsParticleService(seed=0)
+    rest = ParticleState(
+        positions=np.array([[0.5, 0.5], [0.123, 0.877]], dtype=np.float32),
+        velocities=np.zeros((2, 2), dtype=np.float32),
+        settled=np.zeros(2, dtype=bool),
+    )
+    moved = service.update_particles(rest, field, dt=0.1, speed=0.5, damping=1.0, noise=0.0, settle_threshold=0.0)
+    np.testing.assert_allclose(moved.velocities, [[-0.03, -0.04]] * 2, atol=1e-6)
+    np.testing.assert_allclose(moved.positions, rest.positions + moved.velocities * 0.1, atol=1e-6)
+
+    # The amplitude is interpolated too: only the particle near the low corner settles
+    settled = service.update_particles(rest, field, noise=0.0, settle_threshold=1.3 / 1.7).settled
+    assert settled.tolist() == [False, False]
+    corner = ParticleState(np.array([[0.1, 0.1], [0.9, 0.9]], dtype=np.float32), rest.velocities, rest.settled)
+    assert service.update_particles(corner, field, noise=0.0, settle_threshold=1.3 / 1.7).settled.tolist() == [True, False]
+
+
+def test_particles_leaving_the_plate_bounce_back():
+    mask = np.zeros((32, 32), dtype=bool)
+    mask[4:28, 4:28] = True
+    field = np.ones((32, 32))
+    service = CymaticsParticleService(seed=0)
+    state = ParticleState(
+        positions=np.array([[0.84, 0.5], [0.5, 0.5], [0.99, 0.5]], dtype=np.float32),
+        velocities=np.array([[2.0, 0.0], [0.1, 0.0], [1.0, 0.0]], dtype=np.float32),
+        settled=np.zeros(3, dtype=bool),
+    )
+    moved = service.update_particles(state, field, dt=0.1, damping=1.0, noise=0.0, settle_threshold=-1.0, boundary_mask=mask)
+    assert moved.positions[0].tolist() == pytest.approx([0.84, 0.5])
+    assert moved.velocities[0].tolist() == pytest.approx([-1.6, 0.0])
+    assert moved.positions[1, 0] == pytest.approx(0.51)
+
+    # Without a plate mask the unit square still contains them
+    free = service.update_particles(state, field, dt=0.1, damping=1.0, noise=0.0, settle_threshold=-1.0)
+    assert free.positions[2].tolist() == pytest.approx([0.99, 0.5]) and free.velocities[2, 0] < 0
+
+
+def test_overlay_rasterizes_settled_and_moving_particles(qapp):
+    view = CymaticsParticleView()
+    view.resize(100, 100)
+    view.set_particles(ParticleState(
+        positions=np.array([[0.205, 0.305], [0.705, 0.505], [1.5, 0.5]], dtype=np.float32),
+        velocities=np.zeros((3, 2), dtype=np.float32),
+        settled=np.array([True, False, False]),
+    ))
+    pixels = view._rasterize(100, 100)
+    assert pixels[30, 20] == QColor(255, 215, 0, 220).rgba()
+    assert pixels[50, 70] == QColor(200, 200, 200, 150).rgba()
+    assert np.count_nonzero(pixels) == 8  # Two 2x2 dots; the off-plate particle is clipped
+
+    image = QImage(100, 100, QImage.Format.Format_ARGB32)
+    image.fill(0)
+    view.render(image)
+    assert image.pixel(20, 30) != image.pixel(90, 90)
+
+
+def legacy_update(state, field, dt, speed, boundary_mask):
+    """The per-step update the array engine replaced."""
+    grid_size = field.shape[0]
+    grad_y, grad_x = np.gradient(np.abs(field))
+    x = state.positions[:, 0] * (grid_size - 1)
+    y = state.positions[:, 1] * (grid_size - 1)
+    force_x = ndimage.map_coordinates(grad_x, [y, x], order=1, mode="nearest")
+    force_y = ndimage.map_coordinates(grad_y, [y, x], order=1, mode="nearest")
+    force = np.stack((-force_x, -force_y), axis=1)
+    mag = np.linalg.norm(force, axis=1, keepdims=True)
+    force = np.where(mag > 1e-6, force / mag * speed, 0)
+    new_vel = (state.velocities + force * dt) * 0.95
+    new_pos = np.clip(state.positions + new_vel * dt, 0, 1)
+    x_idx = np.clip(np.floor(new_pos[:, 0] * (grid_size - 1)).astype(int), 0, grid_size - 1)
+    y_idx = np.clip(np.floor(new_pos[:, 1] * (grid_size - 1)).astype(int), 0, grid_size - 1)
+    outside = ~boundary_mask[y_idx, x_idx]
+    new_pos[outside] = state.positions[outside]
+    new_vel[outside] = -new_vel[outside] * 0.8
+    return ParticleState(new_pos, new_vel, np.linalg.norm(new_vel, axis=1) < 0.1)
+
+
+def legacy_paint(image, state):
+    """The per-particle painter loop the rasterizing overlay replaced."""
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    w, h = image.width(), image.height()
+    for pos, is_settled in zip(state.positions, state.settled):
+        painter.setBrush(QBrush(QColor(255, 215, 0, 220) if is_settled else QColor(200, 200, 200, 150)))
+        radius = 0.96 if is_settled else 0.8
+        painter.drawEllipse(QPointF(pos[0] * w, pos[1] * h), radius, radius)
+    painter.end()
+
+
+@pytest.mark.slow
+def test_benchmark_100k_particles(qapp):
+    params = SimulationParams(grid_size=512, plate_shape=PlateShape.CIRCULAR, mode_m=4, mode_n=3)
+    result = CymaticsSimulationService().simulate(params)
+    service = CymaticsParticleService(seed=3)
+    state = service.initialize_particles(100_000, 512, boundary_mask=result.boundary_mask)
+    legacy_state = ParticleState(state.positions.astype(float), state.velocities.astype(float), state.settled)
+
+    def per_step(step, steps=30):
+        started = time.perf_counter()
+        for _ in range(steps):
+            step()
+        return (time.perf_counter() - started) / steps
+
+    def new_step():
+        nonlocal state
+        state = service.update_particles(state, result.field, dt=0.045, boundary_mask=result.boundary_mask)
+
+    def old_step():
+        nonlocal legacy_state
+        legacy_state = legacy_update(legacy_state, result.field, 0.045, 0.5, result.boundary_mask)
+
+    engine, legacy = per_step(new_step), per_step(old_step)
+
+    view = CymaticsParticleView()
+    view.resize(700, 700)
+    view.set_particles(state)
+    image = QImage(700, 700, QImage.Format.Format_ARGB32)
+    raster = per_step(lambda: view.render(image), steps=10)
+    painted = per_step(lambda: legacy_paint(image, legacy_state), steps=1)
+
+    print(
+        f"\n100k particles: step {engine * 1000:.1f} ms (was {legacy * 1000:.1f} ms), "
+        f"draw {raster * 1000:.1f} ms (was {painted * 1000:.0f} ms); "
+        f"frame {1 / (engine + raster):.0f} fps (was {1 / (legacy + painted):.1f} fps)"
+    )
+    assert engine < legacy
+    assert (legacy + painted) / (engine + raster) > 10
@@ -0,0 +1,115 @@
+"""Tests for cached cymatics basis fields."""
+import time
+
+import numpy as np
+import pytest
+from scipy.special import jn_zeros, jv
+
+from pillars.cymatics.models import PlateShape, SimulationParams
+from pillars.cymatics.services import CymaticsSimulationService
+from pillars.cymatics.services.cymatics_simulation_service import array_nbytes
+from shared.utils.byte_budget_lru import ByteBudgetLRU
+
+
+def basis_cache(max_bytes):
+    return ByteBudgetLRU(max_bytes, array_nbytes)
+
+
+def circular_reference(params, phase):
+    """Direct J_m(k r) cos(m theta) field, as the simulator computed it per frame."""
+    axis = np.linspace(-1.0, 1.0, params.grid_size)
+    xx, yy = np.meshgrid(axis, axis)
+    r, theta = np.hypot(xx, yy), np.arctan2(yy, xx)
+
+    def mode(m, n):
+        return jv(m, jn_zeros(m, n)[-1] * r) * np.cos(m * theta)
+
+    mix = params.mix
+    field = (1 - mix) * mode(params.mode_m, params.mode_n) * (0.6 + 0.4 * np.cos(phase))
+    field += mix * mode(params.secondary_m, params.secondary_n) * (0.6 + 0.4 * np.cos(1.35 * phase + np.pi / 4))
+    field[r > 1.0] = 0.0
+    return field * np.exp(-params.damping * r**2)
+
+
+def test_cached_modes_recombine_to_the_direct_field():
+    service = CymaticsSimulationService(basis_cache(64 * 1024 * 1024))
+    params = SimulationParams(grid_size=96, plate_shape=PlateShape.CIRCULAR, mode_m=3, mode_n=2, damping=0.4)
+    for phase in (0.0, 1.1, 2.9):
+        result = service.simulate(params, phase=phase)
+        assert result.field.dtype == np.float32
+        np.testing.assert_allclose(result.field, circular_reference(params, phase), atol=1e-6)
+        assert result.normalized.max() == pytest.approx(1.0)
+
+    # Three frames, one build each of: two modes, the polar grid, the envelope, the boundary
+    assert service.cache.misses == 5 and service.cache.hits == 10
+    result.field[0, 0] = 1.0  # Results are the caller's to modify...
+    assert not service.cache.get_or_build(("mode", PlateShape.CIRCULAR, 96, 3, 2), lambda: None).flags.writeable
+
+
+def test_frequency_sweeps_reuse_modes_on_every_plate():
+    service = CymaticsSimulationService(basis_cache(64 * 1024 * 1024))
+    for plate in PlateShape:
+        params = SimulationParams(
+            grid_size=48, plate_shape=plate, use_frequency_mode=True,
+            custom_polygon_vertices=[(0.1, 0.1), (0.9, 0.2), (0.5, 0.9)],
+        )
+        for hz in np.linspace(20, 2000, 12):
+            params.frequency_hz = float(hz)
+            service.simulate(params, phase=hz / 100)
+        first_pass = service.cache.misses
+        for hz in np.linspace(20, 2000, 12):
+            params.frequency_hz = float(hz)
+            service.simulate(params, phase=hz / 50)
+        assert service.cache.misses == first_pass, plate
+
+
+def test_memory_stays_within_the_byte_budget():
+    one_field = 128 * 128 * 4
+    cache = basis_cache(6 * one_field)
+    service = CymaticsSimulationService(cache)
+    params = SimulationParams(grid_size=128, plate_shape=PlateShape.RECTANGULAR, mode_n=2, secondary_n=2)
+    for m in range(1, 9):
+        params.mode_m = params.secondary_m = m
+        service.simulate(params)
+        assert cache.size_bytes <= cache.max_bytes
+
+    # The oldest modes were evicted, the newest are still served from the cache
+    misses = cache.misses
+    service.simulate(params)
+    assert cache.misses == misses
+    params.mode_m = params.secondary_m = 1
+    service.simulate(params)
+    assert cache.misses == misses + 1
+
+    # Arrays larger than the whole budget are built but never stored
+    tiny = basis_cache(1024)
+    CymaticsSimulationService(tiny).simulate(params)
+    assert len(tiny) == 0 and tiny.misses == 3
+    cache.clear()
+    assert len(cache) == 0 and cache.size_bytes == 0
+
+
+@pytest.mark.slow
+def test_animated_sweep_frame_rate_on_a_512_circular_plate():
+    params = SimulationParams(grid_size=512, plate_shape=PlateShape.CIRCULAR, use_frequency_mode=True)
+    sweep = np.linspace(100, 1200, 30)
+
+    def frames_per_second(service, passes):
+        frames = 0
+        started = time.perf_counter()
+        for _ in range(passes):
+            for i, hz in enumerate(sweep):
+                params.frequency_hz = float(hz)
+                service.simulate(params, phase=i * 0.2)
+                frames += 1
+        return frames / (time.perf_counter() - started)
+
+    uncached = frames_per_second(CymaticsSimulationService(basis_cache(0)), 1)
+    service = CymaticsSimulationService(basis_cache(256 * 1024 * 1024))
+    frames_per_second(service, 1)  # Fill the cache with the sweep's modes
+    cached = frames_per_second(service, 3)
+    print(
+        f"\n512x512 circular frequency sweep: {uncached:.1f} fps uncached, {cached:.1f} fps cached "
+        f"({cached / uncached:.1f}x, {len(service.cache)} arrays, {service.cache.size_bytes / 2**20:.0f} MB)"
+    )
+    assert cached > 3 * uncached
@@ -0,0 +1,111 @@
+"""Tests for the content-addressed ImageRepository."""
+from __future__ import annotations
+
+import zlib
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import pillars.document_manager.models  # noqa: F401  (registers all mappings)
+from shared.database import Base
+from shared.models.document_manager.document import Document, DocumentImage, ImageBlob
+from shared.repositories.document_manager import image_repository
+from shared.repositories.document_manager.image_blob_store import ImageBlobStore
+from shared.repositories.document_manager.image_repository import ImageRepository
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 512
+BMP_BYTES = b"BM" + b"\x11" * 4096
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'images.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([Document(id=1, title="One"), Document(id=2, title="Two")])
+    session.commit()
+    image_repository.clear_image_caches()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def repo(db, tmp_path):
+    return ImageRepository(db, store=ImageBlobStore(tmp_path / "store"))
+
+
+def test_identical_images_share_one_blob_across_documents(repo, db):
+    first = repo.create(document_id=1, data=PNG_BYTES, mime_type="image/png")
+    second = repo.create(document_id=2, data=PNG_BYTES, mime_type="image/png")
+    db.commit()
+
+    assert first.id != second.id
+    assert first.data is None and second.data is None
+    blob = db.get(ImageBlob, first.hash)
+    assert blob.ref_count == 2
+    assert repo.store.exists(first.hash)
+    assert repo.get_decompressed_data(second) == PNG_BYTES
+
+
+def test_precompressed_formats_are_stored_verbatim(repo):
+    png = repo.create(document_id=1, data=PNG_BYTES, mime_type="image/png")
+    bmp = repo.create(document_id=1, data=BMP_BYTES, mime_type="image/bmp")
+
+    assert repo.get_blob(png.hash).compressed is False
+    assert repo.store.path_for(png.hash).read_bytes() == PNG_BYTES
+    assert repo.get_blob(bmp.hash).compressed is True
+    assert repo.get_decompressed_data(bmp) == BMP_BYTES
+
+
+def test_blob_removed_when_last_reference_goes(repo, db):
+    first = repo.create(document_id=1, data=BMP_BYTES, mime_type="image/bmp")
+    second = repo.create(document_id=2, data=BMP_BYTES, mime_type="image/bmp")
+    db.commit()
+
+    assert repo.delete(first.id)
+    db.commit()
+    assert db.get(ImageBlob, second.hash).ref_count == 1
+    assert repo.store.exists(second.hash)
+
+    repo.delete_by_document(2)
+    # The file outlives the row until the deletion is committed
+    assert repo.store.exists(second.hash)
+    db.commit()
+    assert repo.purge_released_blobs() == 1
+    assert db.get(ImageBlob, second.hash) is None
+    assert not repo.store.exists(second.hash)
+
+
+def test_rolled_back_release_keeps_blob_file(repo, db):
+    image = repo.create(document_id=1, data=BMP_BYTES, mime_type="image/bmp")
+    db.commit()
+    hash = image.hash
+
+    assert repo.delete(image.id)
+    db.rollback()
+
+    assert repo.purge_released_blobs() == 0
+    assert db.get(ImageBlob, hash).ref_count == 1
+    assert repo.store.exists(hash)
+    assert repo.get_decompressed_data(repo.get(image.id)) == BMP_BYTES
+
+
+def test_legacy_inline_rows_are_readable_and_migrate(repo, db):
+    legacy = DocumentImage(
+        document_id=1,
+        hash="legacy",
+        data=zlib.compress(BMP_BYTES),
+        mime_type="image/bmp",
+    )
+    db.add(legacy)
+    db.commit()
+
+    assert repo.get_decompressed_data(legacy) == BMP_BYTES
+    assert repo.migrate_inline_images() == 1
+
+    db.refresh(legacy)
+    assert legacy.data is None
+    assert repo.get_blob(legacy.hash).ref_count == 1
+    assert repo.get_decompressed_data(legacy) == BMP_BYTES
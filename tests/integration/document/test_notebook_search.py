@@ -0,0 +1,66 @@
+"""Tests for FTS5-backed notebook search."""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import pillars.document_manager.models  # noqa: F401  (registers all mappings)
+from shared.database import Base
+from shared.repositories.document_manager.notebook_search_repository import build_match_query
+from shared.services.document_manager.notebook_service import NotebookService
+
+
+@pytest.fixture
+def service(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'notebooks.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    svc = NotebookService(session)
+
+    notebook = svc.create_notebook("Studies")
+    svc.section = svc.create_section(notebook.id, "Kabbalah")
+    svc.other = svc.create_section(notebook.id, "Astrology")
+    yield svc
+    session.close()
+    engine.dispose()
+
+
+def test_build_match_query_quotes_words_and_prefixes_last():
+    assert build_match_query('tree of "life') == '"tree" "of" "life"*'
+    assert build_match_query("  ") == ""
+
+
+def test_ranked_results_with_path_and_snippet(service):
+    service.create_page(service.section.id, "Sephiroth", "The sephiroth form the tree of life.")
+    service.create_page(service.other.id, "Houses", "Twelve houses, one mention of sephiroth.")
+
+    results = service.search_global("sephiroth")
+
+    # Title match ranks first
+    assert [r.title for r in results] == ["Sephiroth", "Houses"]
+    assert results[0].notebook_name == "Studies"
+    assert results[0].section_name == "Kabbalah"
+    assert "sephiroth" in results[1].snippet.lower()
+
+
+def test_prefix_search_as_you_type(service):
+    service.create_page(service.section.id, "Numbers", "Gematria assigns values to letters.")
+
+    assert [r.title for r in service.search_global("gemat")] == ["Numbers"]
+
+
+def test_index_follows_edits_moves_and_deletes(service):
+    page = service.create_page(service.section.id, "Draft", "alpha")
+    assert service.search_global("alpha")
+
+    page.content = "omega"
+    service.db.commit()
+    assert not service.search_global("alpha")
+    assert service.search_global("omega")
+
+    service.move_page(page.id, service.other.id)
+    assert service.search_global("omega")[0].section_name == "Astrology"
+
+    service.delete_page(page.id)
+    assert not service.search_global("omega")
@@ -0,0 +1,94 @@
+"""Tests for the Whoosh-backed DocumentSearchRepository."""
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from shared.repositories.document_manager import search_repository
+from shared.repositories.document_manager.search_repository import DocumentSearchRepository
+
+
+def _doc(doc_id: int, title: str, content: str):
+    return SimpleNamespace(
+        id=doc_id,
+        title=title,
+        content=content,
+        file_type="txt",
+        author="",
+        collection="Scripture",
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 1, 1),
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    search_repository.clear_search_caches()
+    repository = DocumentSearchRepository(index_dir=str(tmp_path / "index"))
+    repository.index_documents([
+        _doc(1, "Light", "light upon light, and the light shone in darkness"),
+        _doc(2, "Waters", "the spirit moved upon the face of the waters"),
+        _doc(3, "Lights", "Let there be light. Lights in the firmament."),
+    ])
+    yield repository
+    search_repository.clear_search_caches()
+
+
+def test_hit_counts_come_from_postings(repo):
+    results = {r["id"]: r for r in repo.search("light")}
+
+    assert set(results) == {1, 3}
+    # Title + three content occurrences
+    assert results[1]["hit_count"] == 4
+    # Stemming folds "Lights" into "light": title + two content hits
+    assert results[3]["hit_count"] == 3
+    assert "light" in results[1]["highlights"].lower()
+
+
+def test_search_page_paginates_without_highlights(repo):
+    first = repo.search_page("light", page=1, page_size=1)
+
+    assert first["total"] == 2
+    assert first["page_count"] == 2
+    assert len(first["results"]) == 1
+    assert "highlights" not in first["results"][0]
+
+    second = repo.search_page("light", page=2, page_size=1)
+    ids = {first["results"][0]["id"], second["results"][0]["id"]}
+    assert ids == {1, 3}
+
+
+def test_search_page_cache_invalidated_by_writes(repo):
+    before = repo.search_page("waters")
+    assert repo.search_page("waters") == before
+    assert len(search_repository._page_cache) == 1
+
+    repo.index_document(_doc(4, "Deep", "darkness upon the waters"))
+    after = repo.search_page("waters")
+
+    assert len(search_repository._page_cache) == 2
+    assert after["total"] == 2
+
+
+def test_search_page_returns_copies_of_cached_pages(repo):
+    first = repo.search_page("light")
+    first["results"][0]["title"] = "Edited"
+    first["results"].clear()
+    first["total"] = 0
+
+    again = repo.search_page("light")
+
+    assert again["total"] == 2
+    assert len(again["results"]) == 2
+    assert "Edited" not in {r["title"] for r in again["results"]}
+
+
+def test_get_highlights_only_for_requested_rows(repo):
+    highlights = repo.get_highlights("light", [3, 2])
+
+    assert set(highlights) == {2, 3}
+    assert "light" in highlights[3].lower()
+    # Document 2 does not match the query, so it has no snippet
+    assert highlights[2] == ""
@@ -0,0 +1,159 @@
+"""Tests for ArraySolidPayload and the vectorized mesh generators."""
+from __future__ import annotations
+
+import io
+import time
+
+import numpy as np
+import pytest
+
+from pillars.geometry.services import figurate_3d
+from pillars.geometry.services.mesh_export import write_obj
+from pillars.geometry.services.solid_geometry import edges_from_face_arrays, edges_from_faces, grid_quads
+from pillars.geometry.services.sphere_solid import SphereSolidService
+from pillars.geometry.services.torus_knot_solid import TorusKnotMeshConfig, TorusKnotSolidService
+from pillars.geometry.services.torus_solid import TorusMeshConfig, TorusSolidService
+from pillars.geometry.shared.solid_payload import ArraySolidPayload, SolidPayload
+
+
+def square_pyramid() -> ArraySolidPayload:
+    vertices = np.array([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0.5, 0.5, 1)], dtype=float)
+    faces = np.array([0, 3, 2, 1, 0, 1, 4, 1, 2, 4, 2, 3, 4, 3, 0, 4])
+    return ArraySolidPayload(vertices=vertices, faces=faces, face_offsets=np.array([0, 4, 7, 10, 13, 16]))
+
+
+def test_tuple_views_match_list_payload():
+    payload = square_pyramid()
+    assert payload.vertices[4] == (0.5, 0.5, 1.0)
+    assert list(payload.faces[0]) == [0, 3, 2, 1]
+    assert [len(face) for face in payload.faces] == [4, 3, 3, 3, 3]
+    assert payload.edges == edges_from_faces([list(face) for face in payload.faces])
+    assert payload.bounds() == ((0.0, 0.0, 0.0), (1.0, 1.0, 1.0))
+
+    as_lists = SolidPayload(
+        vertices=list(payload.vertices),
+        faces=[tuple(face) for face in payload.faces],
+        edges=list(payload.edges),
+    )
+    packed = as_lists.mesh_buffers()
+    np.testing.assert_array_equal(packed.vertices, payload.mesh_buffers().vertices)
+    np.testing.assert_array_equal(packed.face_offsets, payload.mesh_buffers().face_offsets)
+    np.testing.assert_array_equal(packed.face_indices, payload.mesh_buffers().face_indices)
+
+
+def test_mesh_buffers_are_shared_not_copied():
+    payload = TorusSolidService.build(config=TorusMeshConfig(major_segments=12, minor_segments=8)).payload
+    assert isinstance(payload, ArraySolidPayload)
+    buffers = payload.mesh_buffers()
+    assert payload.mesh_buffers() is buffers
+    assert np.shares_memory(np.asarray(payload.vertices), buffers.vertices)
+
+
+def test_edges_from_face_arrays_matches_edges_from_faces():
+    faces = [[0, 1, 2], [2, 2, 3], [5], [4, 1, 0, 3], [6, 7]]
+    offsets = np.cumsum([0] + [len(face) for face in faces])
+    indices = np.array([i for face in faces for i in face])
+    assert [tuple(edge) for edge in edges_from_face_arrays(indices, offsets).tolist()] == edges_from_faces(faces)
+
+    quads = grid_quads(6, 5, wrap_rows=False)
+    assert [tuple(edge) for edge in edges_from_face_arrays(quads.ravel(), np.arange(0, quads.size + 1, 4)).tolist()] == \
+        edges_from_faces(quads.tolist())
+
+
+@pytest.mark.parametrize(
+    "payload, vertices, faces, closed",
+    [
+        (TorusSolidService.build(config=TorusMeshConfig(major_segments=16, minor_segments=8)).payload, 128, 128, True),
+        (TorusKnotSolidService.build(config=TorusKnotMeshConfig(tubular_segments=64, radial_segments=6)).payload, 384, 384, True),
+        # The UV sphere repeats its pole vertex once per segment
+        (SphereSolidService.build(radius=2.0, rings=6, segments=10).payload, 70, 60, False),
+    ],
+)
+def test_generators_produce_quad_meshes(payload, vertices, faces, closed):
+    assert len(payload.vertices) == vertices
+    assert len(payload.faces) == faces
+    assert all(len(face) == 4 for face in payload.faces)
+    buffers = payload.mesh_buffers()
+    ring = buffers.face_indices.reshape(-1, 4)
+    pairs = np.sort(np.stack((ring, np.roll(ring, -1, axis=1)), axis=-1).reshape(-1, 2), axis=1)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    _, counts = np.unique(pairs, axis=0, return_counts=True)
+    assert len(counts) == len(payload.edges)
+    # Every edge of a wrapped quad grid is shared by exactly two faces
+    assert (counts == 2).all() == closed
+
+
+def test_sphere_vertices_lie_on_the_sphere():
+    payload = SphereSolidService.build(radius=2.0, rings=6, segments=10).payload
+    np.testing.assert_allclose(np.linalg.norm(payload.mesh_buffers().vertices, axis=1), 2.0)
+    assert payload.vertices[0] == pytest.approx((0.0, 0.0, 2.0))
+    assert list(payload.faces[0]) == [0, 1, 11, 10]
+
+
+def test_figurate_points_keep_order_and_counts():
+    assert figurate_3d.cubic_points(2) == [
+        (-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (-0.5, 0.5, -0.5), (0.5, 0.5, -0.5),
+        (-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (-0.5, 0.5, 0.5), (0.5, 0.5, 0.5),
+    ]
+    for n in range(1, 7):
+        assert len(figurate_3d.tetrahedral_points(n)) == figurate_3d.tetrahedral_number(n)
+        assert len(figurate_3d.square_pyramidal_points(n)) == figurate_3d.square_pyramidal_number(n)
+        assert len(figurate_3d.octahedral_points(n)) == figurate_3d.octahedral_number(n)
+        assert len(figurate_3d.centered_cubic_points(n)) == n ** 3 + (n - 1) ** 3
+    # Apex first; octahedral layers alternate above and below the base
+    assert figurate_3d.square_pyramidal_points(3)[0] == (0.0, 0.0, 2.0)
+    assert figurate_3d.octahedral_points(2)[4:] == [(0.0, 0.0, 1.0), (0.0, 0.0, -1.0)]
+    # Each tetrahedral layer is centered on the Z-axis
+    layer = np.array(figurate_3d.tetrahedral_points(4)[4:10])
+    np.testing.assert_allclose(layer[:, :2].mean(axis=0), 0.0, atol=1e-12)
+
+    projected = figurate_3d.project_dynamic([(1.0, 0.0, 0.0), (0.0, 0.0, 1.0)], 90.0, 0.0)
+    assert projected[0] == pytest.approx((0.0, 0.0), abs=1e-12)
+    assert projected[1] == pytest.approx((0.0, -1.0))
+    assert figurate_3d.project_dynamic([], 10.0, 20.0) == []
+
+
+def test_obj_export_writes_buffers():
+    stream = io.StringIO()
+    write_obj(square_pyramid(), stream)
+    lines = stream.getvalue().splitlines()
+    assert lines[0] == "# 5 vertices, 5 faces, 8 edges"
+    assert lines[1:6] == ["v 0 0 0", "v 1 0 0", "v 1 1 0", "v 0 1 0", "v 0.5 0.5 1"]
+    assert lines[6:] == ["f 1 4 3 2", "f 1 2 5", "f 2 3 5", "f 3 4 5", "f 4 1 5"]
+
+    wire = io.StringIO()
+    write_obj(SolidPayload(vertices=[(0, 0, 0), (1, 0, 0)], edges=[(0, 1)]), wire)
+    assert wire.getvalue().splitlines()[-1] == "l 1 2"
+
+
+def test_obj_export_to_path(tmp_path):
+    path = tmp_path / "torus.obj"
+    write_obj(TorusSolidService.build(config=TorusMeshConfig(major_segments=6, minor_segments=4)).payload, path)
+    lines = path.read_text().splitlines()
+    assert sum(line.startswith("v ") for line in lines) == 24
+    assert sum(line.startswith("f ") for line in lines) == 24
+
+
+@pytest.mark.slow
+def test_torus_knot_build_benchmark():
+    config = TorusKnotMeshConfig(tubular_segments=800, radial_segments=24)
+
+    start = time.perf_counter()
+    payload = TorusKnotSolidService.build(p=3, q=7, config=config).payload
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    as_lists = SolidPayload(vertices=list(payload.vertices), faces=list(payload.faces), edges=list(payload.edges))
+    tuples = time.perf_counter() - start
+
+    start = time.perf_counter()
+    write_obj(payload, io.StringIO())
+    export = time.perf_counter() - start
+
+    print(
+        f"\n{len(payload.faces):,} faces: build {build * 1000:.1f} ms, "
+        f"tuple adapter {tuples * 1000:.1f} ms, OBJ export {export * 1000:.1f} ms"
+    )
+    assert as_lists.mesh_buffers().face_indices.size == payload.mesh_buffers().face_indices.size
+    # The array path must beat merely materializing the tuple lists
+    assert build < tuples
@@ -0,0 +1,254 @@
+"""Tests for the append-only geometry history journal."""
+import json
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from pillars.geometry.services import history_journal, persistence_service
+from pillars.geometry.services.history_journal import HistoryJournal
+from pillars.geometry.services.persistence_service import PersistenceService
+from pillars.geometry.services.polygon_shape import RegularPolygonShape
+
+SRC = Path(__file__).resolve().parents[3] / "src"
+
+
+def entry(i, shape="Regular Hexagon", size=0):
+    return {
+        "timestamp": f"2025-01-01T00:00:{i // 1000:02d}.{i % 1000:06d}",
+        "shape_name": shape,
+        "summary": f"Side: {i}",
+        "note": "",
+        "data": {"properties": {"side": i}, "padding": "x" * size},
+    }
+
+
+def sides(entries):
+    return [e["data"]["properties"]["side"] for e in entries]
+
+
+def test_pages_by_shape_and_time_survive_a_reload(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    journal = HistoryJournal(path)
+    for i in range(10):
+        journal.append(entry(i, "Square" if i % 2 else "Circle"))
+    assert journal.set_note(entry(4)["timestamp"], "golden")
+    assert journal.delete(entry(6)["timestamp"])
+    assert not journal.delete(entry(6)["timestamp"]) and not journal.set_note("never", "x")
+
+    for j in (journal, HistoryJournal(path)):
+        assert j.count() == 9 and j.count("Circle") == 4 and j.count("Hexagon") == 0
+        first = j.page("Circle", limit=2)
+        assert sides(first) == [8, 4] and first[1]["note"] == "golden"
+        assert sides(j.page("Circle", before=first[-1]["timestamp"], limit=2)) == [2, 0]
+        assert sides(j.page(limit=3)) == [9, 8, 7]
+        assert j.page("Hexagon") == []
+
+    # Re-saving a timestamp replaces the entry
+    journal.append(dict(entry(8, "Circle"), summary="again"))
+    assert journal.count() == 9 and HistoryJournal(path).page("Circle", limit=1)[0]["summary"] == "again"
+
+
+def test_compaction_keeps_live_entries_and_shrinks_the_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(history_journal, "COMPACT_MIN_DEAD", 20)
+    path = tmp_path / "history.jsonl"
+    journal = HistoryJournal(str(path), max_entries=30)
+    for i in range(40):
+        journal.append(entry(i, size=200))
+    for i in range(30, 35):
+        journal.set_note(entry(i)["timestamp"], f"note {i}")
+
+    # The 10 trimmed entries are dead weight, not yet past the threshold
+    assert len(path.read_bytes().splitlines()) == 45
+    for i in range(20, 26):
+        journal.delete(entry(i)["timestamp"])
+    assert len(path.read_bytes().splitlines()) == 51
+    # A seventh delete makes the dead records outnumber the live ones: rewrite
+    journal.delete(entry(26)["timestamp"])
+    assert len(path.read_bytes().splitlines()) == 23
+    assert not (tmp_path / "history.jsonl.tmp").exists()
+
+    reloaded = HistoryJournal(str(path), max_entries=30)
+    saved = reloaded.page(limit=100)
+    assert sides(saved) == list(range(39, 26, -1)) + list(range(19, 9, -1))
+    assert [e["note"] for e in saved if e["note"]] == [f"note {i}" for i in range(34, 29, -1)]
+
+    reloaded.clear()
+    assert path.read_bytes() == b"" and HistoryJournal(str(path)).count() == 0
+
+
+def test_legacy_history_is_imported_once(tmp_path):
+    legacy = tmp_path / "history.json"
+    legacy.write_text(json.dumps([dict(entry(i), note="old" if i == 2 else "") for i in (3, 2, 1)]))
+    journal = HistoryJournal(str(tmp_path / "history.jsonl"), legacy_path=str(legacy))
+
+    assert sides(journal.page()) == [3, 2, 1] and journal.page()[1]["note"] == "old"
+    assert not legacy.exists() and (tmp_path / "history.json.migrated").exists()
+    journal.append(entry(4))
+    assert sides(HistoryJournal(str(tmp_path / "history.jsonl"), legacy_path=str(legacy)).page()) == [4, 3, 2, 1]
+
+
+def test_persistence_service_uses_the_journal(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence_service, "HISTORY_FILE", str(tmp_path / "history.jsonl"))
+    monkeypatch.setattr(persistence_service, "LEGACY_HISTORY_FILE", str(tmp_path / "missing.json"))
+    hexagon, square = RegularPolygonShape(6), RegularPolygonShape(4)
+    hexagon.set_property("side", 2.0)
+    for shape in (hexagon, square, hexagon):
+        PersistenceService.save_calculation(shape)
+
+    assert PersistenceService.count_calculations() == 3
+    saved = PersistenceService.get_calculations(hexagon.name)
+    assert len(saved) == 2 and saved[0]["summary"].startswith("Side Length: 2.00")
+    assert saved[0]["data"] == hexagon.to_dict()
+    assert PersistenceService.get_calculations(hexagon.name, before=saved[0]["timestamp"]) == saved[1:]
+
+    PersistenceService.update_note(saved[0]["timestamp"], "check")
+    PersistenceService.delete_calculation(saved[1]["timestamp"])
+    assert [e["note"] for e in PersistenceService.get_recent_calculations()] == ["check", ""]
+    PersistenceService.clear_history()
+    assert PersistenceService.get_recent_calculations() == []
+
+
+def test_a_torn_last_record_is_ignored_and_overwritten(tmp_path):
+    path = tmp_path / "history.jsonl"
+    journal = HistoryJournal(str(path))
+    for i in range(3):
+        journal.append(entry(i))
+    line = json.dumps({"op": "save", "entry": entry(3)}).encode()
+    with open(path, "ab") as f:
+        f.write(line[: len(line) // 2])
+
+    recovered = HistoryJournal(str(path))
+    assert sides(recovered.page()) == [2, 1, 0]
+    recovered.append(entry(4))
+    assert sides(HistoryJournal(str(path)).page()) == [4, 2, 1, 0]
+    assert all(json.loads(raw) for raw in path.read_bytes().splitlines())
+
+
+def test_two_instances_sharing_a_journal_keep_each_others_records(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    first, second = HistoryJournal(path), HistoryJournal(path)
+    first.append(entry(0))
+    second.append(entry(1))  # Must not cut off the first instance's record
+    first.append(entry(2))
+    assert sides(first.page()) == sides(second.page()) == [2, 1, 0]
+
+    second.set_note(entry(0)["timestamp"], "from second")
+    first.delete(entry(1)["timestamp"])
+    first.compact()  # Replaces the file under the second instance
+    assert [e["note"] for e in second.page()] == ["", "from second"]
+    second.append(entry(3))
+    third = HistoryJournal(path)
+    assert sides(third.page()) == [3, 2, 0] and third.page()[-1]["note"] == "from second"
+    assert b"\0" not in Path(path).read_bytes()
+
+    # A file cut short elsewhere is re-read rather than padded
+    Path(path).write_bytes(_encoded_saves(entry(4)))
+    first.append(entry(5))
+    assert sides(first.page()) == sides(HistoryJournal(path).page()) == [5, 4]
+    assert b"\0" not in Path(path).read_bytes()
+
+
+def _encoded_saves(*entries):
+    return b"".join(history_journal._encode({"op": "save", "entry": e}) for e in entries)
+
+
+def test_a_failed_compaction_leaves_the_journal_intact(tmp_path, monkeypatch):
+    path = tmp_path / "history.jsonl"
+    journal = HistoryJournal(str(path))
+    for i in range(5):
+        journal.append(entry(i))
+    before = path.read_bytes()
+
+    def crash(*args):
+        raise OSError("disk pulled")
+
+    monkeypatch.setattr(os, "replace", crash)
+    with pytest.raises(OSError):
+        journal.compact()
+    assert path.read_bytes() == before
+    monkeypatch.undo()
+    assert sides(HistoryJournal(str(path)).page()) == [4, 3, 2, 1, 0]
+
+
+WRITER = """
+import sys
+from pillars.geometry.services.history_journal import HistoryJournal
+
+journal = HistoryJournal(sys.argv[1])
+i = 0
+while True:
+    journal.append({"timestamp": f"{i:012d}", "shape_name": "Circle", "summary": "", "note": "",
+                    "data": {"side": i, "padding": "x" * 50_000}})
+    if i % 7 == 0:
+        journal.set_note(f"{i:012d}", f"note {i}")
+    print(i, flush=True)
+    i += 1
+"""
+
+
+def test_killing_a_writer_mid_save_loses_nothing_it_confirmed(tmp_path):
+    path = tmp_path / "history.jsonl"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])))
+    writer = subprocess.Popen(
+        [sys.executable, "-c", textwrap.dedent(WRITER), str(path)], stdout=subprocess.PIPE, text=True, env=env,
+    )
+    confirmed = -1
+    try:
+        while confirmed < 40:
+            confirmed = int(writer.stdout.readline())
+    finally:
+        writer.send_signal(signal.SIGKILL)
+        writer.wait()
+        writer.stdout.close()
+
+    journal = HistoryJournal(str(path))
+    saved = journal.page(limit=10_000)
+    assert len(saved) >= confirmed + 1
+    assert [e["data"]["side"] for e in saved] == list(range(len(saved) - 1, -1, -1))
+    assert saved[-8]["note"] == "note 7"
+
+    journal.append({"timestamp": "999999999999", "shape_name": "Circle", "data": {"side": -1}})
+    reloaded = HistoryJournal(str(path))
+    assert reloaded.count() == len(saved) + 1 and reloaded.page(limit=1)[0]["data"]["side"] == -1
+
+
+def legacy_save(path, new_entry):
+    """The whole-file rewrite the journal replaced."""
+    with open(path) as f:
+        history = json.load(f)
+    history.insert(0, new_entry)
+    with open(path, "w") as f:
+        json.dump(history, f, indent=2)
+
+
+@pytest.mark.slow
+def test_save_time_does_not_grow_with_history(tmp_path):
+    def time_saves(save, start, count=50):
+        started = time.perf_counter()
+        for i in range(start, start + count):
+            save(entry(i, size=500))
+        return (time.perf_counter() - started) / count
+
+    timings = {}
+    for size in (100, 5000):
+        journal = HistoryJournal(str(tmp_path / f"history-{size}.jsonl"), max_entries=10_000)
+        for i in range(size):
+            journal.append(entry(i, size=500))
+        timings[size] = time_saves(journal.append, size)
+
+    legacy = tmp_path / "history.json"
+    legacy.write_text(json.dumps([entry(i, size=500) for i in range(5000)]))
+    rewrite = time_saves(lambda e: legacy_save(legacy, e), 5000, count=10)
+
+    print(
+        f"\nsave latency: journal {timings[100] * 1000:.2f} ms at 100 entries, "
+        f"{timings[5000] * 1000:.2f} ms at 5000; whole-file rewrite {rewrite * 1000:.1f} ms at 5000"
+    )
+    assert timings[5000] < 3 * timings[100]
+    assert timings[5000] < rewrite
@@ -0,0 +1,173 @@
+"""Tests for the vectorized projection pipeline behind Geometry3DView."""
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import QPoint, QPointF
+from PyQt6.QtGui import QColor, QVector3D
+
+from pillars.geometry.services.rectangular_prism_solid import RectangularPrismSolidService
+from pillars.geometry.services.torus_knot_solid import TorusKnotMeshConfig, TorusKnotSolidService
+from pillars.geometry.shared.solid_payload import SolidPayload
+from pillars.geometry.ui.geometry3d.mesh_projection import (
+    build_mesh_arrays,
+    project_mesh,
+    rotation_3x3,
+)
+from pillars.geometry.ui.geometry3d.view3d import CameraState, Geometry3DView
+
+DEFAULT_RGBA = (0, 180, 255, 255)
+
+def legacy_projection(payload, camera, scale):
+    """The per-vertex / per-face QVector3D loop the view used before."""
+    matrix = camera.rotation_matrix()
+    transformed, screen = [], []
+    for vx, vy, vz in payload.vertices:
+        rotated = matrix * QVector3D(vx, vy, vz)
+        transformed.append(rotated)
+        screen.append(QPointF(rotated.x() * scale, -rotated.y() * scale))
+
+    light_dir = QVector3D(-0.5, 0.5, 1.0).normalized()
+    faces = []
+    for i, face in enumerate(payload.faces):
+        positions = [transformed[j] for j in face]
+        if len(positions) < 3:
+            continue
+        centroid_z = sum(v.z() for v in positions) / len(positions)
+        v0, v1, v2 = positions[:3]
+        normal = QVector3D.crossProduct(v1 - v0, v2 - v0).normalized()
+        dot = QVector3D.dotProduct(normal, light_dir)
+        intensity = max(0.1, min(1.0, (dot + 1.0) * 0.5))
+        faces.append((centroid_z, i, intensity))
+    faces.sort(key=lambda x: x[0])
+    return screen, faces
+
+
+def open_strip() -> SolidPayload:
+    vertices = [(float(x), float(y), 0.1 * x * y) for y in range(4) for x in range(4)]
+    faces = [[y * 4 + x, y * 4 + x + 1, (y + 1) * 4 + x + 1, (y + 1) * 4 + x] for y in range(3) for x in range(3)]
+    return SolidPayload(vertices=vertices, faces=faces, edges=[(0, 1), (1, 2)])
+
+
+def test_open_mesh_matches_legacy_loop():
+    payload = open_strip()
+    camera = CameraState(yaw_deg=37.0, pitch_deg=-21.0)
+    legacy_points, legacy_faces = legacy_projection(payload, camera, 40.0)
+
+    mesh = build_mesh_arrays(payload)
+    assert not mesh.cull_back_faces
+    frame = project_mesh(mesh, rotation_3x3(camera.rotation_matrix()), 40.0, DEFAULT_RGBA)
+
+    expected = np.array([(p.x(), p.y()) for p in legacy_points])
+    np.testing.assert_allclose(frame.points, expected, atol=1e-3)
+
+    assert sorted(mesh.face_ids[frame.order].tolist()) == list(range(len(payload.faces)))
+    for _, face_id, intensity in legacy_faces:
+        assert frame.intensity[face_id] == pytest.approx(intensity, abs=1e-4)
+    depths = mesh.centroids[frame.order] @ rotation_3x3(camera.rotation_matrix())[2]
+    assert np.all(np.diff(depths) >= 0)
+
+
+def test_closed_mesh_culls_back_faces():
+    payload = RectangularPrismSolidService.build().payload
+    mesh = build_mesh_arrays(payload)
+    assert mesh.cull_back_faces
+
+    camera = CameraState(yaw_deg=30.0, pitch_deg=25.0)
+    frame = project_mesh(mesh, rotation_3x3(camera.rotation_matrix()), 50.0, DEFAULT_RGBA)
+    # A box seen off-axis shows exactly three faces
+    assert len(frame.order) == 3
+    assert len(frame.polygons()) == len(frame.colors()) == 3
+
+    # A translucent face lets back faces show through, so nothing is culled
+    payload.face_colors = [(200, 100, 50, 120)] * len(payload.faces)
+    translucent = build_mesh_arrays(payload)
+    assert not translucent.cull_back_faces
+    assert len(project_mesh(translucent, np.eye(3), 50.0, DEFAULT_RGBA).order) == len(payload.faces)
+
+
+def test_face_colors_are_shaded_per_face():
+    payload = open_strip()
+    payload.face_colors = [(100, 200, 50, 255)] + [None] * (len(payload.faces) - 1)
+    mesh = build_mesh_arrays(payload)
+    frame = project_mesh(mesh, np.eye(3), 10.0, DEFAULT_RGBA)
+
+    for row, face in enumerate(frame.order.tolist()):
+        base = (100, 200, 50, 255) if mesh.face_ids[face] == 0 else DEFAULT_RGBA
+        shade = frame.intensity[face]
+        assert frame.rgba[row].tolist() == [int(base[0] * shade), int(base[1] * shade), int(base[2] * shade), base[3]]
+
+
+def test_view_reuses_frame_while_panning(qapp):
+    view = Geometry3DView()
+    view.resize(400, 300)
+    view.set_payload(RectangularPrismSolidService.build().payload)
+    view.grab()
+    frame = view._frame
+    polygons = frame.polygons()
+
+    view._camera.pan_x += 0.5
+    view.grab()
+    assert view._frame is frame
+    assert frame.polygons() is polygons
+
+    view.set_camera_angles(60.0, 10.0)
+    view.grab()
+    assert view._frame is not frame
+
+    # Hit testing works on the projected array
+    view.set_measure_mode(True)
+    view.grab()
+    target = view._last_screen_points[3]
+    assert view._find_vertex_at_point(QPoint(round(target.x()), round(target.y())), threshold=2.0) == 3
+
+
+@pytest.mark.slow
+def test_projection_benchmark_high_resolution_knot(qapp):
+    config = TorusKnotMeshConfig(tubular_segments=800, radial_segments=24)
+    payload = TorusKnotSolidService.build(p=3, q=7, config=config).payload
+    camera = CameraState(yaw_deg=30.0, pitch_deg=25.0)
+
+    start = time.perf_counter()
+    for _ in range(3):
+        legacy_projection(payload, camera, 50.0)
+    legacy = (time.perf_counter() - start) / 3
+
+    mesh = build_mesh_arrays(payload)
+    rotation = rotation_3x3(camera.rotation_matrix())
+    start = time.perf_counter()
+    for _ in range(3):
+        frame = project_mesh(mesh, rotation, 50.0, DEFAULT_RGBA)
+        frame.polygons()
+        frame.colors()
+    vectorized = (time.perf_counter() - start) / 3
+
+    print(
+        f"\n{len(payload.faces):,} faces ({len(frame.order):,} front-facing): "
+        f"legacy {legacy * 1000:.1f} ms, vectorized {vectorized * 1000:.1f} ms per frame"
+    )
+    assert vectorized * 3 < legacy
+
+
+def test_array_payload_buffers_pass_through_without_copy():
+    payload = TorusKnotSolidService.build(config=TorusKnotMeshConfig(tubular_segments=48, radial_segments=6)).payload
+    buffers = payload.mesh_buffers()
+    mesh = build_mesh_arrays(payload)
+    assert mesh.vertices is buffers.vertices
+    assert mesh.face_indices is buffers.face_indices
+    assert mesh.edges is buffers.edges
+    assert mesh.cull_back_faces
+
+    # Degenerate faces are dropped, and face colors still land on the right rows
+    payload = SolidPayload(
+        vertices=[(0, 0, 0), (1, 0, 0), (0, 1, 0), (1, 1, 0)],
+        faces=[(0, 1), (0, 1, 2), (1, 3, 2)],
+        face_colors=[(1, 2, 3, 255), None, (10, 20, 30, 255)],
+    )
+    mesh = build_mesh_arrays(payload)
+    assert mesh.face_ids.tolist() == [1, 2]
+    assert mesh.face_offsets.tolist() == [0, 3, 6]
+    assert mesh.has_color.tolist() == [False, True]
+    assert mesh.colors[1].tolist() == [10, 20, 30, 255]
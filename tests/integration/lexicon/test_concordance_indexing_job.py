@@ -0,0 +1,117 @@
+"""Tests for the parallel, resumable concordance indexing job."""
+from __future__ import annotations
+
+import pytest
+
+from shared.repositories.lexicon.key_database import KeyDatabase
+from shared.services.lexicon.concordance_indexer_service import ConcordanceIndexerService
+from shared.services.lexicon import concordance_indexing_job
+from shared.services.lexicon.concordance_indexing_job import ConcordanceIndexingJob, DocumentVerses
+
+
+def _verses(prefix, count):
+    return [
+        {"id": i, "verse_number": i, "text": f"{prefix} lamp tree verse{i} light olive"}
+        for i in range(1, count + 1)
+    ]
+
+
+def _snapshot(db_path):
+    conn = KeyDatabase(db_path)._get_conn()
+    try:
+        freqs = {r["word"]: r["frequency"] for r in conn.execute("SELECT word, frequency FROM master_key")}
+        occurrences = conn.execute(
+            "SELECT COUNT(*) FROM word_occurrences"
+        ).fetchone()[0]
+        return freqs, occurrences
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def documents():
+    return [
+        DocumentVerses(1, "Nur", _verses("blessed", 12)),
+        DocumentVerses(2, "Zohar", _verses("radiance", 7)),
+    ]
+
+
+def test_job_matches_single_document_indexer(tmp_path, documents):
+    job_db = str(tmp_path / "job.db")
+    results = ConcordanceIndexingJob(job_db, workers=0, range_size=5).run(documents)
+
+    serial_db = str(tmp_path / "serial.db")
+    indexer = ConcordanceIndexerService(serial_db)
+    expected = [indexer.index_document(d.document_id, d.document_title, d.verses) for d in documents]
+
+    assert [r.occurrences_added for r in results] == [r.occurrences_added for r in expected]
+    assert sum(r.new_keys_added for r in results) == sum(r.new_keys_added for r in expected)
+    assert _snapshot(job_db) == _snapshot(serial_db)
+
+
+def test_interrupted_run_resumes_from_checkpoint(tmp_path, documents):
+    db_path = str(tmp_path / "keys.db")
+    job = ConcordanceIndexingJob(db_path, workers=0, range_size=5)
+
+    def stop_after_first_range(current, total, message):
+        job.cancel()
+
+    partial = job.run(documents, stop_after_first_range)
+    assert job.cancelled
+    assert partial[0].occurrences_added == 5 * 6
+
+    resumed = ConcordanceIndexingJob(db_path, workers=0, range_size=5).run(documents)
+    assert resumed[0].occurrences_added == 7 * 6
+    assert resumed[1].occurrences_added == 7 * 6
+
+    # A third run finds everything complete
+    again = ConcordanceIndexingJob(db_path, workers=0).run(documents)
+    assert [r.occurrences_added for r in again] == [0, 0]
+    assert _snapshot(db_path)[0]["lamp"] == 19
+
+
+def test_reindex_touches_only_changed_verses(tmp_path, documents):
+    db_path = str(tmp_path / "keys.db")
+    ConcordanceIndexingJob(db_path, workers=0, range_size=5).run(documents)
+
+    nur = documents[0]
+    nur.verses[3] = dict(nur.verses[3], text="a kindled star")
+    del nur.verses[-1]
+
+    results = ConcordanceIndexingJob(db_path, workers=0, reindex=True).run([nur])
+    assert results[0].total_words == 2  # only the edited verse was tokenized
+    freqs, _ = _snapshot(db_path)
+    assert freqs["lamp"] == 19 - 2
+    assert freqs["kindled"] == 1
+    assert freqs["verse12"] == 0
+
+
+def test_process_pool_matches_inline(tmp_path, documents):
+    inline_db = str(tmp_path / "inline.db")
+    pooled_db = str(tmp_path / "pooled.db")
+    ConcordanceIndexingJob(inline_db, workers=0, range_size=4).run(documents)
+    ConcordanceIndexingJob(pooled_db, workers=2, range_size=4).run(documents)
+
+    assert _snapshot(pooled_db) == _snapshot(inline_db)
+
+
+def test_run_documents_parses_then_indexes(tmp_path, documents, monkeypatch):
+    by_id = {d.document_id: (d.document_title, d.verses) for d in documents}
+    parsed = []
+
+    def fake_load(document_id):
+        parsed.append(document_id)
+        return by_id.get(document_id)
+
+    monkeypatch.setattr(concordance_indexing_job, "load_teacher_verses", fake_load)
+
+    db_path = str(tmp_path / "keys.db")
+    results = ConcordanceIndexingJob(db_path, workers=0, range_size=5).run_documents([1, 99, 2])
+
+    assert parsed == [1, 99, 2]
+    assert [r.document_id for r in results] == [1, 2, 99]
+    assert results[2].errors == ["Document 99 not found"]
+
+    expected_db = str(tmp_path / "expected.db")
+    ConcordanceIndexingJob(expected_db, workers=0, range_size=5).run(documents)
+    assert _snapshot(db_path) == _snapshot(expected_db)
@@ -0,0 +1,43 @@
+"""Tests for batched resolver lookups in EnrichmentService.enrich_batch."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from shared.services.lexicon import enrichment_service
+from shared.services.lexicon.enrichment_service import EnrichmentService
+
+
+class _RecordingResolver:
+    _detect_scripts = staticmethod(enrichment_service.LexiconResolver._detect_scripts)
+
+    def __init__(self):
+        self.batches = []
+        self.prefetched = []
+
+    def lookup_many(self, words):
+        self.batches.append(list(words))
+        return {word: [] for word in words}
+
+    def prefetch(self, words):
+        self.prefetched.append(list(words))
+
+
+def test_enrich_batch_resolves_per_batch_and_prefetches_the_next(monkeypatch):
+    targets = [(1, "λόγος"), (2, "light"), (3, "אור"), (4, "φῶς"), (5, "אור")]
+    db = SimpleNamespace(add_definition=lambda *args, **kwargs: None)
+    service = EnrichmentService(SimpleNamespace(get_undefined_keys=lambda: targets, db=db))
+    service.BATCH_SIZE = 2
+    service._resolver = _RecordingResolver()
+
+    looked_up = []
+    monkeypatch.setattr(enrichment_service.time, "sleep", lambda _: None)
+    monkeypatch.setattr(service, "get_suggestions",
+                        lambda word, entries=None: looked_up.append((word, entries)) or [])
+
+    service.enrich_batch()
+
+    # Latin-script words never reach the resolver
+    assert service._resolver.batches == [["λόγος"], ["אור", "φῶς"], ["אור"]]
+    assert service._resolver.prefetched == [["אור", "φῶς"], ["אור"], []]
+    assert [word for word, _ in looked_up] == [w for _, w in targets]
+    assert all(entries == [] for _, entries in looked_up)
@@ -0,0 +1,91 @@
+"""Tests for the SQLite etymology store built from the etymology-db CSV."""
+from __future__ import annotations
+
+import csv
+import gzip
+import logging
+import os
+
+import pytest
+
+from shared.services.lexicon import etymology_db_service
+from shared.services.lexicon.etymology_db_service import EtymologyDbService, build_etymology_store
+
+COLUMNS = [
+    "term_id", "lang", "term", "reltype", "related_term_id", "related_lang",
+    "related_term", "position", "group_tag", "parent_tag", "parent_position",
+]
+
+ROWS = [
+    ("English", "light", "derived_from", "Old English", "lēoht", "0"),
+    ("English", "light", "inherited_from", "Middle English", "light", "0"),
+    ("English", "lucid", "borrowed_from", "Latin", "lucidus", "0"),
+    ("Latin", "lucidus", "derived_from", "Latin", "lux", "0"),
+    ("French", "lucide", "borrowed_from", "Latin", "lucidus", "0"),
+    ("Latin", "lux", "inherited_from", "Proto-Italic", "*louks", "0"),
+]
+
+
+@pytest.fixture
+def service(tmp_path):
+    csv_path = tmp_path / "etymology.csv.gz"
+    with gzip.open(csv_path, "wt", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for i, (lang, term, reltype, rel_lang, rel_term, pos) in enumerate(ROWS):
+            writer.writerow([i, lang, term, reltype, "", rel_lang, rel_term, pos, "", "", ""])
+
+    build_etymology_store(csv_path)
+    svc = EtymologyDbService(csv_path=csv_path)
+    yield svc
+    etymology_db_service._close_store(svc.store_path)
+
+
+def test_lookup_is_case_insensitive_and_priority_sorted(service):
+    relations = service.get_etymologies("Light")
+
+    assert [r.reltype for r in relations] == ["inherited_from", "derived_from"]
+    assert relations[0].related_lang == "Middle English"
+
+
+def test_lookup_covers_non_english_languages(service):
+    relations = service.get_etymologies("lux", lang="Latin")
+
+    assert [(r.related_term, r.related_lang) for r in relations] == [("*louks", "Proto-Italic")]
+    assert service.get_etymologies("lux", lang="English") == []
+    assert len(service.get_etymologies("lucidus", lang=None)) == 1
+
+
+def test_scan_without_store_matches_any_language_for_none(service):
+    etymology_db_service._close_store(service.store_path)
+    service.store_path.unlink()
+
+    assert service.store is None
+    assert [r.related_term for r in service.get_etymologies("lux", lang="Latin")] == ["*louks"]
+    assert [r.related_term for r in service.get_etymologies("lux", lang=None)] == ["*louks"]
+
+
+def test_replaced_csv_warns_that_store_is_stale(service, caplog):
+    etymology_db_service._close_store(service.store_path)
+    source = service.csv_path.stat()
+    os.utime(service.csv_path, (source.st_atime, source.st_mtime + 60))
+
+    with caplog.at_level(logging.WARNING, logger=etymology_db_service.__name__):
+        assert service.store is not None
+
+    assert "rebuild it" in caplog.text
+
+
+def test_reverse_lookup_by_related_term(service):
+    descendants = service.get_descendants("lucidus", related_lang="Latin")
+
+    assert {(r.term, r.lang) for r in descendants} == {("lucid", "English"), ("lucide", "French")}
+    assert service.get_descendants("LUCIDUS")[0].related_term == "lucidus"
+
+
+def test_rebuild_replaces_open_store(service):
+    assert service.get_stats()["indexed_relationships"] == len(ROWS)
+
+    build_etymology_store(service.csv_path)
+
+    assert service.get_etymologies("lucid")[0].related_term == "lucidus"
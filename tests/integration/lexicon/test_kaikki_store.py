@@ -0,0 +1,87 @@
+"""Tests for the shared on-disk Kaikki key store."""
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from shared.services.lexicon import kaikki_store
+from shared.services.lexicon.classical_lexicon_service import ClassicalLexiconService
+from shared.services.lexicon.comprehensive_lexicon_service import ComprehensiveLexiconService
+from shared.services.lexicon.kaikki_store import get_kaikki_store, variant_keys
+
+
+def _write_jsonl(path, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    _write_jsonl(tmp_path / "kaikki.org-dictionary-AncientGreek-words.jsonl", [
+        {"word": "βῆτα", "pos": "noun", "senses": [{"glosses": ["beta"]}]},
+        {"word": "λόγος", "pos": "noun", "senses": [{"glosses": ["word", "reason"]}]},
+        {"word": "Λόγος", "pos": "name", "senses": [{"glosses": ["the Word"]}]},
+    ])
+    _write_jsonl(tmp_path / "indexes" / "kaikki-latin-mini.jsonl", [
+        {"word": "lūx", "pos": "noun", "glosses": ["light"], "romanization": ""},
+        {"word": "lux", "pos": "noun", "glosses": ["light (plain)"], "romanization": ""},
+    ])
+    _write_jsonl(tmp_path / "indexes" / "kaikki-pie-mini.jsonl", [
+        {"word": "bʰer-", "pos": "root", "glosses": ["to carry"]},
+    ])
+    yield tmp_path
+    kaikki_store.close_kaikki_stores()
+
+
+def test_variant_keys_fold_case_accents_and_hyphens():
+    assert variant_keys("Λόγος") == ["Λόγος", "λόγος", "λογος"]
+    assert variant_keys("βῆτα", phonetic=True)[-1] == "βετα"
+    assert variant_keys("bʰer-") == ["bʰer-", "bʰer"]
+
+
+def test_full_dump_lookup_with_fuzzy_variants(data_dir):
+    service = ClassicalLexiconService(data_dir=data_dir)
+
+    assert service._query_kaikki("βετα")[0].word == "βῆτα"
+    # Exact forms win over folded variants of other entries
+    assert service._query_kaikki("Λόγος")[0].definition == "the Word"
+    assert service._query_kaikki("λογος")[0].definition == "word; reason"
+    assert service._query_kaikki("missing") == []
+
+
+def test_compact_lookups_share_one_store_across_services(data_dir):
+    classical = ClassicalLexiconService(data_dir=data_dir)
+    comprehensive = ComprehensiveLexiconService(data_dir=data_dir)
+
+    assert classical.lookup_latin("lux")[0].definition == "light (plain)"
+    assert classical.lookup_latin("LŪX")[0].definition == "light"
+    assert comprehensive.lookup("*bʰer", "Proto-Indo-European")[0].definition == "to carry"
+
+    store = get_kaikki_store(data_dir / "indexes")
+    assert len(kaikki_store._stores) == 1
+    assert set(store._handles) == {
+        data_dir / "indexes" / "kaikki-latin-mini.jsonl",
+        data_dir / "indexes" / "kaikki-pie-mini.jsonl",
+    }
+    assert comprehensive.get_available_languages() == ["Latin", "Proto-Indo-European"]
+
+
+def test_keys_rebuilt_when_data_file_changes(data_dir):
+    service = ComprehensiveLexiconService(data_dir=data_dir)
+    assert service.lookup("lux", "Latin")[0].definition == "light (plain)"
+
+    mini = data_dir / "indexes" / "kaikki-latin-mini.jsonl"
+    _write_jsonl(mini, [{"word": "lux", "pos": "noun", "glosses": ["daylight"]}])
+    stat = mini.stat()
+    os.utime(mini, (stat.st_atime, stat.st_mtime + 5))
+
+    assert service.lookup("lux", "Latin")[0].definition == "daylight"
+    assert get_kaikki_store(data_dir / "indexes").entry_count(mini) == 1
+
+    # Keys persist on disk: a fresh pool reuses them without a rebuild
+    service.clear_caches()
+    assert service.lookup("lux", "Latin")[0].definition == "daylight"
@@ -0,0 +1,74 @@
+"""Tests for KeyDatabase bulk sessions and the concordance indexer using them."""
+from __future__ import annotations
+
+import pytest
+
+from shared.repositories.lexicon.key_database import KeyDatabase
+from shared.services.lexicon.concordance_indexer_service import ConcordanceIndexerService
+
+VERSES = [
+    {"id": 1, "verse_number": 1, "text": "Light upon light, the lamp and the light"},
+    {"id": 2, "verse_number": 2, "text": "A lamp kindled from a blessed tree"},
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    return KeyDatabase(str(tmp_path / "keys.db"))
+
+
+def _frequencies(db):
+    conn = db._get_conn()
+    try:
+        return {row["word"]: row["frequency"] for row in conn.execute("SELECT word, frequency FROM master_key")}
+    finally:
+        conn.close()
+
+
+def test_session_bulk_writes_and_frequencies(db):
+    with db.session() as session:
+        ids = session.ensure_words({"lamp": 10, "tree": 20})
+        assert session.new_keys == 2
+        rows = [
+            (ids["lamp"], 7, "Doc", 1, 1, 0, "Lamp", "lamp"),
+            (ids["lamp"], 7, "Doc", 2, 2, 3, "lamp", "lamp"),
+            (ids["tree"], 7, "Doc", 2, 2, 5, "tree", "tree"),
+        ]
+        assert session.add_occurrences(rows) == 3
+        # Duplicates are skipped, not counted
+        assert session.add_occurrences(rows[:1]) == 0
+
+    assert _frequencies(db) == {"lamp": 2, "tree": 1}
+
+    with db.session() as session:
+        assert session.ensure_words({"lamp": 11}) == {"lamp": ids["lamp"]}
+        assert session.new_keys == 0
+    assert db.get_word_by_id(ids["lamp"]).tq_value == 11
+
+
+def test_session_rolls_back_on_error(db):
+    with pytest.raises(RuntimeError):
+        with db.session() as session:
+            session.ensure_words({"lamp": 10})
+            raise RuntimeError("boom")
+
+    assert db.get_id_by_word("lamp") is None
+
+
+def test_indexer_counts_and_reindex(tmp_path):
+    indexer = ConcordanceIndexerService(str(tmp_path / "keys.db"))
+
+    result = indexer.index_document(1, "Nur", VERSES)
+    assert result.errors == []
+    assert result.occurrences_added == result.total_words
+    assert result.new_keys_added == len(_frequencies(indexer.db))
+    assert _frequencies(indexer.db)["light"] == 3
+
+    again = indexer.index_document(1, "Nur", VERSES)
+    assert again.occurrences_added == 0 and again.errors
+
+    redone = indexer.index_document(1, "Nur", VERSES[:1], reindex=True)
+    assert redone.new_keys_added == 0
+    freqs = _frequencies(indexer.db)
+    assert freqs["light"] == 3
+    assert freqs["tree"] == 0
@@ -0,0 +1,88 @@
+"""Tests for indexed master-key search (trigram, prefix, keyset pages)."""
+from __future__ import annotations
+
+import random
+import string
+import time
+
+import pytest
+
+from shared.repositories.lexicon.key_database import KeyDatabase
+
+WORDS = ["lamp", "lampstand", "clamp", "ample", "tree", "street", "light", "alight", "amen", "am"]
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = KeyDatabase(str(tmp_path / "keys.db"))
+    for value, word in enumerate(WORDS, 1):
+        database.add_word(word, value * 10)
+    return database
+
+
+def _words(entries):
+    return [entry.word for entry in entries]
+
+
+def test_substring_and_prefix_matching(db):
+    results, total = db.search_keys("AMP")
+    assert _words(results) == ["ample", "clamp", "lamp", "lampstand"]
+    assert total == 4
+
+    # Short queries are prefix matches
+    assert _words(db.search_keys("am")[0]) == ["am", "amen", "ample"]
+
+
+def test_keyset_pages_match_a_full_sort(db):
+    for sort_by, descending in [("word", False), ("tq_value", True), ("frequency", True), ("id", True)]:
+        everything, total = db.search_keys("", page_size=100, sort_by=sort_by, descending=descending)
+        assert total == len(WORDS)
+
+        paged = []
+        for page in range(1, 5):
+            paged += db.search_keys("", page=page, page_size=3, sort_by=sort_by, descending=descending)[0]
+        assert _words(paged) == _words(everything)
+
+        # Jumping straight to a page (no known boundary) agrees too
+        assert _words(db.search_keys("", page=3, page_size=3, sort_by=sort_by,
+                                     descending=descending)[0]) == _words(everything[6:9])
+
+
+def test_caches_follow_writes(db):
+    assert db.search_keys("light")[1] == 2
+    db.add_word("lightning", 1)
+    results, total = db.search_keys("light")
+    assert total == 3
+    assert "lightning" in _words(results)
+
+
+@pytest.mark.slow
+def test_typeahead_latency_on_large_master_key(tmp_path):
+    db = KeyDatabase(str(tmp_path / "big.db"))
+    rng = random.Random(7)
+    words = {"".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12))) for _ in range(200_000)}
+    with db.session() as session:
+        session.conn.executemany(
+            "INSERT OR IGNORE INTO master_key (word, tq_value, frequency) VALUES (?, ?, ?)",
+            [(w, rng.randint(1, 2000), rng.randint(0, 50)) for w in words],
+        )
+
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        db.search_keys(*args, **kwargs)
+        return time.perf_counter() - start
+
+    keystrokes = ["q", "qu", "que", "ing", "abc", "zzy"]
+    worst = max(timed(q, sort_by="tq_value", descending=True) for q in keystrokes)
+
+    # Deep page reached by stepping vs. by OFFSET
+    for page in range(1, 200):
+        db.search_keys("", page=page, sort_by="frequency", descending=True)
+    keyset = timed("", page=200, sort_by="frequency", descending=True)
+    db._page_bounds.clear()
+    offset = timed("", page=200, sort_by="frequency", descending=True)
+
+    print(f"\nworst keystroke {worst * 1000:.1f} ms; page 200: keyset {keyset * 1000:.2f} ms, "
+          f"offset {offset * 1000:.2f} ms")
+    assert worst < 0.1
+    assert keyset < offset
@@ -0,0 +1,99 @@
+"""Tests for batched LexiconResolver lookups and the shared result cache."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from shared.services.lexicon import kaikki_store, lexicon_resolver
+from shared.services.lexicon.classical_lexicon_service import ClassicalLexiconService
+from shared.services.lexicon.comprehensive_lexicon_service import ComprehensiveLexiconService
+from shared.services.lexicon.kaikki_store import KaikkiStore
+from shared.services.lexicon.lexicon_resolver import LexiconResolver
+
+
+def _write_jsonl(path, rows):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows), encoding="utf-8")
+
+
+@pytest.fixture
+def resolver(tmp_path):
+    _write_jsonl(tmp_path / "kaikki.org-dictionary-AncientGreek-words.jsonl", [
+        {"word": "λόγος", "pos": "noun", "senses": [{"glosses": ["word"]}]},
+    ])
+    _write_jsonl(tmp_path / "kaikki.org-dictionary-Hebrew-words.jsonl", [
+        {"word": "אור", "pos": "noun", "senses": [{"glosses": ["light"]}]},
+    ])
+    (tmp_path / "strongs_hebrew.json").write_text(json.dumps([
+        {"word": "אוֹר", "translit": "ʼôwr", "definition": "illumination", "strongs": "H216"},
+    ]), encoding="utf-8")
+    _write_jsonl(tmp_path / "indexes" / "kaikki-english-mini.jsonl", [
+        {"word": "light", "pos": "noun", "glosses": ["illumination"]},
+    ])
+    _write_jsonl(tmp_path / "indexes" / "kaikki-latin-mini.jsonl", [
+        {"word": "lux", "pos": "noun", "glosses": ["light"]},
+        {"word": "light", "pos": "noun", "glosses": ["(not Latin)"]},
+    ])
+
+    lexicon_resolver.clear_lookup_cache()
+    instance = LexiconResolver()
+    instance.comprehensive = ComprehensiveLexiconService(data_dir=tmp_path)
+    instance.classical = ClassicalLexiconService(data_dir=tmp_path)
+    yield instance
+    lexicon_resolver.clear_lookup_cache()
+    kaikki_store.close_kaikki_stores()
+
+
+def _definitions(entries):
+    return [e.definition for e in entries]
+
+
+def test_lookup_many_matches_single_lookups(resolver):
+    words = ["light", "λόγος", "אור", "lux", "light", "nothing"]
+
+    batched = resolver.lookup_many(words)
+    lexicon_resolver.clear_lookup_cache()
+    single = {word: resolver.lookup(word) for word in dict.fromkeys(words)}
+
+    assert list(batched) == ["light", "λόγος", "אור", "lux", "nothing"]
+    assert {w: _definitions(e) for w, e in batched.items()} == {w: _definitions(e) for w, e in single.items()}
+    # English wins for "light", so Latin is never consulted for it
+    assert _definitions(batched["light"]) == ["illumination"]
+    assert _definitions(batched["אור"]) == ["light", "illumination"]
+    assert batched["nothing"] == []
+
+
+def test_preferred_languages_are_part_of_the_cache_key(resolver):
+    assert _definitions(resolver.lookup("light", ["Latin"])) == ["(not Latin)"]
+    assert _definitions(resolver.lookup("light")) == ["illumination"]
+
+
+def test_cached_words_skip_the_index(resolver, monkeypatch):
+    resolver.lookup_many(["light", "lux"])
+
+    calls = []
+    original = KaikkiStore.lookup_many
+    monkeypatch.setattr(KaikkiStore, "lookup_many", lambda self, path, probes, phonetic=False: (
+        calls.append(sorted(probes)) or original(self, path, probes, phonetic)))
+
+    # A second window's resolver shares the cache
+    other = LexiconResolver()
+    other.comprehensive, other.classical = resolver.comprehensive, resolver.classical
+    other.lookup_many(["lux", "light", "tenebrae"])
+
+    assert calls == [["tenebrae"], ["tenebrae"]]  # English, then Latin fallback
+
+
+def test_prefetch_warms_the_cache_in_background(resolver):
+    resolver.prefetch(["lux", "λόγος"])
+    lexicon_resolver._prefetch_queue.join()
+
+    assert lexicon_resolver._cache_get(("lux", ())) is not None
+    assert _definitions(lexicon_resolver._cache_get(("λόγος", ()))) == ["word"]
+
+
+def test_language_hint_routes_transliterated_words(resolver):
+    assert _definitions(resolver.lookup("ʼôwr", ["Hebrew"])) == ["illumination"]
+    # Without the hint the word is treated as English/Latin
+    assert resolver.lookup("ʼôwr") == []
@@ -0,0 +1,86 @@
+"""Tests for the byte-offset index over the Perseus LSJ XML."""
+from __future__ import annotations
+
+import os
+import random
+import time
+
+import pytest
+
+from shared.services.lexicon.classical_lexicon_service import ClassicalLexiconService
+
+TEI_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<TEI xmlns="http://www.tei-c.org/ns/1.0"><text><body><div1>\n'
+TEI_FOOTER = '</div1></body></text></TEI>\n'
+
+
+def _entry_free(n: int, lemma: str, gloss: str) -> str:
+    return (
+        f'<entryFree id="n{n}" key="{lemma}"><orth>{lemma}</orth>'
+        f'<sense n="A"><tr>{gloss}</tr>, <bibl><author>Hom.</author></bibl> in use</sense></entryFree>\n'
+    )
+
+
+def _write_lexicon(path, count: int) -> list:
+    lemmas = [("λόγος", "word"), ("φῶς", "light"), ("ὕδωρ", "water")]
+    lemmas += [(f"λεξις{i}", f"gloss number {i}") for i in range(count - len(lemmas))]
+    body = "".join(_entry_free(i, lemma, gloss) for i, (lemma, gloss) in enumerate(lemmas))
+    body += '<entry key="ἀρχή"><sense>beginning, origin</sense></entry>\n'
+    path.write_text(TEI_HEADER + body + TEI_FOOTER, encoding="utf-8")
+    return lemmas
+
+
+@pytest.fixture
+def service(tmp_path):
+    _write_lexicon(tmp_path / "perseus_lsj.xml", 50)
+    return ClassicalLexiconService(data_dir=tmp_path)
+
+
+def test_lookup_by_id_seeks_to_the_entry(service, tmp_path):
+    results = service._query_perseus_by_id("n1", "φῶς")
+
+    assert [r.definition for r in results] == ["light, in use"]
+    assert (tmp_path / "indexes" / "perseus_lsj-offsets.json").exists()
+    assert service._query_perseus_by_id("n9999", "missing") == []
+
+
+def test_lookup_by_key_matches_streamed_scan(service):
+    indexed = service._query_perseus("Ἀρχή")
+
+    assert [r.definition for r in indexed] == ["beginning, origin"]
+    assert indexed == service._scan_perseus("Ἀρχή")
+
+
+def test_index_rebuilt_when_source_changes(service, tmp_path):
+    assert service._query_perseus_by_id("n2", "ὕδωρ")[0].definition.startswith("water")
+
+    xml_path = tmp_path / "perseus_lsj.xml"
+    xml_path.write_text(
+        TEI_HEADER + '<entryFree id="n2" key="ὕδωρ"><sense><tr>rain</tr></sense></entryFree>' + TEI_FOOTER,
+        encoding="utf-8",
+    )
+    stat = xml_path.stat()
+    os.utime(xml_path, (stat.st_atime, stat.st_mtime + 5))
+
+    assert service._query_perseus_by_id("n2", "ὕδωρ")[0].definition == "rain"
+    # A fresh service reuses the saved index instead of rescanning
+    fresh = ClassicalLexiconService(data_dir=tmp_path)
+    assert fresh._query_perseus_by_id("n2", "ὕδωρ")[0].definition == "rain"
+
+
+@pytest.mark.slow
+def test_benchmark_indexed_lookups(tmp_path):
+    lemmas = _write_lexicon(tmp_path / "perseus_lsj.xml", 5000)
+    service = ClassicalLexiconService(data_dir=tmp_path)
+    sample = random.Random(7).sample(range(len(lemmas)), 300)
+
+    start = time.perf_counter()
+    indexed = [service._query_perseus_by_id(f"n{i}", lemmas[i][0]) for i in sample]
+    indexed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [service._scan_perseus_by_id(f"n{i}", lemmas[i][0]) for i in sample[:30]]
+    scan_time = (time.perf_counter() - start) * 10
+
+    print(f"\n300 lemmas: indexed {indexed_time:.3f}s (incl. build), streamed ~{scan_time:.3f}s")
+    assert indexed[:30] == scanned
+    assert indexed_time * 5 < scan_time
@@ -0,0 +1,56 @@
+"""Tests for batched TQ value queries on the Master Key."""
+from __future__ import annotations
+
+import pytest
+
+from shared.services.lexicon.holy_key_service import HolyKeyService
+
+# word -> (tq_value, frequency)
+KEYS = {
+    "lamp": (7, 3),
+    "tree": (7, 9),
+    "oil": (7, 0),
+    "light": (12, 5),
+    "star": (13, 1),
+    "veil": (40, 2),
+}
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = HolyKeyService(str(tmp_path / "keys.db"))
+    with svc.db.session() as session:
+        for word, (value, frequency) in KEYS.items():
+            session.conn.execute(
+                "INSERT INTO master_key (word, tq_value, frequency) VALUES (?, ?, ?)",
+                (word, value, frequency),
+            )
+    return svc
+
+
+def test_value_set_grouped_by_value_most_frequent_first(service):
+    result = service.find_words_by_tq_values([12, 7, 99])
+
+    assert list(result) == [7, 12, 99]
+    assert [w["word"] for w in result[7]] == ["tree", "lamp", "oil"]
+    assert result[12] == [{"word": "light", "frequency": 5}]
+    assert result[99] == []
+    assert service.find_words_by_tq_value(7, limit=2) == [
+        {"word": "tree", "frequency": 9},
+        {"word": "lamp", "frequency": 3},
+    ]
+
+
+def test_range_query(service):
+    result = service.find_words_in_tq_range(13, 7, limit_per_value=1)
+    assert {value: [w["word"] for w in words] for value, words in result.items()} == {
+        7: ["tree"], 12: ["light"], 13: ["star"],
+    }
+
+
+def test_results_cached_until_master_key_changes(service):
+    first = service.db.get_words_by_tq_values([7])[7]
+    assert service.db.get_words_by_tq_values([7])[7] is first
+
+    service.db.add_word("seed", 7)
+    assert "seed" in [w for w, _ in service.db.get_words_by_tq_values([7])[7]]
@@ -0,0 +1,119 @@
+"""Tests for the array synthesis kernel and waveform cache of AmunAudioService."""
+import math
+import os
+import struct
+import time
+import wave
+
+import numpy as np
+import pytest
+
+from pillars.tq.models.amun_sound import AmunSoundCalculator
+from pillars.tq.services import amun_audio_service
+from pillars.tq.services.amun_audio_service import AmunAudioService
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    AmunAudioService.clear_cache()
+    yield
+    AmunAudioService.clear_cache()
+
+
+def legacy_synthesize(frame, duration, volume):
+    """The per-sample loop the array kernel replaced."""
+    data = bytearray()
+    rate = AmunAudioService.SAMPLE_RATE
+    n_samples = int(duration * rate)
+    fade_samples = int(0.3 * rate)
+    spec = frame.waveform
+    norm = 1.0 + (0.1 if spec.odd_harmonics else 0.15) * spec.max_harmonic
+    for i in range(n_samples):
+        t = i / rate
+        val = 0.0
+        for h in range(1, spec.max_harmonic + 1):
+            if spec.odd_harmonics and h % 2 == 0:
+                continue
+            val += math.sin(2 * math.pi * frame.frequency * h * t) / (h ** spec.rolloff_exp)
+        pulse_env = 0.65 + 0.35 * math.sin(2 * math.pi * frame.pulse_rate * t)
+        fade_env = 1.0
+        if i < fade_samples:
+            fade_env = 0.5 * (1 - math.cos(math.pi * i / fade_samples))
+        elif i > n_samples - fade_samples:
+            fade_env = 0.5 * (1 - math.cos(math.pi * (n_samples - i) / fade_samples))
+        sample_int = max(-32767, min(32767, int(val / norm * pulse_env * fade_env * volume * 32767)))
+        data.extend(struct.pack("<hh", sample_int, sample_int))
+    return bytes(data)
+
+
+@pytest.mark.parametrize("decimal", [1, 121, 364, 500, 728])
+def test_array_kernel_matches_the_per_sample_loop(decimal):
+    frame = AmunSoundCalculator.calculate_signature(decimal)
+    rendered = AmunAudioService._synthesize_frame(frame, 0.7, 0.5)
+    expected = legacy_synthesize(frame, 0.7, 0.5)
+    assert len(rendered) == len(expected) == int(0.7 * 44100) * 4
+    left, right = np.frombuffer(rendered, "<i2").reshape(-1, 2).T
+    assert np.array_equal(left, right)
+    assert np.abs(np.frombuffer(rendered, "<i2").astype(int) - np.frombuffer(expected, "<i2")).max() <= 1
+
+
+def test_repeated_tones_come_from_the_cache(monkeypatch):
+    renders = []
+    render = AmunAudioService._render_pcm
+    monkeypatch.setattr(AmunAudioService, "_render_pcm", staticmethod(lambda *a: renders.append(a) or render(*a)))
+
+    path = AmunAudioService.generate_scale([5, 9, 5, 9, 5], duration_per_note=0.2)
+    assert len(renders) == 2
+    with wave.open(path) as wav:
+        assert wav.getnchannels() == 2 and wav.getnframes() == 5 * int(0.2 * 44100)
+        frames = np.frombuffer(wav.readframes(wav.getnframes()), "<i2").reshape(5, -1)
+    os.remove(path)
+    assert np.array_equal(frames[0], frames[2]) and not np.array_equal(frames[0], frames[1])
+
+    # Other durations and volumes are different tones
+    frame = AmunSoundCalculator.calculate_signature(5)
+    AmunAudioService._synthesize_frame(frame, 0.2, 0.25)
+    AmunAudioService._synthesize_frame(frame, 0.3, 0.5)
+    AmunAudioService._synthesize_frame(frame, 0.2, 0.5)
+    assert len(renders) == 4
+
+
+def test_cache_is_bounded_by_bytes(monkeypatch):
+    monkeypatch.setattr(amun_audio_service, "_waveform_cache", amun_audio_service.ByteBudgetLRU(100_000))
+    for decimal in range(1, 10):
+        AmunAudioService._synthesize_frame(AmunSoundCalculator.calculate_signature(decimal), 0.2, 0.5)
+    cache = amun_audio_service._waveform_cache
+    assert cache.size_bytes <= 100_000 and len(cache) == 100_000 // (int(0.2 * 44100) * 4)
+
+
+@pytest.mark.slow
+def test_81_ditrunes_render_faster_than_real_time():
+    duration = 4.0
+    ditrunes = list(range(1, 729, 9))
+    frames = [AmunSoundCalculator.calculate_signature(d) for d in ditrunes]
+    audio_seconds = duration * len(frames)
+
+    started = time.perf_counter()
+    for frame in frames:
+        AmunAudioService._synthesize_frame(frame, duration, 0.5)
+    cold = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for frame in frames:
+        AmunAudioService._synthesize_frame(frame, duration, 0.5)
+    warm = time.perf_counter() - started
+
+    # The per-sample loop, timed on a few tones and scaled to the same audio
+    sample = frames[::27]
+    started = time.perf_counter()
+    for frame in sample:
+        legacy_synthesize(frame, duration, 0.5)
+    legacy = (time.perf_counter() - started) / len(sample) * len(frames)
+
+    print(
+        f"\n81 ditrunes x {duration:.0f} s ({audio_seconds:.0f} s of audio): "
+        f"array kernel {cold:.2f} s ({audio_seconds / cold:.0f}x real time), cached {warm * 1000:.1f} ms, "
+        f"per-sample loop ~{legacy:.1f} s"
+    )
+    assert cold < audio_seconds
+    assert cold * 5 < legacy and warm * 10 < cold
@@ -0,0 +1,193 @@
+"""Tests for lazy pillar hub loading and the startup profiler."""
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from PyQt6.QtWidgets import QTabWidget
+
+from shared.startup_profiler import StartupProfiler
+from shared.ui.hub_registry import HubRegistry, HubSpec
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+@pytest.fixture
+def fake_pillars(tmp_path, monkeypatch):
+    """A package of hub modules that record when they are imported and built."""
+    package = tmp_path / "fake_pillars"
+    package.mkdir()
+    (package / "__init__.py").write_text("built = []\nimported = []\n")
+    for name in ("alpha", "beta", "gamma"):
+        (package / f"{name}.py").write_text(textwrap.dedent(f"""
+            from PyQt6.QtWidgets import QWidget
+            import fake_pillars
+            fake_pillars.imported.append("{name}")
+
+            class Hub(QWidget):
+                def __init__(self, window_manager):
+                    super().__init__()
+                    self.window_manager = window_manager
+                    fake_pillars.built.append("{name}")
+        """))
+    (package / "broken.py").write_text("raise ImportError('no GL here')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield __import__("fake_pillars")
+    for name in [m for m in sys.modules if m.startswith("fake_pillars")]:
+        del sys.modules[name]
+
+
+def make_registry(keys, profiler=None):
+    tabs = QTabWidget()
+    registry = HubRegistry(tabs, window_manager="wm", profiler=profiler or StartupProfiler())
+    for key in keys:
+        registry.register(HubSpec(key, key.title(), f"fake_pillars.{key}", "Hub", unavailable_text=f"{key} needs GL"))
+    return tabs, registry
+
+
+def test_hubs_are_built_when_their_tab_is_first_shown(qapp, fake_pillars):
+    profiler = StartupProfiler()
+    tabs, registry = make_registry(["alpha", "beta", "gamma"], profiler)
+
+    # Adding the first tab makes it current, which builds only that hub
+    assert fake_pillars.imported == ["alpha"] and fake_pillars.built == ["alpha"]
+    assert tabs.count() == 3 and tabs.widget(0) is registry.hub("alpha")
+    assert registry.hub("alpha").window_manager == "wm"
+
+    tabs.setCurrentIndex(2)
+    assert fake_pillars.built == ["alpha", "gamma"]
+    assert tabs.currentIndex() == 2 and tabs.currentWidget() is registry.hub("gamma")
+    assert tabs.tabText(2) == "Gamma"
+
+    tabs.setCurrentIndex(0)
+    tabs.setCurrentIndex(2)
+    assert fake_pillars.built == ["alpha", "gamma"]
+    assert not registry.is_loaded("beta")
+    assert [name for name, _, _ in profiler.phases] == [
+        "import alpha hub", "construct alpha hub", "import gamma hub", "construct gamma hub",
+    ]
+
+
+def test_unavailable_hubs_keep_a_placeholder(qapp, fake_pillars):
+    tabs, registry = make_registry(["alpha", "broken"])
+    tabs.setCurrentIndex(1)
+
+    assert registry.is_loaded("broken") and registry.hub("broken") is None
+    assert tabs.tabText(1) == "Broken (Unavailable)"
+    assert tabs.widget(1).text() == "broken needs GL"
+    tabs.setCurrentIndex(0)
+    tabs.setCurrentIndex(1)
+    assert tabs.tabText(1) == "Broken (Unavailable)"
+
+
+def test_idle_preloading_builds_the_rest_without_switching_tabs(qapp, fake_pillars):
+    tabs, registry = make_registry(["alpha", "beta", "gamma"])
+    loaded = []
+    registry.hub_loaded.connect(lambda key, widget: loaded.append(key))
+
+    registry.preload_when_idle()
+    assert fake_pillars.built == ["alpha"]
+    for _ in range(5):
+        qapp.processEvents()
+
+    assert fake_pillars.built == ["alpha", "beta", "gamma"] and loaded == ["beta", "gamma"]
+    assert tabs.currentIndex() == 0
+    assert [tabs.widget(i) for i in range(3)] == [registry.hub(k) for k in ("alpha", "beta", "gamma")]
+
+
+def test_profiler_times_imports_phases_and_marks(tmp_path, monkeypatch):
+    package = tmp_path / "timed_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("import time\ntime.sleep(0.01)\nfrom . import child\n")
+    (package / "child.py").write_text("import time\ntime.sleep(0.03)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = StartupProfiler()
+    profiler.install()
+    try:
+        import timed_pkg  # noqa: F401
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("timed_pkg", None)
+        sys.modules.pop("timed_pkg.child", None)
+    with profiler.phase("work"):
+        pass
+    profiler.mark("ready")
+
+    parent_total, parent_self = profiler.imports["timed_pkg"]
+    child_total, child_self = profiler.imports["timed_pkg.child"]
+    assert child_total >= 0.03 and parent_total >= child_total + 0.01
+    assert parent_self < parent_total - 0.02 and child_self == child_total
+    # Loaders are handed back once the module has been executed
+    assert type(timed_pkg.__loader__).__name__ == "SourceFileLoader"
+
+    report = json.loads(profiler.write_report(tmp_path / "out" / "profile.json").read_text())
+    assert report["imports"][0]["module"] == "timed_pkg"
+    assert [p["name"] for p in report["phases"]] == ["work"] and "ready" in report["marks"]
+    assert "timed_pkg" in profiler.summary()
+
+
+COLD_START = """
+import json, os, sys, time, traceback
+started = time.perf_counter()
+from sqlalchemy import create_engine
+from PyQt6.QtWidgets import QApplication
+import shared.database as database
+# Keep the test's tables away from the project database
+database.engine = create_engine(f"sqlite:///{sys.argv[1]}")
+database.SessionLocal.configure(bind=database.engine)
+database.init_db()
+app = QApplication([])
+try:
+    import main
+    window = main.IsopGemMainWindow()
+    window.show()
+    app.processEvents()
+    ready = time.perf_counter() - started
+    if "--eager" in sys.argv:
+        window.hubs.load_all()
+except Exception:
+    # Exit rather than let a pillar's excepthook open a modal error box
+    traceback.print_exc()
+    os._exit(1)
+print(json.dumps({
+    "ready": ready,
+    "total": time.perf_counter() - started,
+    "hubs": [key for key in window.hubs.keys if window.hubs.hub(key) is not None],
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+def cold_start(tmp_path, *args):
+    """Start the main window in a fresh offscreen interpreter and return its report."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", HOME=str(tmp_path), XDG_STATE_HOME=str(tmp_path / "state"))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START, str(tmp_path / "isopgem.db"), *args], cwd=SRC, env=env,
+        capture_output=True, text=True, timeout=300,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cold_start_builds_only_the_first_hub(tmp_path):
+    report = cold_start(tmp_path)
+    assert report["hubs"] == ["gematria"]
+    for pillar in ("geometry", "cymatics", "astrology", "tq", "adyton", "time_mechanics"):
+        assert f"pillars.{pillar}.ui" not in report["modules"]
+    assert "skyfield" not in report["modules"]
+
+
+@pytest.mark.slow
+def test_cold_start_benchmark(tmp_path):
+    eager = cold_start(tmp_path, "--eager")
+    lazy = cold_start(tmp_path)
+    print(
+        f"\nfirst interactive window: lazy hubs {lazy['ready'] * 1000:.0f} ms "
+        f"({len(lazy['modules'])} modules), all hubs {eager['total'] * 1000:.0f} ms "
+        f"({len(eager['modules'])} modules)"
+    )
+    assert lazy["ready"] < eager["total"]
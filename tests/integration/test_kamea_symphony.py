@@ -0,0 +1,42 @@
+"""Tests for the render cache of KameaSymphonyService."""
+import os
+
+import numpy as np
+from scipy.io import wavfile
+
+from pillars.tq.models.symphony_config import SymphonyNucleation
+from pillars.tq.services.kamea_symphony_service import KameaSymphonyService
+
+
+def nucleation(core="11", skin="12", x=-4):
+    return SymphonyNucleation(
+        ditrune=core + "12" + skin, core=core, body="12", skin=skin,
+        pyx_count=2, hierarchy_class="Acolyte", coordinates=(x, 3),
+    )
+
+
+def test_repeated_nucleations_are_rendered_once(monkeypatch):
+    service = KameaSymphonyService()
+    renders = []
+    render = service._render
+    monkeypatch.setattr(service, "_render", lambda nuc, duration: renders.append(nuc) or render(nuc, duration))
+
+    a, b = nucleation(), nucleation(core="21", x=6)
+    path = service.generate_sequence([a, b, a, nucleation(), b], duration=0.25)
+    _, audio = wavfile.read(path)
+    os.remove(path)
+    assert len(renders) == 2
+    segments = audio.reshape(5, -1, 2)
+    assert np.array_equal(segments[0], segments[2]) and np.array_equal(segments[0], segments[3])
+
+    os.remove(service.generate_chord([a, b], duration=0.25))
+    assert len(renders) == 2
+
+    # Position, duration and hierarchy are part of the tone
+    service._synthesize(nucleation(x=5), 0.25)
+    service._synthesize(a, 0.5)
+    temple = nucleation()
+    temple.hierarchy_class = "Temple"
+    service._synthesize(temple, 0.25)
+    assert len(renders) == 5 and service._rendered.hits == 5
+    assert not service._synthesize(a, 0.25).flags.writeable
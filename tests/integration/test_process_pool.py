@@ -0,0 +1,190 @@
+"""Tests for the TaskManager process-pool backend."""
+import os
+import time
+
+import pytest
+
+from shared.async_tasks import ProcessPool, ProcessTask, TaskManager
+from shared.errors import AppError, ErrorCode
+
+@pytest.fixture(scope="module")
+def manager(qapp):
+    manager = TaskManager(max_threads=2, max_processes=2)
+    yield manager
+    manager.shutdown()
+
+
+# Work run in the worker processes (module level so it pickles by reference)
+
+def count_primes(start, stop):
+    count = 0
+    for n in range(max(start, 2), stop):
+        d = 2
+        while d * d <= n:
+            if n % d == 0:
+                break
+            d += 1
+        else:
+            count += 1
+    return count
+
+
+def multiples_of_three(n, reporter):
+    found = []
+    for i in range(n):
+        if i % 3 == 0:
+            found.append(i)
+            reporter.partial(i)
+        reporter.progress(i + 1, n, f"checked {i}")
+    return found
+
+
+def run_until_stopped(reporter):
+    for _ in range(3000):
+        reporter.check()
+        time.sleep(0.01)
+    return "ran out"
+
+
+def sleep_for(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def fail():
+    raise ValueError("bad omen")
+
+
+def crash():
+    os._exit(3)
+
+
+def wait_until(qapp, predicate, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for process task"
+        qapp.processEvents()
+        time.sleep(0.005)
+    qapp.processEvents()
+
+
+class Outcome:
+    """Collects the callbacks of one task."""
+
+    def __init__(self):
+        self.result = self.error = None
+        self.progress, self.partials = [], []
+        self.cancelled = False
+
+    @property
+    def done(self):
+        return self.result is not None or self.error is not None or self.cancelled
+
+    def callbacks(self):
+        return dict(
+            on_complete=lambda r: setattr(self, "result", r),
+            on_error=lambda e: setattr(self, "error", e),
+            on_cancelled=lambda: setattr(self, "cancelled", True),
+            on_progress=lambda *p: self.progress.append(p),
+            on_partial=self.partials.append,
+        )
+
+
+def test_results_progress_and_partials_arrive_as_signals(qapp, manager):
+    completed = []
+    manager.task_completed.connect(completed.append)
+    outcome = Outcome()
+    manager.create_task(multiples_of_three, args=(10,), task_name="threes", backend="process", **outcome.callbacks())
+    primes = Outcome()
+    manager.create_task(count_primes, args=(0, 1000), backend="process", **primes.callbacks())
+
+    wait_until(qapp, lambda: outcome.done and primes.done)
+    assert outcome.result == [0, 3, 6, 9] and outcome.partials == [0, 3, 6, 9]
+    assert outcome.progress[-1] == (10, 10, "checked 9") and len(outcome.progress) == 10
+    assert primes.result == 168
+    assert "threes" in completed and manager.active_count() == 0
+
+
+def test_failures_become_app_errors_and_crashed_workers_are_replaced(qapp, manager):
+    outcome = Outcome()
+    manager.create_task(fail, backend="process", **outcome.callbacks())
+    wait_until(qapp, lambda: outcome.done)
+    assert isinstance(outcome.error, AppError) and isinstance(outcome.error.cause, ValueError)
+    assert "bad omen" in outcome.error.message and "raise ValueError" in outcome.error.details
+
+    crashed = Outcome()
+    manager.create_task(crash, backend="process", **crashed.callbacks())
+    wait_until(qapp, lambda: crashed.done)
+    assert "exited with code 3" in crashed.error.message
+
+    after = Outcome()
+    manager.create_task(count_primes, args=(0, 100), backend="process", **after.callbacks())
+    wait_until(qapp, lambda: after.done)
+    assert after.result == 25
+
+    with pytest.raises(Exception):
+        manager.create_task(lambda: 1, backend="process")
+    with pytest.raises(ValueError):
+        manager.create_task(fail, backend="fibre")
+    assert manager.active_count() == 0
+
+
+def test_running_and_queued_tasks_cancel(qapp, manager):
+    running = [Outcome(), Outcome()]
+    tasks = [manager.create_task(run_until_stopped, backend="process", **o.callbacks()) for o in running]
+    queued = Outcome()
+    waiting = manager.create_task(sleep_for, args=(0,), backend="process", **queued.callbacks())
+
+    waiting.cancel()
+    assert queued.cancelled
+    time.sleep(0.2)
+    for task in tasks:
+        task.cancel()
+    wait_until(qapp, lambda: all(o.done for o in running))
+    assert all(o.cancelled and o.result is None for o in running)
+    assert manager.process_pool.wait(5) and manager.active_count() == 0
+
+
+def test_timeouts_stop_cooperative_tasks_and_kill_stubborn_ones(qapp):
+    pool = ProcessPool(max_workers=1, kill_grace=0.3)
+    try:
+        polite, stubborn, after = Outcome(), Outcome(), Outcome()
+        ProcessTask(run_until_stopped, timeout=0.3, pool=pool, **polite.callbacks()).start()
+        ProcessTask(sleep_for, args=(30,), timeout=0.3, pool=pool, **stubborn.callbacks()).start()
+        ProcessTask(sleep_for, args=(0.01,), pool=pool, **after.callbacks()).start()
+
+        start = time.monotonic()
+        wait_until(qapp, lambda: after.done)
+        assert time.monotonic() - start < 10
+        for outcome in (polite, stubborn):
+            assert outcome.error.code == ErrorCode.ERR_SYS_TIMEOUT and outcome.result is None
+        assert after.result == 0.01
+    finally:
+        pool.shutdown()
+
+
+@pytest.mark.slow
+def test_cpu_bound_speedup_on_four_workers(qapp):
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    if (cpus or 1) < 4:
+        pytest.skip(f"needs 4 CPUs, {cpus} available")
+    chunks = [(i * 25_000, (i + 1) * 25_000) for i in range(8)]
+
+    def run(workers):
+        pool = ProcessPool(max_workers=workers)
+        try:
+            pool.warm_up()
+            results = []
+            start = time.perf_counter()
+            for chunk in chunks:
+                ProcessTask(count_primes, args=chunk, pool=pool, on_complete=results.append).start()
+            wait_until(qapp, lambda: len(results) == len(chunks), timeout=300)
+            return time.perf_counter() - start, sum(results)
+        finally:
+            pool.shutdown()
+
+    one, total = run(1)
+    four, total4 = run(4)
+    print(f"\n8 prime-count chunks: 1 worker {one:.2f} s, 4 workers {four:.2f} s ({one / four:.1f}x)")
+    assert total == total4 == 17984
+    assert one / four > 3.0
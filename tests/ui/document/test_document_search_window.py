@@ -0,0 +1,81 @@
+"""Tests for paging and stale-result handling in DocumentSearchWindow."""
+from types import SimpleNamespace
+
+import pytest
+
+from pillars.document_manager.ui.document_search_window import DocumentSearchWindow
+
+
+class _CapturingPool:
+    """Stands in for the thread pool so tests decide when workers finish."""
+
+    def __init__(self):
+        self.workers = []
+
+    def start(self, worker):
+        self.workers.append(worker)
+
+
+def _page(doc_ids, page=1, page_count=1, total=None):
+    return {
+        'results': [
+            {'id': doc_id, 'title': f"Doc {doc_id}", 'file_type': 'txt',
+             'collection': '', 'created_at': None, 'hit_count': 1}
+            for doc_id in doc_ids
+        ],
+        'total': len(doc_ids) if total is None else total,
+        'page': page,
+        'page_size': 50,
+        'page_count': page_count,
+    }
+
+
+@pytest.fixture
+def window(qapp):
+    win = DocumentSearchWindow()
+    win.settings = SimpleNamespace(setValue=lambda *args: None)
+    win.thread_pool = _CapturingPool()
+    yield win
+    win.deleteLater()
+
+
+def _search(window, query):
+    window.search_combo.setCurrentText(query)
+    window._perform_search()
+    return window.thread_pool.workers[-1]
+
+
+def test_first_page_of_superseded_search_is_dropped(window):
+    old = _search(window, "light")
+    new = _search(window, "water")
+
+    new.signals.finished.emit(new.generation, _page([2, 3]))
+    old.signals.finished.emit(old.generation, _page([1], page=1, page_count=4, total=180))
+
+    assert [r['id'] for r in window.current_results] == [2, 3]
+    assert window.total_results == 2
+    assert window.page_count == 1
+
+
+def test_load_more_of_superseded_search_is_dropped(window):
+    first = _search(window, "light")
+    first.signals.finished.emit(first.generation, _page([1], page=1, page_count=2, total=2))
+    window._load_more()
+    more = window.thread_pool.workers[-1]
+
+    repeat = _search(window, "light")
+    more.signals.finished.emit(more.generation, _page([9], page=2, page_count=2, total=2))
+    assert window.current_results == []
+    assert window.current_page == 0
+
+    repeat.signals.finished.emit(repeat.generation, _page([1, 9]))
+    assert [r['id'] for r in window.current_results] == [1, 9]
+
+
+def test_error_from_superseded_search_is_ignored(window):
+    old = _search(window, "light")
+    _search(window, "water")
+
+    old.signals.error.emit(old.generation, "boom")
+
+    assert "boom" not in window.lbl_status.text()
@@ -1,7 +1,12 @@
 
 import pytest
 import math
-from pillars.document_manager.ui.graph_physics import GraphPhysics
+import time
+
+import numpy as np
+from PyQt6.QtCore import QPointF
+
+from pillars.document_manager.ui.graph_physics import GraphPhysics, _barnes_hut_repulsion, _exact_repulsion
 
 def test_physics_initialization():
     physics = GraphPhysics()
@@ -49,3 +54,162 @@ def test_spring_attraction():
     # N1 should move Right (+), N2 Left (-)
     assert n1.vx > 0
     assert n2.vx < 0
+
+
+def legacy_tick(nodes, edges, repulsion=90000.0, damping=0.62, max_speed=6.5, bounds=5000.0):
+    """The per-pair loop the array engine replaced, over [x, y, vx, vy, fixed] lists."""
+    repulsion /= max(1.0, len(nodes) / 50.0)
+    for i, n1 in enumerate(nodes):
+        for n2 in nodes[i + 1:]:
+            dx, dy = n1[0] - n2[0], n1[1] - n2[1]
+            dist_sq = max(dx * dx + dy * dy, 1)
+            dist = math.sqrt(dist_sq)
+            fx, fy = dx / dist * repulsion / dist_sq, dy / dist * repulsion / dist_sq
+            if not n1[4]:
+                n1[2] += fx
+                n1[3] += fy
+            if not n2[4]:
+                n2[2] -= fx
+                n2[3] -= fy
+    for source, target, length, stiffness in edges:
+        n1, n2 = nodes[source], nodes[target]
+        dx, dy = n2[0] - n1[0], n2[1] - n1[1]
+        dist = math.sqrt(dx * dx + dy * dy) or 1.0
+        force = stiffness * (dist - length)
+        for node, sign in ((n1, 1), (n2, -1)):
+            if not node[4]:
+                node[2] += sign * dx / dist * force
+                node[3] += sign * dy / dist * force
+    for node in nodes:
+        if node[4]:
+            continue
+        node[2] *= damping
+        node[3] *= damping
+        speed = math.sqrt(node[2] ** 2 + node[3] ** 2)
+        if speed > max_speed:
+            node[2] *= max_speed / speed
+            node[3] *= max_speed / speed
+        elif speed < 0.05:
+            node[2] = node[3] = 0.0
+        for axis in (0, 1):
+            node[axis] += node[axis + 2]
+            if abs(node[axis]) > bounds:
+                node[axis] = math.copysign(bounds, node[axis])
+                node[axis + 2] *= -0.2
+
+
+def random_graph(n, seed=0, spread=600.0, exact_limit=None):
+    rng = np.random.default_rng(seed)
+    physics = GraphPhysics()
+    if exact_limit is not None:
+        physics.exact_limit = exact_limit
+    for i, (x, y) in enumerate(rng.normal(0.0, spread, (n, 2))):
+        physics.add_node(i, float(x), float(y))
+    for i in range(1, n):
+        physics.add_edge(i, int(rng.integers(0, i)))
+    return physics
+
+
+def positions(physics):
+    return np.array([(node.x, node.y) for node in physics.nodes.values()])
+
+
+def test_exact_solver_matches_the_pairwise_loop():
+    physics = random_graph(120)
+    physics.add_node(500, 0.0, 0.0)
+    physics.add_edge(500, 7, length=80.0, stiffness=0.2)
+    physics.set_fixed(3, True)
+    physics.nodes[9].x = 4999.0
+    reference = [[n.x, n.y, n.vx, n.vy, n.fixed] for n in physics.nodes.values()]
+    rows = {node_id: row for row, node_id in enumerate(physics.nodes)}
+    edges = [(rows[e.source_id], rows[e.target_id], e.length, e.stiffness) for e in physics.edges]
+
+    for _ in range(40):
+        physics.tick()
+        legacy_tick(reference, edges)
+    state = np.array([[n.x, n.y, n.vx, n.vy] for n in physics.nodes.values()])
+    np.testing.assert_allclose(state, np.array(reference)[:, :4].astype(float), atol=1e-8)
+    assert physics.get_position(3) == QPointF(reference[3][0], reference[3][1])
+
+
+def test_barnes_hut_layout_stays_within_tolerance_of_exact():
+    exact, approx = random_graph(600, seed=1, exact_limit=10**9), random_graph(600, seed=1, exact_limit=0)
+
+    # The repulsion itself: theta = 0 opens every cell, the default stays close
+    pos = positions(exact)
+    reference = _exact_repulsion(pos)
+    np.testing.assert_allclose(_barnes_hut_repulsion(pos, 0.0), reference, atol=1e-12)
+    error = np.hypot(*(_barnes_hut_repulsion(pos, exact.theta) - reference).T) / np.hypot(*reference.T).mean()
+    assert np.median(error) < 0.01 and error.max() < 0.25
+
+    for _ in range(10):
+        exact.tick()
+        approx.tick()
+    drift = np.hypot(*(positions(exact) - positions(approx)).T)
+    assert drift.mean() < 1.0 and drift.max() < 20.0
+
+    # Trajectories part ways over time, but settle into the same layout
+    for _ in range(290):
+        exact.tick()
+        approx.tick()
+    src, dst = np.array([(e.source_id, e.target_id) for e in exact.edges]).T
+    pa, pb = positions(exact), positions(approx)
+    assert np.hypot(*(pa[src] - pa[dst]).T).mean() == pytest.approx(np.hypot(*(pb[src] - pb[dst]).T).mean(), rel=0.02)
+    assert pa.std(axis=0) == pytest.approx(pb.std(axis=0), rel=0.02)
+
+
+def test_removing_nodes_keeps_the_rest_intact():
+    physics = random_graph(10)
+    physics.add_edge(2, 1)  # Duplicate (either direction) is ignored
+    physics.add_edge(1, 2)
+    before = {i: (n.x, n.y) for i, n in physics.nodes.items()}
+    edges = len(physics.edges)
+
+    physics.remove_node(0)
+    physics.remove_node(4)
+    assert sorted(physics.nodes) == [1, 2, 3, 5, 6, 7, 8, 9]
+    assert all((n.x, n.y) == before[i] and n.id == i for i, n in physics.nodes.items())
+    assert all(0 not in (e.source_id, e.target_id) and 4 not in (e.source_id, e.target_id) for e in physics.edges)
+    assert len(physics.edges) < edges
+
+    physics.nodes[9].vx = 3.0
+    physics.set_position(5, 1.0, 2.0)
+    physics.set_fixed(6, True)
+    assert physics.nodes[9].vx == 3.0 and physics.get_position(5) == QPointF(1.0, 2.0) and physics.nodes[6].fixed
+    pinned = (physics.nodes[6].x, physics.nodes[6].y)
+    for _ in range(5):
+        physics.tick()
+    assert (physics.nodes[6].x, physics.nodes[6].y) == pinned
+
+    physics.add_node(0, 0.0, 0.0)
+    physics.add_edge(0, 9)
+    physics.tick()
+    assert len(physics.nodes) == 9 and physics.nodes[0].vx != 0.0
+    physics.clear()
+    physics.tick()
+    assert not physics.nodes and not physics.edges
+
+
+@pytest.mark.slow
+def test_ticks_per_second_at_200_2k_and_20k_nodes():
+    def ticks_per_second(tick, seconds=1.0):
+        ticks, started = 0, time.perf_counter()
+        while time.perf_counter() - started < seconds:
+            tick()
+            ticks += 1
+        return ticks / (time.perf_counter() - started)
+
+    report = []
+    for n in (200, 2000, 20000):
+        physics = random_graph(n, spread=30.0 * math.sqrt(n))
+        engine = ticks_per_second(physics.tick)
+        if n <= 2000:
+            reference = [[node.x, node.y, node.vx, node.vy, False] for node in physics.nodes.values()]
+            edges = [(e.source_id, e.target_id, e.length, e.stiffness) for e in physics.edges]
+            legacy = ticks_per_second(lambda: legacy_tick(reference, edges), seconds=0.5)
+            report.append(f"{n}: {engine:.0f}/s (was {legacy:.1f}/s)")
+            assert engine > 5 * legacy
+        else:
+            report.append(f"{n}: {engine:.1f}/s (was ~{legacy / 100:.3f}/s, extrapolated)")
+            assert engine > 2
+    print("\nGraphPhysics ticks per second, " + ", ".join(report))